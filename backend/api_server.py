@@ -38,6 +38,7 @@ _state = {
     "thinking":            False,
     "speaking":            False,
     "user_text":           "",
+    "partial_text":        "",    # live transcript while the user speaks
     "seven_text":          "",
     "status_text":         "SYSTEM ONLINE",
     "status_color":        "#00ff00",
@@ -255,21 +256,12 @@ from backend.routes import triggers as triggers_routes
 from backend.routes import workspaces as workspaces_routes
 from backend.routes import chrome as chrome_routes
 from backend.routes import health as health_routes
+from backend.routes import changes as changes_routes
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
 app.include_router(health_routes.router)
 
-@app.get("/api/speed")
-def get_system_speed():
-    """Diagnostic endpoint to prevent frontend 404. Returns latency metrics."""
-    return {
-        "success": True,
-        "mode": "local",
-        "latency_ms": 1.2,
-        "processing_speed": "high"
-    }
-
 # Bootstrap restart stub — called by setup wizard after environment setup
 # Real restart is handled by Electron watching Python exit code
 @app.post("/api/bootstrap/restart")
@@ -305,6 +297,7 @@ app.include_router(tasks_routes.router)
 app.include_router(triggers_routes.router)
 app.include_router(workspaces_routes.router)
 app.include_router(chrome_routes.router)
+app.include_router(changes_routes.router)
 
 
 # =========================================================================
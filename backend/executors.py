@@ -0,0 +1,194 @@
+"""
+=============================================================================
+PROJECT SEVEN - backend/executors.py
+Dedicated, size-limited thread pools for the blocking work behind async routes
+
+WHAT THIS FILE DOES:
+    A plain `def` route runs on Starlette's one shared threadpool. A few
+    slow /api/chat generations plus an /api/memory/export could hold every
+    thread in it, and /api/status, /api/tasks and the health check then
+    queued behind them — the UI froze while Seven was thinking.
+
+    The hot routes are now `async def` and hand their blocking work to the
+    pool for its kind. A kind can only ever occupy its own workers; the
+    event loop itself stays free for status polls and websockets.
+
+        llm        brain.think(), reading the Ollama stream, actions
+        embedding  memory writes that embed text (facts, imports)
+        db         SQLite / ChromaDB reads, deletes, backup streams
+
+Usage:
+    from backend import executors
+
+    result = await executors.run("llm", brain.think, text, speaker_id=sid)
+    async for chunk in executors.iterate("db", memory_backup.stream_json()):
+        ...
+
+BACKPRESSURE:
+    Work beyond a pool's workers waits in that pool's queue. /api/chat
+    checks busy("llm") first and answers 503 instead of queueing without
+    limit once llm_max_queue calls are already waiting. get_stats() reports
+    active / queued / completed and queue wait per pool for /api/speed and
+    /api/health.
+
+CONFIG (config.json -> api.executors):
+    llm             2
+    embedding       2
+    db              4
+    llm_max_queue   8      0 = never refuse
+=============================================================================
+"""
+
+import time
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULTS = {
+    "llm":           2,
+    "embedding":     2,
+    "db":            4,
+    "llm_max_queue": 8,
+}
+
+KINDS = ("llm", "embedding", "db")
+
+_lock  = threading.Lock()
+_pools = {}
+
+
+def get_settings() -> dict:
+    try:
+        import config
+        raw = config.KEY.get("api", {}).get("executors", {}) or {}
+    except Exception:
+        raw = {}
+    merged = dict(DEFAULTS)
+    if isinstance(raw, dict):
+        merged.update({k: v for k, v in raw.items() if k in DEFAULTS})
+    return merged
+
+
+class _Pool:
+
+    def __init__(self, kind: str, workers: int):
+        self.kind     = kind
+        self.workers  = max(1, int(workers))
+        self.executor = ThreadPoolExecutor(max_workers=self.workers,
+                                           thread_name_prefix=f"Seven-{kind}")
+        self._lock  = threading.Lock()
+        self._stats = {
+            "active":      0,
+            "queued":      0,
+            "completed":   0,
+            "failed":      0,
+            "wait_ms_sum": 0.0,
+            "wait_ms_max": 0.0,
+            "run_ms_sum":  0.0,
+        }
+
+    def _call(self, queued_at, fn):
+        started = time.perf_counter()
+        wait_ms = (started - queued_at) * 1000
+        with self._lock:
+            s = self._stats
+            s["queued"]      -= 1
+            s["active"]      += 1
+            s["wait_ms_sum"] += wait_ms
+            if wait_ms > s["wait_ms_max"]:
+                s["wait_ms_max"] = wait_ms
+        ok = False
+        try:
+            result = fn()
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                s = self._stats
+                s["active"]     -= 1
+                s["completed"]  += 1
+                s["run_ms_sum"] += (time.perf_counter() - started) * 1000
+                if not ok:
+                    s["failed"] += 1
+
+    async def run(self, fn, *args, **kwargs):
+        with self._lock:
+            self._stats["queued"] += 1
+        call = functools.partial(fn, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        future = self.executor.submit(self._call, time.perf_counter(), call)
+        future.add_done_callback(self._dropped)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _dropped(self, future):
+        # The caller went away (client disconnected) before a worker picked it up
+        if future.cancelled():
+            with self._lock:
+                self._stats["queued"] -= 1
+
+    def queued(self) -> int:
+        with self._lock:
+            return self._stats["queued"]
+
+    def stats(self) -> dict:
+        with self._lock:
+            s    = dict(self._stats)
+        done = s["completed"]
+        return {
+            "workers":     self.workers,
+            "active":      s["active"],
+            "queued":      s["queued"],
+            "completed":   done,
+            "failed":      s["failed"],
+            "wait_ms_avg": round(s["wait_ms_sum"] / done, 2) if done else 0.0,
+            "wait_ms_max": round(s["wait_ms_max"], 2),
+            "run_ms_avg":  round(s["run_ms_sum"] / done, 2) if done else 0.0,
+        }
+
+
+def _pool(kind: str) -> _Pool:
+    pool = _pools.get(kind)
+    if pool is None:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown executor: {kind}")
+        with _lock:
+            pool = _pools.get(kind)
+            if pool is None:
+                pool = _pools[kind] = _Pool(kind, get_settings()[kind])
+    return pool
+
+
+async def run(kind: str, fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) on the `kind` pool and await its result."""
+    return await _pool(kind).run(fn, *args, **kwargs)
+
+
+_DONE = object()
+
+
+async def iterate(kind: str, iterable):
+    """
+    Async iterator over a blocking iterator or generator — each next() runs
+    on the `kind` pool, so nothing is held between items. For
+    StreamingResponse bodies and the Ollama sentence stream.
+    """
+    it   = iter(iterable)
+    pool = _pool(kind)
+    while True:
+        item = await pool.run(next, it, _DONE)
+        if item is _DONE:
+            return
+        yield item
+
+
+def busy(kind: str) -> bool:
+    """True when more work is already waiting for `kind` than its queue limit allows."""
+    limit = int(get_settings().get(f"{kind}_max_queue", 0) or 0)
+    return limit > 0 and _pool(kind).queued() >= limit
+
+
+def get_stats() -> dict:
+    """Per pool: workers, active, queued, completed, failed, queue wait and run time."""
+    return {kind: _pool(kind).stats() for kind in KINDS}
+
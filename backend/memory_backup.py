@@ -0,0 +1,773 @@
+"""
+backend/memory_backup.py
+Streaming backup export / import for /api/memory/export and /api/memory/import.
+
+EXPORT:
+    iter_records() walks facts, conversations, schedules, tasks, triggers,
+    workspaces and usage a page at a time (ChromaDB get(limit, offset),
+    SQLite fetchmany) — nothing holds the whole backup in memory.
+    Two encodings of the same record stream:
+        stream_json()    the classic backup file, one JSON object,
+                         emitted in chunks (same shape as before)
+        stream_ndjson()  one line per record:
+                         {"section": "facts", "data": {...}}
+
+IMPORT:
+    BackupReader parses the request body as it arrives — either format,
+    detected from the first bytes — and yields (section, record).
+    BackupImporter groups records into batches: one collection.add() (one
+    embedding pass) per batch of facts / conversations, one executemany()
+    per batch of tasks / triggers / workspaces.
+"""
+
+import os
+import json
+import time
+import uuid
+import re
+import codecs
+import sqlite3
+import datetime
+
+BACKUP_VERSION = "1.3.1"
+BATCH_SIZE     = 500
+_PAGE          = 1000
+
+SECTIONS = ("facts", "conversations", "schedules", "tasks", "triggers", "workspaces")
+
+# Older backups (and other tools) name some sections differently
+SECTION_ALIASES = {
+    "facts":         "facts",
+    "user_facts":    "facts",
+    "conversations": "conversations",
+    "history":       "conversations",
+    "schedules":     "schedules",
+    "reminders":     "schedules",
+    "tasks":         "tasks",
+    "todos":         "tasks",
+    "triggers":      "triggers",
+    "workspaces":    "workspaces",
+}
+
+
+_NDJSON_HEAD = re.compile(r'\{\s*"section"\s*:')
+
+
+def _now() -> str:
+    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# =============================================================================
+# EXPORT — record iterators
+# =============================================================================
+
+def _iter_collection(collection):
+    offset = 0
+    while True:
+        page = collection.get(include=["documents", "metadatas"], limit=_PAGE, offset=offset)
+        ids = page.get("ids") or []
+        if not ids:
+            return
+        docs  = page.get("documents") or [""] * len(ids)
+        metas = page.get("metadatas") or [{}] * len(ids)
+        for doc, meta in zip(docs, metas):
+            yield doc, meta or {}
+        offset += len(ids)
+        if len(ids) < _PAGE:
+            return
+
+
+def _iter_facts():
+    from memory import seven_memory
+    for doc, meta in _iter_collection(seven_memory.user_facts):
+        yield {
+            "text":      doc,
+            "category":  meta.get("category", "general"),
+            "timestamp": meta.get("timestamp", ""),
+        }
+
+
+def _conversation_record(meta: dict, doc: str = None):
+    if meta.get("type") == "summary":
+        return None   # retention rollups — the turns they cover come from the archive
+    user_input     = meta.get("user_input", "")
+    seven_response = meta.get("seven_response", doc if doc is not None else "")
+    if user_input and seven_response:
+        return {
+            "user":      user_input,
+            "seven":     seven_response,
+            "timestamp": meta.get("timestamp", ""),
+            "speaker":   meta.get("user_id", "default"),
+            "source":    meta.get("source", "chat"),
+        }
+    return None
+
+
+def _iter_conversations_sqlite():
+    """Conversations straight from chroma.sqlite3 — no embedding model needed."""
+    from memory.core import MEMORY_DIR
+    db = os.path.join(MEMORY_DIR, "chroma.sqlite3")
+    if not os.path.exists(db):
+        return
+    # Streamed: each next() may resume on a different worker thread
+    conn = sqlite3.connect(db, timeout=5, check_same_thread=False)
+    try:
+        row = conn.execute(
+            "SELECT id FROM collections WHERE name = 'conversations'"
+        ).fetchone()
+        if not row:
+            return
+        seg_ids = [r[0] for r in conn.execute(
+            "SELECT id FROM segments WHERE collection = ? AND scope = 'METADATA'", (row[0],)
+        ).fetchall()]
+        if not seg_ids:
+            return
+        ph = ",".join("?" * len(seg_ids))
+        last_id = -1
+        while True:
+            emb_ids = [r[0] for r in conn.execute(
+                f"SELECT id FROM embeddings WHERE segment_id IN ({ph}) AND id > ? "
+                f"ORDER BY id LIMIT ?", (*seg_ids, last_id, _PAGE)
+            ).fetchall()]
+            if not emb_ids:
+                return
+            metas = {}
+            for emb_id, key, value in conn.execute(
+                f"SELECT id, key, string_value FROM embedding_metadata "
+                f"WHERE id IN ({','.join('?' * len(emb_ids))})", emb_ids
+            ):
+                metas.setdefault(emb_id, {})[key] = value
+            for emb_id in emb_ids:
+                record = _conversation_record(metas.get(emb_id, {}))
+                if record:
+                    yield record
+            last_id = emb_ids[-1]
+    finally:
+        conn.close()
+
+
+def _iter_archived_conversations():
+    """Turns moved to cold storage by memory/retention.py."""
+    from memory.core import MEMORY_DIR
+    from memory.conversation_archive import ConversationArchive, ARCHIVE_FILE
+    if not os.path.exists(os.path.join(MEMORY_DIR, ARCHIVE_FILE)):
+        return
+    archive = ConversationArchive(MEMORY_DIR)
+    try:
+        for doc, meta in archive.iter_turns():
+            record = _conversation_record(meta, doc)
+            if record:
+                yield record
+    finally:
+        archive.close()
+
+
+def _iter_conversations():
+    try:
+        from memory import seven_memory
+        collection = seven_memory.conversations
+        collection.count()   # the singleton fails here if ChromaDB cannot load
+    except Exception:
+        yield from _iter_conversations_sqlite()
+        yield from _iter_archived_conversations()
+        return
+    for doc, meta in _iter_collection(collection):
+        record = _conversation_record(meta, doc)
+        if record:
+            yield record
+    yield from _iter_archived_conversations()
+
+
+def _iter_schedules():
+    path = os.path.join(os.environ.get('APPDATA', ''), 'SEVEN', 'schedules.json')
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from (json.load(f) or [])
+
+
+def _iter_rows(conn, sql):
+    cur = conn.execute(sql)
+    while True:
+        rows = cur.fetchmany(_PAGE)
+        if not rows:
+            return
+        yield from rows
+
+
+def _iter_tasks():
+    from backend.routes.tasks import TASKS_DB, _row_to_dict
+    if not os.path.exists(TASKS_DB):
+        return
+    # A streamed export resumes on whichever worker thread is free, so the
+    # iterators use their own connection rather than a thread's pooled one
+    conn = sqlite3.connect(TASKS_DB, timeout=5, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    try:
+        for row in _iter_rows(conn, "SELECT * FROM tasks ORDER BY id ASC"):
+            yield _row_to_dict(row)
+    finally:
+        conn.close()
+
+
+def _iter_trigger_table(table):
+    from backend.routes.triggers import TRIGGERS_DB
+    if not os.path.exists(TRIGGERS_DB):
+        return
+    conn = sqlite3.connect(TRIGGERS_DB, timeout=5, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    try:
+        for row in _iter_rows(conn, f"SELECT * FROM {table} ORDER BY id ASC"):
+            yield dict(row)
+    finally:
+        conn.close()
+
+
+def _iter_triggers():
+    for d in _iter_trigger_table("triggers"):
+        d["enabled"] = bool(d.get("enabled", 1))
+        d["silent"]  = bool(d.get("silent", 0))
+        try:
+            d["action_data"] = json.loads(d.get("action_data") or "{}")
+        except Exception:
+            d["action_data"] = {}
+        yield d
+
+
+def _iter_workspaces():
+    for d in _iter_trigger_table("workspaces"):
+        try:
+            d["apps"] = json.loads(d.get("apps") or "[]")
+        except Exception:
+            d["apps"] = []
+        yield d
+
+
+_SECTION_ITERS = {
+    "facts":         _iter_facts,
+    "conversations": _iter_conversations,
+    "schedules":     _iter_schedules,
+    "tasks":         _iter_tasks,
+    "triggers":      _iter_triggers,
+    "workspaces":    _iter_workspaces,
+}
+
+
+def _header() -> dict:
+    import config as cfg
+    return {
+        "exported_at": datetime.datetime.now().isoformat(),
+        "version":     BACKUP_VERSION,
+        "identity": {
+            "name":  cfg.KEY.get("identity", {}).get("user_name", ""),
+            "email": cfg.KEY.get("email", ""),
+        },
+    }
+
+
+def _usage() -> dict:
+    try:
+        db_path = os.path.join(os.environ.get("APPDATA", ""), "SEVEN", "data", "telemetry.db")
+        if os.path.exists(db_path):
+            conn = sqlite3.connect(db_path)
+            try:
+                row = conn.execute("SELECT active_hours, last_seen FROM stats LIMIT 1").fetchone()
+            finally:
+                conn.close()
+            if row:
+                return {"total_minutes": int((row[0] or 0) * 60), "last_seen": row[1]}
+    except Exception:
+        pass
+    return {}
+
+
+def iter_records():
+    """
+    Yield ("header", {...}), then (section, record) for every record,
+    ("<section>_error", message) if a section failed part-way, and finally
+    ("usage", {...}).
+    """
+    yield "header", _header()
+    for section in SECTIONS:
+        try:
+            for record in _SECTION_ITERS[section]():
+                yield section, record
+        except Exception as e:
+            yield f"{section}_error", str(e)
+    yield "usage", _usage()
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+
+def stream_ndjson():
+    counts = dict.fromkeys(SECTIONS, 0)
+    for section, data in iter_records():
+        if section in counts:
+            counts[section] += 1
+        yield _dumps({"section": section, "data": data}) + "\n"
+    yield _dumps({"section": "footer", "data": {"counts": counts}}) + "\n"
+
+
+def stream_json(chunk_records: int = 200):
+    """The classic single-object backup, produced a chunk of records at a time."""
+    yield _dumps(_header())[:-1]   # leave the object open
+    for section in SECTIONS:
+        buf, sep, error = [f', "{section}": ['], "", None
+        try:
+            for record in _SECTION_ITERS[section]():
+                buf.append(sep + _dumps(record))
+                sep = ","
+                if len(buf) >= chunk_records:
+                    yield "".join(buf)
+                    buf = []
+        except Exception as e:
+            error = str(e)
+        buf.append("]")
+        if error is not None:
+            buf.append(f', "{section}_error": {_dumps(error)}')
+        yield "".join(buf)
+    yield f', "usage": {_dumps(_usage())}}}\n'
+
+
+# =============================================================================
+# IMPORT — incremental reader
+# =============================================================================
+
+class BackupReader:
+    """
+    Feed raw body chunks, get back (section, record) pairs as soon as each
+    record is complete. Understands NDJSON ({"section": ..., "data": ...}
+    per line) and the single-object backup ({"facts": [...], ...}).
+    """
+
+    _WS = " \t\r\n"
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json    = json.JSONDecoder()
+        self._buf     = ""
+        self._pos     = 0
+        self._mode    = None      # "ndjson" | "json"
+        self._state   = "start"   # json mode: start, key, colon, value, array, done
+        self._key     = None
+
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        self._buf += self._decoder.decode(chunk, final=final)
+        out = []
+        if self._mode is None:
+            self._detect(final)
+        if self._mode == "ndjson":
+            self._feed_ndjson(out, final)
+        elif self._mode == "json":
+            self._feed_json(out, final)
+        if self._pos > 65536:
+            self._buf, self._pos = self._buf[self._pos:], 0
+        return out
+
+    def close(self) -> list:
+        out = self.feed(b"", final=True)
+        if self._mode == "json" and self._state != "done":
+            raise ValueError("backup JSON ended early")
+        return out
+
+    # -- detection -------------------------------------------------------------
+
+    def _detect(self, final):
+        # stream_ndjson() always writes "section" as the first key of a line;
+        # a JSON backup never starts with it.
+        head = self._buf.lstrip()
+        if len(head) < 16 and not final:
+            return
+        self._mode = "ndjson" if _NDJSON_HEAD.match(head) else "json"
+
+    # -- NDJSON ----------------------------------------------------------------
+
+    def _feed_ndjson(self, out, final):
+        while True:
+            nl = self._buf.find("\n", self._pos)
+            if nl < 0:
+                if not final:
+                    return
+                nl = len(self._buf)
+            line = self._buf[self._pos:nl].strip()
+            self._pos = min(nl + 1, len(self._buf))
+            if line:
+                obj = json.loads(line)
+                section = SECTION_ALIASES.get(obj.get("section"))
+                if section:
+                    out.append((section, obj.get("data")))
+            if nl >= len(self._buf):
+                return
+
+    # -- single JSON object ----------------------------------------------------
+
+    def _skip(self, chars):
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in chars:
+            pos += 1
+        self._pos = pos
+        return pos < len(buf)
+
+    def _decode_value(self, final):
+        """Next complete JSON value, or None if more input is needed."""
+        try:
+            value, end = self._json.raw_decode(self._buf, self._pos)
+        except ValueError:
+            if final:
+                raise
+            return None
+        # A number or literal cut at the chunk edge decodes "successfully";
+        # only trust it once the character after it has arrived.
+        if end >= len(self._buf) and not final:
+            return None
+        self._pos = end
+        return (value,)
+
+    def _feed_json(self, out, final):
+        while self._state != "done":
+            if not self._skip(self._WS):
+                return
+            ch = self._buf[self._pos]
+            if self._state == "start":
+                if ch != "{":
+                    raise ValueError("backup must be a JSON object")
+                self._pos += 1
+                self._state = "key"
+            elif self._state == "key":
+                if ch == ",":
+                    self._pos += 1
+                elif ch == "}":
+                    self._pos += 1
+                    self._state = "done"
+                else:
+                    got = self._decode_value(final)
+                    if got is None:
+                        return
+                    self._key, self._state = got[0], "colon"
+            elif self._state == "colon":
+                if ch != ":":
+                    raise ValueError("malformed backup JSON")
+                self._pos += 1
+                self._state = "value"
+            elif self._state == "value":
+                if ch == "[" and self._key in SECTION_ALIASES:
+                    self._pos += 1
+                    self._state = "array"
+                else:
+                    got = self._decode_value(final)   # header fields, usage, ...
+                    if got is None:
+                        return
+                    self._state = "key"
+            elif self._state == "array":
+                if ch == ",":
+                    self._pos += 1
+                elif ch == "]":
+                    self._pos += 1
+                    self._state = "key"
+                else:
+                    got = self._decode_value(final)
+                    if got is None:
+                        return
+                    out.append((SECTION_ALIASES[self._key], got[0]))
+
+
+# =============================================================================
+# IMPORT — batched writer
+# =============================================================================
+
+def _ensure_column(conn, table, column, definition):
+    """Dynamically patch missing schema columns in older databases."""
+    try:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+        print(f"[IMPORT] Patched schema: Added {column} to {table}")
+    except Exception:
+        pass  # Column already exists
+
+
+def _clean_meta(meta: dict) -> dict:
+    """ChromaDB metadata values must be str, int, float or bool — None is rejected."""
+    out = {}
+    for key, value in meta.items():
+        if value is None:
+            continue
+        out[key] = value if isinstance(value, (str, int, float, bool)) else str(value)
+    return out
+
+
+class BackupImporter:
+    """
+    add() records as they are parsed; full batches are written by flush().
+    finish() writes what is left and returns the counts and throughput.
+    A batch ChromaDB rejects is retried record by record, so one bad record
+    is skipped on its own instead of taking its whole batch with it.
+    """
+
+    def __init__(self, seven_memory=None, batch_size: int = BATCH_SIZE):
+        self.memory     = seven_memory
+        self.batch_size = batch_size
+        self.pending    = {s: [] for s in SECTIONS}
+        self.imported   = dict.fromkeys(SECTIONS, 0)
+        self.received   = 0
+        self.skipped    = 0
+        self.t0         = time.perf_counter()
+        self._tasks_conn = None
+        self._trig_conn  = None
+
+    def add(self, section: str, item) -> bool:
+        """Queue one record. True when a batch is ready for flush()."""
+        self.received += 1
+        batch = self.pending.get(section)
+        if batch is None:
+            return False
+        batch.append(item)
+        return len(batch) >= self.batch_size
+
+    def flush(self, final: bool = False):
+        for section in SECTIONS:
+            batch = self.pending[section]
+            if not batch or (section == "schedules" and not final):
+                continue   # schedules are one JSON file — written once at the end
+            if not final and len(batch) < self.batch_size:
+                continue
+            self.pending[section] = []
+            if section == "schedules":
+                chunks = [batch]
+            else:
+                chunks = [batch[i:i + self.batch_size]
+                          for i in range(0, len(batch), self.batch_size)]
+            for chunk in chunks:
+                try:
+                    getattr(self, f"_write_{section}")(chunk)
+                except Exception as e:
+                    print(f"[IMPORT] {section.capitalize()} error: {e}")
+
+    def finish(self) -> dict:
+        try:
+            self.flush(final=True)
+        finally:
+            for conn in (self._tasks_conn, self._trig_conn):
+                if conn is not None:
+                    conn.close()
+        if self.imported["triggers"]:
+            try:
+                from backend.routes.triggers import _signal_daemon_reload
+                _signal_daemon_reload()
+            except Exception:
+                pass
+        elapsed = time.perf_counter() - self.t0
+        total   = sum(self.imported.values())
+        rate    = total / elapsed if elapsed > 0 else 0.0
+        print(f"[IMPORT] {total} records in {elapsed:.2f}s ({rate:.0f} records/s)"
+              + (f", {self.skipped} skipped" if self.skipped else ""))
+        return {"imported": dict(self.imported), "total": total, "skipped": self.skipped,
+                "elapsed_s": round(elapsed, 3), "records_per_s": round(rate, 1)}
+
+    # -- ChromaDB: one add() per batch ------------------------------------------
+
+    def _add(self, collection, docs, metas, ids):
+        """add() the batch; if it is rejected, add one by one. Returns (ids, metas) stored."""
+        try:
+            collection.add(documents=docs, metadatas=metas, ids=ids)
+            return ids, metas
+        except Exception as e:
+            print(f"[IMPORT] Batch of {len(ids)} rejected ({e}) — retrying one by one")
+        kept_ids, kept_metas = [], []
+        for doc, meta, rid in zip(docs, metas, ids):
+            try:
+                collection.add(documents=[doc], metadatas=[meta], ids=[rid])
+            except Exception as e:
+                self.skipped += 1
+                print(f"[IMPORT] Skipped record: {e}")
+                continue
+            kept_ids.append(rid)
+            kept_metas.append(meta)
+        return kept_ids, kept_metas
+
+    def _write_facts(self, items):
+        if not self.memory:
+            return
+        docs, metas, ids = [], [], []
+        for item in items:
+            text, cat, ts = "", "imported", None
+            if isinstance(item, str):
+                text = item.strip()
+            elif isinstance(item, dict):
+                text = (item.get("text") or item.get("fact") or item.get("document") or "").strip()
+                cat  = item.get("category", "imported")
+                ts   = item.get("timestamp")
+            if text:
+                docs.append(text)
+                metas.append(_clean_meta({"category": cat or "imported",
+                                          "timestamp": ts or _now(),
+                                          "user_id": "default", "type": "fact"}))
+                ids.append(f"fact_import_{uuid.uuid4().hex}")
+        if docs:
+            with self.memory._write_lock:
+                ids, metas = self._add(self.memory.user_facts, docs, metas, ids)
+                self.memory.counters.added("user_facts", metas)
+            self.imported["facts"] += len(ids)
+
+    def _write_conversations(self, items):
+        if not self.memory:
+            return
+        docs, metas, ids = [], [], []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            user_txt  = (item.get("user") or item.get("user_input") or item.get("prompt") or item.get("input") or "").strip()
+            seven_txt = (item.get("seven") or item.get("seven_response") or item.get("response") or item.get("output") or "").strip()
+            if user_txt and seven_txt:
+                docs.append(f"User said: {user_txt} | Seven replied: {seven_txt}")
+                metas.append(_clean_meta({
+                    "user_input":     user_txt,
+                    "seven_response": seven_txt,
+                    "timestamp":      item.get("timestamp") or _now(),
+                    "user_id":        item.get("speaker") or "default",
+                    "type":           "conversation",
+                    "source":         item.get("source") or "import",
+                }))
+                ids.append(f"conv_import_{uuid.uuid4().hex}")
+        if docs:
+            # Same lock as store_conversations(): compaction swaps the
+            # collection under it, so an unlocked add() could land in the old one
+            with self.memory._write_lock:
+                ids, metas = self._add(self.memory.conversations, docs, metas, ids)
+                self.memory.counters.added("conversations", metas)
+                self.memory.index_conversations(ids, metas)
+            self.imported["conversations"] += len(ids)
+
+    # -- schedules.json: one write at the end -------------------------------------
+
+    def _write_schedules(self, items):
+        path = os.path.join(os.environ.get('APPDATA', ''), 'SEVEN', 'schedules.json')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        existing = []
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    existing = json.load(f)
+            except Exception:
+                existing = []
+        existing_ids = {s.get('id') for s in existing if isinstance(s, dict)}
+        max_id = max([i for i in existing_ids if isinstance(i, int)] or [0])
+        for item in items:
+            if isinstance(item, dict) and item.get("message"):
+                max_id += 1
+                item["id"] = max_id
+                existing.append(item)
+                self.imported["schedules"] += 1
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(existing, f, indent=2)
+
+    # -- SQLite: one executemany() per batch ---------------------------------------
+    # Batches are flushed from run_in_threadpool, so consecutive batches may run
+    # on different threads: one dedicated connection per import, not the pool.
+
+    def _tasks(self):
+        if self._tasks_conn is None:
+            from backend.routes.tasks import TASKS_DB, init_db as init_tasks_db
+            init_tasks_db()
+            conn = sqlite3.connect(TASKS_DB, timeout=10, check_same_thread=False)
+            _ensure_column(conn, "tasks", "description", "TEXT")
+            _ensure_column(conn, "tasks", "subtasks", "TEXT DEFAULT '[]'")
+            _ensure_column(conn, "tasks", "tags", "TEXT")
+            self._tasks_conn = conn
+        return self._tasks_conn
+
+    def _triggers_db(self):
+        if self._trig_conn is None:
+            from backend.routes.triggers import TRIGGERS_DB, init_db as init_trig_db
+            init_trig_db()
+            conn = sqlite3.connect(TRIGGERS_DB, timeout=10, check_same_thread=False)
+            _ensure_column(conn, "triggers", "audio_pattern", "TEXT")
+            _ensure_column(conn, "triggers", "silent", "INTEGER DEFAULT 0")
+            _ensure_column(conn, "triggers", "icon", "TEXT")
+            _ensure_column(conn, "triggers", "last_fired", "TEXT")
+            _ensure_column(conn, "triggers", "fire_count", "INTEGER DEFAULT 0")
+            _ensure_column(conn, "workspaces", "description", "TEXT")
+            _ensure_column(conn, "workspaces", "icon", "TEXT")
+            _ensure_column(conn, "workspaces", "last_used", "TEXT")
+            _ensure_column(conn, "workspaces", "use_count", "INTEGER DEFAULT 0")
+            self._trig_conn = conn
+        return self._trig_conn
+
+    def _write_tasks(self, items):
+        rows = []
+        for item in items:
+            if isinstance(item, dict) and item.get("text"):
+                subtasks = item.get("subtasks") or []
+                tags_raw = item.get("tags")
+                rows.append((
+                    str(item.get("text", "")).strip(),
+                    item.get("due_date"),
+                    item.get("due_time"),
+                    item.get("priority", "medium"),
+                    1 if item.get("completed") else 0,
+                    item.get("created_at") or datetime.datetime.now().isoformat(),
+                    item.get("completed_at"),
+                    ",".join(tags_raw) if isinstance(tags_raw, list) else (tags_raw or ""),
+                    item.get("description"),
+                    json.dumps(subtasks if isinstance(subtasks, list) else []),
+                ))
+        if rows:
+            conn = self._tasks()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO tasks (text, due_date, due_time, priority, "
+                    "completed, created_at, completed_at, tags, description, subtasks) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            self.imported["tasks"] += len(rows)
+
+    def _write_triggers(self, items):
+        now_iso = datetime.datetime.now().isoformat()
+        rows = []
+        for item in items:
+            if isinstance(item, dict) and item.get("name") and item.get("action_type"):
+                action_data = item.get("action_data") or {}
+                rows.append((
+                    str(item.get("name", "")).strip(),
+                    str(item.get("action_type")),
+                    json.dumps(action_data if isinstance(action_data, dict) else {}),
+                    item.get("hotkey"),
+                    item.get("voice_phrase"),
+                    item.get("audio_pattern"),
+                    1 if item.get("enabled", True) else 0,
+                    1 if item.get("silent", False) else 0,
+                    item.get("icon"),
+                    item.get("created_at", now_iso),
+                    item.get("updated_at", now_iso),
+                ))
+        if rows:
+            conn = self._triggers_db()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO triggers (name, action_type, action_data, hotkey, "
+                    "voice_phrase, audio_pattern, enabled, silent, icon, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            self.imported["triggers"] += len(rows)
+
+    def _write_workspaces(self, items):
+        now_iso = datetime.datetime.now().isoformat()
+        rows = []
+        for item in items:
+            if isinstance(item, dict) and item.get("name"):
+                apps = item.get("apps") or []
+                rows.append((
+                    str(item.get("name", "")).strip(),
+                    item.get("description"),
+                    json.dumps(apps if isinstance(apps, list) else []),
+                    item.get("icon"),
+                    item.get("created_at", now_iso),
+                    item.get("updated_at", now_iso),
+                ))
+        if rows:
+            conn = self._triggers_db()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO workspaces (name, description, apps, icon, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+            self.imported["workspaces"] += len(rows)
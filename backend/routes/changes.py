@@ -0,0 +1,60 @@
+"""
+backend/routes/changes.py
+Handles: /api/changes
+
+Change versions for the polled list endpoints (seven_utils/changes.py).
+
+    conditional()   ETag / If-None-Match for a list route: an unchanged
+                    poll gets a bodyless 304 before any query runs.
+    /api/changes    Long-poll. ?since=<cursor> returns as soon as a domain
+                    changes (or after `timeout` seconds with nothing), so
+                    the UI can refetch only what changed instead of on a timer.
+"""
+
+import time
+import asyncio
+from typing import Optional
+from fastapi import APIRouter, Request, Response
+
+from seven_utils import changes
+
+router = APIRouter()
+
+POLL_INTERVAL_S = 0.25
+MAX_TIMEOUT_S   = 30.0
+
+
+def conditional(request: Request, response: Response, domain: str, extra: str = "") -> Optional[Response]:
+    """
+    Call first thing in a list route. Returns a 304 Response to return as-is
+    when the client already has the current version; otherwise sets ETag on
+    `response` and returns None. `extra` goes into the tag for lists that
+    also depend on something besides the data (today's date for due counts).
+    """
+    tag = changes.etag(domain)
+    if extra:
+        tag = f'{tag[:-1]}-{extra}"'
+    headers = {"ETag": tag, "Cache-Control": "no-cache"}
+    sent = request.headers.get("if-none-match")
+    if sent and tag in [t.strip() for t in sent.split(",")]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+@router.get("/api/changes", summary="Wait for data changes",
+            description="Long-poll. Returns the domains (tasks, schedules, triggers, workspaces) whose version is newer than `since`, waiting up to `timeout` seconds for one. Pass the returned cursor as the next `since`.")
+async def get_changes(since: int = 0, timeout: float = 25.0, domains: Optional[str] = None):
+    wanted   = [d.strip() for d in (domains or "").split(",") if d.strip()] or None
+    deadline = time.monotonic() + min(max(timeout, 0.0), MAX_TIMEOUT_S)
+    while True:
+        changed = changes.changed_since(since, wanted)
+        if changed or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(POLL_INTERVAL_S)
+    current = changes.versions()
+    return {
+        "changed":  changed,
+        "versions": current,
+        "cursor":   max(current.values()),
+    }
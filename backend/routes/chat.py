@@ -1,14 +1,18 @@
 """
 backend/routes/chat.py
-Handles: POST /api/chat
+Handles: POST /api/chat, POST /api/chat/stream
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
+import json
 import re
 import logging
 
+from backend import executors
+
 _log = logging.getLogger('seven.chat')
 
 router = APIRouter()
@@ -89,19 +93,30 @@ def _build_clean_response(full_response: str, speaker_id: str) -> str:
 
     return "."
 
+
+def _check_busy():
+    """503 instead of an ever-growing queue when the llm pool is backed up."""
+    if executors.busy("llm"):
+        raise HTTPException(status_code=503, detail="Seven is busy. Try again in a moment.",
+                            headers={"Retry-After": "5"})
+
+
 @router.post("/api/chat", response_model=ChatResponse,
              summary="Send message to Seven",
-             description="Send text to Seven's brain pipeline. Runs through 22 processing layers. First 4 layers handle commands in under 5ms without LLM. Open questions go to Ollama. Returns response text and any action tags executed.")
-def chat(req: ChatRequest):
+             description="Send text to Seven's brain pipeline. Runs through 22 processing layers. First 4 layers handle commands in under 5ms without LLM. Open questions go to Ollama. Returns response text and any action tags executed. 503 when too many chats are already waiting.")
+async def chat(req: ChatRequest):
     """Send a text message to Seven's brain."""
-    import brain
-    import telemetry
-    import datetime
-    import uuid
-    from backend.api_server import set_state, check_limit
-
     if not req.text or not req.text.strip():
         raise HTTPException(status_code=400, detail="Empty message")
+    _check_busy()
+    return await executors.run("llm", _chat, req)
+
+
+def _chat(req: ChatRequest):
+    """The whole /api/chat turn — think, execute actions. Runs on the llm pool."""
+    import brain
+    import telemetry
+    from backend.api_server import set_state
 
     set_state("thinking", True)
 
@@ -135,71 +150,160 @@ def chat(req: ChatRequest):
         else:
             full_response = response if response else "Processing error."
 
-        # Extract action tags
-        actions = re.findall(r"###(\w+):\s*(.*?)(?=###|$)", full_response, re.DOTALL)
-        action_list = [f"{cmd}:{arg.strip()}" for cmd, arg in actions]
+        return ChatResponse(**_finalize_response(full_response, req.speaker_id, is_streaming))
 
-        # Clean response
-        clean_response = re.sub(
-            r"###\w+:\s*.*?(?=###|$)", "", full_response, flags=re.DOTALL
-        ).strip()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Execute commands
-        _execute_actions(action_list, full_response, req.speaker_id)
+    finally:
+        set_state("thinking", False)
 
-        # Build human-readable response if empty after tag removal
-        if not clean_response:
-            clean_response = _build_clean_response(
-                full_response, req.speaker_id
-            )
 
-        # Plan limit check for conversation history
-        try:
-            from memory import seven_memory
-            all_convos = seven_memory.conversations.get()
-            convo_count = (
-                len(all_convos["documents"])
-                if all_convos and all_convos.get("documents")
-                else 0
+def _finalize_response(full_response: str, speaker_id: str, is_streaming: bool) -> dict:
+    """
+    Post-process a complete brain response.
+    Shared by /api/chat and /api/chat/stream (which calls it once the
+    stream has ended).
+
+    Extracts and executes action tags, strips them from the text, and
+    pulls file/task results out of shared state.
+    Returns the ChatResponse fields as a dict.
+    """
+    from backend.api_server import set_state, check_limit
+
+    # Extract action tags
+    actions = re.findall(r"###(\w+):\s*(.*?)(?=###|$)", full_response, re.DOTALL)
+    action_list = [f"{cmd}:{arg.strip()}" for cmd, arg in actions]
+
+    # Clean response
+    clean_response = re.sub(
+        r"###\w+:\s*.*?(?=###|$)", "", full_response, flags=re.DOTALL
+    ).strip()
+
+    # Execute commands
+    _execute_actions(action_list, full_response, speaker_id)
+
+    # Build human-readable response if empty after tag removal
+    if not clean_response:
+        clean_response = _build_clean_response(full_response, speaker_id)
+
+    # Plan limit check for conversation history
+    try:
+        from memory import seven_memory
+        convo_count = seven_memory.count_conversations()
+        limit_check = check_limit("conversation_history", convo_count)
+        if not limit_check["allowed"]:
+            _log.info(
+                f"Conversation memory full "
+                f"({convo_count}/{limit_check['limit']}) "
+                f"tier: {limit_check['tier']}"
             )
-            limit_check = check_limit("conversation_history", convo_count)
-            if not limit_check["allowed"]:
-                _log.info(
-                    f"Conversation memory full "
-                    f"({convo_count}/{limit_check['limit']}) "
-                    f"tier: {limit_check['tier']}"
-                )
-        except Exception as _e:
-            _log.debug(f"Memory limit check failed: {_e}")
-
-        # Pull file/task results from shared state
-        file_results = None
-        task_results = None
-        try:
-            from backend.api_server import get_state as _get_state
-            _current_state = _get_state()
-            file_results = _current_state.get("file_search_results")
-            task_results = _current_state.get("task_results")
-            if file_results:
-                set_state("file_search_results", None)
-            if task_results:
-                set_state("task_results", None)
-        except Exception as _e:
-            _log.debug(f"State read failed: {_e}")
-
-        return ChatResponse(
-            response=clean_response,
-            actions=action_list,
-            streaming=is_streaming,
-            file_results=file_results,
-            task_results=task_results,
-        )
+    except Exception as _e:
+        _log.debug(f"Memory limit check failed: {_e}")
+
+    # Pull file/task results from shared state
+    file_results = None
+    task_results = None
+    try:
+        from backend.api_server import get_state as _get_state
+        _current_state = _get_state()
+        file_results = _current_state.get("file_search_results")
+        task_results = _current_state.get("task_results")
+        if file_results:
+            set_state("file_search_results", None)
+        if task_results:
+            set_state("task_results", None)
+    except Exception as _e:
+        _log.debug(f"State read failed: {_e}")
 
+    return {
+        "response":     clean_response,
+        "actions":      action_list,
+        "streaming":    is_streaming,
+        "file_results": file_results,
+        "task_results": task_results,
+    }
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/api/chat/stream",
+             summary="Send message to Seven (Server-Sent Events)",
+             description="Same pipeline as /api/chat, but LLM answers are streamed sentence by sentence as SSE "
+                         "'sentence' events while Ollama generates. Action tags are extracted and executed once "
+                         "the stream ends; the final 'done' event carries the same fields as /api/chat.")
+async def chat_stream(req: ChatRequest):
+    """Stream Seven's reply as text/event-stream."""
+    import brain
+    import telemetry
+    from backend.api_server import set_state
+
+    if not req.text or not req.text.strip():
+        raise HTTPException(status_code=400, detail="Empty message")
+    _check_busy()
+
+    text = req.text.strip()
+    set_state("thinking", True)
+
+    try:
+        telemetry.log_activity()
+    except Exception as _te:
+        _log.debug(f"Telemetry log failed: {_te}")
+
+    try:
+        # Layers 0-7 run here. Layer 8 returns a generator without waiting
+        # for Ollama, so this returns as soon as the prompt is assembled.
+        response = await executors.run(
+            "llm", brain.think, text, speaker_id=req.speaker_id, stream=True
+        )
     except Exception as e:
+        set_state("thinking", False)
         raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        set_state("thinking", False)
+    async def _events():
+        # Each sentence is pulled from Ollama on the llm pool, so no worker
+        # is pinned for the whole generation and the event loop never blocks.
+        is_streaming = (
+            isinstance(response, tuple)
+            and len(response) == 2
+            and response[0] == "__STREAM__"
+        )
+        try:
+            if is_streaming:
+                parts = []
+                async for sentence in executors.iterate("llm", response[1]):
+                    parts.append(sentence)
+                    shown = re.sub(r"###\w+:\s*.*?(?=###|$)", "", sentence, flags=re.DOTALL).strip()
+                    if shown:
+                        yield _sse("sentence", {"text": shown})
+                full_response = " ".join(parts)
+                await executors.run("llm", brain.save_stream_turn, text, full_response, req.speaker_id)
+            elif response == "":
+                import random
+                full_response = random.choice(["Good.", "Alright.", "Fair.", "Okay.", "Works."])
+            else:
+                full_response = response if response else "Processing error."
+
+            done = await executors.run(
+                "llm", _finalize_response, full_response, req.speaker_id, is_streaming
+            )
+            yield _sse("done", done)
+
+        except Exception as e:
+            _log.error(f"Chat stream error: {e}")
+            yield _sse("error", {"detail": str(e)})
+
+        finally:
+            set_state("thinking", False)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 def _execute_actions(action_list, full_response, speaker_id):
@@ -298,6 +402,7 @@ def _execute_actions(action_list, full_response, speaker_id):
 
                 try:
                     from backend.routes.tasks import _get_conn, _row_to_dict
+                    from seven_utils import changes
                     from datetime import datetime as _dt
 
                     _pri = params.get("priority", "medium").lower()
@@ -317,6 +422,7 @@ def _execute_actions(action_list, full_response, speaker_id):
                         row = conn.execute(
                             "SELECT * FROM tasks WHERE id = ?", (new_id,)
                         ).fetchone()
+                    changes.bump("tasks")
 
                     _task_set("task_results", {
                         "action": "created",
@@ -339,6 +445,7 @@ def _execute_actions(action_list, full_response, speaker_id):
             elif action == "complete":
                 search = params.get("search", "").replace("_", " ")
                 from backend.routes.tasks import db_find_task_by_text, _get_conn
+                from seven_utils import changes
                 from datetime import datetime as _dt
                 found = db_find_task_by_text(search)
                 if found:
@@ -348,6 +455,7 @@ def _execute_actions(action_list, full_response, speaker_id):
                             (_dt.now().isoformat(), found["id"])
                         )
                         conn.commit()
+                    changes.bump("tasks")
                     _task_set("task_results", {
                         "action": "completed",
                         "task_id": found["id"],
@@ -356,11 +464,13 @@ def _execute_actions(action_list, full_response, speaker_id):
             elif action == "delete":
                 search = params.get("search", "").replace("_", " ")
                 from backend.routes.tasks import db_find_task_by_text, _get_conn
+                from seven_utils import changes
                 found = db_find_task_by_text(search)
                 if found:
                     with _get_conn() as conn:
                         conn.execute("DELETE FROM tasks WHERE id = ?", (found["id"],))
                         conn.commit()
+                    changes.bump("tasks")
                     _task_set("task_results", {
                         "action": "deleted",
                         "task_id": found["id"],
@@ -35,6 +35,24 @@ def get_speed():
     stats          = brain_manager.get_latency_stats()
     stats["model"] = config.KEY.get("brain", {}).get("model_name", "unknown")
     stats["streaming"] = config.KEY.get("brain", {}).get("streaming", False)
+    try:
+        from brain_modules.response_cache import get_stats as get_cache_stats
+        stats["response_cache"] = get_cache_stats()
+        stats["response_cache"]["enabled"] = bool(
+            config.KEY.get("brain", {}).get("response_cache", {}).get("enabled", False)
+        )
+    except Exception:
+        stats["response_cache"] = None
+    try:
+        from memory.ingest import get_stats as get_ingest_stats
+        stats["memory_ingest"] = get_ingest_stats()
+    except Exception:
+        stats["memory_ingest"] = None
+    try:
+        from backend.executors import get_stats as get_executor_stats
+        stats["executors"] = get_executor_stats()
+    except Exception:
+        stats["executors"] = None
     return stats
 
 
@@ -8,21 +8,24 @@ Used for monitoring, debugging, and startup validation.
 
 import os
 import time
+import asyncio
 import sqlite3
 from fastapi import APIRouter
 
+from backend import executors
+from seven_utils.db import connect as db_connect, get_stats as db_stats
+
 router = APIRouter()
 
 
 @router.get("/api/health", summary="System health check",
             description="Checks all critical systems in parallel: memory DB, tasks DB, triggers DB, Ollama, disk space, config, schedules. Returns structured JSON. Always returns 200 - check the 'healthy' field and individual check statuses.")
-def health_check():
+async def health_check():
     """
-    Check health of all Seven subsystems in parallel.
+    Check health of all Seven subsystems in parallel on the db pool.
     Returns 200 always - caller reads the individual statuses.
     Response time target: under 200ms.
     """
-    import concurrent.futures
     start = time.time()
 
     check_fns = {
@@ -35,18 +38,14 @@ def health_check():
         "schedules":   _check_schedules,
     }
 
-    checks = {}
-    with concurrent.futures.ThreadPoolExecutor(max_workers=7) as executor:
-        futures = {
-            executor.submit(fn): name
-            for name, fn in check_fns.items()
-        }
-        for future in concurrent.futures.as_completed(futures):
-            name = futures[future]
-            try:
-                checks[name] = future.result(timeout=3)
-            except Exception as e:
-                checks[name] = {"ok": False, "error": str(e)}
+    async def _run(fn):
+        try:
+            return await asyncio.wait_for(executors.run("db", fn), timeout=3)
+        except Exception as e:
+            return {"ok": False, "error": str(e) or type(e).__name__}
+
+    results = await asyncio.gather(*(_run(fn) for fn in check_fns.values()))
+    checks  = dict(zip(check_fns, results))
 
     elapsed_ms = round((time.time() - start) * 1000, 1)
     all_ok = all(c["ok"] for c in checks.values())
@@ -55,6 +54,8 @@ def health_check():
         "healthy":    all_ok,
         "elapsed_ms": elapsed_ms,
         "checks":     checks,
+        "sqlite":     db_stats(),
+        "executors":  executors.get_stats(),
         "version":    _get_version(),
     }
 
@@ -109,9 +110,7 @@ def _check_tasks_db():
         from backend.routes.tasks import TASKS_DB
         if not os.path.exists(TASKS_DB):
             return {"ok": False, "error": "tasks.db not found"}
-        conn = sqlite3.connect(TASKS_DB, timeout=2)
-        count = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
-        conn.close()
+        count = db_connect(TASKS_DB, timeout=2).execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
         return {"ok": True, "task_count": count}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -122,9 +121,9 @@ def _check_triggers_db():
         from backend.routes.triggers import TRIGGERS_DB
         if not os.path.exists(TRIGGERS_DB):
             return {"ok": False, "error": "triggers.db not found"}
-        conn = sqlite3.connect(TRIGGERS_DB, timeout=2)
-        count = conn.execute("SELECT COUNT(*) FROM triggers WHERE enabled=1").fetchone()[0]
-        conn.close()
+        count = db_connect(TRIGGERS_DB, timeout=2).execute(
+            "SELECT COUNT(*) FROM triggers WHERE enabled=1"
+        ).fetchone()[0]
         return {"ok": True, "active_triggers": count}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -238,9 +237,10 @@ def production_health():
     # 7778  = Panel server
     # 7779  = Panel host cmd
     # 7891  = Overlay IPC
+    # 7892  = Whisper service (ears/whisper_service.py)
     # 11434 = Ollama
     # 8888  = Admin dashboard
-    for port in [7777, 7778, 7779, 7891, 11434, 8888]:
+    for port in [7777, 7778, 7779, 7891, 7892, 11434, 8888]:
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.settimeout(1)
@@ -142,15 +142,13 @@ def get_plan_usage():
 
     try:
         from memory import seven_memory
-        all_facts   = seven_memory.user_facts.get()
-        facts_count = len(all_facts["documents"]) if all_facts and all_facts.get("documents") else 0
+        facts_count = seven_memory.count_facts()
     except Exception:
         facts_count = 0
 
     try:
         from memory import seven_memory
-        all_convos  = seven_memory.conversations.get()
-        convo_count = len(all_convos["documents"]) if all_convos and all_convos.get("documents") else 0
+        convo_count = seven_memory.count_conversations()
     except Exception:
         convo_count = 0
 
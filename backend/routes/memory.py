@@ -1,6 +1,10 @@
 """
 backend/routes/memory.py
 Handles: all /api/memory/* endpoints
+
+The read, write and export routes are async: ChromaDB and SQLite work runs
+on the db pool, anything that embeds text on the embedding pool
+(backend/executors.py), so a big export never holds up /api/status.
 """
 
 from fastapi import APIRouter, HTTPException, Request
@@ -8,14 +12,20 @@ import os
 import datetime
 import logging
 
+from backend import executors
+
 _log = logging.getLogger('seven.memory')
 
 router = APIRouter()
 
 
 @router.post("/api/memory/facts")
-def add_manual_fact(data: dict):
+async def add_manual_fact(data: dict):
     """Manually add a fact. Enforces plan limit."""
+    return await executors.run("embedding", _add_manual_fact, data)
+
+
+def _add_manual_fact(data: dict):
     from memory import seven_memory
     from backend.api_server import check_limit, plan_limit_error
 
@@ -26,8 +36,7 @@ def add_manual_fact(data: dict):
         raise HTTPException(status_code=400, detail="Empty fact text")
 
     try:
-        all_facts     = seven_memory.user_facts.get()
-        current_count = len(all_facts["documents"]) if all_facts and all_facts.get("documents") else 0
+        current_count = seven_memory.count_facts()
     except Exception:
         current_count = 0
 
@@ -51,9 +60,12 @@ def add_manual_fact(data: dict):
 
 
 @router.get("/api/memory/facts")
-def get_facts():
+async def get_facts():
     """Get all stored facts."""
+    return await executors.run("db", _get_facts)
 
+
+def _get_facts():
     # Try via ChromaDB singleton first
     try:
         from memory import seven_memory
@@ -140,104 +152,128 @@ def get_facts():
 
 
 @router.delete("/api/memory/facts/{fact_id}")
-def delete_fact(fact_id: str):
+async def delete_fact(fact_id: str):
     """Delete a specific fact."""
+    return await executors.run("db", _delete_fact, fact_id)
+
+
+def _delete_fact(fact_id: str):
     from memory import seven_memory
     try:
-        seven_memory.user_facts.delete(ids=[fact_id])
+        seven_memory.delete_facts([fact_id])
         return {"success": True, "deleted": fact_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/memory/conversations", summary="Get conversation history",
-            description="Returns paginated conversation history from ChromaDB. Falls back to direct SQLite read if ChromaDB singleton fails (numpy/tensorflow conflict). Each record includes user_input, seven_response, timestamp, source (chat or voice).")
-def get_conversations(limit: int = 500, offset: int = 0):
+            description="Returns conversation history, newest first, one page at a time from a sidecar index (keyset pagination: pass next_cursor back as cursor). offset still works for older clients. Optional speaker/source filters. Falls back to direct SQLite read if ChromaDB singleton fails (numpy/tensorflow conflict). Each record includes user_input, seven_response, timestamp, source (chat or voice).")
+async def get_conversations(limit: int = 500, offset: int = 0, cursor: str = None,
+                            speaker: str = None, source: str = None):
     """Get stored conversations (paginated)."""
+    limit = max(1, min(int(limit), 1000))
+    return await executors.run("db", _get_conversations, limit, offset, cursor, speaker, source)
 
+
+def _get_conversations(limit, offset, cursor, speaker, source):
     # Try via ChromaDB singleton first
     try:
         from memory import seven_memory
-        all_convos = seven_memory.conversations.get()
-        if not all_convos or not all_convos['documents']:
-            return {"conversations": [], "total": 0}
-
-        convos = []
-        for i in range(len(all_convos['documents'])):
-            convos.append({
-                "id":             all_convos['ids'][i],
-                "text":           all_convos['documents'][i],
-                "timestamp":      all_convos['metadatas'][i].get("timestamp", ""),
-                "user_input":     all_convos['metadatas'][i].get("user_input", ""),
-                "seven_response": all_convos['metadatas'][i].get("seven_response", ""),
-                "speaker":        all_convos['metadatas'][i].get("user_id", "default"),
-                "source":         all_convos['metadatas'][i].get("source", "chat"),
-            })
-
-        convos.sort(key=lambda x: x["timestamp"], reverse=True)
-        total     = len(convos)
-        paginated = convos[offset:offset + limit]
-        return {"conversations": paginated, "total": total}
+        return seven_memory.list_conversations(
+            limit=limit, cursor=cursor, offset=offset, speaker=speaker, source=source
+        )
 
     except Exception as _chroma_err:
         _log.debug(f"[API] Conversations via ChromaDB using fallback: {type(_chroma_err).__name__}")
 
-    # Fallback: read directly from SQLite without embedding model
+    # Fallback: read directly from SQLite without embedding model.
+    # Same keyset paging, done on chroma's own tables: one query for the
+    # page, one for its metadata, one for its documents.
     try:
         import sqlite3 as _sq
         from memory.core import MEMORY_DIR as _mdir
+        from memory.conversation_index import encode_cursor, decode_cursor
 
+        _empty = {"conversations": [], "total": 0, "next_cursor": None}
         _db = os.path.join(_mdir, "chroma.sqlite3")
         if not os.path.exists(_db):
-            return {"conversations": [], "total": 0}
+            return _empty
 
         _conn = _sq.connect(_db, timeout=5)
-
-        # Get conversations collection ID
-        _conv_row = _conn.execute(
-            "SELECT id FROM collections WHERE name = 'conversations'"
-        ).fetchone()
-        if not _conv_row:
-            _conn.close()
-            return {"conversations": [], "total": 0}
-        _conv_col_id = _conv_row[0]
-
-        # Get segment IDs that belong to conversations collection
-        # metadata segments have scope = METADATA
-        _seg_rows = _conn.execute(
-            "SELECT id FROM segments WHERE collection = ? AND scope = 'METADATA'",
-            (_conv_col_id,)
-        ).fetchall()
-        _seg_ids = [r[0] for r in _seg_rows]
-
-        if not _seg_ids:
+        try:
+            # Get conversations collection ID
+            _conv_row = _conn.execute(
+                "SELECT id FROM collections WHERE name = 'conversations'"
+            ).fetchone()
+            if not _conv_row:
+                return _empty
+            _conv_col_id = _conv_row[0]
+
+            # Get segment IDs that belong to conversations collection
+            # metadata segments have scope = METADATA
+            _seg_ids = [r[0] for r in _conn.execute(
+                "SELECT id FROM segments WHERE collection = ? AND scope = 'METADATA'",
+                (_conv_col_id,)
+            ).fetchall()]
+            if not _seg_ids:
+                return _empty
+
+            _from = (
+                "FROM embeddings e "
+                "LEFT JOIN embedding_metadata ts ON ts.id = e.id AND ts.key = 'timestamp' "
+                "LEFT JOIN embedding_metadata sp ON sp.id = e.id AND sp.key = 'user_id' "
+                "LEFT JOIN embedding_metadata so ON so.id = e.id AND so.key = 'source' "
+                f"WHERE e.segment_id IN ({','.join('?' * len(_seg_ids))})"
+            )
+            _params = list(_seg_ids)
+            if speaker:
+                _from += " AND COALESCE(sp.string_value, 'default') = ?"
+                _params.append(speaker)
+            if source:
+                _from += " AND COALESCE(so.string_value, 'chat') = ?"
+                _params.append(source)
+            total = _conn.execute(f"SELECT COUNT(*) {_from}", _params).fetchone()[0]
+
+            _sql = f"SELECT e.id, e.embedding_id, COALESCE(ts.string_value, '') AS t {_from}"
+            _page_params = list(_params)
+            if cursor:
+                _ts, _cid = decode_cursor(cursor)
+                _sql += " AND (t < ? OR (t = ? AND e.embedding_id < ?))"
+                _page_params += [_ts, _ts, _cid]
+            _sql += " ORDER BY t DESC, e.embedding_id DESC LIMIT ?"
+            _page_params.append(limit + 1)
+            if offset and not cursor:
+                _sql += " OFFSET ?"
+                _page_params.append(int(offset))
+            _rows = _conn.execute(_sql, _page_params).fetchall()
+
+            next_cursor = None
+            if len(_rows) > limit:
+                _rows = _rows[:limit]
+                next_cursor = encode_cursor(_rows[-1][2], _rows[-1][1])
+
+            _row_ids = [r[0] for r in _rows]
+            _in = ",".join("?" * len(_row_ids))
+            metas, docs = {}, {}
+            if _row_ids:
+                for _id, _key, _val in _conn.execute(
+                    f"SELECT id, key, string_value FROM embedding_metadata WHERE id IN ({_in})",
+                    _row_ids
+                ):
+                    metas.setdefault(_id, {})[_key] = _val
+                docs = dict(_conn.execute(
+                    f"SELECT rowid, c0 FROM embedding_fulltext_search_content WHERE rowid IN ({_in})",
+                    _row_ids
+                ).fetchall())
+        finally:
             _conn.close()
-            return {"conversations": [], "total": 0}
-
-        # Get all embeddings in those segments
-        _placeholders = ",".join("?" * len(_seg_ids))
-        _emb_rows = _conn.execute(
-            f"SELECT id, embedding_id FROM embeddings WHERE segment_id IN ({_placeholders})",
-            _seg_ids
-        ).fetchall()
 
         convos = []
-        for _emb_id, _emb_uuid in _emb_rows:
-            _meta_rows = _conn.execute(
-                "SELECT key, string_value FROM embedding_metadata WHERE id = ?",
-                (_emb_id,)
-            ).fetchall()
-            meta = {row[0]: row[1] for row in _meta_rows}
-
-            _doc_row = _conn.execute(
-                "SELECT c0 FROM embedding_fulltext_search_content WHERE rowid = ?",
-                (_emb_id,)
-            ).fetchone()
-            doc_text = _doc_row[0] if _doc_row else ""
-
+        for _emb_id, _emb_uuid, _ts in _rows:
+            meta = metas.get(_emb_id, {})
             convos.append({
                 "id":             _emb_uuid,
-                "text":           doc_text,
+                "text":           docs.get(_emb_id) or "",
                 "timestamp":      meta.get("timestamp", ""),
                 "user_input":     meta.get("user_input", ""),
                 "seven_response": meta.get("seven_response", ""),
@@ -245,12 +281,8 @@ def get_conversations(limit: int = 500, offset: int = 0):
                 "source":         meta.get("source", "chat"),
             })
 
-        _conn.close()
-        convos.sort(key=lambda x: x["timestamp"], reverse=True)
-        total     = len(convos)
-        paginated = convos[offset:offset + limit]
-        _log.debug(f"[API] Conversations via SQLite fallback: {total} records")
-        return {"conversations": paginated, "total": total}
+        _log.debug(f"[API] Conversations via SQLite fallback: {len(convos)} of {total} records")
+        return {"conversations": convos, "total": total, "next_cursor": next_cursor}
 
     except Exception as _sq_err:
         _log.warning(f"[API] Conversations SQLite fallback failed: {_sq_err}")
@@ -258,191 +290,44 @@ def get_conversations(limit: int = 500, offset: int = 0):
 
 
 @router.delete("/api/memory/conversations/{conv_id}")
-def delete_conversation(conv_id: str):
+async def delete_conversation(conv_id: str):
     """Delete a specific conversation."""
+    return await executors.run("db", _delete_conversation, conv_id)
+
+
+def _delete_conversation(conv_id: str):
     from memory import seven_memory
     try:
-        seven_memory.conversations.delete(ids=[conv_id])
+        seven_memory.delete_conversations([conv_id])
         return {"success": True, "deleted": conv_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/api/memory/export")
-def export_memory():
+async def export_memory(format: str = "json"):
     """
-    Export ALL user data as JSON for backup.
+    Export ALL user data for backup, streamed — never built in memory.
     Includes: facts, conversations, schedules, tasks, triggers, workspaces.
+        format=json     one JSON object (the classic backup file)
+        format=ndjson   one {"section": ..., "data": ...} record per line
+    Each chunk is produced on the db pool.
     """
-    import sqlite3
-    import json
-    import config as cfg
-    from memory.core import MEMORY_DIR
-
-    export = {
-        "exported_at": datetime.datetime.now().isoformat(),
-        "version":     "1.3.1",
-        "identity": {
-            "name":  cfg.KEY.get("identity", {}).get("user_name", ""),
-            "email": cfg.KEY.get("email", ""),
-        },
-        "facts":         [],
-        "conversations": [],
-        "schedules":     [],
-        "tasks":         [],
-        "triggers":      [],
-        "workspaces":    [],
-        "usage":         {}
-    }
-
-    # 1. Facts
-    try:
-        from memory import seven_memory
-        all_facts = seven_memory.user_facts.get()
-        if all_facts and all_facts.get('documents'):
-            for i, doc in enumerate(all_facts['documents']):
-                meta = all_facts['metadatas'][i] if all_facts.get('metadatas') else {}
-                export["facts"].append({
-                    "text":      doc,
-                    "category":  meta.get("category", "general"),
-                    "timestamp": meta.get("timestamp", "")
-                })
-    except Exception as e:
-        export["facts_error"] = str(e)
-
-    # 2. Conversations
-    try:
-        from memory import seven_memory
-        all_convos = seven_memory.conversations.get()
-        if all_convos and all_convos.get('documents'):
-            for i, doc in enumerate(all_convos['documents']):
-                meta = all_convos['metadatas'][i] if all_convos.get('metadatas') else {}
-                user_input     = meta.get("user_input", "")
-                seven_response = meta.get("seven_response", doc)
-                if user_input and seven_response:
-                    export["conversations"].append({
-                        "user":      user_input,
-                        "seven":     seven_response,
-                        "timestamp": meta.get("timestamp", "")
-                    })
-    except Exception:
-        try:
-            import sqlite3 as _sq
-            _db = os.path.join(MEMORY_DIR, "chroma.sqlite3")
-            if os.path.exists(_db):
-                _conn = _sq.connect(_db, timeout=5)
-                _conv_row = _conn.execute(
-                    "SELECT id FROM collections WHERE name = 'conversations'"
-                ).fetchone()
-                if _conv_row:
-                    _seg_ids = [r[0] for r in _conn.execute(
-                        "SELECT id FROM segments WHERE collection = ? AND scope = 'METADATA'",
-                        (_conv_row[0],)
-                    ).fetchall()]
-                    if _seg_ids:
-                        _ph = ",".join("?" * len(_seg_ids))
-                        _emb_rows = _conn.execute(
-                            f"SELECT id FROM embeddings WHERE segment_id IN ({_ph})",
-                            _seg_ids
-                        ).fetchall()
-                        for (_emb_id,) in _emb_rows:
-                            _meta = {
-                                r[0]: r[1] for r in _conn.execute(
-                                    "SELECT key, string_value FROM embedding_metadata WHERE id=?",
-                                    (_emb_id,)
-                                ).fetchall()
-                            }
-                            user_in  = _meta.get("user_input", "")
-                            seven_r  = _meta.get("seven_response", "")
-                            if user_in and seven_r:
-                                export["conversations"].append({
-                                    "user":      user_in,
-                                    "seven":     seven_r,
-                                    "timestamp": _meta.get("timestamp", "")
-                                })
-                _conn.close()
-        except Exception as _se:
-            export["conversations_error"] = str(_se)
-
-    # 3. Schedules
-    try:
-        _appdata = os.environ.get('APPDATA', '')
-        _sched_path = os.path.join(_appdata, 'SEVEN', 'schedules.json')
-        if os.path.exists(_sched_path):
-            with open(_sched_path, 'r', encoding='utf-8') as _f:
-                export["schedules"] = json.load(_f) if _f else []
-    except Exception as _e:
-        export["schedules_error"] = str(_e)
-
-    # 4. Tasks
-    try:
-        from backend.routes.tasks import TASKS_DB, _get_conn, _row_to_dict as _task_row
-        if os.path.exists(TASKS_DB):
-            with _get_conn() as conn:
-                rows = conn.execute("SELECT * FROM tasks ORDER BY id ASC").fetchall()
-                export["tasks"] = [_task_row(r) for r in rows]
-    except Exception as _e:
-        export["tasks_error"] = str(_e)
-
-    # 5. Triggers
-    try:
-        from backend.routes.triggers import TRIGGERS_DB
-        if os.path.exists(TRIGGERS_DB):
-            conn = sqlite3.connect(TRIGGERS_DB, timeout=5)
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("SELECT * FROM triggers ORDER BY id ASC").fetchall()
-            for row in rows:
-                d = dict(row)
-                d["enabled"] = bool(d.get("enabled", 1))
-                d["silent"]  = bool(d.get("silent", 0))
-                try:
-                    d["action_data"] = json.loads(d.get("action_data") or "{}")
-                except Exception:
-                    d["action_data"] = {}
-                export["triggers"].append(d)
-            conn.close()
-    except Exception as _e:
-        export["triggers_error"] = str(_e)
-
-    # 6. Workspaces
-    try:
-        from backend.routes.triggers import TRIGGERS_DB
-        if os.path.exists(TRIGGERS_DB):
-            conn = sqlite3.connect(TRIGGERS_DB, timeout=5)
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("SELECT * FROM workspaces ORDER BY id ASC").fetchall()
-            for row in rows:
-                d = dict(row)
-                try:
-                    d["apps"] = json.loads(d.get("apps") or "[]")
-                except Exception:
-                    d["apps"] = []
-                export["workspaces"].append(d)
-            conn.close()
-    except Exception as _e:
-        export["workspaces_error"] = str(_e)
-
-    # 7. Telemetry / Usage
-    try:
-        db_path = os.path.join(
-            os.environ.get("APPDATA", ""), "SEVEN", "data", "telemetry.db"
+    from fastapi.responses import StreamingResponse
+    from backend import memory_backup
+
+    stamp = datetime.datetime.now().strftime("%Y-%m-%d")
+    if format == "ndjson":
+        return StreamingResponse(
+            executors.iterate("db", memory_backup.stream_ndjson()),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": f'attachment; filename="seven-backup-{stamp}.ndjson"'},
         )
-        if os.path.exists(db_path):
-            conn = sqlite3.connect(db_path)
-            c    = conn.cursor()
-            c.execute("SELECT active_hours, last_seen FROM stats LIMIT 1")
-            row = c.fetchone()
-            if row:
-                mins = int((row[0] or 0) * 60)
-                export["usage"] = {
-                    "total_minutes": mins,
-                    "last_seen":     row[1]
-                }
-            conn.close()
-    except Exception:
-        pass
-
-    return export
+    return StreamingResponse(
+        executors.iterate("db", memory_backup.stream_json()),
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="seven-backup-{stamp}.json"'},
+    )
 
 @router.delete("/api/memory/clear", summary="Clear all facts and conversations",
                description="Permanently deletes all stored facts and conversation history from ChromaDB and resets brain session state.")
@@ -465,274 +350,47 @@ def clear_all_memory():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _wait_for_memory(timeout: float = 10):
+    """Ensure ChromaDB memory system is ready. None if it does not come up."""
+    import time as _t
+    _deadline = _t.time() + timeout
+    while _t.time() < _deadline:
+        try:
+            from memory import seven_memory as _sm
+            if _sm is not None:
+                _sm.user_facts.count()
+                return _sm
+        except Exception:
+            pass
+        _t.sleep(0.3)
+    return None
+
+
 @router.post("/api/memory/import")
 async def import_memory(request: Request):
-    """Import ALL user data from backup JSON. Auto-patches DB schema on the fly."""
-    try:
-        import json
-        import sqlite3
-        import uuid
-        import datetime
-
-        data = await request.json()
-
-        # Ensure ChromaDB memory system is ready
-        import time as _t
-        _deadline = _t.time() + 10
-        seven_memory = None
-        while _t.time() < _deadline:
-            try:
-                from memory import seven_memory as _sm
-                if _sm is not None:
-                    _sm.user_facts.count()
-                    seven_memory = _sm
-                    break
-            except Exception:
-                pass
-            _t.sleep(0.3)
-
-        imported = {
-            "facts": 0, "conversations": 0, "schedules": 0,
-            "tasks": 0, "triggers": 0, "workspaces": 0
-        }
+    """
+    Import ALL user data from a backup, parsed as the body streams in.
+    Accepts the JSON backup or NDJSON export. Records are written in
+    batches (one embedding pass per batch). Auto-patches DB schema on the fly.
+    """
+    from backend.memory_backup import BackupReader, BackupImporter
 
-        # ── 1. FACTS ──
-        raw_facts = data.get("facts") or data.get("user_facts") or []
-        if seven_memory and isinstance(raw_facts, list):
-            for item in raw_facts:
-                text = ""
-                cat = "imported"
-                if isinstance(item, str):
-                    text = item.strip()
-                elif isinstance(item, dict):
-                    text = (item.get("text") or item.get("fact") or item.get("document") or "").strip()
-                    cat = item.get("category", "imported")
-                if text:
-                    try:
-                        seven_memory.user_facts.add(
-                            documents=[text],
-                            metadatas=[{
-                                "category":  cat,
-                                "timestamp": item.get("timestamp") or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "user_id":   "default",
-                                "type":      "fact"
-                            }],
-                            ids=[f"fact_import_{uuid.uuid4().hex}"]
-                        )
-                        imported["facts"] += 1
-                    except Exception as e:
-                        print(f"[IMPORT] Fact import error: {e}")
-
-        # ── 2. CONVERSATIONS ──
-        raw_convos = data.get("conversations") or data.get("history") or []
-        if seven_memory and isinstance(raw_convos, list):
-            for item in raw_convos:
-                user_txt = ""
-                seven_txt = ""
-                if isinstance(item, dict):
-                    user_txt = (item.get("user") or item.get("user_input") or item.get("prompt") or item.get("input") or "").strip()
-                    seven_txt = (item.get("seven") or item.get("seven_response") or item.get("response") or item.get("output") or "").strip()
-                if user_txt and seven_txt:
-                    try:
-                        combined = f"User said: {user_txt} | Seven replied: {seven_txt}"
-                        seven_memory.conversations.add(
-                            documents=[combined],
-                            metadatas=[{
-                                "user_input": user_txt,
-                                "seven_response": seven_txt,
-                                "timestamp": item.get("timestamp") or datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                                "user_id": item.get("speaker") or "default",
-                                "type": "conversation",
-                                "source": item.get("source") or "import"
-                            }],
-                            ids=[f"conv_import_{uuid.uuid4().hex}"]
-                        )
-                        imported["conversations"] += 1
-                    except Exception as e:
-                        print(f"[IMPORT] Convo import error: {e}")
-
-        # ── 3. SCHEDULES ──
-        raw_scheds = data.get("schedules") or data.get("reminders") or []
-        if isinstance(raw_scheds, list) and raw_scheds:
-            try:
-                _appdata = os.environ.get('APPDATA', '')
-                _sched_path = os.path.join(_appdata, 'SEVEN', 'schedules.json')
-                os.makedirs(os.path.dirname(_sched_path), exist_ok=True)
-                _existing = []
-                if os.path.exists(_sched_path):
-                    try:
-                        with open(_sched_path, 'r', encoding='utf-8') as _f:
-                            _existing = json.load(_f)
-                    except Exception:
-                        _existing = []
-
-                _existing_ids = {s.get('id') for s in _existing if isinstance(s, dict)}
-                _max_id = max([_id for _id in _existing_ids if isinstance(_id, int)] or [0])
-
-                for item in raw_scheds:
-                    if isinstance(item, dict) and item.get("message"):
-                        _max_id += 1
-                        item["id"] = _max_id
-                        _existing.append(item)
-                        imported["schedules"] += 1
-
-                with open(_sched_path, 'w', encoding='utf-8') as _f:
-                    json.dump(_existing, _f, indent=2)
-            except Exception as e:
-                print(f"[IMPORT] Schedules error: {e}")
-
-        # Helper to dynamically patch missing schema columns
-        def _ensure_column(conn, table, column, definition):
-            try:
-                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
-                print(f"[IMPORT] Patched schema: Added {column} to {table}")
-            except Exception:
-                pass  # Column already exists
-
-        # ── 4. TASKS ──
-        raw_tasks = data.get("tasks") or data.get("todos") or []
-        if isinstance(raw_tasks, list) and raw_tasks:
-            try:
-                from backend.routes.tasks import TASKS_DB, init_db as init_tasks_db
-                init_tasks_db()
-                if os.path.exists(TASKS_DB):
-                    conn = sqlite3.connect(TASKS_DB, timeout=10)
-                    conn.execute("PRAGMA journal_mode=WAL")
-                    
-                    # Auto-patch missing columns for older databases
-                    _ensure_column(conn, "tasks", "description", "TEXT")
-                    _ensure_column(conn, "tasks", "subtasks", "TEXT DEFAULT '[]'")
-                    _ensure_column(conn, "tasks", "tags", "TEXT")
-
-                    for item in raw_tasks:
-                        if isinstance(item, dict) and item.get("text"):
-                            try:
-                                subtasks_data = item.get("subtasks") or []
-                                subtasks_str = json.dumps(subtasks_data if isinstance(subtasks_data, list) else [])
-                                tags_raw = item.get("tags")
-                                tags_str = ",".join(tags_raw) if isinstance(tags_raw, list) else (tags_raw or "")
-                                conn.execute(
-                                    "INSERT INTO tasks (text, due_date, due_time, priority, "
-                                    "completed, created_at, completed_at, tags, description, subtasks) "
-                                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                                    (
-                                        str(item.get("text", "")).strip(),
-                                        item.get("due_date"),
-                                        item.get("due_time"),
-                                        item.get("priority", "medium"),
-                                        1 if item.get("completed") else 0,
-                                        item.get("created_at") or datetime.datetime.now().isoformat(),
-                                        item.get("completed_at"),
-                                        tags_str,
-                                        item.get("description"),
-                                        subtasks_str
-                                    )
-                                )
-                                imported["tasks"] += 1
-                            except Exception as te:
-                                print(f"[IMPORT] Single task error: {te}")
-                    conn.commit()
-                    conn.close()
-            except Exception as e:
-                print(f"[IMPORT] Tasks error: {e}")
-
-        # ── 5. TRIGGERS ──
-        raw_trigs = data.get("triggers") or []
-        if isinstance(raw_trigs, list) and raw_trigs:
-            try:
-                from backend.routes.triggers import TRIGGERS_DB, init_db as init_trig_db
-                init_trig_db()
-                if os.path.exists(TRIGGERS_DB):
-                    conn = sqlite3.connect(TRIGGERS_DB, timeout=10)
-                    conn.execute("PRAGMA journal_mode=WAL")
-                    
-                    # Auto-patch missing columns for older databases
-                    _ensure_column(conn, "triggers", "audio_pattern", "TEXT")
-                    _ensure_column(conn, "triggers", "silent", "INTEGER DEFAULT 0")
-                    _ensure_column(conn, "triggers", "icon", "TEXT")
-                    _ensure_column(conn, "triggers", "last_fired", "TEXT")
-                    _ensure_column(conn, "triggers", "fire_count", "INTEGER DEFAULT 0")
-
-                    now_iso = datetime.datetime.now().isoformat()
-                    for item in raw_trigs:
-                        if isinstance(item, dict) and item.get("name") and item.get("action_type"):
-                            try:
-                                action_data = item.get("action_data") or {}
-                                action_data_str = json.dumps(action_data if isinstance(action_data, dict) else {})
-                                conn.execute(
-                                    "INSERT INTO triggers (name, action_type, action_data, hotkey, "
-                                    "voice_phrase, audio_pattern, enabled, silent, icon, created_at, updated_at) "
-                                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                                    (
-                                        str(item.get("name", "")).strip(),
-                                        str(item.get("action_type")),
-                                        action_data_str,
-                                        item.get("hotkey"),
-                                        item.get("voice_phrase"),
-                                        item.get("audio_pattern"),
-                                        1 if item.get("enabled", True) else 0,
-                                        1 if item.get("silent", False) else 0,
-                                        item.get("icon"),
-                                        item.get("created_at", now_iso),
-                                        item.get("updated_at", now_iso)
-                                    )
-                                )
-                                imported["triggers"] += 1
-                            except Exception as tre:
-                                print(f"[IMPORT] Single trigger error: {tre}")
-                    conn.commit()
-                    conn.close()
-                    try:
-                        from backend.routes.triggers import _signal_daemon_reload
-                        _signal_daemon_reload()
-                    except Exception:
-                        pass
-            except Exception as e:
-                print(f"[IMPORT] Triggers error: {e}")
-
-        # ── 6. WORKSPACES ──
-        raw_ws = data.get("workspaces") or []
-        if isinstance(raw_ws, list) and raw_ws:
-            try:
-                from backend.routes.triggers import TRIGGERS_DB, init_db as init_trig_db
-                init_trig_db()
-                if os.path.exists(TRIGGERS_DB):
-                    conn = sqlite3.connect(TRIGGERS_DB, timeout=10)
-                    conn.execute("PRAGMA journal_mode=WAL")
-                    
-                    # Auto-patch missing columns for older databases
-                    _ensure_column(conn, "workspaces", "description", "TEXT")
-                    _ensure_column(conn, "workspaces", "icon", "TEXT")
-                    _ensure_column(conn, "workspaces", "last_used", "TEXT")
-                    _ensure_column(conn, "workspaces", "use_count", "INTEGER DEFAULT 0")
-
-                    now_iso = datetime.datetime.now().isoformat()
-                    for item in raw_ws:
-                        if isinstance(item, dict) and item.get("name"):
-                            try:
-                                apps_data = item.get("apps") or []
-                                apps_str = json.dumps(apps_data if isinstance(apps_data, list) else [])
-                                conn.execute(
-                                    "INSERT INTO workspaces (name, description, apps, icon, created_at, updated_at) "
-                                    "VALUES (?, ?, ?, ?, ?, ?)",
-                                    (
-                                        str(item.get("name", "")).strip(),
-                                        item.get("description"),
-                                        apps_str,
-                                        item.get("icon"),
-                                        item.get("created_at", now_iso),
-                                        item.get("updated_at", now_iso)
-                                    )
-                                )
-                                imported["workspaces"] += 1
-                            except Exception as wse:
-                                print(f"[IMPORT] Single workspace error: {wse}")
-                    conn.commit()
-                    conn.close()
-            except Exception as e:
-                print(f"[IMPORT] Workspaces error: {e}")
-
-        total = sum(imported.values())
+    try:
+        seven_memory = await executors.run("db", _wait_for_memory)
+        reader   = BackupReader()
+        importer = BackupImporter(seven_memory)
+
+        async for chunk in request.stream():
+            batch_ready = False
+            for section, item in reader.feed(chunk):
+                batch_ready |= importer.add(section, item)
+            if batch_ready:
+                await executors.run("embedding", importer.flush)
+        for section, item in reader.close():
+            importer.add(section, item)
+        result = await executors.run("embedding", importer.finish)
+
+        imported = result["imported"]
         return {
             "success": True,
             "imported_facts":         imported["facts"],
@@ -741,13 +399,16 @@ async def import_memory(request: Request):
             "imported_tasks":         imported["tasks"],
             "imported_triggers":      imported["triggers"],
             "imported_workspaces":    imported["workspaces"],
-            "message": f"Imported {total} items: "
+            "elapsed_s":              result["elapsed_s"],
+            "records_per_s":          result["records_per_s"],
+            "message": f"Imported {result['total']} items: "
                        f"{imported['facts']} facts, "
                        f"{imported['conversations']} convos, "
                        f"{imported['schedules']} schedules, "
                        f"{imported['tasks']} tasks, "
                        f"{imported['triggers']} triggers, "
-                       f"{imported['workspaces']} workspaces"
+                       f"{imported['workspaces']} workspaces "
+                       f"({result['records_per_s']:.0f} records/s)"
         }
     except Exception as e:
         import traceback
@@ -757,8 +418,12 @@ async def import_memory(request: Request):
 
 @router.get("/api/memory/stats", summary="Memory statistics",
             description="Returns count of stored conversations and facts, storage size in MB, and current license tier. Uses SQLite fallback if ChromaDB unavailable.")
-def get_memory_stats():
+async def get_memory_stats():
     """Get memory statistics including storage size."""
+    return await executors.run("db", _get_memory_stats)
+
+
+def _get_memory_stats():
     stats = {"total_conversations": 0, "total_facts": 0, "storage_path": ""}
 
     # Try live ChromaDB count via singleton first
@@ -820,4 +485,25 @@ def get_memory_stats():
         _log.debug(f"Tier read failed, defaulting to free: {_e}")
         stats["tier"] = "free"
 
-    return stats
\ No newline at end of file
+    return stats
+
+@router.get("/api/memory/retention", summary="Conversation retention status",
+            description="Hot conversation count, archived turns and archive size, rollup totals, deletions since the last index compaction, last run times and the retention settings (config.json -> memory.retention).")
+def get_retention_status():
+    """Retention tiers: what is hot, archived, and when it last ran."""
+    from memory import retention
+    try:
+        return retention.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/api/memory/retention/run", summary="Run a retention pass now",
+             description="Rolls up and archives turns older than hot_days, then compacts the vector index if enough records were removed. force=true ignores min_conversations and compacts after any deletion.")
+def run_retention(force: bool = False):
+    """Run one retention pass on demand."""
+    from memory import retention
+    try:
+        return retention.run_now(force=force)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
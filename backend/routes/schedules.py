@@ -3,13 +3,15 @@ backend/routes/schedules.py
 Handles: /api/schedules/*, /api/schedule/alert/*, /api/system/battery-alert
 """
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 from typing import Optional
 import os
 import json as _json_alert
 import logging
 
+from backend.routes.changes import conditional
+
 _log = logging.getLogger('seven.schedules')
 
 router = APIRouter()
@@ -71,8 +73,11 @@ def dismiss_schedule_alert_sync():
 # ── Endpoints ──
 
 @router.get("/api/schedules")
-def get_schedules():
+def get_schedules(request: Request, response: Response):
     """Get all schedules."""
+    cached = conditional(request, response, "schedules")
+    if cached:
+        return cached
     import hands.scheduler as scheduler_mod
     return scheduler_mod.get_all_schedules()
 
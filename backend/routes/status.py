@@ -16,8 +16,12 @@ router = APIRouter()
 
 
 @router.get("/api/status")
-def get_status():
-    """Get current Seven system status. Bulletproof — never 500s."""
+async def get_status():
+    """
+    Get current Seven system status. Bulletproof — never 500s.
+    Everything here is in memory, so it answers on the event loop and never
+    waits behind a busy chat or export (backend/executors.py).
+    """
     # Import here to avoid circular import
     from backend.api_server import _state, _start_time
 
@@ -56,6 +60,7 @@ def get_status():
             "speaking":       _state.get("speaking",   False),
             "thinking":       _state.get("thinking",   False),
             "user_text":      _state.get("user_text",  ""),
+            "partial_text":   _state.get("partial_text", ""),
             "seven_text":     _state.get("seven_text", ""),
             "mood":           mood_label,
             "mood_value":     mood_value,
@@ -97,7 +102,7 @@ def interrupt_speech():
     
 
 @router.get("/api/version")
-def get_version():
+async def get_version():
     """Get version info."""
     import config
     return {
@@ -120,6 +125,7 @@ async def status_websocket(websocket: WebSocket):
                 "thinking":   _state.get("thinking",   False),
                 "speaking":   _state.get("speaking",   False),
                 "user_text":  _state.get("user_text",  ""),
+                "partial_text": _state.get("partial_text", ""),
                 "seven_text": _state.get("seven_text", ""),
             })
             await asyncio.sleep(0.3)
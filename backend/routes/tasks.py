@@ -5,13 +5,25 @@ Task System with subtasks and detailed descriptions.
 
 import sqlite3
 import os
+import re
 import json
+import difflib
 from datetime import datetime, date
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from colorama import Fore
 
+from seven_utils.db import connect as db_connect
+from seven_utils import changes
+from backend import executors
+from backend.routes.changes import conditional
+
+try:
+    from rapidfuzz import fuzz as _rfuzz
+except ImportError:
+    _rfuzz = None
+
 try:
     from seven_paths import paths as _paths
     _SEVEN_DATA = _paths._seven_data
@@ -24,6 +36,9 @@ os.makedirs(_SEVEN_DATA, exist_ok=True)
 TASKS_DB = os.path.join(_SEVEN_DATA, "tasks.db")
 print(Fore.GREEN + f"[TASKS] DB: {TASKS_DB}")
 
+# The panel server writes tasks.db from its own process
+changes.watch_db("tasks", TASKS_DB)
+
 router = APIRouter()
 
 
@@ -55,11 +70,56 @@ class TaskUpdate(BaseModel):
 
 
 def _get_conn():
-    conn = sqlite3.connect(TASKS_DB, timeout=10)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    return conn
+    """This thread's pooled connection (WAL, foreign keys on)."""
+    return db_connect(TASKS_DB, row_factory=sqlite3.Row, foreign_keys=True)
+
+
+# Full-text index over text / description / tags for db_find_task_by_text.
+# External content: the words live in the index, the rows stay in tasks.
+# The triggers keep it in sync for every writer (API, voice, panel server).
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    text, description, tags,
+    content='tasks', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, text, description, tags)
+    VALUES (new.id, new.text, new.description, new.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, text, description, tags)
+    VALUES ('delete', old.id, old.text, old.description, old.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF text, description, tags ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, text, description, tags)
+    VALUES ('delete', old.id, old.text, old.description, old.tags);
+    INSERT INTO tasks_fts (rowid, text, description, tags)
+    VALUES (new.id, new.text, new.description, new.tags);
+END;
+"""
+
+_FTS_WEIGHTS    = (10.0, 2.0, 1.0)   # bm25 weight of text, description, tags
+_FTS_CANDIDATES = 25
+FUZZY_MIN_SCORE = 70
+
+_fts_ok = False
+
+
+def _init_fts(conn):
+    """Create tasks_fts + triggers; rebuild it if it is new or out of step with tasks."""
+    global _fts_ok
+    try:
+        conn.executescript(_FTS_SCHEMA)
+        indexed = conn.execute("SELECT COUNT(*) FROM tasks_fts_docsize").fetchone()[0]
+        total   = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        if indexed != total:
+            conn.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+            print(Fore.CYAN + f"[TASKS] Search index built ({total} tasks)")
+        _fts_ok = True
+    except sqlite3.OperationalError as e:
+        # SQLite built without FTS5 — db_find_task_by_text falls back to LIKE
+        print(Fore.YELLOW + f"[TASKS] Full-text search unavailable: {e}")
 
 
 def init_db():
@@ -102,6 +162,7 @@ def init_db():
                 CREATE INDEX IF NOT EXISTS idx_tasks_done
                 ON tasks(completed)
             """)
+            _init_fts(conn)
             conn.commit()
             print(Fore.GREEN + "[TASKS] DB initialized")
     except Exception as e:
@@ -139,9 +200,16 @@ def _serialize_subtasks(subtasks):
 
 @router.get("/api/tasks/stats", summary="Task statistics",
             description="Returns count of total, pending, completed, due today, and overdue tasks. Used by sidebar badge and dashboard.")
-def get_task_stats():
+async def get_task_stats(request: Request, response: Response):
+    today_str = date.today().isoformat()
+    cached = conditional(request, response, "tasks", extra=today_str)
+    if cached:
+        return cached
+    return await executors.run("db", _query_stats, today_str)
+
+
+def _query_stats(today_str):
     try:
-        today_str = date.today().isoformat()
         with _get_conn() as conn:
             total     = conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
             pending   = conn.execute(
@@ -168,9 +236,16 @@ def get_task_stats():
 
 
 @router.get("/api/tasks/today")
-def get_tasks_today():
+async def get_tasks_today(request: Request, response: Response):
+    today_str = date.today().isoformat()
+    cached = conditional(request, response, "tasks", extra=today_str)
+    if cached:
+        return cached
+    return await executors.run("db", _query_today, today_str)
+
+
+def _query_today(today_str):
     try:
-        today_str = date.today().isoformat()
         with _get_conn() as conn:
             rows = conn.execute(
                 "SELECT * FROM tasks WHERE due_date = ? AND completed = 0 "
@@ -184,9 +259,16 @@ def get_tasks_today():
 
 
 @router.get("/api/tasks/overdue")
-def get_tasks_overdue():
+async def get_tasks_overdue(request: Request, response: Response):
+    today_str = date.today().isoformat()
+    cached = conditional(request, response, "tasks", extra=today_str)
+    if cached:
+        return cached
+    return await executors.run("db", _query_overdue, today_str)
+
+
+def _query_overdue(today_str):
     try:
-        today_str = date.today().isoformat()
         with _get_conn() as conn:
             rows = conn.execute(
                 "SELECT * FROM tasks WHERE due_date < ? AND completed = 0 "
@@ -201,11 +283,21 @@ def get_tasks_overdue():
 
 @router.get("/api/tasks", summary="List all tasks",
             description="Returns all tasks with optional filters. Tasks include subtasks array, priority, due_date, due_time, description. Ordered by completion status then due date then priority.")
-def list_tasks(
+async def list_tasks(
+    request:     Request,
+    response:    Response,
     status:      Optional[str] = Query(None),
     priority:    Optional[str] = Query(None),
     date_filter: Optional[str] = Query(None, alias="date"),
 ):
+    # The ETag check is in memory; only a changed list costs a db-pool query
+    cached = conditional(request, response, "tasks")
+    if cached:
+        return cached
+    return await executors.run("db", _query_tasks, status, priority, date_filter)
+
+
+def _query_tasks(status, priority, date_filter):
     try:
         with _get_conn() as conn:
             query  = "SELECT * FROM tasks WHERE 1=1"
@@ -266,6 +358,7 @@ def create_task(body: TaskCreate):
                 )
             )
             conn.commit()
+            changes.bump("tasks")
             new_id = cursor.lastrowid
 
         with _get_conn() as conn:
@@ -346,6 +439,7 @@ def update_task(task_id: int, body: TaskUpdate):
                 params
             )
             conn.commit()
+            changes.bump("tasks")
 
             updated = conn.execute(
                 "SELECT * FROM tasks WHERE id = ?", (task_id,)
@@ -371,6 +465,7 @@ def delete_task(task_id: int):
                 raise HTTPException(status_code=404, detail=f"Task {task_id} not found.")
             conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
             conn.commit()
+            changes.bump("tasks")
 
         print(Fore.GREEN + f"[TASKS] Deleted #{task_id}")
         return {"success": True, "deleted_id": task_id}
@@ -434,25 +529,87 @@ def db_get_stats():
         return {"pending": 0, "due_today": 0, "overdue": 0}
 
 
+def _search_words(search_lower):
+    return re.findall(r"[^\W_]+", search_lower)
+
+
+def _fts_candidates(conn, match, limit=_FTS_CANDIDATES):
+    """Pending tasks matching an FTS5 query, best bm25 rank first."""
+    return conn.execute(
+        "SELECT tasks.* FROM tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid "
+        "WHERE tasks_fts MATCH ? AND tasks.completed = 0 "
+        "ORDER BY bm25(tasks_fts, ?, ?, ?) LIMIT ?",
+        (match, *_FTS_WEIGHTS, limit)
+    ).fetchall()
+
+
+def _fuzzy_score(search_lower, text):
+    if _rfuzz is not None:
+        return _rfuzz.token_set_ratio(search_lower, text)
+    return difflib.SequenceMatcher(None, search_lower, text).ratio() * 100
+
+
+def _find_by_fts(conn, search_lower):
+    words = _search_words(search_lower)
+    if not words:
+        return None
+
+    # Every word, as a word or word prefix ("rep" finds "report")
+    rows = _fts_candidates(conn, " AND ".join(f'"{w}"*' for w in words))
+    if rows:
+        # The old LIKE rule still wins when it applies: whole phrase in the title
+        for row in rows:
+            if search_lower in row["text"].lower():
+                return row
+        return rows[0]
+
+    # Fuzzy fallback, scored only over tasks sharing a word start with the search —
+    # covers misheard words ("reprot") and extra words ("the report thing")
+    prefixes = {w[:3] if len(w) > 3 else w for w in words if len(w) > 1}
+    if not prefixes:
+        return None
+    rows = _fts_candidates(conn, " OR ".join(f'"{p}"*' for p in sorted(prefixes)))
+    best, best_score = None, FUZZY_MIN_SCORE
+    for row in rows:
+        score = _fuzzy_score(search_lower, row["text"].lower())
+        if score >= best_score:
+            best, best_score = row, score
+    return best
+
+
+def _find_by_like(conn, search_lower):
+    rows = conn.execute(
+        "SELECT * FROM tasks WHERE LOWER(text) LIKE ? AND completed = 0",
+        (f"%{search_lower}%",)
+    ).fetchall()
+    if rows:
+        return rows[0]
+    words = search_lower.split()
+    if len(words) > 1:
+        all_tasks = conn.execute(
+            "SELECT * FROM tasks WHERE completed = 0"
+        ).fetchall()
+        for row in all_tasks:
+            if all(w in row["text"].lower() for w in words):
+                return row
+    return None
+
+
 def db_find_task_by_text(search):
+    """Best pending task for a spoken/typed reference ("the report task"), or None."""
     try:
         search_lower = search.lower().strip().replace("_", " ")
         with _get_conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM tasks WHERE LOWER(text) LIKE ? AND completed = 0",
-                (f"%{search_lower}%",)
-            ).fetchall()
-            if rows:
-                return _row_to_dict(rows[0])
-            words = search_lower.split()
-            if len(words) > 1:
-                all_tasks = conn.execute(
-                    "SELECT * FROM tasks WHERE completed = 0"
-                ).fetchall()
-                for row in all_tasks:
-                    if all(w in row["text"].lower() for w in words):
-                        return _row_to_dict(row)
-        return None
+            row = None
+            if _fts_ok:
+                try:
+                    row = _find_by_fts(conn, search_lower)
+                except sqlite3.OperationalError as e:
+                    print(Fore.YELLOW + f"[TASKS] FTS search failed, using LIKE: {e}")
+                    row = _find_by_like(conn, search_lower)
+            else:
+                row = _find_by_like(conn, search_lower)
+        return _row_to_dict(row) if row else None
     except Exception as e:
         print(Fore.YELLOW + f"[TASKS] find failed: {e}")
         return None
@@ -29,10 +29,14 @@ import os
 import json
 from datetime import datetime
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 from colorama import Fore
 
+from seven_utils.db import connect as db_connect
+from seven_utils import changes
+from backend.routes.changes import conditional
+
 
 # ─────────────────────────────────────────────────────────────────────────
 # DATABASE PATH
@@ -53,6 +57,9 @@ TRIGGERS_DB = os.path.join(_SEVEN_DATA, "triggers.db")
 
 print(Fore.GREEN + f"[TRIGGERS] DB: {TRIGGERS_DB}")
 
+# trigger_daemon updates fire counts from its own process
+changes.watch_db("triggers", TRIGGERS_DB)
+
 router = APIRouter()
 
 
@@ -93,12 +100,8 @@ class TriggerUpdate(BaseModel):
 # ─────────────────────────────────────────────────────────────────────────
 
 def _get_conn():
-    """Get SQLite connection with WAL mode (concurrent access)."""
-    conn = sqlite3.connect(TRIGGERS_DB, timeout=10)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA foreign_keys=ON")
-    return conn
+    """This thread's pooled SQLite connection (WAL mode, foreign keys on)."""
+    return db_connect(TRIGGERS_DB, row_factory=sqlite3.Row, foreign_keys=True)
 
 
 def init_db():
@@ -294,8 +297,11 @@ def _check_voice_phrase_conflict(phrase, exclude_id=None):
 
 @router.get("/api/triggers/stats", summary="Trigger statistics",
             description="Returns count of total, enabled, hotkey, voice, and audio triggers. Used by dashboard.")
-def get_stats():
+def get_stats(request: Request, response: Response):
     """Aggregate stats for dashboard badge."""
+    cached = conditional(request, response, "triggers")
+    if cached:
+        return cached
     try:
         with _get_conn() as conn:
             total     = conn.execute("SELECT COUNT(*) FROM triggers").fetchone()[0]
@@ -348,6 +354,7 @@ def bulk_toggle_triggers(data: dict):
             else:
                 conn.execute("UPDATE triggers SET enabled = 0")
             conn.commit()
+            changes.bump("triggers")
             _signal_daemon_reload()
         return {"success": True}
     except Exception as e:
@@ -355,10 +362,15 @@ def bulk_toggle_triggers(data: dict):
 
 @router.get("/api/triggers")
 def list_triggers(
+    request:     Request,
+    response:    Response,
     action_type: Optional[str] = None,
     enabled:     Optional[bool] = None,
 ):
     """List all triggers with optional filters."""
+    cached = conditional(request, response, "triggers")
+    if cached:
+        return cached
     try:
         with _get_conn() as conn:
             query = "SELECT * FROM triggers WHERE 1=1"
@@ -443,6 +455,7 @@ def create_trigger(body: TriggerCreate):
                 )
             )
             conn.commit()
+            changes.bump("triggers")
             new_id = cursor.lastrowid
 
         with _get_conn() as conn:
@@ -561,6 +574,7 @@ def update_trigger(trigger_id: int, body: TriggerUpdate):
                 params
             )
             conn.commit()
+            changes.bump("triggers")
 
             updated = conn.execute(
                 "SELECT * FROM triggers WHERE id = ?", (trigger_id,)
@@ -592,6 +606,7 @@ def delete_trigger(trigger_id: int):
 
             conn.execute("DELETE FROM triggers WHERE id = ?", (trigger_id,))
             conn.commit()
+            changes.bump("triggers")
 
         print(Fore.GREEN + f"[TRIGGERS] Deleted #{trigger_id}: {existing['name']}")
         _signal_daemon_reload()
@@ -632,6 +647,7 @@ def fire_trigger(trigger_id: int):
                 (datetime.now().isoformat(), trigger_id)
             )
             conn.commit()
+            changes.bump("triggers")
 
         # ── STEP 1: Show notification IMMEDIATELY (before doing anything) ──
         if not trigger.get("silent", False):
@@ -855,5 +871,6 @@ def db_increment_fire_count(trigger_id):
                 (datetime.now().isoformat(), trigger_id)
             )
             conn.commit()
+            changes.bump("triggers")
     except Exception as e:
         print(Fore.YELLOW + f"[TRIGGERS] fire count update failed: {e}")
\ No newline at end of file
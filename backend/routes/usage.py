@@ -4,8 +4,6 @@ Handles: /api/usage/stats, /api/usage/history, /api/email/*
 """
 
 from fastapi import APIRouter, HTTPException
-import os
-import sqlite3
 import logging
 from datetime import datetime, timedelta
 
@@ -15,12 +13,12 @@ _log = logging.getLogger('seven.usage')
 
 @router.get("/api/usage/stats")
 def get_usage_stats():
-    """Get current user's total usage time."""
+    """Get current user's total usage time (telemetry's in-memory totals, no query)."""
     try:
         import telemetry as tel
         device_id = tel.get_device_id()
         email     = tel.get_email()
-        tel_db    = tel.TELEMETRY_DB
+        totals    = tel.get_usage_totals()
     except Exception as e:
         print(f"[API] Telemetry import error: {e}")
         return {
@@ -29,37 +27,10 @@ def get_usage_stats():
             "device_id": None, "last_seen": None
         }
 
-    total_hours = 0
-    last_seen   = None
-
-    if os.path.exists(tel_db):
-        try:
-            conn = sqlite3.connect(tel_db)
-            c    = conn.cursor()
-            c.execute(
-                "SELECT active_hours, last_seen, email FROM stats WHERE device_id = ?",
-                (device_id,)
-            )
-            row = c.fetchone()
-            if not row:
-                c.execute(
-                    "SELECT active_hours, last_seen, email FROM stats ORDER BY last_seen DESC LIMIT 1"
-                )
-                row = c.fetchone()
-            if row:
-                total_hours = row[0] or 0
-                last_seen   = row[1]
-                if not email and row[2]:
-                    email = row[2]
-            conn.close()
-        except Exception as e:
-            print(f"[API] telemetry.db read error: {e}")
-
-    try:
-        import telemetry as tel
-        total_hours += tel.get_active_hours()
-    except Exception as e:
-        _log.debug(f"Active hours read failed: {e}")
+    total_hours = totals["total_hours"]
+    last_seen   = totals["last_seen"]
+    if not email and totals["email"]:
+        email = totals["email"]
 
     total_minutes = int(total_hours * 60)
     if total_minutes < 1:
@@ -83,15 +54,7 @@ def get_usage_stats():
 
 @router.get("/api/usage/history")
 def get_usage_history():
-    """Get actual daily usage for last 7 days."""
-    try:
-        import telemetry as tel
-        device_id = tel.get_device_id()
-        tel_db    = tel.TELEMETRY_DB
-    except Exception:
-        device_id = None
-        tel_db    = None
-
+    """Get actual daily usage for last 7 days (telemetry's daily rollup, no query)."""
     history = []
     for i in range(6, -1, -1):
         date = datetime.now() - timedelta(days=i)
@@ -102,24 +65,15 @@ def get_usage_history():
             "minutes": 0
         })
 
-    if tel_db and os.path.exists(tel_db) and device_id:
-        try:
-            conn           = sqlite3.connect(tel_db)
-            c              = conn.cursor()
-            seven_days_ago = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
-            c.execute("""
-                SELECT date, hours FROM daily_usage
-                WHERE device_id = ? AND date >= ?
-                ORDER BY date ASC
-            """, (device_id, seven_days_ago))
-            actual = {row[0]: row[1] for row in c.fetchall()}
-            conn.close()
-            for day in history:
-                if day["date"] in actual:
-                    day["hours"]   = round(actual[day["date"]], 3)
-                    day["minutes"] = int(actual[day["date"]] * 60)
-        except Exception as e:
-            print(f"[API] Usage history error: {e}")
+    try:
+        import telemetry as tel
+        actual = tel.get_daily_usage()
+        for day in history:
+            if day["date"] in actual:
+                day["hours"]   = round(actual[day["date"]], 3)
+                day["minutes"] = int(actual[day["date"]] * 60)
+    except Exception as e:
+        print(f"[API] Usage history error: {e}")
 
     return {
         "history":     history,
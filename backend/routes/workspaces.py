@@ -46,10 +46,14 @@ import os
 import json
 from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 from colorama import Fore
 
+from seven_utils.db import connect as db_connect
+from seven_utils import changes
+from backend.routes.changes import conditional
+
 
 # Reuse triggers DB (workspaces table lives in same DB)
 try:
@@ -65,6 +69,8 @@ TRIGGERS_DB = os.path.join(_SEVEN_DATA, "triggers.db")
 
 print(Fore.GREEN + f"[WORKSPACES] Sharing DB: {TRIGGERS_DB}")
 
+changes.watch_db("workspaces", TRIGGERS_DB)
+
 router = APIRouter()
 
 
@@ -91,10 +97,7 @@ class WorkspaceUpdate(BaseModel):
 # ─────────────────────────────────────────────────────────────────────────
 
 def _get_conn():
-    conn = sqlite3.connect(TRIGGERS_DB, timeout=10)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    return conn
+    return db_connect(TRIGGERS_DB, row_factory=sqlite3.Row)
 
 
 def _row_to_dict(row):
@@ -111,8 +114,11 @@ def _row_to_dict(row):
 # ─────────────────────────────────────────────────────────────────────────
 
 @router.get("/api/workspaces")
-def list_workspaces():
+def list_workspaces(request: Request, response: Response):
     """List all saved workspaces."""
+    cached = conditional(request, response, "workspaces")
+    if cached:
+        return cached
     try:
         with _get_conn() as conn:
             rows = conn.execute(
@@ -153,6 +159,7 @@ def create_workspace(body: WorkspaceCreate):
                 )
             )
             conn.commit()
+            changes.bump("workspaces")
             new_id = cursor.lastrowid
 
             row = conn.execute(
@@ -212,6 +219,7 @@ def update_workspace(workspace_id: int, body: WorkspaceUpdate):
                 params
             )
             conn.commit()
+            changes.bump("workspaces")
 
             updated = conn.execute(
                 "SELECT * FROM workspaces WHERE id = ?", (workspace_id,)
@@ -241,6 +249,7 @@ def delete_workspace(workspace_id: int):
 
             conn.execute("DELETE FROM workspaces WHERE id = ?", (workspace_id,))
             conn.commit()
+            changes.bump("workspaces")
 
         print(Fore.GREEN + f"[WORKSPACES] Deleted #{workspace_id}: {existing['name']}")
         return {"success": True, "deleted_id": workspace_id}
@@ -306,6 +315,7 @@ def restore_workspace(workspace_id: int, stats_only: bool = False):
                 (datetime.now().isoformat(), workspace_id)
             )
             conn.commit()
+            changes.bump("workspaces")
 
         # stats_only=True means daemon already restored — just update stats
         if not stats_only:
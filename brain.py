@@ -16,9 +16,11 @@ import config
 try:
     from memory import seven_memory
     from memory.mood import mood_engine
+    from memory import ingest as memory_ingest
 except Exception as _mem_imp_err:
     seven_memory = None
     mood_engine = None
+    memory_ingest = None
 
 from brain_modules.pipeline import run as run_pipeline
 from brain_modules.context import BrainContext
@@ -87,6 +89,9 @@ def reset_session():
     from brain_modules.identity_layer import reset_session as identity_reset
     identity_reset()
 
+    from brain_modules.response_cache import clear as clear_response_cache
+    clear_response_cache()
+
     print(Fore.YELLOW + "[BRAIN] Session reset.")
 
 
@@ -120,8 +125,9 @@ def _save_conversation(prompt_text, result, speaker_id):
 
         # Enforce memory quotas directly to avoid background API context failures
         try:
-            if seven_memory and hasattr(seven_memory, 'conversations'):
-                _current = seven_memory.conversations.count()
+            if seven_memory and hasattr(seven_memory, 'count_conversations'):
+                # Turns still in the write-behind queue count against the quota too
+                _current = seven_memory.count_conversations() + memory_ingest.pending()
                 _tier = config.KEY.get("license", {}).get("tier", "free")
                 
                 _limits = {
@@ -142,19 +148,16 @@ def _save_conversation(prompt_text, result, speaker_id):
         if not _clean_response:
             return
 
-        if seven_memory:
-            try:
-                seven_memory.extract_and_store_facts(prompt_text, user_id=_save_user_id)
-            except Exception:
-                pass
-
-            seven_memory.store_conversation(
-                user_input=prompt_text,
-                seven_response=_clean_response,
+        if seven_memory and memory_ingest:
+            # Fact extraction + embedding run on the write-behind worker
+            memory_ingest.submit(
+                prompt_text,
+                _clean_response,
                 user_id=_save_user_id,
                 source=_source,
+                extract_facts=True,
             )
-            print(Fore.GREEN + f"[BRAIN] Saved turn ({_source}): '{prompt_text[:35]}...'")
+            print(Fore.GREEN + f"[BRAIN] Queued turn ({_source}): '{prompt_text[:35]}...'")
 
     except Exception as _mem_err:
         print(Fore.YELLOW + f"[BRAIN] Auto-save skipped: {_mem_err}")
@@ -179,30 +182,38 @@ def store_voice_turn(prompt_text, response_text, speaker_id, was_interrupted=Fal
         if was_interrupted:
             _clean = f"[INTERRUPTED] {_clean}"
 
-        # Resolve seven_memory instance safely
-        mem = seven_memory
-        if not mem:
-            try:
-                from memory import seven_memory as _lazy_mem
-                mem = _lazy_mem
-            except Exception:
-                mem = None
-
-        if mem:
-            mem.store_conversation(
-                user_input=prompt_text,
-                seven_response=_clean,
-                user_id=_save_user_id,
-                source="voice",
-            )
-            print(Fore.GREEN + f"[BRAIN] Voice conversation saved to memory (interrupted={was_interrupted})")
+        # The worker resolves the memory singleton when it writes
+        if not memory_ingest:
+            return
+        memory_ingest.submit(
+            prompt_text,
+            _clean,
+            user_id=_save_user_id,
+            source="voice",
+        )
+        print(Fore.GREEN + f"[BRAIN] Voice conversation queued for memory (interrupted={was_interrupted})")
 
     except Exception as _err:
         print(Fore.YELLOW + f"[BRAIN] Voice memory save skipped: {_err}")
 
 
-def think(prompt_text, speaker_id="default"):
-    """Execute pipeline layers and generate assistant response."""
+def save_stream_turn(prompt_text, response_text, speaker_id="default"):
+    """
+    Save a streamed turn once the caller has consumed the generator.
+    think() cannot do this itself — it returns before the stream runs.
+    Used by /api/chat/stream.
+    """
+    _save_conversation(prompt_text, response_text, speaker_id)
+
+
+def think(prompt_text, speaker_id="default", stream=False):
+    """
+    Execute pipeline layers and generate assistant response.
+
+    stream=True asks layer_08 to return ("__STREAM__", generator) even for
+    chat callers (speaker_id "default"). The caller then owns saving the
+    turn via save_stream_turn().
+    """
     global USER_NAME
 
     ctx = BrainContext(
@@ -210,6 +221,7 @@ def think(prompt_text, speaker_id="default"):
         speaker_id=speaker_id,
         user_name=USER_NAME
     )
+    ctx.force_stream = stream
 
     deps = {
         "seven_memory": seven_memory,
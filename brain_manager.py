@@ -21,9 +21,11 @@ HARDWARE TIERS:
 import subprocess
 import requests
 import json
+import math
 import os
 import time
 import platform
+import threading
 from colorama import Fore
 import config
 
@@ -275,30 +277,150 @@ def switch_to_chat():
 
 # =========================================================================
 # LATENCY TRACKING
+#
+# Fixed-memory, log-bucketed histograms (HDR-style) instead of a list of
+# the last 50 samples. Each histogram is 8 buckets per power of two from
+# 1 ms to ~17 minutes: 161 ints, ~9% worst-case bucket error, regardless
+# of how many samples are recorded. Percentiles come from a cumulative
+# walk over the buckets.
+#
+# Histograms are keyed by (metric, model, streaming, source):
+#     metric    "total" | "ttft" (first token) | "first_sentence"
+#     model     Ollama model name
+#     streaming True / False
+#     source    "voice" | "chat"
 # =========================================================================
 
-_latency_history = []
+_SUB_BUCKETS  = 8     # per power of two
+_MAX_EXPONENT = 20    # 2^20 ms ≈ 17.5 minutes; larger values clamp
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with constant memory."""
+
+    __slots__ = ("counts", "count", "total", "min", "max", "last")
+
+    def __init__(self):
+        self.counts = [0] * (_MAX_EXPONENT * _SUB_BUCKETS + 1)
+        self.count  = 0
+        self.total  = 0.0
+        self.min    = None
+        self.max    = None
+        self.last   = None
+
+    @staticmethod
+    def _index(value_ms):
+        if value_ms <= 1:
+            return 0
+        idx = int(math.log2(value_ms) * _SUB_BUCKETS)
+        return min(idx, _MAX_EXPONENT * _SUB_BUCKETS)
+
+    @staticmethod
+    def _upper_bound(index):
+        return 2 ** ((index + 1) / _SUB_BUCKETS)
+
+    def record(self, value_ms):
+        value_ms = max(0.0, float(value_ms))
+        self.counts[self._index(value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.min  = value_ms if self.min is None else min(self.min, value_ms)
+        self.max  = value_ms if self.max is None else max(self.max, value_ms)
+        self.last = value_ms
+
+    def merge(self, other):
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min  = other.min if self.min is None else min(self.min, other.min)
+            self.max  = other.max if self.max is None else max(self.max, other.max)
+            self.last = other.last
+
+    def percentile(self, pct):
+        """Value at pct (0-100). Bucket upper bound, clamped to observed max."""
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(self._upper_bound(i), self.max)
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {"avg": 0, "min": 0, "max": 0, "count": 0, "last": 0,
+                    "p50": 0, "p90": 0, "p99": 0}
+        return {
+            "avg":   round(self.total / self.count),
+            "min":   round(self.min),
+            "max":   round(self.max),
+            "count": self.count,
+            "last":  round(self.last),
+            "p50":   round(self.percentile(50)),
+            "p90":   round(self.percentile(90)),
+            "p99":   round(self.percentile(99)),
+        }
+
+
+_latency_lock       = threading.Lock()
+_latency_histograms = {}   # (metric, model, streaming, source) -> LatencyHistogram
+_last_total_ms      = 0    # most recent "total" sample across all keys
+
+
+def record_latency(duration_ms, model=None, streaming=False, source="chat", metric="total"):
+    """
+    Record a latency measurement.
+
+    Called by layer_08 with metric="total" after every generation, and from
+    the streaming generator with metric="ttft" / "first_sentence".
+    """
+    global _last_total_ms
+    key = (metric, model or "unknown", bool(streaming), source)
+    with _latency_lock:
+        if metric == "total":
+            _last_total_ms = duration_ms
+        hist = _latency_histograms.get(key)
+        if hist is None:
+            hist = _latency_histograms[key] = LatencyHistogram()
+        hist.record(duration_ms)
 
 
-def record_latency(duration_ms):
-    """Record a response latency measurement."""
-    _latency_history.append(duration_ms)
-    if len(_latency_history) > 50:
-        _latency_history.pop(0)
+def _merged(metric):
+    merged = LatencyHistogram()
+    for key, hist in _latency_histograms.items():
+        if key[0] == metric:
+            merged.merge(hist)
+    return merged
 
 
 def get_latency_stats():
-    """Get latency statistics."""
-    if not _latency_history:
-        return {"avg": 0, "min": 0, "max": 0, "count": 0, "last": 0}
-    
-    return {
-        "avg": round(sum(_latency_history) / len(_latency_history)),
-        "min": round(min(_latency_history)),
-        "max": round(max(_latency_history)),
-        "count": len(_latency_history),
-        "last": round(_latency_history[-1])
-    }
+    """
+    Get latency statistics.
+
+    Top-level avg/min/max/count/last/p50/p90/p99 cover all total-generation
+    samples (same keys the chat /speed command always read). "ttft" is the
+    merged time-to-first-token summary; "breakdown" splits every metric by
+    model, streaming and source.
+    """
+    with _latency_lock:
+        stats = _merged("total").summary()
+        stats["last"] = round(_last_total_ms)
+        stats["ttft"] = _merged("ttft").summary()
+        stats["breakdown"] = [
+            {
+                "metric":    metric,
+                "model":     model,
+                "streaming": streaming,
+                "source":    source,
+                **hist.summary(),
+            }
+            for (metric, model, streaming, source), hist in sorted(_latency_histograms.items())
+        ]
+    return stats
 
 
 def get_speed_report():
@@ -324,10 +446,40 @@ def get_speed_report():
     lines.append(f"")
     if latency["count"] > 0:
         lines.append(f"Avg Latency: {latency['avg']}ms")
+        lines.append(f"p50/p90/p99: {latency['p50']}ms / {latency['p90']}ms / {latency['p99']}ms")
         lines.append(f"Min/Max: {latency['min']}ms / {latency['max']}ms")
         lines.append(f"Last: {latency['last']}ms")
         lines.append(f"Samples: {latency['count']}")
+        if latency["ttft"]["count"] > 0:
+            t = latency["ttft"]
+            lines.append(f"First Token p50/p90/p99: {t['p50']}ms / {t['p90']}ms / {t['p99']}ms")
+        for row in latency["breakdown"]:
+            mode = "stream" if row["streaming"] else "full"
+            lines.append(
+                f"  {row['metric']:<14} {row['model']:<12} {mode:<6} {row['source']:<5} "
+                f"n={row['count']:<5} p50={row['p50']}ms p90={row['p90']}ms p99={row['p99']}ms"
+            )
     else:
         lines.append(f"Latency: No measurements yet")
-    
+
+    try:
+        from brain_modules.response_cache import get_stats as get_cache_stats
+        cache = get_cache_stats()
+        lines.append(f"")
+        lines.append(f"Response Cache: {'ON' if config.KEY.get('brain', {}).get('response_cache', {}).get('enabled') else 'OFF'}")
+        lines.append(f"Cache Hit Rate: {round(cache['hit_rate'] * 100)}% "
+                     f"({cache['hits']} hits / {cache['misses']} misses, {cache['entries']} entries)")
+    except Exception:
+        pass
+
+    try:
+        from memory.ingest import get_stats as get_ingest_stats
+        ing = get_ingest_stats()
+        lines.append(f"Memory Write-Behind: {ing['pending']}/{ing['max_pending']} queued "
+                     f"(peak {ing['high_water']}), {ing['stored']} stored in {ing['batches']} batches, "
+                     f"lag avg {ing['lag_ms_avg']}ms / max {ing['lag_ms_max']}ms, "
+                     f"{ing['sync_writes']} synchronous")
+    except Exception:
+        pass
+
     return "\n".join(lines)
\ No newline at end of file
@@ -77,4 +77,14 @@ class BrainContext:
         # Layer 02 uses this to pass a note to layer_08 without
         # poisoning prompt_text (which gets stored in history).
         # layer_08 prepends this to the assembled prompt only.
-        self.llm_note = ""
\ No newline at end of file
+        self.llm_note = ""
+
+        # ── Response cache handle (set by response cache layer) ──
+        # (key, embedding, is_voice) when this question may be cached.
+        # layer_08 stores the generated answer under it. None = do not cache.
+        self.cache_entry = None
+
+        # ── Streaming override (set by brain.think(stream=True)) ─
+        # /api/chat/stream wants a sentence generator even though chat
+        # callers use speaker_id "default". layer_08 honours this.
+        self.force_stream = False
\ No newline at end of file
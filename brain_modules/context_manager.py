@@ -6,7 +6,9 @@ PROJECT SEVEN -- Conversation History + Prompt Assembler
 WHAT THIS FILE DOES:
     1. Manages per-speaker conversation history (CONVO_HISTORY dict)
     2. Trims history to last N turns (sliding window)
-    3. Assembles the final prompt string sent to Ollama
+    3. Compacts turns that leave the window into a running summary
+       (background thread, idle-time LLM call)
+    4. Assembles the final prompt string sent to Ollama
 
 WHY THIS IS A SEPARATE FILE:
     brain.py had CONVO_HISTORY as a global variable with history management
@@ -55,6 +57,10 @@ ALTERNATIVE (interview question):
 =============================================================================
 """
 
+import queue
+import threading
+import time
+
 from colorama import Fore
 
 # ---------------------------------------------------------------------------
@@ -74,6 +80,41 @@ CONVO_HISTORY = {}
 # 8 turns = 16 lines. Keeps context window manageable.
 MAX_HISTORY_TURNS = 8
 
+# ---------------------------------------------------------------------------
+# RUNNING SUMMARY (background compaction)
+# Turns that slide out of the window are not thrown away. They are queued
+# and folded into a short per-speaker summary by an idle-time LLM call on a
+# background thread -- never on the voice path. assemble_prompt injects the
+# summary above the LOG, so prompt size stays bounded while long
+# conversations keep continuity.
+#
+# CONFIG (config.json -> brain.history_summary):
+#     enabled        True
+#     idle_seconds   4     -- wait this long after the last turn before calling Ollama
+#     max_chars      600   -- summary length cap (~150 tokens)
+# ---------------------------------------------------------------------------
+SUMMARY_IDLE_SECONDS = 4
+SUMMARY_MAX_CHARS    = 600
+
+HISTORY_SUMMARY = {}     # speaker_id -> str
+_DROPPED_TURNS  = {}     # speaker_id -> [lines waiting to be summarized]
+_SUMMARY_EPOCH  = {}     # speaker_id -> int, bumped on clear to discard in-flight work
+_summary_lock   = threading.Lock()
+_summary_queue  = queue.Queue()
+_summary_worker = None
+_last_activity  = 0.0
+
+
+def history_input(prompt_text: str) -> str:
+    """
+    The user's own words from a prompt, for the history record.
+    Injected context blocks ("=== ... === User asked: ...") are dropped, so
+    history holds what was said, not what the layers wrapped around it.
+    """
+    if "===" in prompt_text and "User asked:" in prompt_text:
+        return prompt_text.split("User asked:")[-1].strip()
+    return prompt_text
+
 
 def add_user_turn(speaker_id: str, text: str):
     """
@@ -88,6 +129,7 @@ def add_user_turn(speaker_id: str, text: str):
         The LLM might think this is a conversational pattern and start
         randomly suggesting opening apps. Commands are not conversational.
     """
+    _touch()
     if speaker_id not in CONVO_HISTORY:
         CONVO_HISTORY[speaker_id] = []
     CONVO_HISTORY[speaker_id].append(f"User: {text}")
@@ -101,6 +143,7 @@ def add_seven_turn(speaker_id: str, text: str):
     CALLED BY: brain.py after getting LLM response.
     Only called for non-command responses.
     """
+    _touch()
     if speaker_id not in CONVO_HISTORY:
         CONVO_HISTORY[speaker_id] = []
     CONVO_HISTORY[speaker_id].append(f"Seven: {text}")
@@ -140,6 +183,20 @@ def clear_history(speaker_id: str = None):
     else:
         CONVO_HISTORY = {}
 
+    with _summary_lock:
+        speakers = [speaker_id] if speaker_id else list(
+            set(HISTORY_SUMMARY) | set(_DROPPED_TURNS) | set(_SUMMARY_EPOCH)
+        )
+        for sid in speakers:
+            HISTORY_SUMMARY.pop(sid, None)
+            _DROPPED_TURNS.pop(sid, None)
+            _SUMMARY_EPOCH[sid] = _SUMMARY_EPOCH.get(sid, 0) + 1
+
+
+def get_summary(speaker_id: str) -> str:
+    """Running summary of turns older than the sliding window ("" if none)."""
+    return HISTORY_SUMMARY.get(speaker_id, "")
+
 
 def _trim(speaker_id: str):
     """
@@ -147,7 +204,8 @@ def _trim(speaker_id: str):
     (Each turn = 1 User line + 1 Seven line = 2 lines)
 
     Uses list slicing to keep the MOST RECENT turns.
-    Older turns are dropped -- recency is more important than completeness.
+    Older turns leave the window but are queued for the background
+    summarizer -- their gist survives in HISTORY_SUMMARY.
 
     WHY [-limit:] slicing:
         Python negative indexing counts from the end.
@@ -156,7 +214,108 @@ def _trim(speaker_id: str):
     """
     limit = MAX_HISTORY_TURNS * 2  # 8 turns * 2 lines per turn = 16 lines
     if len(CONVO_HISTORY.get(speaker_id, [])) > limit:
+        dropped = CONVO_HISTORY[speaker_id][:-limit]
         CONVO_HISTORY[speaker_id] = CONVO_HISTORY[speaker_id][-limit:]
+        _queue_for_summary(speaker_id, dropped)
+
+
+# ---------------------------------------------------------------------------
+# BACKGROUND SUMMARIZER
+# ---------------------------------------------------------------------------
+
+def _touch():
+    """Record voice/chat activity. The summarizer waits for quiet."""
+    global _last_activity
+    _last_activity = time.time()
+
+
+def _summary_settings() -> dict:
+    try:
+        import config
+        raw = config.KEY.get("brain", {}).get("history_summary", {}) or {}
+    except Exception:
+        raw = {}
+    return {
+        "enabled":      bool(raw.get("enabled", True)),
+        "idle_seconds": float(raw.get("idle_seconds", SUMMARY_IDLE_SECONDS)),
+        "max_chars":    int(raw.get("max_chars", SUMMARY_MAX_CHARS)),
+    }
+
+
+def _queue_for_summary(speaker_id: str, lines: list):
+    """Hand dropped lines to the background worker. Never blocks."""
+    global _summary_worker
+    if not lines or not _summary_settings()["enabled"]:
+        return
+    with _summary_lock:
+        _DROPPED_TURNS.setdefault(speaker_id, []).extend(lines)
+        if _summary_worker is None or not _summary_worker.is_alive():
+            _summary_worker = threading.Thread(
+                target=_summary_loop, daemon=True, name="SevenHistorySummary"
+            )
+            _summary_worker.start()
+    # Duplicates are harmless: _compact() returns at once if nothing is pending.
+    _summary_queue.put(speaker_id)
+
+
+def _summary_loop():
+    """Low-priority worker: one summary call at a time, only when idle."""
+    while True:
+        speaker_id = _summary_queue.get()
+        try:
+            settings = _summary_settings()
+            # Yield to live conversation. Each new turn pushes this back.
+            while time.time() - _last_activity < settings["idle_seconds"]:
+                time.sleep(0.5)
+            _compact(speaker_id, settings)
+        except Exception as e:
+            print(Fore.YELLOW + f"[CONTEXT] History summary skipped: {e}")
+
+
+def _compact(speaker_id: str, settings: dict):
+    """Fold pending dropped lines into the speaker's running summary."""
+    with _summary_lock:
+        lines = _DROPPED_TURNS.pop(speaker_id, [])
+        epoch = _SUMMARY_EPOCH.get(speaker_id, 0)
+        previous = HISTORY_SUMMARY.get(speaker_id, "")
+    if not lines:
+        return
+
+    import config
+    from brain_modules.ollama_client import call_ollama, is_error_reply
+
+    prompt = (
+        "Summarize this conversation between a user and the assistant Seven "
+        "in at most 3 short sentences. Keep names, topics, decisions and open "
+        "questions. No preamble.\n\n"
+        + (f"Earlier summary: {previous}\n\n" if previous else "")
+        + "\n".join(lines)
+        + "\n\nSummary:"
+    )
+    payload = {
+        "model":  config.KEY.get("brain", {}).get("model_name", "llama3"),
+        "prompt": prompt,
+        "stream": False,
+        "options": {
+            "temperature": 0.2,
+            "num_predict": 120,
+            "num_ctx":     2048,
+        },
+    }
+    summary = call_ollama(payload).strip()
+    if not summary or summary == "Listening." or is_error_reply(summary):
+        # Ollama busy or down -- put the lines back for the next overflow.
+        with _summary_lock:
+            if _SUMMARY_EPOCH.get(speaker_id, 0) == epoch:
+                _DROPPED_TURNS[speaker_id] = lines + _DROPPED_TURNS.get(speaker_id, [])
+        return
+
+    summary = " ".join(summary.split())[:settings["max_chars"]]
+    with _summary_lock:
+        if _SUMMARY_EPOCH.get(speaker_id, 0) != epoch:
+            return  # history was cleared while we were generating
+        HISTORY_SUMMARY[speaker_id] = summary
+    print(Fore.CYAN + f"[CONTEXT] History compacted for '{speaker_id}' ({len(lines)} lines)")
 
 
 def assemble_prompt(
@@ -174,8 +333,9 @@ def assemble_prompt(
         2. Web context (live data -- highest recency)
         3. Knowledge context (offline facts)
         4. Memory context (personal facts about user)
-        5. Conversation history (recent turns)
-        6. "Seven:" prompt (tells LLM to complete as Seven)
+        5. Running summary of older turns (if any have been compacted)
+        6. Conversation history (recent turns)
+        7. "Seven:" prompt (tells LLM to complete as Seven)
 
     WHY THIS ORDER:
         LLMs give more attention to text near the end of the prompt.
@@ -215,6 +375,12 @@ def assemble_prompt(
         parts.append(memory_context)
         parts.append("")
 
+    # Older turns, compacted in the background
+    summary = get_summary(speaker_id)
+    if summary:
+        parts.append(f"EARLIER IN THIS CONVERSATION: {summary}")
+        parts.append("")
+
     # Conversation history
     history_str = get_history_string(speaker_id)
     if history_str:
@@ -74,9 +74,8 @@ def process(ctx, deps):
     # Store original input in history.
     # Use prompt_text directly - never the modified version with injected notes.
     # llm_note is passed separately so it never enters the history record.
-    _original_input = ctx.prompt_text
-    if "===" in _original_input and "User asked:" in _original_input:
-        _original_input = _original_input.split("User asked:")[-1].strip()
+    from brain_modules.context_manager import history_input
+    _original_input = history_input(ctx.prompt_text)
 
     if "VISUAL_REPORT:" not in _original_input and not ctx.is_action_cmd:
         try:
@@ -185,7 +184,9 @@ def process(ctx, deps):
     # Chat API always passes speaker_id="default". Streaming on chat forces
     # chat.py to consume the full generator before responding anyway,
     # adding overhead without benefit.
-    use_streaming = (
+    # Exception: /api/chat/stream sets ctx.force_stream and forwards each
+    # sentence to the browser as it arrives.
+    use_streaming = ctx.force_stream or (
         config.KEY.get('brain', {}).get('streaming', False)
         and ctx.speaker_id != "default"
     )
@@ -196,21 +197,39 @@ def process(ctx, deps):
         speaker_id  = ctx.speaker_id
         prompt_text = ctx.prompt_text
 
-        def _sentence_gen():
-            full_reply = []
-            for sentence in stream_sentences(full_prompt, payload):
-                full_reply.append(sentence)
-                yield sentence
+        # TTS chunking: brain.sentence_stream.min_clause_chars / max_clause_chars
+        _seg_cfg   = _brain_cfg.get("sentence_stream", {}) or {}
+        _min_chars = int(_seg_cfg.get("min_clause_chars", 2))
+        _max_chars = int(_seg_cfg.get("max_clause_chars", 0))
 
-            complete_reply = " ".join(full_reply)
-            elapsed = int((_time.time() - start_time) * 1000)
+        _source = "voice" if _is_voice else "chat"
 
+        def _record(metric, elapsed_ms):
             try:
                 from brain_manager import record_latency
-                record_latency(elapsed)
+                record_latency(elapsed_ms, model=model_name, streaming=True,
+                               source=_source, metric=metric)
             except Exception:
                 pass
 
+        def _sentence_gen():
+            from brain_modules.ollama_client import is_error_reply
+            full_reply = []
+            failed     = False   # stream_sentences appends its error line after any real sentences
+            for sentence in stream_sentences(
+                    full_prompt, payload,
+                    min_chars=_min_chars, max_chars=_max_chars,
+                    on_first_token=lambda: _record(
+                        "ttft", (_time.time() - start_time) * 1000)):
+                if not full_reply:
+                    _record("first_sentence", (_time.time() - start_time) * 1000)
+                full_reply.append(sentence)
+                failed = failed or is_error_reply(sentence)
+                yield sentence
+
+            complete_reply = " ".join(full_reply)
+            _record("total", (_time.time() - start_time) * 1000)
+
             if "VISUAL_REPORT:" not in prompt_text:
                 try:
                     from brain_modules.context_manager import add_seven_turn
@@ -218,6 +237,9 @@ def process(ctx, deps):
                 except Exception:
                     pass
 
+            if not failed:
+                _store_in_cache(ctx, config, model_name, complete_reply)
+
         return LayerResult.stop_stream(_sentence_gen())
 
     # ── Non-streaming path ───────────────────────────────────────
@@ -229,7 +251,8 @@ def process(ctx, deps):
         elapsed = int((_time.time() - start_time) * 1000)
         try:
             from brain_manager import record_latency
-            record_latency(elapsed)
+            record_latency(elapsed, model=model_name, streaming=False,
+                           source="voice" if _is_voice else "chat")
         except Exception:
             pass
 
@@ -244,6 +267,7 @@ def process(ctx, deps):
                 except Exception:
                     pass
 
+            _store_in_cache(ctx, config, model_name, reply)
             return LayerResult.stop(reply)
 
         print(Fore.RED + f"[BRAIN] Ollama status {r.status_code}")
@@ -261,6 +285,23 @@ def process(ctx, deps):
         print(Fore.RED + f"[BRAIN] Unexpected error: {e}")
         return LayerResult.stop("Something went wrong with my thinking.")
 
+def _store_in_cache(ctx, config, model_name, reply):
+    """Save a generated answer if layer_75 marked this question cacheable."""
+    from brain_modules.ollama_client import is_error_reply
+    if not ctx.cache_entry or not reply or is_error_reply(reply):
+        return
+    try:
+        from brain_modules import response_cache
+        key, embedding, is_voice = ctx.cache_entry
+        response_cache.store(
+            key, ctx.clean_in, reply, embedding, is_voice,
+            response_cache.make_fingerprint(config, model_name),
+            response_cache.get_settings(config),
+        )
+    except Exception as _cache_err:
+        print(Fore.YELLOW + f"[CACHE] Store skipped: {_cache_err}")
+
+
 def _clean_response(text):
     """
     Strip robotic trailing phrases that LLMs append regardless of system prompt.
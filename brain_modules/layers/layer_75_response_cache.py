@@ -0,0 +1,71 @@
+"""
+=============================================================================
+LAYER 7.5: RESPONSE CACHE (opt-in)
+
+Answers repeated and near-duplicate open questions from
+brain_modules/response_cache.py instead of running layer_08.
+
+Runs after memory, knowledge, web and personal-filter layers so it can see
+what they injected. Only caches when none of them added context:
+    memory_context    → personal question, answer depends on the user
+    knowledge_context → local documents, can be re-indexed any time
+    web_searched      → live data, stale within minutes
+
+On a miss, sets ctx.cache_entry so layer_08 stores the generated answer.
+Disabled unless config brain.response_cache.enabled is true.
+=============================================================================
+"""
+
+from colorama import Fore
+from brain_modules.layer_result import LayerResult
+from brain_modules import response_cache
+
+
+def process(ctx, deps):
+    config   = deps.get("config")
+    settings = response_cache.get_settings(config)
+    if not settings["enabled"]:
+        return LayerResult.pass_through()
+
+    if ("VISUAL_REPORT:" in ctx.prompt_text
+            or ctx.is_command or ctx.is_greeting or ctx.is_action_cmd):
+        return LayerResult.pass_through()
+
+    if ctx.memory_context or ctx.knowledge_context or ctx.web_searched:
+        return LayerResult.pass_through()
+
+    if not response_cache.is_cacheable(ctx.clean_in):
+        return LayerResult.pass_through()
+
+    _is_voice   = ctx.speaker_id not in ("default",)
+    fingerprint = response_cache.make_fingerprint(config, deps.get("model_name"))
+    key         = response_cache.make_key(ctx.clean_in, _is_voice)
+
+    # Embedding for the near-duplicate tier. Reuses the memory embedder —
+    # no second model in RAM. Exact-match tier still works if this fails.
+    embedding = None
+    seven_memory = deps.get("seven_memory")
+    try:
+        if seven_memory:
+            embedding = response_cache.to_unit_vector(
+                seven_memory.embedding_function([response_cache.normalize(ctx.clean_in)])[0]
+            )
+    except Exception as _emb_err:
+        print(Fore.YELLOW + f"[CACHE] Embedding skipped: {_emb_err}")
+
+    cached = response_cache.lookup(key, embedding, _is_voice, fingerprint, settings)
+    if cached is None:
+        ctx.cache_entry = (key, embedding, _is_voice)
+        return LayerResult.pass_through()
+
+    print(Fore.GREEN + f"[CACHE] Hit for '{ctx.clean_in[:40]}'")
+
+    # Keep conversation history identical to an LLM-answered turn.
+    try:
+        from brain_modules.context_manager import add_user_turn, add_seven_turn, history_input
+        add_user_turn(ctx.speaker_id, history_input(ctx.prompt_text))
+        add_seven_turn(ctx.speaker_id, cached)
+    except Exception:
+        pass
+
+    return LayerResult.stop(cached)
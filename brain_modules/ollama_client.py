@@ -35,6 +35,19 @@ colorama.init(autoreset=True)
 # ---------------------------------------------------------------------------
 OLLAMA_URL = "http://127.0.0.1:11434/api/generate"
 
+# Every user-facing failure string this module (and layer_08) returns.
+# Callers that must not treat a failure as real output (caches,
+# summaries) check replies with is_error_reply().
+ERROR_REPLY_PREFIXES = (
+    "My brain hiccupped", "My brain took too long",
+    "I can't reach my brain", "Something went wrong with my thinking",
+)
+
+
+def is_error_reply(text: str) -> bool:
+    """True if text is one of the fallback strings returned on failure."""
+    return bool(text) and text.startswith(ERROR_REPLY_PREFIXES)
+
 
 def call_ollama(payload: dict) -> str:
     """
@@ -95,7 +108,8 @@ def call_ollama(payload: dict) -> str:
         return "Something went wrong with my thinking."
 
 
-def stream_sentences(prompt: str, payload: dict):
+def stream_sentences(prompt: str, payload: dict, min_chars: int = 2, max_chars: int = 0,
+                     on_first_token=None):
     """
     Stream tokens from Ollama and yield complete sentences.
 
@@ -107,16 +121,15 @@ def stream_sentences(prompt: str, payload: dict):
     HOW IT WORKS:
         1. Send request with stream=True to Ollama
         2. Ollama sends one JSON line per token (Server-Sent Events style)
-        3. We buffer tokens until we hit a sentence boundary (. ! ?)
+        3. SentenceSegmenter scans only the new characters of each token
         4. We yield each complete sentence immediately
         5. main.py calls mouth.speak(sentence) per yield
 
     SENTENCE BOUNDARY DETECTION:
-        We check if the character after . ! ? is a space or end of buffer.
-        This prevents false splits on:
-        - Decimals: "3.14" — no space after dot
-        - Abbreviations: "Dr." — caught by "no space" rule most of the time
-        This is heuristic, not perfect. Good enough for voice.
+        Delegated to brain_modules/sentence_segmenter.py.
+        Handles decimals ("3.14"), abbreviations ("Dr.", "e.g.") and
+        initials. Linear in response length -- the old loop rescanned the
+        whole buffer after every token.
 
     YIELD PATTERN (Generator):
         Using yield makes this a Python generator.
@@ -127,6 +140,12 @@ def stream_sentences(prompt: str, payload: dict):
         prompt (str): Not used directly — payload contains the full prompt.
                       Kept for API consistency.
         payload (dict): Full Ollama request body.
+        min_chars (int): Shorter sentences are merged into the next one.
+        max_chars (int): 0 = off. Otherwise long sentences are cut at a
+                         clause break (, ; :) once they pass this length.
+        on_first_token (callable): Called once, with no arguments, when the
+                         first non-empty token arrives. Used for
+                         time-to-first-token metrics.
 
     Yields:
         str: One complete sentence at a time.
@@ -137,14 +156,12 @@ def stream_sentences(prompt: str, payload: dict):
          This is the same pattern used in file reading, database cursors,
          and any time you process data larger than RAM."
     """
+    from brain_modules.sentence_segmenter import SentenceSegmenter
+
     # Force streaming on — caller may have set stream=False
     stream_payload = {**payload, "stream": True}
 
-    # Token buffer — accumulates characters until a sentence boundary
-    buffer = ""
-
-    # Characters that end a sentence
-    sentence_endings = {'.', '!', '?'}
+    segmenter = SentenceSegmenter(min_chars=min_chars, max_chars=max_chars)
 
     try:
         response = requests.post(
@@ -169,35 +186,20 @@ def stream_sentences(prompt: str, payload: dict):
                 token = chunk.get("response", "")  # One token (word piece)
                 done  = chunk.get("done", False)    # True on last chunk
 
-                # Accumulate token into buffer
-                if token:
-                    buffer += token
-
-                # Scan buffer for sentence boundaries
-                # We want: "Hello world. " → yield "Hello world."
-                # We avoid: "3.14" → no yield (no space after dot)
-                if buffer:
-                    last_boundary = -1
-                    for i, ch in enumerate(buffer):
-                        if ch in sentence_endings:
-                            # Check character after boundary
-                            if i + 1 < len(buffer) and buffer[i + 1] == ' ':
-                                last_boundary = i + 1  # Include the space
-                            elif i + 1 >= len(buffer):
-                                last_boundary = i + 1  # End of buffer
-
-                    # Yield everything up to last boundary
-                    if last_boundary > 0:
-                        sentence = buffer[:last_boundary].strip()
-                        buffer   = buffer[last_boundary:].strip()
-                        # Guard: skip single chars and empty strings
-                        if sentence and len(sentence) > 1:
-                            yield sentence
+                if token and on_first_token:
+                    try:
+                        on_first_token()
+                    except Exception:
+                        pass
+                    on_first_token = None
+
+                for sentence in segmenter.feed(token):
+                    yield sentence
 
                 if done:
                     # Flush remaining buffer as final sentence
-                    if buffer.strip():
-                        yield buffer.strip()
+                    for sentence in segmenter.flush():
+                        yield sentence
                     break
 
             except json.JSONDecodeError:
@@ -213,4 +215,4 @@ def stream_sentences(prompt: str, payload: dict):
 
     except Exception as e:
         print(Fore.RED + f"[OLLAMA] Stream error: {e}")
-        yield "Something went wrong with my thinking."
\ No newline at end of file
+        yield "Something went wrong with my thinking."
@@ -0,0 +1,233 @@
+"""
+=============================================================================
+brain_modules/response_cache.py
+PROJECT SEVEN -- Semantic Response Cache (opt-in)
+
+WHAT THIS FILE DOES:
+    1. Remembers recent LLM answers to open, non-personal questions
+    2. Answers an exact repeat from a hash lookup
+    3. Answers a near-duplicate ("capital of france?" vs
+       "what's the capital of France") from an embedding-similarity lookup
+    4. Expires entries by TTL and evicts least-recently-used past a size cap
+    5. Drops everything when the model or humor/honesty settings change
+
+WHY:
+    identity_layer.handle_repetition only changes the prompt note for a
+    repeated question -- the full Ollama generation still runs (1-5 s).
+    A cache hit costs one MiniLM embedding (~10 ms on CPU) or nothing at all
+    for exact repeats.
+
+WHAT NEVER GETS CACHED:
+    Personal questions (memory context injected), web-searched questions
+    (live data goes stale), commands, visual reports, and follow-ups that
+    lean on conversation history ("tell me more about it").
+    layer_75_response_cache decides eligibility, layer_08 stores answers.
+
+CONFIG (config.json -> brain.response_cache):
+    enabled        False  -- opt-in
+    ttl_seconds    3600
+    max_entries    200
+    similarity     0.92   -- cosine threshold for a near-duplicate hit
+
+DESIGN PATTERN: Module-level repository (same as context_manager.py)
+    One OrderedDict owns all entries. Insertion order doubles as LRU order.
+
+INTERVIEW TALKING POINT:
+    "I put a two-tier cache in front of the LLM: an exact hash for literal
+     repeats and a vector lookup for paraphrases. The cache key carries a
+     fingerprint of model + personality settings, so changing the model or
+     humor slider invalidates every answer generated under the old one."
+=============================================================================
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from colorama import Fore
+
+# ---------------------------------------------------------------------------
+# DEFAULTS -- overridden by config.KEY["brain"]["response_cache"]
+# ---------------------------------------------------------------------------
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 200
+DEFAULT_SIMILARITY  = 0.92
+
+# Words that make a question depend on the previous turn.
+# "What about it?" means something different every time it is asked.
+_FOLLOWUP_WORDS = {
+    "it", "its", "that", "this", "those", "these", "them", "they",
+    "he", "she", "him", "her", "his", "there",
+    "more", "again", "continue", "else", "also", "too",
+}
+
+# First-person words. "I feel tired" or "my sister..." is about the user,
+# even when memory search found nothing to inject.
+_PERSONAL_WORDS = {"i", "i'm", "im", "i've", "me", "my", "mine", "myself", "we", "our", "us"}
+
+_lock    = threading.Lock()
+_entries = OrderedDict()   # key -> {"question", "response", "embedding", "created"}
+_fingerprint = None        # (model, humor, honesty) the entries were generated under
+_stats = {"hits": 0, "exact_hits": 0, "semantic_hits": 0, "misses": 0,
+          "stores": 0, "evictions": 0, "invalidations": 0}
+
+
+def get_settings(config) -> dict:
+    """Read brain.response_cache from config with safe defaults."""
+    try:
+        raw = config.KEY.get("brain", {}).get("response_cache", {}) or {}
+    except Exception:
+        raw = {}
+    return {
+        "enabled":     bool(raw.get("enabled", False)),
+        "ttl_seconds": float(raw.get("ttl_seconds", DEFAULT_TTL_SECONDS)),
+        "max_entries": int(raw.get("max_entries", DEFAULT_MAX_ENTRIES)),
+        "similarity":  float(raw.get("similarity", DEFAULT_SIMILARITY)),
+    }
+
+
+def make_fingerprint(config, model_name) -> tuple:
+    """Everything that changes the answer to the same question."""
+    try:
+        brain_cfg = config.KEY.get("brain", {})
+    except Exception:
+        brain_cfg = {}
+    return (
+        (model_name or "").lower(),
+        int(brain_cfg.get("tars_humor",   75)),
+        int(brain_cfg.get("tars_honesty", 85)),
+    )
+
+
+def normalize(question: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    text = re.sub(r"[^\w\s']", " ", (question or "").lower())
+    text = text.replace("what's", "what is").replace("whats", "what is")
+    return " ".join(text.split())
+
+
+def is_cacheable(question: str) -> bool:
+    """
+    False for short inputs, follow-ups that refer back to earlier
+    conversation, and anything phrased about the user.
+    """
+    words = normalize(question).split()
+    if len(words) < 3:
+        return False
+    return not any(w in _FOLLOWUP_WORDS or w in _PERSONAL_WORDS for w in words)
+
+
+def make_key(question: str, is_voice: bool) -> str:
+    """Exact-match key. Voice and chat answers differ in length, keep apart."""
+    raw = ("v|" if is_voice else "c|") + normalize(question)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _check_fingerprint(fingerprint):
+    """Drop all entries if model or personality changed since they were made."""
+    global _fingerprint
+    if fingerprint != _fingerprint:
+        if _entries:
+            _stats["invalidations"] += 1
+            print(Fore.YELLOW + "[CACHE] Model/personality changed -- response cache cleared.")
+        _entries.clear()
+        _fingerprint = fingerprint
+
+
+def _expire(ttl_seconds):
+    """Remove entries older than ttl_seconds."""
+    cutoff = time.time() - ttl_seconds
+    stale  = [k for k, e in _entries.items() if e["created"] < cutoff]
+    for k in stale:
+        del _entries[k]
+
+
+def to_unit_vector(embedding):
+    """Convert an embedder output row to a unit-length float32 vector."""
+    if embedding is None:
+        return None
+    vec  = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else None
+
+
+def lookup(key, embedding, is_voice, fingerprint, settings):
+    """
+    Return a cached response or None.
+
+    ARGS:
+        key:         make_key() of the question
+        embedding:   to_unit_vector() of the question, or None to skip
+                     the semantic tier
+        is_voice:    only entries from the same source can match semantically
+        fingerprint: (model, humor, honesty) of the current config
+        settings:    get_settings() result
+    """
+    with _lock:
+        _check_fingerprint(fingerprint)
+        _expire(settings["ttl_seconds"])
+
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            _stats["exact_hits"] += 1
+            return entry["response"]
+
+        if embedding is not None:
+            best_key, best_score = None, 0.0
+            for k, e in _entries.items():
+                if e["is_voice"] != is_voice or e["embedding"] is None:
+                    continue
+                score = float(np.dot(embedding, e["embedding"]))
+                if score > best_score:
+                    best_key, best_score = k, score
+            if best_key is not None and best_score >= settings["similarity"]:
+                _entries.move_to_end(best_key)
+                _stats["hits"] += 1
+                _stats["semantic_hits"] += 1
+                print(Fore.CYAN + f"[CACHE] Near-duplicate hit (similarity {best_score:.3f})")
+                return _entries[best_key]["response"]
+
+        _stats["misses"] += 1
+        return None
+
+
+def store(key, question, response, embedding, is_voice, fingerprint, settings):
+    """Insert or refresh an answer. Evicts least-recently-used past max_entries."""
+    if not response or not response.strip():
+        return
+    with _lock:
+        _check_fingerprint(fingerprint)
+        _entries[key] = {
+            "question":  question,
+            "response":  response,
+            "embedding": embedding,
+            "is_voice":  is_voice,
+            "created":   time.time(),
+        }
+        _entries.move_to_end(key)
+        _stats["stores"] += 1
+        while len(_entries) > max(1, settings["max_entries"]):
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def clear():
+    """Drop every cached response (memory wipe, session reset)."""
+    with _lock:
+        _entries.clear()
+
+
+def get_stats() -> dict:
+    """Counters for /api/speed and get_speed_report()."""
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "entries":  len(_entries),
+            "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else 0.0,
+        }
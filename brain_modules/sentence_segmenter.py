@@ -0,0 +1,191 @@
+"""
+=============================================================================
+brain_modules/sentence_segmenter.py
+PROJECT SEVEN -- Incremental Sentence Segmenter for streamed LLM output
+
+WHAT THIS FILE DOES:
+    Turns a stream of Ollama tokens into speakable chunks for TTS.
+    feed(token) returns the chunks completed by that token.
+    flush() returns whatever is left when the stream ends.
+
+WHY NOT RESCAN THE BUFFER:
+    The old loop in ollama_client.stream_sentences ran
+    `for i, ch in enumerate(buffer)` after EVERY token. A 400-character
+    sentence with no punctuation got scanned ~100 times -- quadratic.
+    This class remembers where it stopped scanning and only looks at
+    characters that arrived since the last feed().
+
+BOUNDARY RULES:
+    . ! ? followed by whitespace (optionally after a closing quote/bracket)
+    NOT a boundary:
+        "3.14"       -- next character is a digit, not whitespace
+        "Dr. Smith"  -- known abbreviation before the dot
+        "No. 5"      -- word that is also an abbreviation, judged by what
+        "St. Louis"     follows ("The answer is no. Next" still splits)
+        "e.g. this"  -- dotted abbreviation
+        "J. R. R."   -- single-letter initials
+    A terminator at the very end of the buffer waits for the next token.
+    That is the only way to tell "3." + "14" from "done." + " Next".
+
+TTS CHUNKING:
+    min_chars  -- chunks shorter than this are held and merged into the
+                  next one ("Yes." + "It is." becomes one utterance).
+    max_chars  -- 0 = off. Otherwise, a sentence running past this length
+                  without a terminator is cut at its last clause break
+                  (, ; :) so TTS can start speaking sooner.
+
+INTERVIEW TALKING POINT:
+    "Streaming segmentation is a classic incremental-parsing problem.
+     Keeping a scan cursor makes it O(n) in the response length instead of
+     O(n^2), which matters for long, punctuation-light LLM output."
+=============================================================================
+"""
+
+# Lowercase words that end with a dot but do not end a sentence.
+ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "mt", "ft",
+    "vs", "etc", "approx", "dept", "inc", "ltd", "corp",
+    "vol", "fig", "jan", "feb", "apr", "jun", "jul", "aug",
+    "sep", "sept", "oct", "nov", "dec",
+    "e.g", "i.e", "a.m", "p.m", "u.s", "u.k", "cf",
+}
+
+# Abbreviations that are also words which often end a sentence. They
+# only count as abbreviations when what comes next says so:
+#   digit    "No. 5", "Mar. 3", "Est. 1990"
+#   capital  "St. Louis", "Co. Ltd"
+#   et       "et al." (the word before is "et")
+CONTEXT_ABBREVIATIONS = {
+    "no": "digit", "mar": "digit", "est": "digit",
+    "st": "capital", "co": "capital",
+    "al": "et",
+}
+
+_TERMINATORS = {".", "!", "?"}
+_CLOSERS     = {'"', "'", ")", "]", "”", "’"}
+_CLAUSE      = {",", ";", ":"}
+
+
+class SentenceSegmenter:
+    """Stateful, incremental splitter. One instance per streamed response."""
+
+    def __init__(self, min_chars=2, max_chars=0):
+        self.min_chars = max(1, int(min_chars or 1))
+        self.max_chars = max(0, int(max_chars or 0))
+        self._buf    = ""   # text not yet emitted
+        self._scan   = 0    # next index in _buf to inspect
+        self._clause = -1   # index just after the last clause break in _buf
+
+    # ── Public API ────────────────────────────────────────────────
+
+    def feed(self, token: str) -> list:
+        """Add one token. Returns the list of chunks it completed (often empty)."""
+        if not token:
+            return []
+        self._buf += token
+
+        chunks = []
+        buf = self._buf
+        n   = len(buf)
+        i   = self._scan
+
+        while i < n:
+            ch = buf[i]
+            if ch in _TERMINATORS:
+                end = self._boundary_end(buf, i)
+                if end is None:
+                    break               # need the next token to decide
+                if end > 0:
+                    chunk = buf[:end].strip()
+                    if len(chunk) >= self.min_chars:
+                        chunks.append(chunk)
+                        buf = buf[end:]
+                        n   = len(buf)
+                        self._clause = -1
+                        i = 0
+                    else:
+                        i = end         # too short -- merge into next chunk
+                    continue
+            elif ch in _CLAUSE:
+                if i + 1 >= n:
+                    break               # same: wait to see what follows
+                if buf[i + 1].isspace():
+                    self._clause = i + 1
+            i += 1
+
+        # Long sentence with no terminator yet -- cut at the last clause break.
+        if self.max_chars and len(buf) > self.max_chars and self._clause > 0:
+            chunk = buf[:self._clause].strip()
+            if len(chunk) >= self.min_chars:
+                chunks.append(chunk)
+                buf = buf[self._clause:]
+                i   = max(0, i - self._clause)
+                self._clause = -1
+
+        self._buf  = buf
+        self._scan = i
+        return chunks
+
+    def flush(self) -> list:
+        """End of stream. Returns the remaining text as a final chunk."""
+        rest = self._buf.strip()
+        self._buf, self._scan, self._clause = "", 0, -1
+        return [rest] if rest else []
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    def _boundary_end(self, buf, i):
+        """
+        Decide whether the terminator at buf[i] ends a sentence.
+
+        RETURNS:
+            None -- not enough text yet, wait for more tokens
+            0    -- not a boundary
+            int  -- index just past the boundary (chunk = buf[:end])
+        """
+        j = i + 1
+        n = len(buf)
+        # Swallow runs of terminators ("?!", "...") and closing quotes.
+        while j < n and (buf[j] in _TERMINATORS or buf[j] in _CLOSERS):
+            j += 1
+        if j >= n:
+            return None
+        if not buf[j].isspace():
+            return 0
+        if buf[i] == "." and j == i + 1:
+            abbrev = self._is_abbreviation(buf, i)
+            if abbrev is None:
+                return None
+            if abbrev:
+                return 0
+        return j
+
+    @staticmethod
+    def _is_abbreviation(buf, dot_index):
+        """
+        True if the word right before buf[dot_index] is an abbreviation.
+        None if that depends on a next word that has not arrived yet.
+        """
+        start = dot_index
+        while start > 0 and not buf[start - 1].isspace():
+            start -= 1
+        word = buf[start:dot_index].lstrip("(\"'[")
+        if not word:
+            return False
+        if word.lower() in ABBREVIATIONS:
+            return True
+        rule = CONTEXT_ABBREVIATIONS.get(word.lower())
+        if rule == "et":
+            return buf[:start].rstrip().lower().endswith("et")
+        if rule:
+            k = dot_index + 1
+            while k < len(buf) and buf[k].isspace():
+                k += 1
+            if k >= len(buf):
+                return None
+            return buf[k].isdigit() if rule == "digit" else buf[k].isupper()
+        # Capital initials ("J." / "U.S") -- but "I." and "A." end sentences
+        if word in ("I", "A"):
+            return False
+        parts = word.split(".")
+        return all(len(p) == 1 and p.isalpha() and p.isupper() for p in parts)
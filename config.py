@@ -241,6 +241,21 @@ def get_defaults():
             "max_history": 10,
             "streaming": False,
             "auto_model": True,
+            "response_cache": {
+                "enabled": False,
+                "ttl_seconds": 3600,
+                "max_entries": 200,
+                "similarity": 0.92
+            },
+            "sentence_stream": {
+                "min_clause_chars": 2,
+                "max_clause_chars": 0
+            },
+            "history_summary": {
+                "enabled": True,
+                "idle_seconds": 4,
+                "max_chars": 600
+            },
             "model_tiers": {
                 "high": "llama3",
                 "medium": "phi3:mini",
@@ -248,6 +263,76 @@ def get_defaults():
                 "minimum": "tinyllama"
             }
         },
+        "ears": {
+            "capture_bus": {
+                "enabled": True,
+                "ring_seconds": 30,
+                "shared_memory": True,
+                "wav_source": ""
+            },
+            "endpointer": {
+                "enabled": True,
+                "backend": "auto",
+                "threshold": 0.5,
+                "min_speech_ms": 90,
+                "hangover_ms": 300,
+                "preroll_ms": 300
+            },
+            "partials": {
+                "enabled": "auto",
+                "interval_ms": 500,
+                "commit_margin_ms": 500,
+                "min_audio_ms": 600
+            },
+            "keyword_spotter": {
+                "enabled": True,
+                "threshold": 0.2,
+                "min_templates": 2,
+                "max_templates": 5,
+                "audit_every": 10
+            },
+            "yamnet": {
+                "backend": "auto"
+            },
+            "whisper_service": {
+                "max_concurrency": 0,
+                "server_enabled": True,
+                "port": 7892,
+                "remote_sizes": ["tiny.en"],
+                "max_request_seconds": 30
+            },
+            "debug": {
+                "dump_dir": ""
+            }
+        },
+        "memory": {
+            "write_behind": {
+                "enabled": True,
+                "batch_size": 16,
+                "window_ms": 1500,
+                "max_pending": 512,
+                "block_ms": 250
+            },
+            "retention": {
+                "enabled": True,
+                "hot_days": 90,
+                "period": "week",
+                "min_conversations": 2000,
+                "max_per_pass": 5000,
+                "summary_chars": 1200,
+                "compact_after": 5000,
+                "interval_hours": 24,
+                "startup_delay_s": 600
+            }
+        },
+        "api": {
+            "executors": {
+                "llm": 2,
+                "embedding": 2,
+                "db": 4,
+                "llm_max_queue": 8
+            }
+        },
         "gui": {
             "opacity": 0.8,
             "text_color": "#00FF00"
@@ -2,6 +2,17 @@
 # Bridge file — keeps backward compatibility
 # V1.2: listen() returns (text, audio_path) tuple
 # V1.3: Added listen_for_interrupt for full duplex
+# V1.4: Lazy — ears.core (Whisper load + calibration) is imported on first
+#       use of listen/listen_for_interrupt, not on "import ears.<anything>".
+#       trigger_daemon.py imports ears.capture_bus and ears.audio_triggers
+#       and must not load the main Whisper model as a side effect.
+# V1.5: Voice ID runs on the in-memory clip; listen() no longer writes
+#       temp_audio.wav — last_speaker() carries the result instead.
+#       listen(return_clip=True) still hands back a WAV path (enrollment).
 
-from ears.core import listen
-from ears.core import listen_for_interrupt
\ No newline at end of file
+
+def __getattr__(name):
+    if name in ("listen", "listen_for_interrupt", "last_speaker"):
+        from ears import core
+        return getattr(core, name)
+    raise AttributeError(f"module 'ears' has no attribute {name!r}")
@@ -157,7 +157,7 @@ def stop():
     _loopback_running = False
 
 
-def apply(mic_audio: np.ndarray, mic_rate: int) -> np.ndarray:
+def apply(mic_audio: np.ndarray, mic_rate: int, inplace: bool = False) -> np.ndarray:
     """
     Apply AEC to microphone audio.
 
@@ -167,6 +167,7 @@ def apply(mic_audio: np.ndarray, mic_rate: int) -> np.ndarray:
     Args:
         mic_audio: float32 numpy array, microphone audio
         mic_rate:  sample rate of mic_audio
+        inplace:   subtract into mic_audio's own buffer (float32 only)
 
     Returns:
         float32 numpy array with echo reduced
@@ -190,8 +191,8 @@ def apply(mic_audio: np.ndarray, mic_rate: int) -> np.ndarray:
         ref = ref[-mic_len:]
 
     # Normalize both signals to same scale
-    mic_rms = float(np.sqrt(np.mean(mic_audio ** 2)))
-    ref_rms = float(np.sqrt(np.mean(ref ** 2)))
+    mic_rms = float(np.sqrt(np.dot(mic_audio, mic_audio) / mic_len))
+    ref_rms = float(np.sqrt(np.dot(ref, ref) / len(ref)))
 
     if ref_rms < 1e-6:
         # Reference is silent — nothing to subtract
@@ -224,7 +225,14 @@ def apply(mic_audio: np.ndarray, mic_rate: int) -> np.ndarray:
 
     # Subtract reference from mic
     # Subtract only a fraction (0.7) to avoid over-subtraction artifacts
-    result = mic_audio - (ref_aligned * 0.7)
+    ref_aligned *= 0.7
+    if inplace and mic_audio.dtype == np.float32:
+        result = mic_audio
+        np.subtract(result, ref_aligned, out=result, casting="unsafe")
+        np.clip(result, -1.0, 1.0, out=result)
+        return result
+
+    result = mic_audio - ref_aligned
 
     # Clip to valid range
     result = np.clip(result, -1.0, 1.0)
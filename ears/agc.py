@@ -36,7 +36,7 @@ _smoothed_gain = 1.0
 _SMOOTH_FACTOR = 0.3   # how quickly gain adapts (0=no adapt, 1=instant)
 
 
-def apply(audio: np.ndarray) -> np.ndarray:
+def apply(audio: np.ndarray, inplace: bool = False) -> np.ndarray:
     """
     Conservative AGC.
 
@@ -49,13 +49,17 @@ def apply(audio: np.ndarray) -> np.ndarray:
         Very loud input (shouting): gentle attenuation.
         Reasonably quiet speech: gentle amplification.
     It never activates for near-silence.
+
+    inplace=True scales a float32 array in its own buffer and returns it
+    (the listen() pipeline path — no new allocation per utterance).
     """
     global _smoothed_gain
 
     if len(audio) == 0:
         return audio
 
-    rms = float(np.sqrt(np.mean(audio ** 2)))
+    # dot() instead of mean(audio ** 2) — no temporary squared copy
+    rms = float(np.sqrt(np.dot(audio, audio) / len(audio)))
 
     # Hard floor — below this is noise, not speech
     # Do not amplify noise. Return untouched.
@@ -81,24 +85,30 @@ def apply(audio: np.ndarray) -> np.ndarray:
         (1.0 - _SMOOTH_FACTOR) * _smoothed_gain
     )
 
-    applied = np.clip(audio * _smoothed_gain, -1.0, 1.0)
-    output_rms = float(np.sqrt(np.mean(applied ** 2)))
+    if inplace and audio.dtype == np.float32:
+        applied = audio
+        np.multiply(applied, np.float32(_smoothed_gain), out=applied)
+        np.clip(applied, -1.0, 1.0, out=applied)
+    else:
+        applied = np.clip(audio * _smoothed_gain, -1.0, 1.0).astype(np.float32)
 
     # Only print when gain correction is significant (>20% change)
     if abs(_smoothed_gain - 1.0) > 0.2:
+        output_rms = float(np.sqrt(np.dot(applied, applied) / len(applied)))
         print(Fore.CYAN + (
             f"[AGC] gain={_smoothed_gain:.2f}x "
             f"input={rms:.4f} output={output_rms:.4f}"
         ))
 
-    return applied.astype(np.float32)
+    return applied
 
 
 def apply_to_wav_bytes(wav_bytes: bytes) -> bytes:
     """
     Apply AGC to raw WAV bytes.
     Returns WAV bytes with normalized volume.
-    Used to normalize before signal quality check.
+    Kept for callers that only have WAV bytes — listen() now calls
+    apply(audio, inplace=True) on the float32 array instead.
     """
     import io
     import wave
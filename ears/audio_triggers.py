@@ -16,6 +16,14 @@ KEY INSIGHT:
     
     This is how professional beat detection works in music software.
 
+BLOCK PROCESSING:
+    Audio is read BLOCK_MS (100ms) at a time, not 10ms at a time.
+    Per-10ms peaks for the whole block come from one reshape + max, and
+    the event state machine only runs Python code at event boundaries.
+    Every 10ms chunk keeps its own timestamp, so event start/end times,
+    durations, leap checks and pattern timing are exactly what the old
+    chunk-by-chunk loop produced.
+
 WORKS ON:
     HP OMEN, Dell, Lenovo laptops (all with AGC)
     External USB mics (also works, less filtering needed)
@@ -41,8 +49,7 @@ except ImportError:
 try:
     import pyaudio
 except ImportError:
-    print(Fore.RED + "[TRIGGERS] pyaudio required")
-    raise
+    pyaudio = None   # capture bus still works; a dedicated device_index needs pyaudio
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -50,9 +57,10 @@ except ImportError:
 # ─────────────────────────────────────────────────────────────────────────
 
 SAMPLE_RATE = 16000
-CHUNK_SIZE  = 160          # 10ms at 16kHz base rate
+CHUNK_SIZE  = 160          # 10ms at 16kHz base rate — detection resolution
+BLOCK_MS    = 100          # audio read and processed per loop iteration
 CHANNELS    = 1
-FORMAT      = pyaudio.paInt16
+FORMAT      = pyaudio.paInt16 if pyaudio else 8
 
 
 # ─────────────────────────────────────────────────────────────────────────
@@ -210,8 +218,15 @@ def _find_best_input_device():
 class TriggerDetector:
 
     def __init__(self, sensitivity="medium", device_index=None, debug=False):
+        # No explicit device: read 10ms frames from the shared capture bus
+        # instead of opening (and probing) devices of our own.
+        self._sub = None
+        self._use_bus = False
         if device_index is None:
-            device_index = _find_best_input_device()
+            from ears import capture_bus
+            self._use_bus = capture_bus.get_settings()["enabled"]
+            if not self._use_bus:
+                device_index = _find_best_input_device()
         self.sensitivity  = sensitivity
         self.device_index = device_index
         self.debug        = debug
@@ -227,6 +242,7 @@ class TriggerDetector:
         self._actual_rate     = SAMPLE_RATE
         self._actual_chunk    = CHUNK_SIZE
         self._actual_channels = CHANNELS
+        self._block_chunks    = max(1, BLOCK_MS // 10)
 
         self._pending_taps      = deque()
         self._last_pattern_time = 0
@@ -238,8 +254,8 @@ class TriggerDetector:
         # Store last ~500ms of peak values (10 chunks at 50ms each)
         self._peak_history = deque(maxlen=10)
 
-        # Current transient event being tracked
-        # {"start": float, "peak": float, "samples": [float]}
+        # Current transient event being tracked (may span blocks)
+        # {"start": float, "peak": float}
         self._event = None
 
         self._load_thresholds()
@@ -282,6 +298,9 @@ class TriggerDetector:
         self._running = False
         if self._thread:
             self._thread.join(timeout=2)
+        if self._sub:
+            self._sub.close()
+            self._sub = None
         if self._stream:
             try:
                 self._stream.stop_stream()
@@ -295,7 +314,67 @@ class TriggerDetector:
                 pass
         print(Fore.YELLOW + "[TRIGGERS] Stopped")
 
+    def _open_bus(self):
+        """Subscribe to the shared capture bus (16kHz mono, 10ms frames)."""
+        from ears import capture_bus
+        bus = capture_bus.get_bus()
+        if bus is None:
+            raise OSError("capture bus disabled")
+        self._sub = bus.subscribe("triggers")
+        self._actual_rate     = capture_bus.SAMPLE_RATE
+        self._actual_chunk    = capture_bus.FRAME_SAMPLES
+        self._actual_channels = 1
+
+    def _read_block(self):
+        """
+        BLOCK_MS of audio plus the timestamp of each 10ms chunk in it.
+        Mono int16 straight from the bus or a mono device; float32 in
+        [-1, 1] for a stereo device (channels averaged).
+        """
+        n = self._block_chunks
+        if self._use_bus:
+            samples = None
+            if self._sub is not None:
+                samples = self._sub.read(self._actual_chunk * n, timeout=1.0 + BLOCK_MS / 1000.0)
+            if samples is None:
+                # Owner process gone: attach to the next one or open the mic here
+                if self._running:
+                    from ears import capture_bus
+                    self._sub = capture_bus.resubscribe(self._sub, "triggers")
+                raise OSError("capture bus stalled")
+        else:
+            raw = self._stream.read(self._actual_chunk * n, exception_on_overflow=False)
+            samples = np.frombuffer(raw, dtype=np.int16)
+            if self._actual_channels == 2:
+                samples = (samples.astype(np.float32) / 32768.0).reshape(-1, 2).mean(axis=1)
+        now   = time.time()
+        dt    = self._actual_chunk / float(self._actual_rate)
+        times = now - (n - 1 - np.arange(n)) * dt
+        return samples, times
+
+    def _chunk_peaks(self, samples):
+        """Peak |amplitude| of every 10ms chunk, in [0, 1]."""
+        n   = len(samples) // self._actual_chunk
+        blk = samples[:n * self._actual_chunk].reshape(n, self._actual_chunk)
+        if blk.dtype == np.int16:
+            return np.maximum(blk.max(axis=1), -blk.min(axis=1).astype(np.int32)) / 32768.0
+        return np.abs(blk).max(axis=1).astype(np.float64)
+
     def _run(self):
+        if self._use_bus:
+            try:
+                self._open_bus()
+            except Exception as e:
+                print(Fore.RED + f"[TRIGGERS] Failed to open capture bus: {e}")
+                self._running = False
+                return
+        else:
+            if not self._open_device():
+                return
+        self._loop()
+
+    def _open_device(self):
+        """Dedicated pyaudio stream — only when a device_index was given."""
         try:
             self._audio = pyaudio.PyAudio()
 
@@ -329,19 +408,17 @@ class TriggerDetector:
         except Exception as e:
             print(Fore.RED + f"[TRIGGERS] Failed to open mic: {e}")
             self._running = False
-            return
+            return False
+        return True
 
+    def _loop(self):
         # Warmup
         print(Fore.CYAN + "[TRIGGERS] Warming up (2 seconds)...")
         warmup_end = time.time() + 2.0
         while self._running and time.time() < warmup_end:
             try:
-                raw = self._stream.read(self._actual_chunk, exception_on_overflow=False)
-                samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
-                if self._actual_channels == 2:
-                    samples = samples.reshape(-1, 2).mean(axis=1)
-                peak = float(np.max(np.abs(samples)))
-                self._peak_history.append(peak)
+                samples, _ = self._read_block()
+                self._peak_history.extend(self._chunk_peaks(samples).tolist())
             except Exception:
                 pass
 
@@ -349,67 +426,92 @@ class TriggerDetector:
 
         while self._running:
             try:
-                raw = self._stream.read(self._actual_chunk, exception_on_overflow=False)
-                samples = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
-
-                if self._actual_channels == 2:
-                    samples = samples.reshape(-1, 2).mean(axis=1)
-
-                if self.paused or time.time() < self.suppressed_until:
-                    self._peak_history.append(0)
-                    continue
-
-                peak_amp = float(np.max(np.abs(samples)))
-                now      = time.time()
-
-                if self.debug and peak_amp > 0.15:
-                    print(f"  peak={peak_amp:.3f}")
-
-                self._track_event(peak_amp, now)
-                self._peak_history.append(peak_amp)
-                self._check_pattern_ready()
-
+                samples, times = self._read_block()
+                self._process_block(samples, times)
             except Exception:
                 time.sleep(0.3)
 
-    def _track_event(self, peak_amp, now):
+    def _process_block(self, samples, times):
         """
-        Track short transient events and classify as snap/clap taps.
-
-        Logic:
-          - start event when peak rises above event_floor
-          - continue event while above floor
-          - when it falls back below floor, finalize event
-          - confirm tap only if:
-              * peak is high enough
-              * duration is short enough
-              * event is a strong leap over recent background
+        Run onset detection over one block, chunk by chunk in effect.
+
+        Per 10ms chunk (vectorized): peak, paused/suppressed mask, above
+        event_floor. Python-level work happens only where an event ends
+        (classify it) or a tap is pending (pattern timing).
         """
-        # Start or continue event
-        if peak_amp >= self.event_floor:
-            if self._event is None:
-                self._event = {
-                    "start": now,
-                    "peak": peak_amp,
-                    "samples": [peak_amp],
-                }
-            else:
-                self._event["samples"].append(peak_amp)
-                if peak_amp > self._event["peak"]:
-                    self._event["peak"] = peak_amp
+        peaks = self._chunk_peaks(samples)
+        n     = len(peaks)
+        times = times[:n]
+        if n == 0:
             return
 
-        # Event ended → classify it
-        if self._event is None:
-            return
+        if self.debug:
+            for p in peaks[peaks > 0.15]:
+                print(f"  peak={p:.3f}")
+
+        # Paused/suppressed chunks count as silence in the history and are
+        # skipped by the event tracker (an open event stays open).
+        if self.paused:
+            muted = np.ones(n, dtype=bool)
+        else:
+            muted = times < self.suppressed_until
+        history  = np.where(muted, 0.0, peaks)
+        prior    = list(self._peak_history)
+        combined = prior + history.tolist()
+        h0       = len(prior)
+
+        active = np.nonzero(~muted)[0]
+        above  = peaks[active] >= self.event_floor
+        was_in = np.concatenate(([self._event is not None], above[:-1]))
+        starts = np.nonzero(above & ~was_in)[0]
+        ends   = np.nonzero(~above & was_in)[0]
+
+        checked = 0
+        for k in ends:
+            e       = active[k]
+            run_beg = starts[starts < k]
+            if len(run_beg):
+                s          = run_beg[-1]
+                event_start = float(times[active[s]])
+                event_peak  = float(peaks[active[s:k]].max())
+            else:
+                event_start = self._event["start"]
+                event_peak  = self._event["peak"]
+                if k > 0:
+                    event_peak = max(event_peak, float(peaks[active[:k]].max()))
+
+            # Pattern timing for the chunks before this one, then classify
+            self._check_pattern_ready(times[active[checked:k]])
+            checked = k
+            self._classify_event(event_start, event_peak, float(times[e]),
+                                 combined[max(0, h0 + e - 10):h0 + e])
+            self._event = None
+
+        # Event still open at the end of the block
+        if len(active) and above[-1]:
+            tail_beg = starts[starts > (ends[-1] if len(ends) else -1)]
+            if len(tail_beg):
+                s = tail_beg[-1]
+                self._event = {"start": float(times[active[s]]),
+                               "peak":  float(peaks[active[s:]].max())}
+            else:
+                self._event["peak"] = max(self._event["peak"], float(peaks[active].max()))
+
+        self._check_pattern_ready(times[active[checked:]])
+        self._peak_history.extend(history.tolist())
 
-        event_start = self._event["start"]
-        event_peak  = self._event["peak"]
-        samples     = self._event["samples"]
+    def _classify_event(self, event_start, event_peak, now, recent):
+        """
+        Classify a finished transient event as a snap/clap tap.
+
+        Confirm tap only if:
+          * peak is high enough
+          * duration is short enough
+          * event is a strong leap over recent background
+            (mean of the 10 chunk peaks before the event ended)
+        """
         duration_ms = (now - event_start) * 1000.0
 
-        # Background leap check
-        recent = list(self._peak_history)[-10:]  # ~100ms history now
         recent_avg = (sum(recent) / len(recent)) if recent else 0.01
         if recent_avg < 0.01:
             recent_avg = 0.01
@@ -433,8 +535,6 @@ class TriggerDetector:
         if is_tap:
             self._register_tap(event_start)
 
-        self._event = None
-
     def _register_tap(self, timestamp):
         if self._pending_taps:
             last_time = self._pending_taps[-1]
@@ -453,15 +553,20 @@ class TriggerDetector:
             except Exception:
                 pass
 
-    def _check_pattern_ready(self):
-        if not self._pending_taps:
+    def _check_pattern_ready(self, times):
+        """
+        Fire the pending pattern at the first chunk time in `times` that
+        is PATTERN_WINDOW_MS past the last tap — the chunk at which the
+        old per-chunk loop would have fired it.
+        """
+        if not self._pending_taps or len(times) == 0:
             return
 
-        now = time.time()
         last_time = self._pending_taps[-1]
-
-        if (now - last_time) * 1000 < PATTERN_WINDOW_MS:
+        ready = np.nonzero((times - last_time) * 1000 >= PATTERN_WINDOW_MS)[0]
+        if len(ready) == 0:
             return
+        now = float(times[ready[0]])
 
         count = len(self._pending_taps)
         self._pending_taps.clear()
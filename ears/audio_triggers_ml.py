@@ -80,11 +80,14 @@ class MLTriggerDetector:
             return
         self._running = True
 
-        # Load YAMNet classifier
+        # YAMNet classifier — the runtime and model load on the first onset
         try:
-            from ears.yamnet_wrapper import YAMNetClassifier
+            from ears.yamnet_wrapper import YAMNetClassifier, backend_available
+            backend = backend_available()
+            if backend is None:
+                raise ImportError("no runtime/model found")
             self._classifier = YAMNetClassifier()
-            print(Fore.GREEN + "[AUDIO ML] YAMNet loaded")
+            print(Fore.GREEN + f"[AUDIO ML] YAMNet available ({backend}, loads on first onset)")
         except Exception as e:
             print(Fore.YELLOW + f"[AUDIO ML] YAMNet not available, using DSP only: {e}")
 
@@ -206,11 +209,16 @@ class MLTriggerDetector:
         audio_1s = np.concatenate(recent)
 
         try:
-            result = self._classifier.classify(audio_1s, sample_rate=SAMPLE_RATE)
+            result = self._classifier.classify(audio_1s, sample_rate=SAMPLE_RATE, top_k=0)
             snap_conf = result.get("snap", 0)
             clap_conf = result.get("clap", 0)
             return max(snap_conf, clap_conf)
         except Exception as e:
+            if self._classifier.backend_name is None:
+                # First-use load failed — fall back to DSP only for good
+                print(Fore.YELLOW + f"[AUDIO ML] YAMNet load failed, using DSP only: {e}")
+                self._classifier = None
+                return 1.0
             if self.debug:
                 print(Fore.RED + f"  YAMNet error: {e}")
             return 0.0
@@ -10,14 +10,21 @@ Why RapidFuzz over simple replace():
     RapidFuzz catches variations you have not listed yet.
     Example: "heavens" would not match replace("heaven", "seven")
              but RapidFuzz partial match catches it.
+
+The table is compiled once (reload() recompiles) into preprocessed choice
+lists. Words are scored against every single-word correction with one
+process.cdist() call (and cached), the text against every phrase with one
+more. Results are the same as applying the table entry by entry.
 """
 
 import os
 import re
+import numpy as np
 from colorama import Fore
 
 try:
     from rapidfuzz import fuzz as _rfuzz
+    from rapidfuzz import process as _rprocess
     _RAPIDFUZZ_AVAILABLE = True
 except ImportError:
     _RAPIDFUZZ_AVAILABLE = False
@@ -118,16 +125,131 @@ def _exact_correct(text: str) -> str:
     return result
 
 
+class _Compiled:
+    """
+    _CORRECTIONS as two choice lists (single words, phrases) plus the runs
+    of consecutive entries of each kind, in table order. Per utterance:
+    one ratio cdist() for words not seen yet, one partial_ratio cdist()
+    for the phrases, redone only if a correction changed the text.
+    """
+
+    def __init__(self, corrections):
+        self.words   = []   # (wrong, right, threshold)
+        self.phrases = []
+        self.runs    = []   # (is_single, start, end) into words / phrases
+        for wrong, right, threshold in corrections:
+            if wrong == right:
+                continue   # identity entries never change anything
+            is_single = len(wrong.split()) == 1
+            table = self.words if is_single else self.phrases
+            if not self.runs or self.runs[-1][0] != is_single:
+                self.runs.append([is_single, len(table), len(table)])
+            table.append((wrong, right, threshold))
+            self.runs[-1][2] += 1
+
+        self.word_wrongs   = [w for w, _, _ in self.words]
+        self.word_thr      = np.array([t for _, _, t in self.words], dtype=np.float64)
+        self.phrase_wrongs = [w for w, _, _ in self.phrases]
+        self.phrase_thr    = np.array([t for _, _, t in self.phrases], dtype=np.float64)
+        self.word_cutoff   = float(self.word_thr.min()) if self.words else 0.0
+        self.phrase_cutoff = float(self.phrase_thr.min()) if self.phrases else 0.0
+
+        # A replaced word is checked against the corrections after it, as
+        # it would be applying the table entry by entry. Replacement words
+        # are known up front, so their scores are too.
+        self.known = {}
+        self.word_hits({piece for _, right, _ in self.words for piece in right.split()})
+
+    def word_hits(self, words) -> dict:
+        """word -> (scores, indices of the corrections it passes), cached."""
+        missing = [w for w in words if w not in self.known]
+        if missing and self.words:
+            scores = _rprocess.cdist(missing, self.word_wrongs, scorer=_rfuzz.ratio,
+                                     score_cutoff=self.word_cutoff)
+            for word, row in zip(missing, scores):
+                self.known[word] = (row, np.flatnonzero(row >= self.word_thr).tolist())
+            if len(self.known) > 5000:
+                self.known = dict(list(self.known.items())[-2000:])
+        return self.known
+
+    def _chain(self, word, start, end, out) -> bool:
+        row, hits = self.known[word]
+        k = next((i for i in hits if start <= i < end), None)
+        if k is None:
+            out.append(word)
+            return False
+        right = self.words[k][1]
+        print(Fore.CYAN + (
+            f"[EARS] Autocorrect: '{word}' -> '{right}' "
+            f"(score={row[k]:.0f})"
+        ))
+        for piece in right.split():
+            self._chain(piece, k + 1, end, out)
+        return True
+
+    def apply_words(self, result: str, start: int, end: int) -> str:
+        words = result.split()
+        known = self.word_hits(words)
+        if not any(start <= i < end for w in words for i in known[w][1]):
+            return result   # the common case: nothing in this run matches
+        out     = []
+        changed = False
+        for word in words:
+            changed |= self._chain(word, start, end, out)
+        return " ".join(out) if changed else result
+
+    def apply_phrases(self, result: str, start: int, end: int, scored: dict) -> str:
+        j = start
+        while j < end:
+            if scored.get("text") != result:
+                scores = _rprocess.cdist(
+                    [result], self.phrase_wrongs, scorer=_rfuzz.partial_ratio,
+                    score_cutoff=self.phrase_cutoff,
+                )[0]
+                scored.update(text=result, scores=scores,
+                              hits=np.flatnonzero(scores >= self.phrase_thr).tolist())
+            j = next((i for i in scored["hits"] if j <= i < end), end)
+            if j == end:
+                break
+            wrong, right, _ = self.phrases[j]
+            print(Fore.CYAN + (
+                f"[EARS] Autocorrect: '{wrong}' -> '{right}' "
+                f"(score={scored['scores'][j]:.0f})"
+            ))
+            result = result.replace(wrong, right)
+            j += 1
+        return result
+
+
+_compiled = None
+
+
+def _table() -> _Compiled:
+    global _compiled
+    if _compiled is None:
+        _compiled = _Compiled(_CORRECTIONS)
+    return _compiled
+
+
+def reload():
+    """Recompile the correction table. Call after changing _CORRECTIONS."""
+    global _compiled
+    _compiled = None
+    if _RAPIDFUZZ_AVAILABLE:
+        _table()
+
+
 def correct(text: str) -> str:
     """
     Apply autocorrect to transcribed text.
 
     Strategy:
-        1. Tokenize into words and short phrases
-        2. For each correction pair, check if the wrong phrase
-           appears in the text with high enough fuzzy similarity
-        3. Replace with the correct phrase
-        4. Return corrected text with original capitalization restored
+        1. Tokenize into words
+        2. Score every word against each run of single-word corrections
+           at once (ratio — avoids false positives on single words), and
+           the text against each run of phrase corrections at once
+           (partial_ratio — checks substrings)
+        3. Replace with the correct phrase, in table order
 
     Returns corrected text, lowercase.
     """
@@ -137,44 +259,12 @@ def correct(text: str) -> str:
     if not _RAPIDFUZZ_AVAILABLE:
         return _exact_correct(text)
 
+    table  = _table()
     result = text.lower().strip()
-
-    for wrong, right, threshold in _CORRECTIONS:
-        # Skip identity entries
-        if wrong == right:
-            continue
-
-        # Check if wrong phrase appears in text with sufficient similarity
-        # Use partial_ratio for multi-word phrases (checks substrings)
-        # Use ratio for single words (avoids false positives)
-        wrong_words = wrong.split()
-
-        if len(wrong_words) == 1:
-            # Single word: check each word in result
-            words = result.split()
-            new_words = []
-            changed   = False
-            for w in words:
-                score = _rfuzz.ratio(w, wrong)
-                if score >= threshold:
-                    new_words.append(right)
-                    changed = True
-                    print(Fore.CYAN + (
-                        f"[EARS] Autocorrect: '{w}' -> '{right}' "
-                        f"(score={score:.0f})"
-                    ))
-                else:
-                    new_words.append(w)
-            if changed:
-                result = " ".join(new_words)
+    scored = {}
+    for is_single, start, end in table.runs:
+        if is_single:
+            result = table.apply_words(result, start, end)
         else:
-            # Multi-word phrase: use partial_ratio on full text
-            score = _rfuzz.partial_ratio(wrong, result)
-            if score >= threshold:
-                print(Fore.CYAN + (
-                    f"[EARS] Autocorrect: '{wrong}' -> '{right}' "
-                    f"(score={score:.0f})"
-                ))
-                result = result.replace(wrong, right)
-
-    return result
\ No newline at end of file
+            result = table.apply_phrases(result, start, end, scored)
+    return result
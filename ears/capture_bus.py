@@ -0,0 +1,794 @@
+"""
+=============================================================================
+ears/capture_bus.py
+Seven — Shared microphone capture bus
+
+WHAT THIS FILE DOES:
+    Opens the microphone ONCE and writes 16 kHz mono int16 audio into a
+    ring buffer. Every audio consumer subscribes with its own cursor:
+
+        listen()               ears/core.py        (via microphone())
+        listen_for_interrupt() ears/core.py        (via microphone())
+        _measure_rms()         ears/noise_floor.py
+        TriggerDetector        ears/audio_triggers.py
+        VoiceListener          trigger_daemon.py   (separate process)
+
+WHY:
+    Before this, five places opened the device on their own. Every
+    utterance paid device open/close latency, each stream had its own
+    kernel buffer, and concurrent opens failed with "device busy" —
+    worked around with sleeps and retries.
+
+CROSS-PROCESS:
+    The process that owns the device also mirrors the ring into a named
+    shared-memory block (SHM_NAME). A second process (trigger_daemon.py
+    while Seven is running, or Seven while the daemon is running) attaches
+    read-only instead of opening the mic again. The owner stamps a
+    heartbeat on every frame; if it goes stale the reader's reads return
+    None. A consumer that holds a subscription for its whole lifetime
+    passes it to resubscribe() on a stall: that drops the dead view,
+    re-resolves with get_bus() — attaching to a new owner or opening the
+    device here — and returns a fresh subscription under the same name.
+
+RING LAYOUT:
+    Samples are addressed by an absolute, ever-increasing position.
+    Position p lives at ring[p % capacity]. A subscriber whose cursor
+    falls more than `capacity` behind the writer is moved forward and
+    the skipped samples are counted in `dropped` — slow consumers never
+    block the writer.
+
+TESTING:
+    WavFileSource replays a WAV file as if it were the microphone.
+        set SEVEN_CAPTURE_WAV=C:\\path\\to\\clip.wav
+    or  config.json -> ears.capture_bus.wav_source
+    Standalone check:
+        python -m ears.capture_bus --wav clip.wav
+
+CONFIG (config.json -> ears.capture_bus):
+    enabled        True   -- False = old behaviour, sr.Microphone() per call
+    ring_seconds   30
+    shared_memory  True   -- export/attach the cross-process ring
+    wav_source     ""     -- replay this file instead of the mic
+
+OFFLINE: Yes. pyaudio for the device, numpy for the ring.
+=============================================================================
+"""
+
+import os
+import sys
+import time
+import wave
+import atexit
+import threading
+import numpy as np
+from colorama import Fore
+
+from ears import settings as _settings
+
+try:
+    import speech_recognition as sr
+    _AudioSourceBase = sr.AudioSource
+except ImportError:
+    sr = None
+    _AudioSourceBase = object
+
+
+SAMPLE_RATE   = 16000
+SAMPLE_WIDTH  = 2            # int16
+FRAME_SAMPLES = 160          # 10 ms — matches audio_triggers CHUNK_SIZE
+SHM_NAME      = "seven_capture_bus"
+
+_SHM_MAGIC        = 0x3153554256455653   # "SEVEBUS1"
+_SHM_HEADER_BYTES = 64
+_HEARTBEAT_STALE  = 2.0                  # seconds without a frame = owner gone
+
+# Header slots (int64 each)
+_H_MAGIC, _H_CAPACITY, _H_RATE, _H_WRITE_POS, _H_HEARTBEAT_MS, _H_PID = range(6)
+
+_DEFAULTS = {
+    "enabled":       True,
+    "ring_seconds":  30,
+    "shared_memory": True,
+    "wav_source":    "",
+}
+
+
+def get_settings() -> dict:
+    """config.json -> ears.capture_bus merged over defaults."""
+    return _settings.load("capture_bus", _DEFAULTS)
+
+
+def _to_mono_16k(pcm: np.ndarray, rate: int, channels: int) -> np.ndarray:
+    """int16 interleaved PCM at any rate -> int16 mono 16 kHz."""
+    if channels > 1:
+        pcm = pcm.reshape(-1, channels).mean(axis=1)
+    if rate != SAMPLE_RATE and len(pcm):
+        n_out = int(round(len(pcm) * SAMPLE_RATE / float(rate)))
+        x_old = np.arange(len(pcm), dtype=np.float64)
+        x_new = np.linspace(0, len(pcm) - 1, n_out)
+        pcm   = np.interp(x_new, x_old, pcm)
+    return np.asarray(pcm).astype(np.int16, copy=False)
+
+
+# =============================================================================
+# SOURCES
+# =============================================================================
+
+class MicSource:
+    """
+    The physical microphone. Asks PortAudio for 16 kHz mono directly;
+    falls back to the device's native rate and resamples if refused.
+    """
+
+    def __init__(self, device_index=None):
+        self.device_index = device_index
+        self._pa     = None
+        self._stream = None
+        self._rate   = SAMPLE_RATE
+
+    def open(self):
+        import pyaudio
+        self._pa = pyaudio.PyAudio()
+        try:
+            self._stream = self._pa.open(
+                format=pyaudio.paInt16, channels=1, rate=SAMPLE_RATE,
+                input=True, frames_per_buffer=FRAME_SAMPLES,
+                input_device_index=self.device_index,
+            )
+            self._rate = SAMPLE_RATE
+        except Exception:
+            if self.device_index is not None:
+                info = self._pa.get_device_info_by_index(self.device_index)
+            else:
+                info = self._pa.get_default_input_device_info()
+            self._rate   = int(info["defaultSampleRate"])
+            self._stream = self._pa.open(
+                format=pyaudio.paInt16, channels=1, rate=self._rate,
+                input=True,
+                frames_per_buffer=int(self._rate * FRAME_SAMPLES / SAMPLE_RATE),
+                input_device_index=self.device_index,
+            )
+        print(Fore.CYAN + f"[CAPTURE] Microphone open ({self._rate}Hz)")
+
+    def read(self, n: int) -> np.ndarray:
+        need = n if self._rate == SAMPLE_RATE else int(round(n * self._rate / SAMPLE_RATE))
+        raw  = self._stream.read(need, exception_on_overflow=False)
+        pcm  = np.frombuffer(raw, dtype=np.int16)
+        if self._rate != SAMPLE_RATE:
+            pcm = _to_mono_16k(pcm, self._rate, 1)
+        return pcm
+
+    def close(self):
+        try:
+            if self._stream:
+                self._stream.stop_stream()
+                self._stream.close()
+        except Exception:
+            pass
+        try:
+            if self._pa:
+                self._pa.terminate()
+        except Exception:
+            pass
+        self._stream, self._pa = None, None
+
+    def describe(self) -> str:
+        return f"mic:{self.device_index if self.device_index is not None else 'default'}"
+
+
+class WavFileSource:
+    """
+    Replays a WAV file as the microphone.
+
+    realtime=True paces frames at 10 ms, like a real device.
+    realtime=False delivers the file as fast as consumers read it —
+    for benchmarks. Either way, after the file ends the source delivers
+    real-time silence (or loops), so endpointers and timeouts still fire.
+    """
+
+    def __init__(self, path, realtime=True, loop=False):
+        self.path     = path
+        self.realtime = realtime
+        self.loop     = loop
+        self.finished = False
+        self._pcm     = np.zeros(0, dtype=np.int16)
+        self._pos     = 0
+        self._t0      = 0.0
+        self._sent    = 0
+
+    def open(self):
+        with wave.open(self.path, 'rb') as wf:
+            rate     = wf.getframerate()
+            channels = wf.getnchannels()
+            raw      = wf.readframes(wf.getnframes())
+        self._pcm = _to_mono_16k(np.frombuffer(raw, dtype=np.int16), rate, channels)
+        self._pos, self._sent, self.finished = 0, 0, False
+        self._t0  = time.perf_counter()
+        print(Fore.CYAN + (
+            f"[CAPTURE] Replaying {os.path.basename(self.path)} "
+            f"({len(self._pcm) / SAMPLE_RATE:.1f}s)"
+        ))
+
+    def read(self, n: int) -> np.ndarray:
+        if self._pos >= len(self._pcm) and self.loop and len(self._pcm):
+            self._pos = 0
+        if self._pos < len(self._pcm):
+            out = self._pcm[self._pos:self._pos + n]
+            self._pos += len(out)
+            if len(out) < n:
+                out = np.concatenate([out, np.zeros(n - len(out), dtype=np.int16)])
+        else:
+            self.finished = True
+            out = np.zeros(n, dtype=np.int16)
+
+        self._sent += n
+        if self.realtime or self.finished:
+            due = self._t0 + self._sent / float(SAMPLE_RATE)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif self.finished:
+                self._t0, self._sent = time.perf_counter(), 0
+        return out
+
+    def close(self):
+        pass
+
+    def describe(self) -> str:
+        return f"wav:{os.path.basename(self.path)}"
+
+
+# =============================================================================
+# RING + SUBSCRIPTIONS
+# =============================================================================
+
+class _RingView:
+    """
+    Read side shared by the in-process bus and the shared-memory reader.
+    Subclasses provide: capacity, _ring, write_pos(), wait_for(), is_alive().
+    """
+
+    def _init_view(self):
+        self._subs      = {}
+        self._subs_lock = threading.Lock()
+
+    def copy(self, start: int, n: int) -> np.ndarray:
+        """Samples [start, start+n) as a new int16 array."""
+        cap = self.capacity
+        i   = start % cap
+        if i + n <= cap:
+            return self._ring[i:i + n].copy()
+        first = cap - i
+        return np.concatenate([self._ring[i:], self._ring[:n - first]])
+
+    def subscribe(self, name: str, preroll: float = 0.0) -> "Subscription":
+        """
+        New cursor at "now", or `preroll` seconds back if the ring has it.
+        Pre-roll lets an endpointer keep the start of a word that began
+        before the consumer subscribed.
+        """
+        wp    = self.write_pos()
+        start = max(0, wp - int(preroll * SAMPLE_RATE), wp - self.capacity)
+        sub   = Subscription(self, name, start)
+        with self._subs_lock:
+            self._subs[id(sub)] = sub
+        return sub
+
+    def _unsubscribe(self, sub):
+        with self._subs_lock:
+            self._subs.pop(id(sub), None)
+
+    def subscriber_stats(self) -> dict:
+        wp = self.write_pos()
+        with self._subs_lock:
+            subs = list(self._subs.values())
+        return {
+            s.name: {
+                "lag_ms":  round((wp - s.cursor) * 1000.0 / SAMPLE_RATE, 1),
+                "dropped": s.dropped,
+            }
+            for s in subs
+        }
+
+
+class Subscription:
+    """One consumer's cursor into the ring."""
+
+    def __init__(self, ring, name, cursor):
+        self._ring   = ring
+        self.name    = name
+        self.cursor  = cursor
+        self.dropped = 0
+
+    def _catch_up(self):
+        oldest = self._ring.write_pos() - self._ring.capacity
+        if self.cursor < oldest:
+            self.dropped += oldest - self.cursor
+            self.cursor   = oldest
+
+    def read(self, n: int, timeout: float = None):
+        """
+        Block until n samples past the cursor exist, return them as int16.
+        Returns None on timeout or if the bus stopped.
+        """
+        target = self.cursor + n
+        if not self._ring.wait_for(target, timeout):
+            return None
+        if self._ring.write_pos() < target:
+            return None
+        self._catch_up()
+        data = self._ring.copy(self.cursor, n)
+        self.cursor += n
+        return data
+
+    def read_available(self, max_samples: int = None) -> np.ndarray:
+        """Everything written since the cursor, without blocking."""
+        self._catch_up()
+        n = self._ring.write_pos() - self.cursor
+        if max_samples is not None:
+            n = min(n, max_samples)
+        if n <= 0:
+            return np.zeros(0, dtype=np.int16)
+        data = self._ring.copy(self.cursor, n)
+        self.cursor += n
+        return data
+
+    def seek_to_now(self):
+        """Drop anything not yet read (e.g. audio captured while Seven spoke)."""
+        self.cursor = self._ring.write_pos()
+
+    def is_alive(self) -> bool:
+        """False once the bus behind it stopped (or its shared owner went away)."""
+        return self._ring.is_alive()
+
+    def close(self):
+        self._ring._unsubscribe(self)
+
+
+class CaptureBus(_RingView):
+    """
+    Owns the source. One thread reads 10 ms frames into the ring and
+    (optionally) the shared-memory mirror.
+    """
+
+    def __init__(self, source, ring_seconds=30, export_shared=False):
+        self._init_view()
+        self._source   = source
+        self.capacity  = int(ring_seconds * SAMPLE_RATE)
+        self._pos      = 0
+        self._cond     = threading.Condition()
+        self._running  = False
+        self._thread   = None
+        self._shm      = None
+        self._hdr      = None
+
+        if export_shared:
+            self._shm = _create_shared_block(self.capacity)
+        if self._shm is not None:
+            self._hdr  = np.ndarray((8,), dtype=np.int64, buffer=self._shm.buf[:_SHM_HEADER_BYTES])
+            self._ring = np.ndarray((self.capacity,), dtype=np.int16,
+                                    buffer=self._shm.buf[_SHM_HEADER_BYTES:])
+            self._hdr[:] = 0
+            self._hdr[_H_CAPACITY] = self.capacity
+            self._hdr[_H_RATE]     = SAMPLE_RATE
+            self._hdr[_H_PID]      = os.getpid()
+            self._hdr[_H_MAGIC]    = _SHM_MAGIC
+        else:
+            self._ring = np.zeros(self.capacity, dtype=np.int16)
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread  = threading.Thread(target=self._run, daemon=True, name="SevenCaptureBus")
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        if self._shm is not None:
+            self._hdr = None
+            self._ring = np.zeros(0, dtype=np.int16)
+            try:
+                self._shm.close()
+                self._shm.unlink()
+            except Exception:
+                pass
+            self._shm = None
+
+    def is_alive(self) -> bool:
+        return self._running and self._thread is not None and self._thread.is_alive()
+
+    def is_owner(self) -> bool:
+        return True
+
+    def describe(self) -> str:
+        return self._source.describe()
+
+    # ── Writer ───────────────────────────────────────────────────────────
+
+    def _run(self):
+        try:
+            self._source.open()
+        except Exception as e:
+            print(Fore.YELLOW + f"[CAPTURE] Source unavailable: {e}")
+            self._running = False
+            with self._cond:
+                self._cond.notify_all()
+            return
+
+        errors = 0
+        while self._running:
+            try:
+                frame = self._source.read(FRAME_SAMPLES)
+                errors = 0
+            except Exception as e:
+                errors += 1
+                if errors == 1:
+                    print(Fore.YELLOW + f"[CAPTURE] Read error: {e}")
+                time.sleep(0.05)
+                continue
+            if len(frame):
+                self._write(frame)
+
+        self._source.close()
+
+    def _write(self, frame: np.ndarray):
+        cap   = self.capacity
+        n     = min(len(frame), cap)
+        frame = frame[-n:]
+        i     = self._pos % cap
+        first = min(n, cap - i)
+        self._ring[i:i + first] = frame[:first]
+        if first < n:
+            self._ring[:n - first] = frame[first:]
+
+        with self._cond:
+            self._pos += n
+            self._cond.notify_all()
+
+        hdr = self._hdr
+        if hdr is not None:
+            hdr[_H_WRITE_POS]    = self._pos
+            hdr[_H_HEARTBEAT_MS] = int(time.time() * 1000)
+
+    # ── Read side ────────────────────────────────────────────────────────
+
+    def write_pos(self) -> int:
+        return self._pos
+
+    def wait_for(self, target: int, timeout: float = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._pos >= target or not self._running, timeout
+            )
+
+
+class SharedBusReader(_RingView):
+    """Attaches to another process's CaptureBus via shared memory."""
+
+    def __init__(self, shm):
+        self._init_view()
+        self._shm     = shm
+        self._hdr     = np.ndarray((8,), dtype=np.int64, buffer=shm.buf[:_SHM_HEADER_BYTES])
+        self.capacity = int(self._hdr[_H_CAPACITY])
+        self._ring    = np.ndarray((self.capacity,), dtype=np.int16,
+                                   buffer=shm.buf[_SHM_HEADER_BYTES:])
+        self.owner_pid = int(self._hdr[_H_PID])
+
+    def write_pos(self) -> int:
+        return int(self._hdr[_H_WRITE_POS]) if self._hdr is not None else 0
+
+    def is_alive(self) -> bool:
+        if self._hdr is None:
+            return False
+        age = time.time() - self._hdr[_H_HEARTBEAT_MS] / 1000.0
+        return bool(age < _HEARTBEAT_STALE)
+
+    def is_owner(self) -> bool:
+        return False
+
+    def describe(self) -> str:
+        return f"shared:{self.owner_pid}"
+
+    def wait_for(self, target: int, timeout: float = None) -> bool:
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.write_pos() < target:
+            if not self.is_alive():
+                return True    # caller sees write_pos < target -> None
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def stop(self):
+        self._hdr  = None
+        self._ring = np.zeros(0, dtype=np.int16)
+        try:
+            self._shm.close()
+        except Exception:
+            pass
+
+
+# =============================================================================
+# SHARED MEMORY HELPERS
+# =============================================================================
+
+def _open_existing(name=SHM_NAME):
+    """Attach without letting this process's resource tracker unlink it on exit."""
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 — no track flag. Unregister by hand on POSIX.
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name != "nt":
+            try:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:
+                pass
+        return shm
+
+
+def _attach_shared(name=SHM_NAME):
+    """SharedBusReader for a live owner, or None."""
+    try:
+        shm = _open_existing(name)
+    except Exception:
+        return None
+    try:
+        reader = SharedBusReader(shm)
+        if int(reader._hdr[_H_MAGIC]) == _SHM_MAGIC and reader.is_alive():
+            return reader
+        reader.stop()
+    except Exception:
+        try:
+            shm.close()
+        except Exception:
+            pass
+    return None
+
+
+def _create_shared_block(capacity, name=SHM_NAME):
+    """Create the shared block. Replaces a stale one left by a crashed owner."""
+    from multiprocessing import shared_memory
+    size = _SHM_HEADER_BYTES + capacity * SAMPLE_WIDTH
+    for _ in range(2):
+        try:
+            return shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            try:
+                stale = _open_existing(name)
+                stale.close()
+                stale.unlink()
+            except Exception:
+                break
+        except Exception as e:
+            print(Fore.YELLOW + f"[CAPTURE] Shared memory unavailable: {e}")
+            return None
+    print(Fore.YELLOW + "[CAPTURE] Shared memory block busy — in-process only")
+    return None
+
+
+# =============================================================================
+# MODULE-LEVEL BUS
+# =============================================================================
+
+_bus      = None
+_bus_lock = threading.Lock()
+
+
+def get_bus():
+    """
+    The bus for this process. Resolution order:
+        1. Already running here and alive           -> reuse
+        2. Another process owns the mic (shm live)  -> attach
+        3. Otherwise                                -> open the source here
+    Returns None only if the bus is disabled in config.
+    """
+    global _bus
+    with _bus_lock:
+        if _bus is not None and _bus.is_alive():
+            return _bus
+        if _bus is not None:
+            _bus.stop()
+            _bus = None
+
+        cfg = get_settings()
+        if not cfg["enabled"]:
+            return None
+
+        wav = os.environ.get("SEVEN_CAPTURE_WAV") or cfg["wav_source"]
+        use_shm = bool(cfg["shared_memory"]) and not wav
+
+        if use_shm:
+            reader = _attach_shared()
+            if reader is not None:
+                print(Fore.CYAN + f"[CAPTURE] Attached to shared capture bus (pid {reader.owner_pid})")
+                _bus = reader
+                return _bus
+
+        source = WavFileSource(wav, realtime=True, loop=False) if wav else MicSource()
+        _bus = CaptureBus(source, ring_seconds=float(cfg["ring_seconds"]), export_shared=use_shm)
+        _bus.start()
+        return _bus
+
+
+def set_source(source, ring_seconds=None):
+    """
+    Replace this process's bus with one reading `source`.
+    Used by benchmarks and manual tests with WavFileSource.
+    """
+    global _bus
+    with _bus_lock:
+        if _bus is not None:
+            _bus.stop()
+        seconds = ring_seconds or float(get_settings()["ring_seconds"])
+        _bus = CaptureBus(source, ring_seconds=seconds, export_shared=False)
+        _bus.start()
+        return _bus
+
+
+def shutdown():
+    """Stop the bus and release the device / shared block."""
+    global _bus
+    with _bus_lock:
+        if _bus is not None:
+            _bus.stop()
+            _bus = None
+
+
+atexit.register(shutdown)
+
+
+def resubscribe(sub, name: str = None):
+    """
+    Recover a held subscription after a stalled read. While its bus is
+    alive the stall was only a quiet moment and `sub` is returned as is.
+    Otherwise closes it, re-resolves the bus (taking the device over if
+    no other process owns it) and returns a new subscription with the
+    same name — or None if the bus is disabled or cannot be opened.
+    Pass the last value it returned back in, even None (with `name`).
+    """
+    if sub is not None and sub.is_alive():
+        return sub
+    if sub is not None:
+        sub.close()
+    try:
+        bus = get_bus()
+    except Exception as e:
+        print(Fore.YELLOW + f"[CAPTURE] Re-resolving the capture bus failed: {e}")
+        return None
+    if bus is None:
+        return None
+    name = name or (sub.name if sub is not None else "consumer")
+    print(Fore.CYAN + f"[CAPTURE] {name}: capture bus owner gone — now on {bus.describe()}")
+    return bus.subscribe(name)
+
+
+def get_stats() -> dict:
+    """Snapshot for logs and /api/speed."""
+    bus = _bus
+    if bus is None:
+        return {"running": False}
+    return {
+        "running":     bus.is_alive(),
+        "owner":       bus.is_owner(),
+        "source":      bus.describe(),
+        "captured_s":  round(bus.write_pos() / float(SAMPLE_RATE), 1),
+        "subscribers": bus.subscriber_stats(),
+    }
+
+
+# =============================================================================
+# SPEECH_RECOGNITION ADAPTER
+# =============================================================================
+
+class _SubscriptionStream:
+    """The .stream object sr.Recognizer reads from: read(n_frames) -> bytes."""
+
+    def __init__(self, mic, timeout):
+        self._mic     = mic
+        self._timeout = timeout
+
+    def read(self, size, exception_on_overflow=False):
+        sub  = self._mic.subscription
+        data = sub.read(size, timeout=self._timeout) if sub is not None else None
+        if data is None:
+            # Held across many listen() calls (trigger daemon): switch to a
+            # live bus so the caller's next attempt gets audio again
+            self._mic.subscription = resubscribe(sub, self._mic.name)
+            if self._mic.subscription is None:
+                raise OSError("capture bus unavailable")
+            raise OSError("capture bus stalled")
+        return data.tobytes()
+
+
+class BusMicrophone(_AudioSourceBase):
+    """
+    Drop-in for sr.Microphone() backed by a bus subscription.
+    Entering subscribes (no device open); exiting unsubscribes.
+    """
+
+    def __init__(self, name="listen", preroll=0.0, read_timeout=2.0):
+        self.name          = name
+        self.preroll       = preroll
+        self.read_timeout  = read_timeout
+        self.SAMPLE_RATE   = SAMPLE_RATE
+        self.SAMPLE_WIDTH  = SAMPLE_WIDTH
+        self.CHUNK         = 1024
+        self.format        = None
+        self.stream        = None
+        self.subscription  = None
+
+    def __enter__(self):
+        bus = get_bus()
+        if bus is None:
+            raise OSError("capture bus disabled")
+        self.subscription = bus.subscribe(self.name, preroll=self.preroll)
+        self.stream       = _SubscriptionStream(self, self.read_timeout)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.subscription is not None:
+            self.subscription.close()
+        self.subscription = None
+        self.stream       = None
+
+
+def microphone(name="listen", preroll=0.0):
+    """
+    Audio source for sr.Recognizer.listen().
+    BusMicrophone normally; a real sr.Microphone() if the bus is disabled.
+    """
+    if get_settings()["enabled"]:
+        return BusMicrophone(name=name, preroll=preroll)
+    return sr.Microphone()
+
+
+# =============================================================================
+# STANDALONE TEST
+# =============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Capture bus smoke test")
+    parser.add_argument("--wav", help="replay this WAV instead of the microphone")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    if args.wav:
+        set_source(WavFileSource(args.wav, realtime=True))
+    bus = get_bus()
+    if bus is None:
+        print("Capture bus disabled in config.")
+        sys.exit(1)
+
+    subs = [bus.subscribe(f"reader{i}") for i in range(3)]
+    results = {}
+
+    def _drain(sub):
+        got = sub.read(int(args.seconds * SAMPLE_RATE), timeout=args.seconds + 3)
+        results[sub.name] = got
+
+    threads = [threading.Thread(target=_drain, args=(s,)) for s in subs]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for name, pcm in sorted(results.items()):
+        if pcm is None:
+            print(f"  {name}: timed out")
+        else:
+            rms = float(np.sqrt(np.mean(pcm.astype(np.float32) ** 2)))
+            print(f"  {name}: {len(pcm)} samples  rms={rms:.0f}")
+    print(get_stats())
+    shutdown()
@@ -4,11 +4,11 @@ PROJECT SEVEN - ears/core.py
 Version: 1.2.7 - Final Production Pipeline
 
 PIPELINE (in order):
-    1. Microphone capture (SpeechRecognition, adaptive threshold)
+    1. Microphone capture (shared capture bus, SpeechRecognition threshold)
     2. AGC — normalize volume (ears/agc.py)
     3. AEC — remove echo if speaking (ears/aec.py)
     4. Signal gates — RMS, duration, crest factor (ears/signal_gates.py)
-    5. Whisper transcription — in memory via BytesIO
+    5. Whisper transcription — float32 array passed straight to faster-whisper
     6. TranscriptionInfo confidence — avg_logprob, VAD removal ratio
     7. Per-segment confidence — no_speech_prob filter
     8. Non-ASCII / emoji filter — catches music emoji output
@@ -27,16 +27,23 @@ ARCHITECTURE:
     ears/autocorrect.py       RapidFuzz fuzzy autocorrect.
     ears/agc.py               Automatic gain control.
     ears/aec.py               Acoustic echo cancellation.
-
-NO TEMP FILES:
-    Audio stays in RAM via BytesIO throughout.
-    temp_audio.wav written only when Voice ID is enabled in config.
+    ears/capture_bus.py       One shared microphone stream for all consumers.
+    ears/whisper_service.py   Whisper models, prioritized decode queue, local API.
+    ears/keyword_spotter.py   MFCC/DTW gate in front of the interrupt decode.
+
+NO TEMP FILES, NO WAV ROUND TRIPS:
+    One float32 array carries the utterance from capture to Whisper.
+    AGC, AEC and the signal gates work on it in place.
+    Voice ID embeds the same array in a thread while Whisper decodes it.
+    WAV bytes are built only when a debug dump is configured
+    (config.json -> ears.debug.dump_dir) or a caller asks for the clip
+    (listen(return_clip=True) — voice enrollment).
 
 SOURCE TAGGING:
-    Returns ("__voice__", audio_path) on valid speech from microphone.
-    audio_path is "__voice__" sentinel when Voice ID disabled.
-    audio_path is "temp_audio.wav" when Voice ID enabled.
-    main.py uses audio_path to set speaker_id correctly.
+    Returns (text, "__voice__") on valid speech from microphone.
+    listen(return_clip=True) returns (text, wav_path) instead.
+    When Voice ID is enabled, last_speaker() holds the speaker for that
+    utterance; main.py uses it to set speaker_id.
 =============================================================================
 """
 
@@ -45,6 +52,7 @@ import os
 import re
 import json
 import time
+import tempfile
 import threading
 import numpy as np
 import colorama
@@ -55,11 +63,10 @@ if not hasattr(np, 'iterable'):
     np.iterable = lambda obj: hasattr(obj, '__iter__')
 
 import speech_recognition as sr
-from faster_whisper import WhisperModel
 
 # Sub-modules
 from ears import noise_floor as _nf
-from ears.signal_gates import check as _signal_check
+from ears.signal_gates import check_array as _signal_check
 from ears.hallucination_filter import (
     is_hallucination,
     is_repetition_loop,
@@ -68,6 +75,12 @@ from ears.hallucination_filter import (
 from ears.autocorrect import correct as _autocorrect
 from ears import agc as _agc
 from ears import aec as _aec
+from ears import capture_bus as _capture_bus
+from ears import settings as _ears_settings
+from ears import endpointer as _endpointer
+from ears import partial_transcriber as _partials
+from ears import whisper_service as _whisper
+from ears import keyword_spotter as _kws
 
 colorama.init(autoreset=True)
 
@@ -119,37 +132,13 @@ def _is_voice_id_enabled() -> bool:
 
 
 # =============================================================================
-# WHISPER LOADER
+# WHISPER — models and decode queue live in ears/whisper_service.py
 # =============================================================================
 
-def _load_whisper(model_size: str) -> WhisperModel:
-    try:
-        import torch
-        if torch.cuda.is_available():
-            name = torch.cuda.get_device_name(0)
-            print(Fore.CYAN + f"[EARS] GPU: {name}")
-            model = WhisperModel(
-                model_size, device="cuda", compute_type="float16"
-            )
-            print(Fore.GREEN + f"[EARS] Whisper {model_size} — GPU ready")
-            return model
-    except Exception as e:
-        print(Fore.YELLOW + f"[EARS] GPU init failed: {e}")
-
-    try:
-        model = WhisperModel(
-            model_size, device="cpu", compute_type="int8"
-        )
-        print(Fore.YELLOW + f"[EARS] Whisper {model_size} — CPU mode")
-        return model
-    except Exception as e:
-        print(Fore.RED + f"[EARS] Whisper load failed: {e}")
-        raise
-
-
 _MODEL_SIZE = _get_configured_model()
-print(Fore.CYAN + f"[EARS] Loading Whisper ({_MODEL_SIZE})...")
-audio_model = _load_whisper(_MODEL_SIZE)
+_whisper.set_default_size(_MODEL_SIZE)
+audio_model = _whisper.get_model(_MODEL_SIZE)
+_whisper.start_server()
 
 # Calibrate after Whisper loads — mic may be busy during model load
 _nf.calibrate()
@@ -189,25 +178,179 @@ def set_speaking_fn(fn):
     _is_speaking_fn = fn
 
 
+# =============================================================================
+# PARTIAL TRANSCRIPT HOOK
+# Injected by main.py. Receives the running hypothesis while the user is
+# still speaking ("" when the utterance ends) — shown as UI status.
+# =============================================================================
+
+_partial_fn = lambda text: None
+
+
+def set_partial_fn(fn):
+    """
+    Register the partial-transcript sink. Called by main.py:
+        ears.core.set_partial_fn(lambda t: api_set_state("partial_text", t))
+    """
+    global _partial_fn
+    _partial_fn = fn
+
+
+def _publish_partial(text: str):
+    try:
+        _partial_fn(text)
+    except Exception:
+        pass
+
+
+# =============================================================================
+# VOICE ID — TitaNet runs next to Whisper on the same float32 buffer
+# =============================================================================
+
+_last_speaker = None
+
+
+def last_speaker():
+    """
+    Speaker for the utterance listen() last returned: enrolled name,
+    "unknown", "default" (nobody enrolled), or None when Voice ID was off.
+    """
+    return _last_speaker
+
+
+class _VoiceIdJob:
+    """Speaker embedding of one utterance, computed while Whisper decodes."""
+
+    def __init__(self, samples: np.ndarray):
+        self.embedding = None
+        self._thread = threading.Thread(
+            target=self._run, args=(samples,), daemon=True, name="SevenVoiceID"
+        )
+        self._thread.start()
+
+    def _run(self, samples):
+        try:
+            from ears.voice_id import speaker_embedding
+            self.embedding = speaker_embedding(samples)
+        except Exception as e:
+            print(Fore.YELLOW + f"[EARS] Voice ID error: {e}")
+
+    def result(self) -> str:
+        t0 = time.perf_counter()
+        self._thread.join()
+        waited = (time.perf_counter() - t0) * 1000
+        if waited >= 1:
+            print(Fore.CYAN + f"[EARS] Voice ID finished {waited:.0f}ms after Whisper")
+        from ears.voice_id import identify_embedding
+        return identify_embedding(self.embedding)
+
+
 # =============================================================================
 # WHISPER TRANSCRIPTION — IN MEMORY
 # =============================================================================
 
-def _transcribe(wav_bytes: bytes) -> tuple:
+_WHISPER_RATE = 16000
+
+
+def _audio_to_float32(audio) -> np.ndarray:
+    """
+    sr.AudioData -> float32 mono 16 kHz in [-1, 1].
+    The one allocation of the pipeline; every later stage reuses it.
+    """
+    if audio.sample_rate == _WHISPER_RATE and audio.sample_width == 2:
+        pcm = audio.frame_data
+    else:
+        # sr.Microphone fallback (capture bus disabled) runs at device rate
+        pcm = audio.get_raw_data(convert_rate=_WHISPER_RATE, convert_width=2)
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    samples *= np.float32(1.0 / 32767.0)
+    return samples
+
+
+def _float32_to_wav_bytes(samples: np.ndarray) -> bytes:
+    """Materialize WAV bytes — only for debug dumps."""
+    import wave as _wv
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype(np.int16)
+    buf = io.BytesIO()
+    with _wv.open(buf, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(_WHISPER_RATE)
+        wf.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+
+CLIP_PATH = os.path.join(tempfile.gettempdir(), "seven_clip.wav")
+
+
+def _write_clip(samples: np.ndarray) -> str:
+    """The utterance as a 16 kHz WAV for callers that need a file (enrollment)."""
+    with open(CLIP_PATH, "wb") as f:
+        f.write(_float32_to_wav_bytes(samples))
+    return CLIP_PATH
+
+
+def _debug_dump(samples: np.ndarray, tag: str):
+    """Write the clip to ears.debug.dump_dir if configured. Off by default."""
+    dump_dir = _ears_settings.load("debug", {"dump_dir": ""})["dump_dir"]
+    if not dump_dir:
+        return
+    try:
+        os.makedirs(dump_dir, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d_%H%M%S')}_{int(time.time() * 1000) % 1000:03d}_{tag}.wav"
+        with open(os.path.join(dump_dir, name), "wb") as f:
+            f.write(_float32_to_wav_bytes(samples))
+    except Exception as e:
+        print(Fore.YELLOW + f"[EARS] Debug dump failed: {e}")
+
+
+def _whisper_on_gpu() -> bool:
+    return _whisper.on_gpu(_MODEL_SIZE)
+
+
+def _decode_partial(samples: np.ndarray, prompt: str = None) -> list:
+    """
+    Fast pass for partial hypotheses: greedy, word timestamps, no VAD
+    (the endpointer already decided this is speech).
+    Returns [(start_s, end_s, word), ...].
+    """
+    segments, _ = _whisper.transcribe(
+        samples,
+        priority=_whisper.PRIORITY_PARTIAL,
+        beam_size=1,
+        language="en",
+        condition_on_previous_text=False,
+        initial_prompt=prompt or None,
+        word_timestamps=True,
+        vad_filter=False,
+    )
+    words = []
+    for seg in segments:
+        if getattr(seg, 'no_speech_prob', 0.0) > 0.6:
+            continue
+        for w in (seg.words or []):
+            words.append((w.start, w.end, w.word))
+    return words
+
+
+def _transcribe(samples: np.ndarray, prompt: str = None) -> tuple:
     """
-    Transcribe WAV bytes using Whisper via BytesIO.
-    No temp files written.
+    Transcribe a float32 16 kHz array with Whisper.
+    faster-whisper takes the array as-is — no WAV encode/decode.
+    prompt: text already committed by the partial transcriber, so the
+    decoder continues the sentence instead of starting a new one.
 
     Returns:
         (full_text: str, info: TranscriptionInfo or None)
     """
     try:
-        wav_buf = io.BytesIO(wav_bytes)
-        result  = audio_model.transcribe(
-            wav_buf,
+        segments, info = _whisper.transcribe(
+            samples,
+            priority=_whisper.PRIORITY_MAIN,
             beam_size=5,
             language="en",
             condition_on_previous_text=False,
+            initial_prompt=prompt or None,
             no_speech_threshold=0.6,
             # Reduced from 0.7 — stricter silence rejection.
             # 0.7 meant Whisper would accept segments it was 30% unsure about.
@@ -231,13 +374,6 @@ def _transcribe(wav_bytes: bytes) -> tuple:
             },
         )
 
-        if isinstance(result, tuple):
-            segments = list(result[0])
-            info     = result[1] if len(result) > 1 else None
-        else:
-            segments = list(result)
-            info     = None
-
         # Per-segment confidence filter
         # Whisper sets no_speech_prob per segment — high value means
         # Whisper detected that segment contains no real speech.
@@ -365,205 +501,233 @@ def _check_text_validity(text: str) -> tuple:
 # MAIN LISTEN FUNCTION
 # =============================================================================
 
-def listen() -> tuple:
+def _capture_with_vad(listen_timeout: float, phrase_limit: float,
+                      on_frame=None) -> np.ndarray:
+    """
+    Streaming-VAD capture from the capture bus. The utterance closes
+    hangover_ms after speech ends; non-speech never leaves this function.
+    Raises _endpointer.EndpointTimeout if no speech starts in time.
+    """
+    bus = _capture_bus.get_bus()
+    if bus is None:
+        raise OSError("capture bus disabled")
+    sub = bus.subscribe("listen")
+    try:
+        print(Fore.WHITE + "[EARS] Listening — streaming VAD")
+        return _endpointer.capture(
+            sub, timeout=listen_timeout, phrase_limit=phrase_limit,
+            consumer="listen", on_frame=on_frame,
+        )
+    finally:
+        sub.close()
+
+
+def _capture_with_recognizer(listen_timeout: float, phrase_limit: float) -> np.ndarray:
+    """
+    Energy-threshold capture via speech_recognition — used when the VAD
+    endpointer is disabled (config.json -> ears.endpointer.enabled).
+    Raises sr.WaitTimeoutError if nothing crosses the threshold in time.
+    """
+    with _capture_bus.microphone("listen") as source:
+        recognizer = sr.Recognizer()
+        recognizer.dynamic_energy_threshold = False
+        recognizer.energy_threshold         = _nf.get_threshold()
+        recognizer.pause_threshold          = 0.8
+        recognizer.non_speaking_duration    = 0.4
+        recognizer.phrase_threshold         = 0.1
+
+        if _force_return_event.is_set():
+            recognizer.energy_threshold = _nf.get_min_noise_floor()
+
+        print(Fore.WHITE + (
+            f"[EARS] Listening — "
+            f"threshold={recognizer.energy_threshold:.0f}"
+        ))
+        audio = recognizer.listen(
+            source,
+            timeout=listen_timeout,
+            phrase_time_limit=phrase_limit
+        )
+    return _audio_to_float32(audio)
+
+
+def listen(return_clip: bool = False) -> tuple:
     """
     Listen for one utterance and return transcribed text.
 
     Returns:
-        (text: str, audio_path: str) on valid speech
-            audio_path = "__voice__" when Voice ID disabled
-            audio_path = "temp_audio.wav" when Voice ID enabled
+        (text: str, "__voice__") on valid speech
+            last_speaker() then holds the Voice ID result (None if disabled)
+        (text: str, wav_path) on valid speech with return_clip=True
+            the clip is written to CLIP_PATH, overwritten by the next call
         (None, None) on silence, noise, or any rejection
     """
+    global _last_speaker
+    _last_speaker = None
     print(Fore.WHITE + "[EARS] Waiting for input...")
 
-    try:
-        mic = sr.Microphone()
-    except Exception as e:
-        print(Fore.YELLOW + f"[EARS] Microphone unavailable: {e}")
-        time.sleep(2)
-        return None, None
+    if _force_return_event.is_set():
+        listen_timeout = 1.5
+        phrase_limit   = 1
+    else:
+        listen_timeout = 10
+        phrase_limit   = 15
 
+    partial = None
     try:
-        with mic as source:
-            recognizer = sr.Recognizer()
-            recognizer.dynamic_energy_threshold = False
-            recognizer.energy_threshold         = _nf.get_threshold()
-            recognizer.pause_threshold          = 0.8
-            recognizer.non_speaking_duration    = 0.4
-            recognizer.phrase_threshold         = 0.1
-
-            if _force_return_event.is_set():
-                recognizer.energy_threshold = _nf.get_min_noise_floor()
-                listen_timeout              = 1.5
-                phrase_limit                = 1
+        # ── Capture ─────────────────────────────────────────────────────
+        try:
+            if _endpointer.is_enabled():
+                # Partial transcription runs while the endpointer is still
+                # collecting — the final decode then covers only the tail.
+                if _partials.is_enabled(_whisper_on_gpu()):
+                    partial = _partials.PartialTranscriber(
+                        _decode_partial, _transcribe, on_partial=_publish_partial
+                    )
+                samples = _capture_with_vad(
+                    listen_timeout, phrase_limit,
+                    on_frame=partial.feed if partial else None,
+                )
             else:
-                listen_timeout  = 10
-                phrase_limit    = 15
-
+                samples = _capture_with_recognizer(listen_timeout, phrase_limit)
             print(Fore.WHITE + (
-                f"[EARS] Listening — "
-                f"threshold={recognizer.energy_threshold:.0f}"
+                f"[EARS] Captured — "
+                f"{len(samples) / _WHISPER_RATE:.2f}s"
             ))
+            _nf.on_audio_captured()
+
+        except (sr.WaitTimeoutError, _endpointer.EndpointTimeout):
+            _nf.on_timeout()
+            return None, None
+        except OSError as e:
+            print(Fore.YELLOW + f"[EARS] Mic error: {e}")
+            time.sleep(1)
+            return None, None
+        except Exception:
+            return None, None
+
+        # ── AGC — normalize volume (in place) ───────────────────────
+        samples = _agc.apply(samples, inplace=True)
 
-            # ── Capture ─────────────────────────────────────────────────
+        # ── AEC — remove echo (in place) ─────────────────────────────
+        if _aec.is_available():
             try:
-                audio     = recognizer.listen(
-                    source,
-                    timeout=listen_timeout,
-                    phrase_time_limit=phrase_limit
-                )
-                wav_bytes = audio.get_wav_data()
-                print(Fore.WHITE + (
-                    f"[EARS] Captured — "
-                    f"{len(wav_bytes) // 1024}KB"
-                ))
-                _nf.on_audio_captured()
-
-            except sr.WaitTimeoutError:
-                _nf.on_timeout()
-                return None, None
-            except OSError as e:
-                print(Fore.YELLOW + f"[EARS] Mic error: {e}")
-                time.sleep(1)
-                return None, None
-            except Exception:
-                return None, None
-
-            # ── AGC — normalize volume ───────────────────────────────────
-            wav_bytes = _agc.apply_to_wav_bytes(wav_bytes)
-
-            # ── AEC — remove echo ────────────────────────────────────────
-            if _aec.is_available():
-                try:
-                    import wave as _wv
-                    with _wv.open(io.BytesIO(wav_bytes), 'rb') as wf:
-                        _sr  = wf.getframerate()
-                        _pcm = wf.readframes(wf.getnframes())
-                    _mic_f32 = (
-                        np.frombuffer(_pcm, dtype=np.int16)
-                        .astype(np.float32) / 32767.0
-                    )
-                    _cleaned = _aec.apply(_mic_f32, _sr)
-                    _buf = io.BytesIO()
-                    with _wv.open(_buf, 'wb') as wf_out:
-                        wf_out.setnchannels(1)
-                        wf_out.setsampwidth(2)
-                        wf_out.setframerate(_sr)
-                        wf_out.writeframes(
-                            (_cleaned * 32767.0)
-                            .astype(np.int16)
-                            .tobytes()
-                        )
-                    wav_bytes = _buf.getvalue()
-                except Exception as e:
-                    print(Fore.YELLOW + f"[EARS] AEC error: {e}")
-
-            # ── Signal gates ─────────────────────────────────────────────
-            passed, rms, reason = _signal_check(
-                wav_bytes, _nf.get_threshold()
-            )
-            if not passed:
-                _nf.update(rms)
-                print(Fore.YELLOW + f"[EARS] Gate rejected — {reason}")
-                return None, None
-
-            # ── Speaking guard ────────────────────────────────────────────
-            # If Seven is currently speaking, audio captured now is either:
-            # (a) Seven's own TTS feeding back through the mic, or
-            # (b) User trying to interrupt — handled by listen_for_interrupt.
-            # Either way, the main pipeline should not process this clip.
-            # main.py double-speech lock handles this at a higher level,
-            # but checking here prevents Whisper from running unnecessarily.
-            if _is_speaking_fn():
-                return None, None
-
-            # ── Whisper transcription ────────────────────────────────────
-            full_text, info = _transcribe(wav_bytes)
-            if not full_text:
-                print(Fore.YELLOW + "[EARS] Whisper returned empty")
-                return None, None
-
-            # ── TranscriptionInfo confidence ─────────────────────────────
-            conf_ok, conf_reason = _check_confidence(info)
-            if not conf_ok:
-                print(Fore.YELLOW + f"[EARS] Confidence rejected — {conf_reason}")
-                return None, None
-
-            # ── Non-ASCII / emoji / music filter ─────────────────────────
-            text_ok, text_reason = _check_text_validity(full_text)
-            if not text_ok:
-                print(Fore.YELLOW + f"[EARS] Content rejected — {text_reason}")
-                return None, None
-
-            # ── Normalise for filter checks ──────────────────────────────
-            clean = full_text.lower().strip()
-            for ch in [".", "!", ",", "?", "..."]:
-                clean = clean.replace(ch, "")
-            clean = clean.strip()
-
-            if len(clean) < 2:
-                return None, None
-
-            # Single word guard
-            # Single isolated words from Whisper are almost always
-            # mishearings or hallucinations unless they are a known command.
-            # "Bonjour", "Yes", "Okay", "Sure" — these are not commands.
-            # Exception: single-word wake words like "Seven" are handled
-            # by the wake word gate in main.py, not here.
-            _single_word_passthrough = {
-                "stop", "seven", "pause", "resume", "yes", "no",
-                "open", "close", "help", "back", "next", "play",
-            }
-            words_check = clean.split()
-            if len(words_check) == 1 and clean not in _single_word_passthrough:
-                print(Fore.YELLOW + (
-                    f"[EARS] Single word rejected — '{clean}' "
-                    f"(not in passthrough list)"
-                ))
-                return None, None
-
-            # ── Hallucination filter ─────────────────────────────────────
-            is_ghost, ghost_reason = is_hallucination(clean, full_text.lower())
-            if is_ghost:
-                print(Fore.YELLOW + f"[EARS] Hallucination — {ghost_reason}")
-                return None, None
-
-            # ── Repetition loop ──────────────────────────────────────────
-            if is_repetition_loop(clean):
-                print(Fore.YELLOW + (
-                    f"[EARS] Repetition loop — '{clean[:60]}'"
-                ))
-                return None, None
-
-            # ── Semantic coherence ───────────────────────────────────────
-            if is_incoherent(clean):
-                print(Fore.YELLOW + (
-                    f"[EARS] Incoherent input — '{clean[:60]}'"
-                ))
-                return None, None
-
-            # ── Autocorrect ──────────────────────────────────────────────
-            corrected = _autocorrect(full_text)
-            final     = corrected.strip().capitalize()
-            if not final:
-                return None, None
-
-            print(Fore.GREEN + f"[EARS] Transcribed: '{final}'")
-
-            # ── Determine audio path for Voice ID ────────────────────────
-            # Write temp file only when Voice ID is enabled.
-            # Avoids unnecessary disk writes in the common case.
-            audio_out_path = "__voice__"
-            if _is_voice_id_enabled():
-                try:
-                    with open("temp_audio.wav", "wb") as f:
-                        f.write(wav_bytes)
-                    audio_out_path = "temp_audio.wav"
-                except Exception as e:
-                    print(Fore.YELLOW + f"[EARS] Audio save failed: {e}")
-
-            return final, audio_out_path
+                samples = _aec.apply(samples, _WHISPER_RATE, inplace=True)
+            except Exception as e:
+                print(Fore.YELLOW + f"[EARS] AEC error: {e}")
+
+        _debug_dump(samples, "captured")
+
+        # ── Signal gates ─────────────────────────────────────────────
+        passed, rms, reason = _signal_check(
+            samples, _nf.get_threshold(), _WHISPER_RATE
+        )
+        if not passed:
+            _nf.update(rms)
+            print(Fore.YELLOW + f"[EARS] Gate rejected — {reason}")
+            return None, None
+
+        # ── Speaking guard ────────────────────────────────────────────
+        # If Seven is currently speaking, audio captured now is either:
+        # (a) Seven's own TTS feeding back through the mic, or
+        # (b) User trying to interrupt — handled by listen_for_interrupt.
+        # Either way, the main pipeline should not process this clip.
+        # main.py double-speech lock handles this at a higher level,
+        # but checking here prevents Whisper from running unnecessarily.
+        if _is_speaking_fn():
+            return None, None
+
+        # ── Voice ID — embedding overlaps the Whisper decode ─────────
+        voice_job = _VoiceIdJob(samples) if _is_voice_id_enabled() else None
+
+        # ── Whisper transcription ────────────────────────────────────
+        if partial is not None:
+            full_text, info = partial.finalize(samples)
+            print(Fore.CYAN + (
+                f"[EARS] Final decode {partial.stats['final_ms']:.0f}ms "
+                f"on {partial.stats['final_audio_s']:.2f}s tail "
+                f"({partial.stats['committed_words']} words committed early)"
+            ))
+        else:
+            full_text, info = _transcribe(samples)
+        if not full_text:
+            print(Fore.YELLOW + "[EARS] Whisper returned empty")
+            return None, None
+
+        # ── TranscriptionInfo confidence ─────────────────────────────
+        conf_ok, conf_reason = _check_confidence(info)
+        if not conf_ok:
+            print(Fore.YELLOW + f"[EARS] Confidence rejected — {conf_reason}")
+            return None, None
+
+        # ── Non-ASCII / emoji / music filter ─────────────────────────
+        text_ok, text_reason = _check_text_validity(full_text)
+        if not text_ok:
+            print(Fore.YELLOW + f"[EARS] Content rejected — {text_reason}")
+            return None, None
+
+        # ── Normalise for filter checks ──────────────────────────────
+        clean = full_text.lower().strip()
+        for ch in [".", "!", ",", "?", "..."]:
+            clean = clean.replace(ch, "")
+        clean = clean.strip()
+
+        if len(clean) < 2:
+            return None, None
+
+        # Single word guard
+        # Single isolated words from Whisper are almost always
+        # mishearings or hallucinations unless they are a known command.
+        # "Bonjour", "Yes", "Okay", "Sure" — these are not commands.
+        # Exception: single-word wake words like "Seven" are handled
+        # by the wake word gate in main.py, not here.
+        _single_word_passthrough = {
+            "stop", "seven", "pause", "resume", "yes", "no",
+            "open", "close", "help", "back", "next", "play",
+        }
+        words_check = clean.split()
+        if len(words_check) == 1 and clean not in _single_word_passthrough:
+            print(Fore.YELLOW + (
+                f"[EARS] Single word rejected — '{clean}' "
+                f"(not in passthrough list)"
+            ))
+            return None, None
+
+        # ── Hallucination filter ─────────────────────────────────────
+        is_ghost, ghost_reason = is_hallucination(clean, full_text.lower())
+        if is_ghost:
+            print(Fore.YELLOW + f"[EARS] Hallucination — {ghost_reason}")
+            return None, None
+
+        # ── Repetition loop ──────────────────────────────────────────
+        if is_repetition_loop(clean):
+            print(Fore.YELLOW + (
+                f"[EARS] Repetition loop — '{clean[:60]}'"
+            ))
+            return None, None
+
+        # ── Semantic coherence ───────────────────────────────────────
+        if is_incoherent(clean):
+            print(Fore.YELLOW + (
+                f"[EARS] Incoherent input — '{clean[:60]}'"
+            ))
+            return None, None
+
+        # ── Autocorrect ──────────────────────────────────────────────
+        corrected = _autocorrect(full_text)
+        final     = corrected.strip().capitalize()
+        if not final:
+            return None, None
+
+        print(Fore.GREEN + f"[EARS] Transcribed: '{final}'")
+
+        # ── Voice ID — join before handing the text to the brain ──────
+        if voice_job is not None:
+            _last_speaker = voice_job.result()
+
+        if return_clip:
+            return final, _write_clip(samples)
+        return final, "__voice__"
 
     except OSError as e:
         print(Fore.YELLOW + f"[EARS] Stream error: {e}")
@@ -574,11 +738,15 @@ def listen() -> tuple:
         import traceback
         traceback.print_exc()
         return None, None
+    finally:
+        if partial is not None:
+            partial.cancel()
+            _publish_partial("")
 
 
 # =============================================================================
 # INTERRUPT LISTENER
-# Mic opened ONCE. Audio in RAM. beam_size=1 for speed.
+# Capture bus subscription held for the whole TTS. Audio in RAM. beam_size=1.
 # =============================================================================
 
 def listen_for_interrupt(interrupt_words, on_interrupt_callback, stop_event):
@@ -597,10 +765,21 @@ def listen_for_interrupt(interrupt_words, on_interrupt_callback, stop_event):
         "okay", "subtitles", "subscribe", "caption",
     }
 
-    # Open mic once — hold for duration of TTS
+    # Keyword gate — Whisper only sees clips that could hold an interrupt word
+    spotter = _kws.get_spotter("interrupt", interrupt_words) if _kws.is_enabled() else None
+
+    # Subscribe once — hold for duration of TTS
+    bus_sub       = None
+    interrupt_mic = None
     try:
-        interrupt_mic = sr.Microphone()
-        mic_ctx       = interrupt_mic.__enter__()
+        if _endpointer.is_enabled():
+            bus = _capture_bus.get_bus()
+            if bus is None:
+                raise OSError("capture bus disabled")
+            bus_sub = bus.subscribe("interrupt")
+        else:
+            interrupt_mic = _capture_bus.microphone("interrupt")
+            mic_ctx       = interrupt_mic.__enter__()
     except Exception as e:
         print(Fore.YELLOW + f"[EARS] Interrupt mic unavailable: {e}")
         return
@@ -608,47 +787,53 @@ def listen_for_interrupt(interrupt_words, on_interrupt_callback, stop_event):
     try:
         while not stop_event.is_set():
             try:
-                audio = recognizer.listen(
-                    mic_ctx, timeout=1.5, phrase_time_limit=3
-                )
-            except sr.WaitTimeoutError:
+                if bus_sub is not None:
+                    if spotter:
+                        spotter.reset()
+                    samples = _endpointer.capture(
+                        bus_sub, timeout=1.5, phrase_limit=3,
+                        consumer="interrupt",
+                        on_frame=spotter.feed if spotter else None,
+                    )
+                else:
+                    audio = recognizer.listen(
+                        mic_ctx, timeout=1.5, phrase_time_limit=3
+                    )
+                    samples = _audio_to_float32(audio)
+                    if spotter:
+                        spotter.scan(samples)
+            except (sr.WaitTimeoutError, _endpointer.EndpointTimeout):
                 continue
             except Exception:
                 break
 
             try:
-                wav_bytes = audio.get_wav_data()
 
                 # Quick energy check — if clip is near-silent, skip Whisper.
                 # This prevents 3 unnecessary Whisper runs while Seven speaks.
                 # The interrupt listener runs during TTS — most clips are
                 # just Seven's own voice or room noise. Check energy first.
-                import wave as _wv_int
-                with _wv_int.open(io.BytesIO(wav_bytes), 'rb') as _wf_int:
-                    _pcm_int = _wf_int.readframes(_wf_int.getnframes())
-                _arr_int = np.frombuffer(_pcm_int, dtype=np.int16).astype(np.float32)
-                _rms_int = float(np.sqrt(np.mean(_arr_int ** 2)))
+                if len(samples) == 0:
+                    continue
+                _rms_int = float(np.sqrt(np.dot(samples, samples) / len(samples))) * 32767.0
                 # Use a lower threshold than main pipeline — interrupt words
                 # might be spoken quietly. But reject near-silence entirely.
                 _interrupt_threshold = max(_nf.get_threshold() * 0.5, 200.0)
                 if _rms_int < _interrupt_threshold:
                     continue
 
-                wav_buf   = io.BytesIO(wav_bytes)
+                if spotter and not spotter.should_escalate():
+                    continue
 
-                result = audio_model.transcribe(
-                    wav_buf,
+                segments, _ = _whisper.transcribe(
+                    samples,
+                    priority=_whisper.PRIORITY_INTERRUPT,
                     beam_size=1,
                     language="en",
                     no_speech_threshold=0.7,
                     vad_filter=True,
                 )
 
-                if isinstance(result, tuple):
-                    segments = list(result[0])
-                else:
-                    segments = list(result)
-
                 text = "".join(
                     s.text for s in segments
                 ).strip().lower()
@@ -670,6 +855,9 @@ def listen_for_interrupt(interrupt_words, on_interrupt_callback, stop_event):
             if clean in _interrupt_ghosts:
                 continue
 
+            if spotter:
+                spotter.learn(clean, samples)
+
             for word in interrupt_words:
                 if re.search(
                     r'\b' + re.escape(word) + r'\b', clean
@@ -681,7 +869,10 @@ def listen_for_interrupt(interrupt_words, on_interrupt_callback, stop_event):
                     return
 
     finally:
-        try:
-            interrupt_mic.__exit__(None, None, None)
-        except Exception:
-            pass
\ No newline at end of file
+        if bus_sub is not None:
+            bus_sub.close()
+        if interrupt_mic is not None:
+            try:
+                interrupt_mic.__exit__(None, None, None)
+            except Exception:
+                pass
\ No newline at end of file
@@ -0,0 +1,226 @@
+"""
+=============================================================================
+ears/endpointer.py
+Seven — Streaming VAD endpointer
+
+WHAT THIS FILE DOES:
+    Decides where an utterance starts and ends while audio is still
+    arriving. Frames come from a capture bus subscription; each one gets
+    a speech probability from ears/vad.py; a small state machine opens
+    the utterance after min_speech_ms of speech and closes it hangover_ms
+    after speech stops.
+
+WHY:
+    speech_recognition's energy threshold always waits pause_threshold
+    (800 ms) of silence before returning, and steady noise (fan, TV)
+    crosses the threshold as easily as speech does. A VAD looks at the
+    spectral shape, not loudness, and the endpoint closes 250-400 ms
+    after the last word. Audio that never opens an utterance is dropped
+    here — Whisper is never called on it.
+
+BACKENDS (config.json -> ears.endpointer.backend):
+    "auto"    Silero if torch is importable, otherwise energy
+    "silero"  ears.vad.StreamingVAD — 32 ms frames, recurrent state kept
+    "energy"  ears.vad.EnergyVAD    — 30 ms frames vs noise_floor threshold
+
+HYSTERESIS:
+    open  when prob >= threshold for min_speech_ms
+    close when prob <  threshold - 0.15 for hangover_ms
+    The gap stops a syllable hovering at the threshold from flapping the
+    endpoint open and closed.
+
+CONFIG (config.json -> ears.endpointer):
+    enabled        True
+    backend        "auto"
+    threshold      0.5
+    min_speech_ms  90
+    hangover_ms    300    -- 250-400 recommended
+    preroll_ms     300    -- audio kept from before the open decision
+=============================================================================
+"""
+
+import math
+import threading
+from collections import deque
+
+import numpy as np
+from colorama import Fore
+
+from ears import settings as _settings
+from ears import noise_floor as _nf
+
+SAMPLE_RATE = 16000
+
+_DEFAULTS = {
+    "enabled":       True,
+    "backend":       "auto",
+    "threshold":     0.5,
+    "min_speech_ms": 90,
+    "hangover_ms":   300,
+    "preroll_ms":    300,
+}
+
+_HYSTERESIS = 0.15
+
+
+class EndpointTimeout(Exception):
+    """No speech started before the timeout. Mirrors sr.WaitTimeoutError."""
+
+
+def get_settings() -> dict:
+    return _settings.load("endpointer", _DEFAULTS)
+
+
+def is_enabled() -> bool:
+    return bool(get_settings()["enabled"])
+
+
+# =============================================================================
+# VAD INSTANCES — one per consumer, each with its own model and state
+# =============================================================================
+
+_vads      = {}
+_vads_lock = threading.Lock()
+_silero_failed = False
+
+
+def get_vad(consumer: str):
+    """StreamingVAD (or EnergyVAD fallback) owned by `consumer`."""
+    global _silero_failed
+    backend = str(get_settings()["backend"]).lower()
+    with _vads_lock:
+        vad = _vads.get(consumer)
+        if vad is not None and (backend == "auto" or vad.name == backend):
+            return vad
+
+        vad = None
+        if backend in ("auto", "silero") and not _silero_failed:
+            try:
+                from ears.vad import StreamingVAD
+                vad = StreamingVAD()
+            except Exception as e:
+                _silero_failed = True
+                print(Fore.YELLOW + f"[VAD] Silero unavailable ({e}) — energy endpointing")
+        if vad is None:
+            from ears.vad import EnergyVAD
+            vad = EnergyVAD(_nf.get_threshold)
+        _vads[consumer] = vad
+        return vad
+
+
+# =============================================================================
+# STATE MACHINE
+# =============================================================================
+
+class Endpointer:
+    """
+    Feed one speech probability per frame; update() returns "start",
+    "end" or None.
+    """
+
+    def __init__(self, frame_ms, threshold=0.5, min_speech_ms=90, hangover_ms=300):
+        self.frame_ms     = frame_ms
+        self.threshold    = threshold
+        self.release      = max(0.05, threshold - _HYSTERESIS)
+        self.open_frames  = max(1, int(math.ceil(min_speech_ms / frame_ms)))
+        self.close_frames = max(1, int(math.ceil(hangover_ms / frame_ms)))
+        self.reset()
+
+    def reset(self):
+        self.in_speech    = False
+        self._speech_run  = 0
+        self._silence_run = 0
+
+    def update(self, prob: float):
+        if not self.in_speech:
+            self._speech_run = self._speech_run + 1 if prob >= self.threshold else 0
+            if self._speech_run >= self.open_frames:
+                self.in_speech    = True
+                self._silence_run = 0
+                return "start"
+            return None
+
+        self._silence_run = self._silence_run + 1 if prob < self.release else 0
+        if self._silence_run >= self.close_frames:
+            self.in_speech   = False
+            self._speech_run = 0
+            return "end"
+        return None
+
+
+def capture(sub, timeout: float, phrase_limit: float, consumer: str = "listen",
+            on_frame=None) -> np.ndarray:
+    """
+    Read frames from a capture bus subscription until one utterance is
+    complete. Returns it as float32 16 kHz in [-1, 1].
+
+    ARGS:
+        sub:          ears.capture_bus.Subscription
+        timeout:      seconds of audio to wait for speech to start
+        phrase_limit: maximum utterance length in seconds
+        consumer:     VAD instance key (one per concurrent stream)
+        on_frame:     optional callback(frame, in_speech) for every frame
+                      after the utterance opened — used by partial
+                      transcription and keyword spotting. Returning True
+                      closes the utterance at that frame.
+
+    RAISES:
+        EndpointTimeout  no speech started within `timeout`
+        OSError          the capture bus stopped delivering audio
+    """
+    cfg = get_settings()
+    vad = get_vad(consumer)
+    vad.reset()
+
+    frame_n  = vad.frame_samples
+    frame_ms = frame_n * 1000.0 / SAMPLE_RATE
+    ep = Endpointer(
+        frame_ms,
+        threshold=float(cfg["threshold"]),
+        min_speech_ms=float(cfg["min_speech_ms"]),
+        hangover_ms=float(cfg["hangover_ms"]),
+    )
+
+    preroll_frames = int(math.ceil(float(cfg["preroll_ms"]) / frame_ms))
+    preroll   = deque(maxlen=preroll_frames + ep.open_frames)
+    collected = None
+    waited    = 0
+    max_wait  = int(timeout * SAMPLE_RATE)
+    max_len   = int(phrase_limit * SAMPLE_RATE)
+    scale     = np.float32(1.0 / 32767.0)
+
+    while True:
+        pcm = sub.read(frame_n, timeout=1.0)
+        if pcm is None:
+            raise OSError("capture bus stalled")
+        frame = pcm.astype(np.float32)
+        frame *= scale
+
+        event = ep.update(vad.prob(frame))
+
+        if collected is None:
+            preroll.append(frame)
+            if event == "start":
+                collected = list(preroll)
+                if on_frame and on_frame(np.concatenate(collected), True):
+                    break
+                continue
+            waited += frame_n
+            if waited >= max_wait:
+                raise EndpointTimeout()
+            continue
+
+        collected.append(frame)
+        if on_frame and on_frame(frame, ep.in_speech):
+            break
+
+        if event == "end":
+            # Keep ~100 ms of the hangover so the last phoneme is not clipped
+            drop = ep.close_frames - int(math.ceil(100.0 / frame_ms))
+            if drop > 0:
+                collected = collected[:-drop]
+            break
+        if len(collected) * frame_n >= max_len:
+            break
+
+    return np.concatenate(collected)
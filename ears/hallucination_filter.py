@@ -5,6 +5,14 @@ Seven — Hallucination detection.
 Reads phrases from ears/hallucinations.json.
 Updating the JSON file is enough to change filter behavior.
 No code changes needed when Whisper model updates its hallucination patterns.
+
+The lists are compiled once per load (reload() recompiles):
+    exact phrases        hash set; "starts with a phrase" is a lookup of
+                         each prefix ending at a space/period, not a scan
+                         of every phrase
+    single words         hash set
+    substrings, ads      one Aho-Corasick automaton each (pyahocorasick),
+                         plain scan of a tuple if it is not installed
 """
 
 import os
@@ -13,11 +21,17 @@ from colorama import Fore
 
 import re as _re
 
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
 _HALLUCINATIONS_PATH = os.path.join(
     os.path.dirname(__file__), "hallucinations.json"
 )
 
-_cache = None
+_cache    = None
+_compiled = None
 
 # Pre-compiled patterns — built once at import, not on every call
 _ORDINAL_RE = _re.compile(r'\b(\d+(?:st|nd|rd|th))\b', _re.IGNORECASE)
@@ -60,11 +74,93 @@ def _load() -> dict:
     return _cache
 
 
+# Commercial / advertisement phrases — TV and phone ads, never commands
+_AD_PATTERNS = (
+    "rupees", "swiggy", "zomato", "amazon", "flipkart",
+    "order now", "download", "offer valid", "call now",
+    "buy now", "shop now", "subscribe now", "click here",
+    "visit", "terms and conditions", "limited time",
+    "never go out of style", "all the traditions",
+    "soft kulab", "crisp chale",
+)
+
+_OUTRO_PREFIXES = ("thank you", "thanks")
+_OUTRO_WORDS    = (
+    "watching", "having me", "joining",
+    "listening", "for me", "for watching", "for having me",
+)
+
+
+class _SubstringMatcher:
+    """All patterns found in a text, in one pass over the text."""
+
+    def __init__(self, patterns):
+        self.patterns = tuple(p for p in dict.fromkeys(patterns) if p)
+        self._automaton = None
+        if _ahocorasick is not None and self.patterns:
+            automaton = _ahocorasick.Automaton()
+            for index, pattern in enumerate(self.patterns):
+                automaton.add_word(pattern, index)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find_all(self, text: str) -> list:
+        """Matched patterns, in list order."""
+        if self._automaton is None:
+            return [p for p in self.patterns if p in text]
+        found = {index for _, index in self._automaton.iter(text)}
+        return [self.patterns[i] for i in sorted(found)]
+
+    def find_first(self, text: str):
+        if self._automaton is None:
+            for pattern in self.patterns:
+                if pattern in text:
+                    return pattern
+            return None
+        first = min((index for _, index in self._automaton.iter(text)), default=None)
+        return None if first is None else self.patterns[first]
+
+
+def _compile(data: dict) -> dict:
+    exact = frozenset(data.get("exact", []))
+    return {
+        "exact":         exact,
+        "prefix_max":    max((len(p) for p in exact), default=0),
+        "single_words":  frozenset(p for p in exact if p and len(p.split()) == 1),
+        "substrings":    _SubstringMatcher(data.get("substrings", [])),
+        "ads":           _SubstringMatcher(_AD_PATTERNS),
+        "filler_words":  frozenset(data.get("filler_words", [])),
+        "intent_words":  frozenset(data.get("intent_words", [])),
+    }
+
+
+def _tables() -> dict:
+    """Compiled lookup tables for the current list. Built once per load."""
+    global _compiled
+    if _compiled is None:
+        _compiled = _compile(_load())
+    return _compiled
+
+
+def _hallucination_prefix(clean: str, tables: dict):
+    """
+    Known phrase that `clean` starts with, followed by a space or period.
+    Only prefixes ending at a word boundary can match, so this is a few
+    set lookups instead of a startswith() per phrase.
+    """
+    exact = tables["exact"]
+    for i, ch in enumerate(clean[:tables["prefix_max"] + 1]):
+        if i and (ch == " " or ch == ".") and clean[:i] in exact:
+            return clean[:i]
+    return None
+
+
 def reload():
     """Force reload from disk. Call after editing hallucinations.json."""
-    global _cache
-    _cache = None
-    _load()
+    global _cache, _compiled
+    _cache    = None
+    _compiled = None
+    _tables()
     print(Fore.CYAN + "[EARS] Hallucination list reloaded from disk")
 
 
@@ -80,31 +176,25 @@ def is_hallucination(clean: str, raw_lower: str = "") -> tuple:
     Returns:
         (is_hallucination: bool, reason: str)
     """
-    data = _load()
+    tables = _tables()
 
     # Exact match against known silence outputs
-    if clean in data["exact"]:
+    if clean in tables["exact"]:
         return True, f"exact match: '{clean}'"
 
     # Partial match — text starts with a known hallucination phrase
     # Catches: "thank you bye bye", "thanks for watching everyone"
     # where the full string is not in exact list but starts with one
-    exact_set = set(data["exact"])
-    for phrase in exact_set:
-        if not phrase:
-            continue
-        if clean.startswith(phrase + " ") or clean.startswith(phrase + "."):
-            return True, f"starts with hallucination: '{phrase}'"
+    phrase = _hallucination_prefix(clean, tables)
+    if phrase:
+        return True, f"starts with hallucination: '{phrase}'"
 
     # Hallucination saturation — more than half the words are known hallucinations
     # Catches: "thank you bye bye" where 3/3 words are hallucination phrases
     words = clean.split()
     if len(words) >= 2:
         # Check individual words against single-word hallucinations
-        single_word_hallucinations = {
-            p for p in exact_set
-            if p and len(p.split()) == 1
-        }
+        single_word_hallucinations = tables["single_words"]
         hallucination_word_count = sum(
             1 for w in words if w in single_word_hallucinations
         )
@@ -115,18 +205,15 @@ def is_hallucination(clean: str, raw_lower: str = "") -> tuple:
             )
 
     # Outro hallucinations — Whisper invents these from TV/audio bleed
-    if clean.startswith(("thank you", "thanks")):
-        if any(k in clean for k in (
-            "watching", "having me", "joining",
-            "listening", "for me", "for watching", "for having me"
-        )):
+    if clean.startswith(_OUTRO_PREFIXES):
+        if any(k in clean for k in _OUTRO_WORDS):
             return True, f"outro phrase: '{clean}'"
 
     # Substring match — use punctuation-preserved text
     check_text = raw_lower if raw_lower else clean
-    for pattern in data["substrings"]:
-        if pattern in check_text:
-            return True, f"substring match: '{pattern}'"
+    pattern = tables["substrings"].find_first(check_text)
+    if pattern is not None:
+        return True, f"substring match: '{pattern}'"
 
     words = clean.split()
 
@@ -138,7 +225,7 @@ def is_hallucination(clean: str, raw_lower: str = "") -> tuple:
 
     # Pure filler — 85%+ of words are connectors with no intent
     if len(words) >= 6:
-        filler_set    = set(data.get("filler_words", []))
+        filler_set    = tables["filler_words"]
         content_words = [w for w in words if w not in filler_set]
         filler_ratio  = 1 - (len(content_words) / len(words))
         if filler_ratio > 0.85:
@@ -166,15 +253,7 @@ def is_hallucination(clean: str, raw_lower: str = "") -> tuple:
     # Commercial / advertisement detection
     # TV ads and phone ads have specific patterns that are never commands:
     # prices, brand delivery platforms, calls to action
-    _ad_patterns = {
-        "rupees", "swiggy", "zomato", "amazon", "flipkart",
-        "order now", "download", "offer valid", "call now",
-        "buy now", "shop now", "subscribe now", "click here",
-        "visit", "terms and conditions", "limited time",
-        "never go out of style", "all the traditions",
-        "soft kulab", "crisp chale",
-    }
-    _ad_matches = [p for p in _ad_patterns if p in clean]
+    _ad_matches = tables["ads"].find_all(clean)
     if _ad_matches:
         return True, f"commercial content detected: {_ad_matches[:2]}"
 
@@ -183,7 +262,7 @@ def is_hallucination(clean: str, raw_lower: str = "") -> tuple:
     words = clean.split() if not words else words
     if len(words) > 25:
         # Check if there are any intent words at all
-        intent_set = set(data.get("intent_words", []))
+        intent_set = tables["intent_words"]
         has_intent = any(w in intent_set for w in words)
         if not has_intent:
             return True, (
@@ -244,9 +323,9 @@ def is_incoherent(clean: str) -> bool:
     if len(words) < 5:
         return False
 
-    data = _load()
-    connector_set  = set(data.get("filler_words", []))
-    intent_set     = set(data.get("intent_words", []))
+    tables = _tables()
+    connector_set  = tables["filler_words"]
+    intent_set     = tables["intent_words"]
 
     connector_count = sum(1 for w in words if w in connector_set)
     connector_ratio = connector_count / len(words)
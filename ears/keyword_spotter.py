@@ -0,0 +1,397 @@
+"""
+=============================================================================
+ears/keyword_spotter.py
+Seven — Keyword-spotting front gate (MFCC + streaming DTW)
+
+WHAT THIS FILE DOES:
+    Decides, frame by frame, whether a clip could contain one of a small
+    fixed set of phrases (interrupt words, voice trigger phrases). Only
+    clips that match — or that the spotter cannot judge yet — are sent to
+    Whisper, which still makes the final call.
+
+WHY:
+    listen_for_interrupt (during every TTS reply) and the daemon's
+    VoiceListener (all day) ran a Whisper decode on every clip above the
+    noise floor, mostly Seven's own voice or room chatter, just to regex
+    the text against a handful of words. An MFCC frame costs a few
+    microseconds; a Whisper decode costs hundreds of milliseconds of CPU.
+
+HOW:
+    features  13 MFCCs per 10 ms hop (25 ms window), c0 dropped, running
+              mean subtracted, rows L2-normalized (cosine distance)
+    matching  subsequence DTW against every template at once, one numpy
+              step per input frame. Steps: stay, advance 1, advance 2,
+              with the path held between 1/1.5x and 1.5x the template's
+              length; the match may start and end anywhere in the clip
+    score     mean cosine distance along the best path ending at the
+              template's last frame. score < threshold = keyword likely
+
+ENROLLMENT (templates come from the user's own voice):
+    When Whisper confirms a clip whose whole text is exactly a configured
+    phrase, that clip becomes a template for the phrase (up to
+    max_templates, stored in %APPDATA%/SEVEN/kws/, shared by Seven and
+    trigger_daemon.py). Until every phrase has min_templates, the gate
+    stays open and every clip goes to Whisper as before.
+    Every audit_every-th rejected clip is still sent to Whisper; if it
+    did contain a phrase, the clip is enrolled so the miss is not repeated.
+
+CONFIG (config.json -> ears.keyword_spotter):
+    enabled        True
+    threshold      0.20   -- synthetic fixtures: 100% of keywords and ~25%
+                             of other speech escalated, ~2% of one core;
+                             see scripts/bench_keyword_spotter.py
+    min_templates  2
+    max_templates  5
+    audit_every    10
+=============================================================================
+"""
+
+import os
+import re
+import time
+import threading
+
+import numpy as np
+from colorama import Fore
+
+from ears import settings as _settings
+
+SAMPLE_RATE = 16000
+WIN         = 400     # 25 ms
+HOP         = 160     # 10 ms
+N_FFT       = 512
+N_MELS      = 40
+N_CEPS      = 13
+
+_DEFAULTS = {
+    "enabled":       True,
+    "threshold":     0.20,
+    "min_templates": 2,
+    "max_templates": 5,
+    "audit_every":   10,
+}
+
+_STORE_DIR = os.path.join(
+    os.environ.get('APPDATA', os.path.expanduser('~')),
+    'SEVEN', 'kws'
+)
+
+
+def get_settings() -> dict:
+    return _settings.load("keyword_spotter", _DEFAULTS)
+
+
+def is_enabled() -> bool:
+    return bool(get_settings()["enabled"])
+
+
+def normalize_phrase(text: str) -> str:
+    return " ".join(re.sub(r"[^\w' ]", " ", text.lower()).split())
+
+
+# =============================================================================
+# FEATURES
+# =============================================================================
+
+def _build_filters():
+    def hz_to_mel(f):
+        return 2595.0 * np.log10(1.0 + f / 700.0)
+
+    def mel_to_hz(m):
+        return 700.0 * (10.0 ** (m / 2595.0) - 1.0)
+
+    mels  = np.linspace(hz_to_mel(60.0), hz_to_mel(7600.0), N_MELS + 2)
+    bins  = np.floor((N_FFT + 1) * mel_to_hz(mels) / SAMPLE_RATE).astype(int)
+    fbank = np.zeros((N_MELS, N_FFT // 2 + 1), dtype=np.float32)
+    for m in range(1, N_MELS + 1):
+        lo, mid, hi = bins[m - 1], bins[m], bins[m + 1]
+        if mid > lo:
+            fbank[m - 1, lo:mid] = (np.arange(lo, mid) - lo) / (mid - lo)
+        if hi > mid:
+            fbank[m - 1, mid:hi] = (hi - np.arange(mid, hi)) / (hi - mid)
+
+    n   = np.arange(N_MELS)
+    dct = np.cos(np.pi / N_MELS * (n + 0.5)[None, :] * np.arange(N_CEPS)[:, None])
+    return fbank, dct.astype(np.float32)
+
+
+_FBANK, _DCT = _build_filters()
+_WINDOW      = np.hamming(WIN).astype(np.float32)
+
+
+def mfcc(samples: np.ndarray) -> tuple:
+    """
+    float32 16 kHz -> (cepstra (n, N_CEPS - 1), log frame energy (n,)).
+    Frames are WIN long every HOP samples; a tail shorter than WIN is ignored.
+    """
+    n = 1 + (len(samples) - WIN) // HOP if len(samples) >= WIN else 0
+    if n <= 0:
+        return np.zeros((0, N_CEPS - 1), np.float32), np.zeros(0, np.float32)
+    frames = np.lib.stride_tricks.as_strided(
+        samples, shape=(n, WIN),
+        strides=(samples.strides[0] * HOP, samples.strides[0]),
+    ) * _WINDOW
+    power  = np.abs(np.fft.rfft(frames, N_FFT)) ** 2
+    logmel = np.log(power @ _FBANK.T + 1e-8)
+    ceps   = logmel @ _DCT.T
+    energy = np.log(power.sum(axis=1) + 1e-8)
+    return ceps[:, 1:].astype(np.float32), energy.astype(np.float32)
+
+
+class _Normalizer:
+    """Running-mean subtraction + L2 norm. Same code for templates and live audio."""
+
+    def __init__(self):
+        self.mean = None
+        self.n    = 0
+
+    def __call__(self, ceps: np.ndarray) -> np.ndarray:
+        out = np.empty_like(ceps)
+        for i, row in enumerate(ceps):
+            self.n += 1
+            if self.mean is None:
+                self.mean = row.copy()
+            else:
+                self.mean += (row - self.mean) / min(self.n, 100)
+            out[i] = row - self.mean
+        out /= np.linalg.norm(out, axis=1, keepdims=True) + 1e-6
+        return out
+
+
+def template_features(samples: np.ndarray) -> np.ndarray:
+    """Normalized features of a keyword recording, silence at both ends trimmed."""
+    ceps, energy = mfcc(np.ascontiguousarray(samples, dtype=np.float32))
+    feats = _Normalizer()(ceps)
+    if len(energy) == 0:
+        return feats
+    voiced = np.nonzero(energy > energy.max() - 5.0)[0]   # within ~22 dB of the peak
+    return feats[voiced[0]:voiced[-1] + 1]
+
+
+# =============================================================================
+# TEMPLATE STORE — one .npz per phrase
+# =============================================================================
+
+class TemplateStore:
+
+    def __init__(self, directory: str = _STORE_DIR):
+        self.directory = directory
+        self._cache    = {}   # phrase -> (mtime, [arrays])
+        self._lock     = threading.Lock()
+
+    def _path(self, phrase: str) -> str:
+        slug = re.sub(r"[^a-z0-9]+", "_", phrase) or "_"
+        return os.path.join(self.directory, slug + ".npz")
+
+    def get(self, phrase: str) -> list:
+        path = self._path(phrase)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._cache.get(phrase)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            try:
+                with np.load(path) as data:
+                    templates = [data[k] for k in sorted(data.files)]
+            except Exception:
+                templates = []
+            self._cache[phrase] = (mtime, templates)
+            return templates
+
+    def add(self, phrase: str, feats: np.ndarray, max_templates: int):
+        templates = (self.get(phrase) + [feats])[-max_templates:]
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(phrase)
+        tmp  = path + ".tmp.npz"
+        np.savez(tmp, **{f"t{i:02d}": t for i, t in enumerate(templates)})
+        os.replace(tmp, path)
+
+
+_default_store = None
+
+
+def get_store() -> TemplateStore:
+    global _default_store
+    if _default_store is None:
+        _default_store = TemplateStore()
+    return _default_store
+
+
+# =============================================================================
+# SPOTTER
+# =============================================================================
+
+class KeywordSpotter:
+    """
+    One per stream. feed() frames in order (endpointer.capture on_frame);
+    after the clip, should_escalate() says whether Whisper must look at it.
+    """
+
+    def __init__(self, phrases, store: TemplateStore = None):
+        self.store    = store or get_store()
+        self.phrases  = []
+        self._loaded  = None
+        self.hit      = None     # (phrase, score) of the best match this clip
+        self._rejects = 0
+        self.stats = {"clips": 0, "frames": 0, "hits": 0, "escalated": 0,
+                      "audits": 0, "enrolled": 0, "cpu_ms": 0.0}
+        self.set_phrases(phrases)
+
+    # ── Templates ────────────────────────────────────────────────────────
+
+    def set_phrases(self, phrases):
+        self.phrases = sorted({normalize_phrase(p) for p in phrases if normalize_phrase(p)})
+        self._loaded = None
+
+    def _load_templates(self):
+        """Stack every template into one (K, M, D) matrix for the DTW step."""
+        owners, temps = [], []
+        for phrase in self.phrases:
+            for t in self.store.get(phrase):
+                if len(t) >= 3:
+                    owners.append(phrase)
+                    temps.append(t)
+        key = tuple(id(t) for t in temps)
+        if self._loaded == key:
+            return
+        self._loaded = key
+        self._owners = owners
+        self._lens   = np.array([len(t) for t in temps], dtype=np.int64)
+        m = int(self._lens.max()) if temps else 1
+        self._T = np.zeros((len(temps), m, N_CEPS - 1), dtype=np.float32)
+        for k, t in enumerate(temps):
+            self._T[k, :len(t)] = t
+
+    @property
+    def armed(self) -> bool:
+        """True once every phrase has enough templates to be judged."""
+        need = int(get_settings()["min_templates"])
+        return bool(self.phrases) and all(
+            len(self.store.get(p)) >= need for p in self.phrases
+        )
+
+    # ── Streaming ────────────────────────────────────────────────────────
+
+    def reset(self):
+        self._load_templates()
+        k, m = self._T.shape[:2]
+        self._D     = np.full((k, m), np.inf, dtype=np.float32)   # path cost sums
+        self._L     = np.zeros((k, m), dtype=np.float32)          # path lengths
+        self._pend  = np.zeros(0, dtype=np.float32)
+        self._norm  = _Normalizer()
+        self._thr   = float(get_settings()["threshold"])
+        self._rows  = np.arange(k)
+        self.hit    = None
+        self.stats["clips"] += 1
+
+    def feed(self, frame: np.ndarray, in_speech: bool = True) -> bool:
+        """
+        Append audio. Returns True when a keyword has matched (the
+        endpointer then closes the clip early). Signature matches
+        endpointer.capture(on_frame=...).
+        """
+        t0 = time.process_time()
+        audio = np.concatenate((self._pend, frame)) if len(self._pend) else frame
+        ceps, _ = mfcc(np.ascontiguousarray(audio, dtype=np.float32))
+        used = len(ceps) * HOP
+        self._pend = audio[used:].copy() if len(ceps) else audio.copy()
+        if len(ceps) and len(self._T):
+            for x in self._norm(ceps):
+                self._step(x)
+        self.stats["frames"] += len(ceps)
+        self.stats["cpu_ms"] += (time.process_time() - t0) * 1000
+        return self.hit is not None
+
+    def _step(self, x: np.ndarray):
+        cost = 1.0 - self._T @ x   # (K, M) cosine distance to every template frame
+        D, L = self._D, self._L
+        inf  = np.float32(np.inf)
+
+        # Predecessors for frame i: same i (stay), i-1, i-2. i = 0 starts fresh.
+        cand_d = np.stack((
+            D,
+            np.concatenate((np.zeros((len(D), 1), D.dtype), D[:, :-1]), axis=1),
+            np.concatenate((np.full((len(D), 2), inf, D.dtype), D[:, :-2]), axis=1)[:, :D.shape[1]],
+        ))
+        cand_l = np.stack((
+            L,
+            np.concatenate((np.zeros((len(L), 1), L.dtype), L[:, :-1]), axis=1),
+            np.concatenate((np.zeros((len(L), 2), L.dtype), L[:, :-2]), axis=1)[:, :L.shape[1]],
+        ))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg = np.where(cand_l > 0, cand_d / np.maximum(cand_l, 1), 0.0)
+        avg[np.isinf(cand_d)] = inf
+        best = np.argmin(avg, axis=0)[None]
+        self._D = np.take_along_axis(cand_d, best, 0)[0] + cost
+        self._L = np.take_along_axis(cand_l, best, 0)[0] + 1
+        self._D[self._L > 1.5 * self._lens[:, None]] = inf   # spoken too slowly
+
+        end   = self._lens - 1
+        done  = self._L[self._rows, end]
+        score = np.where(done >= self._lens / 1.5,                # not too fast
+                         self._D[self._rows, end] / np.maximum(done, 1), np.inf)
+        k = int(np.argmin(score))
+        if score[k] < self._thr and (self.hit is None or score[k] < self.hit[1]):
+            self.hit = (self._owners[k], float(score[k]))
+
+    def scan(self, samples: np.ndarray):
+        """Whole clip at once (recognizer capture path). Returns self.hit."""
+        self.reset()
+        self.feed(samples)
+        return self.hit
+
+    # ── Gate decision + learning ─────────────────────────────────────────
+
+    def should_escalate(self) -> bool:
+        """After the clip: does Whisper need to see it?"""
+        if self.hit is not None:
+            self.stats["hits"] += 1
+        elif self.armed:
+            self._rejects += 1
+            audit_every = int(get_settings()["audit_every"])
+            if audit_every <= 0 or self._rejects % audit_every:
+                return False
+            self.stats["audits"] += 1
+        self.stats["escalated"] += 1
+        return True
+
+    def learn(self, text: str, samples: np.ndarray):
+        """
+        Whisper's verdict on an escalated clip. A clip whose entire text is
+        one configured phrase becomes a template for it — while the phrase
+        is short of templates, or when the spotter missed it.
+        """
+        phrase = normalize_phrase(text)
+        if phrase not in self.phrases:
+            return
+        cfg = get_settings()
+        have = len(self.store.get(phrase))
+        if have >= int(cfg["min_templates"]) and self.hit is not None:
+            return
+        feats = template_features(samples)
+        if len(feats) < 3:
+            return
+        try:
+            self.store.add(phrase, feats, int(cfg["max_templates"]))
+            self.stats["enrolled"] += 1
+            print(Fore.CYAN + f"[KWS] Template enrolled for '{phrase}' ({min(have + 1, int(cfg['max_templates']))})")
+        except Exception as e:
+            print(Fore.YELLOW + f"[KWS] Enroll failed: {e}")
+
+
+_spotters      = {}
+_spotters_lock = threading.Lock()
+
+
+def get_spotter(consumer: str, phrases) -> KeywordSpotter:
+    """The spotter owned by `consumer`, with its phrase list brought up to date."""
+    with _spotters_lock:
+        spotter = _spotters.get(consumer)
+        if spotter is None:
+            spotter = _spotters[consumer] = KeywordSpotter(phrases)
+        elif sorted({normalize_phrase(p) for p in phrases} - {""}) != spotter.phrases:
+            spotter.set_phrases(phrases)
+        return spotter
@@ -150,8 +150,37 @@ def _measure_rms(duration: float = 1.5) -> float:
     """
     Record ambient audio and return RMS.
     Returns 0.0 on failure.
-    Handles device-busy errors from concurrent audio listeners.
+    Reads from the shared capture bus — no second device open, so no
+    device-busy errors from concurrent audio listeners.
     """
+    from ears import capture_bus
+
+    try:
+        bus = capture_bus.get_bus()
+        if bus is None:
+            return _measure_rms_direct(duration)
+
+        sub = bus.subscribe("calibration")
+        try:
+            # Generous timeout — the first call may be waiting for the
+            # device to open
+            pcm = sub.read(int(duration * capture_bus.SAMPLE_RATE),
+                           timeout=duration + 3.0)
+        finally:
+            sub.close()
+        if pcm is None:
+            return 0.0
+
+        arr = pcm.astype(np.float32)
+        return float(np.sqrt(np.mean(arr ** 2)))
+
+    except Exception as e:
+        print(Fore.YELLOW + f"[EARS] RMS measurement error: {e}")
+        return 0.0
+
+
+def _measure_rms_direct(duration: float) -> float:
+    """Capture bus disabled in config — open the microphone directly."""
     import speech_recognition as sr
 
     try:
@@ -0,0 +1,226 @@
+"""
+=============================================================================
+ears/partial_transcriber.py
+Seven — Incremental (partial) transcription while the user is speaking
+
+WHAT THIS FILE DOES:
+    While the endpointer is still collecting an utterance, a worker thread
+    re-decodes the audio every ~500 ms and publishes a partial hypothesis
+    ("turn on the" ... "turn on the kitchen lights"). Words that two
+    consecutive decodes agree on, and that end well before the newest
+    audio, are COMMITTED: their text is frozen and their audio is never
+    decoded again. At the endpoint only the uncommitted tail is decoded
+    (full beam), with the committed text as the prompt.
+
+WHY:
+    Before, Whisper started only after the whole utterance was captured,
+    so a beam_size=5 decode of the full clip was added serially on top of
+    the end-of-speech wait. With a committed prefix the final decode
+    covers only the last second or two of audio.
+
+COMMIT RULE (local agreement):
+    hypothesis N-1:  turn on the kitchen light
+    hypothesis N:    turn on the kitchen lights please
+    agreed prefix:   turn on the kitchen
+    committed:       the agreed words whose end time is more than
+                     commit_margin_ms before the end of the audio
+    The margin keeps a word that is still being spoken from being frozen.
+
+DECODER CONTRACT:
+    decode_partial(samples, prompt) -> [(start_s, end_s, word), ...]
+        fast pass (beam 1, word timestamps), times relative to `samples`
+    decode_final(samples, prompt)   -> (text, info)
+    ears/core.py supplies both, so this file has no Whisper dependency.
+
+CONFIG (config.json -> ears.partials):
+    enabled           "auto"  -- True / False / "auto" (on when Whisper
+                                 runs on GPU; CPU decodes are too slow to
+                                 re-run every 500 ms without delaying the
+                                 final decode)
+    interval_ms       500
+    commit_margin_ms  500
+    min_audio_ms      600     -- no partial decode before this much speech
+=============================================================================
+"""
+
+import re
+import time
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+from colorama import Fore
+
+from ears import settings as _settings
+
+SAMPLE_RATE = 16000
+
+_DEFAULTS = {
+    "enabled":          "auto",
+    "interval_ms":      500,
+    "commit_margin_ms": 500,
+    "min_audio_ms":     600,
+}
+
+
+def get_settings() -> dict:
+    return _settings.load("partials", _DEFAULTS)
+
+
+def is_enabled(on_gpu: bool) -> bool:
+    flag = get_settings()["enabled"]
+    if isinstance(flag, str):
+        return on_gpu if flag.lower() == "auto" else flag.lower() in ("1", "true", "yes", "on")
+    return bool(flag)
+
+
+def _norm(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def _whole_clip_info(info, clip_s: float, committed_s: float):
+    """Tail TranscriptionInfo rescaled to the full utterance."""
+    if info is None or committed_s <= 0:
+        return info
+    fields = info._asdict() if hasattr(info, "_asdict") else dict(vars(info))
+    fields["duration"] = clip_s
+    if fields.get("duration_after_vad") is not None:
+        fields["duration_after_vad"] = committed_s + fields["duration_after_vad"]
+    return SimpleNamespace(**fields)
+
+
+class PartialTranscriber:
+    """One instance per utterance. feed() from the capture loop, finalize() at the endpoint."""
+
+    def __init__(self, decode_partial, decode_final, on_partial=None):
+        cfg = get_settings()
+        self._decode_partial = decode_partial
+        self._decode_final   = decode_final
+        self._on_partial     = on_partial
+        self._interval       = float(cfg["interval_ms"]) / 1000.0
+        self._margin         = float(cfg["commit_margin_ms"]) / 1000.0
+        self._min_samples    = int(float(cfg["min_audio_ms"]) * SAMPLE_RATE / 1000.0)
+
+        self._chunks        = []
+        self._n_samples     = 0
+        self._audio_lock    = threading.Lock()
+        self._decode_lock   = threading.Lock()   # held for the duration of a decode
+
+        self.committed_text   = ""
+        self.committed_sample = 0
+        self.partial_text     = ""
+        self._prev_words      = []   # last hypothesis, relative to committed_sample
+        self._decoded_upto    = 0
+
+        self.stats = {"partial_decodes": 0, "committed_words": 0,
+                      "partial_ms": 0.0, "final_ms": 0.0, "final_audio_s": 0.0}
+
+        self._stop   = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="SevenPartialSTT")
+        self._thread.start()
+
+    # ── Capture side ─────────────────────────────────────────────────────
+
+    def feed(self, frame: np.ndarray, in_speech: bool = True):
+        """Append frames in order. Signature matches endpointer.capture(on_frame=...)."""
+        with self._audio_lock:
+            self._chunks.append(frame)
+            self._n_samples += len(frame)
+
+    def _audio_from(self, start: int) -> np.ndarray:
+        with self._audio_lock:
+            if len(self._chunks) > 1:
+                self._chunks = [np.concatenate(self._chunks)]
+            audio = self._chunks[0] if self._chunks else np.zeros(0, dtype=np.float32)
+        return audio[start:]
+
+    # ── Worker ───────────────────────────────────────────────────────────
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            if self._n_samples - self.committed_sample < self._min_samples:
+                continue
+            if self._n_samples == self._decoded_upto:
+                continue
+            with self._decode_lock:
+                if self._stop.is_set():
+                    break
+                try:
+                    self._partial_pass()
+                except Exception as e:
+                    print(Fore.YELLOW + f"[EARS] Partial decode error: {e}")
+
+    def _partial_pass(self):
+        start = self.committed_sample
+        tail  = self._audio_from(start)
+        self._decoded_upto = start + len(tail)
+
+        t0    = time.perf_counter()
+        words = self._decode_partial(tail, self.committed_text) or []
+        self.stats["partial_decodes"] += 1
+        self.stats["partial_ms"] += (time.perf_counter() - t0) * 1000
+
+        # Local agreement with the previous hypothesis
+        tail_end = len(tail) / float(SAMPLE_RATE)
+        agreed = 0
+        for prev, cur in zip(self._prev_words, words):
+            if _norm(prev[2]) != _norm(cur[2]) or cur[1] > tail_end - self._margin:
+                break
+            agreed += 1
+
+        if agreed:
+            frozen = words[:agreed]
+            self.committed_text = (
+                self.committed_text + "".join(w[2] for w in frozen)
+            ).strip()
+            shift = frozen[-1][1]
+            self.committed_sample = start + int(shift * SAMPLE_RATE)
+            self.stats["committed_words"] += agreed
+            words = [(s - shift, e - shift, w) for s, e, w in words[agreed:]]
+        self._prev_words = words
+
+        text = (self.committed_text + "".join(w[2] for w in words)).strip()
+        if text and text != self.partial_text:
+            self.partial_text = text
+            if self._on_partial:
+                try:
+                    self._on_partial(text)
+                except Exception:
+                    pass
+
+    # ── Endpoint ─────────────────────────────────────────────────────────
+
+    def finalize(self, samples: np.ndarray = None) -> tuple:
+        """
+        Stop the worker and decode only the uncommitted tail.
+
+        ARGS:
+            samples: the processed utterance (after AGC/AEC), sample-aligned
+                     with what was fed. None = use the fed frames as-is.
+
+        RETURNS:
+            (text, info) — same shape as ears.core._transcribe. info is the
+            tail decode's, with duration and duration_after_vad widened to
+            the whole clip (committed audio counts as speech), so the
+            confidence gates judge the utterance and not just its tail.
+        """
+        self._stop.set()
+        with self._decode_lock:   # wait out an in-flight partial decode
+            pass
+        self._thread.join(timeout=0.1)
+
+        audio = samples if samples is not None else self._audio_from(0)
+        tail  = audio[self.committed_sample:]
+        self.stats["final_audio_s"] = round(len(tail) / float(SAMPLE_RATE), 2)
+
+        t0 = time.perf_counter()
+        tail_text, info = self._decode_final(tail, self.committed_text or None)
+        self.stats["final_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+
+        text = " ".join(p for p in (self.committed_text, tail_text.strip()) if p)
+        return text, _whole_clip_info(info, len(audio) / float(SAMPLE_RATE),
+                                      self.committed_sample / float(SAMPLE_RATE))
+
+    def cancel(self):
+        """Utterance abandoned (gates rejected it, Seven started speaking)."""
+        self._stop.set()
@@ -0,0 +1,56 @@
+"""
+ears/settings.py
+Seven — Shared config reader for the ears package.
+
+ears/ modules run both inside Seven and inside trigger_daemon.py, which
+does not import the top-level config module. They read
+%APPDATA%/SEVEN/config.json directly (same as core._get_configured_model).
+This file does that once per file change instead of once per call site.
+
+    from ears.settings import load
+    cfg = load("capture_bus", {"ring_seconds": 30})
+
+Returns defaults merged with config.json -> ears.<section>.
+Missing file, bad JSON, or missing section: defaults only.
+"""
+
+import os
+import json
+import threading
+
+_CONFIG_PATH = os.path.join(
+    os.environ.get('APPDATA', os.path.expanduser('~')),
+    'SEVEN', 'config.json'
+)
+
+_cache_lock  = threading.Lock()
+_cache_mtime = None
+_cache_ears  = {}
+
+
+def _read_ears_section() -> dict:
+    """Return config.json -> ears, re-reading only when the file changed."""
+    global _cache_mtime, _cache_ears
+    try:
+        mtime = os.path.getmtime(_CONFIG_PATH)
+    except OSError:
+        return {}
+
+    with _cache_lock:
+        if mtime != _cache_mtime:
+            try:
+                with open(_CONFIG_PATH, 'r', encoding='utf-8') as f:
+                    _cache_ears = json.load(f).get('ears', {}) or {}
+            except Exception:
+                _cache_ears = {}
+            _cache_mtime = mtime
+        return _cache_ears
+
+
+def load(section: str, defaults: dict) -> dict:
+    """Defaults overlaid with config.json -> ears.<section>."""
+    merged = dict(defaults)
+    raw = _read_ears_section().get(section, {})
+    if isinstance(raw, dict):
+        merged.update({k: v for k, v in raw.items() if k in defaults})
+    return merged
@@ -2,30 +2,114 @@
 ears/vad.py
 Silero VAD wrapper for Seven.
 Segments audio into speech/non-speech regions.
+
+Two modes:
+    segment_audio(wav_bytes)   offline, whole clip -> [(start, end), ...]
+    StreamingVAD               one frame at a time, model state kept
+                               between frames (used by ears/endpointer.py)
+
+Model loading prefers the `silero-vad` pip package (bundled weights,
+ONNX runtime when available). torch.hub is the fallback — it needs the
+network on first run.
 """
 
-import torch
+import threading
 import numpy as np
 import io
 import wave
 from typing import List, Tuple
 
-# Silero VAD model
+try:
+    import torch
+except ImportError:
+    torch = None
+
+SAMPLE_RATE   = 16000
+SILERO_FRAME  = 512      # samples per Silero call at 16 kHz (32 ms)
+
+# Silero VAD model (segment_audio). StreamingVADs load their own.
 _model, _utils = None, None
+_load_lock  = threading.Lock()
+_model_lock = threading.Lock()
 
-def _load_vad_model():
-    global _model, _utils
-    if _model is None:
+
+def _new_vad_model():
+    """A fresh Silero instance with its own recurrent state: (model, utils)."""
+    if torch is None:
+        raise ImportError("torch is required for Silero VAD")
+    try:
+        import silero_vad as _sv
+        try:
+            model = _sv.load_silero_vad(onnx=True)
+        except Exception:
+            model = _sv.load_silero_vad()
+        return model, (_sv.get_speech_timestamps, None, None, None, None)
+    except ImportError:
         torch.hub.set_dir(".cache/torch/hub")
-        model, utils = torch.hub.load(
+        return torch.hub.load(
             repo_or_dir='snakers4/silero-vad',
             model='silero_vad',
             force_reload=False,
             onnx=False
         )
-        _model, _utils = model, utils
+
+
+def _load_vad_model():
+    global _model, _utils
+    with _load_lock:
+        if _model is None:
+            _model, _utils = _new_vad_model()
     return _model, _utils
 
+
+class StreamingVAD:
+    """
+    Frame-by-frame Silero. Feed consecutive SILERO_FRAME-sample float32
+    frames; the model's recurrent state carries context across calls, so
+    each frame costs one small forward pass instead of re-scoring a window.
+
+    Each instance loads its own model (the ONNX Silero is ~2 MB), so
+    listen() and the interrupt listener can score frames on their own
+    threads at the same time without resetting or advancing each other's
+    state. One instance per stream — do not interleave two streams on it.
+    """
+
+    frame_samples = SILERO_FRAME
+    name          = "silero"
+
+    def __init__(self):
+        with _load_lock:
+            self._model, _ = _new_vad_model()
+
+    def reset(self):
+        if hasattr(self._model, "reset_states"):
+            self._model.reset_states()
+
+    def prob(self, frame: np.ndarray) -> float:
+        with torch.no_grad():
+            return float(self._model(torch.from_numpy(frame), SAMPLE_RATE))
+
+
+class EnergyVAD:
+    """
+    No-ML fallback: 30 ms frames, speech = frame RMS above the adaptive
+    noise-floor threshold. Same interface as StreamingVAD.
+    """
+
+    frame_samples = 480
+    name          = "energy"
+
+    def __init__(self, threshold_fn):
+        self._threshold_fn = threshold_fn
+
+    def reset(self):
+        pass
+
+    def prob(self, frame: np.ndarray) -> float:
+        rms = float(np.sqrt(np.dot(frame, frame) / len(frame))) * 32767.0
+        return 1.0 if rms >= self._threshold_fn() else 0.0
+
+
 def _read_wav_bytes(wav_bytes: bytes) -> Tuple[np.ndarray, int]:
     """Read WAV bytes into numpy array and sample rate."""
     with wave.open(io.BytesIO(wav_bytes), 'rb') as wf:
@@ -43,15 +127,20 @@ def segment_audio(wav_bytes: bytes) -> List[Tuple[float, float]]:
     model, utils = _load_vad_model()
     (get_speech_timestamps, _, _, _, _) = utils
 
-    speech_timestamps = get_speech_timestamps(
-        audio,
-        model,
+    params = dict(
         sampling_rate=sr,
         threshold=0.5,
         min_speech_duration_ms=200,
         min_silence_duration_ms=300,
-        window_size_samples=512
     )
+    with _model_lock:   # one shared instance, and it keeps state between frames
+        try:
+            speech_timestamps = get_speech_timestamps(
+                audio, model, window_size_samples=512, **params
+            )
+        except TypeError:
+            # silero-vad >= 5 fixes the window at 512 and dropped the argument
+            speech_timestamps = get_speech_timestamps(audio, model, **params)
 
     segments = []
     for ts in speech_timestamps:
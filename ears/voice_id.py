@@ -55,10 +55,11 @@ def _get_model():
         return None
 
 
-def _audio_to_embedding(audio_path: str) -> np.ndarray:
+def _audio_to_embedding(audio) -> np.ndarray:
     """
-    Convert WAV to 192-dim TitaNet speaker embedding.
-    Returns L2-normalized numpy array or None.
+    Convert audio to 192-dim TitaNet speaker embedding.
+    audio: WAV path, or float32 mono 16 kHz array (what listen() captures —
+    no temp file). Returns L2-normalized numpy array or None.
     """
     try:
         import torch
@@ -67,10 +68,13 @@ def _audio_to_embedding(audio_path: str) -> np.ndarray:
         if model is None:
             return None
 
-        # Pass audio path directly to TitaNet
-        # get_embedding() handles resampling internally via NeMo's audio pipeline
         with torch.no_grad():
-            emb = model.get_embedding(audio_path)
+            if isinstance(audio, np.ndarray):
+                # Same call get_embedding() makes after reading the file
+                emb, _ = model.infer_segment(np.asarray(audio, dtype=np.float32))
+            else:
+                # get_embedding() handles resampling internally via NeMo's audio pipeline
+                emb = model.get_embedding(audio)
         emb = emb.squeeze().cpu().numpy()  # [192]
 
         # L2 normalize
@@ -87,6 +91,16 @@ def _audio_to_embedding(audio_path: str) -> np.ndarray:
         return None
 
 
+def speaker_embedding(audio) -> np.ndarray:
+    """
+    Embedding only, no scoring — safe to run in a thread next to Whisper.
+    Returns None when no speaker is enrolled (nothing to compare against).
+    """
+    if not _load_profiles():
+        return None
+    return _audio_to_embedding(audio)
+
+
 def _ensure_dirs():
     os.makedirs(VOICE_PRINTS_DIR, exist_ok=True)
     if not os.path.exists(PROFILES_FILE):
@@ -194,14 +208,21 @@ def enroll_speaker(name: str, audio_path: str) -> bool:
 _score_history: dict = {}
 
 
-def identify_speaker(audio_path: str) -> str:
+def identify_speaker(audio) -> str:
+    """audio: WAV path or float32 mono 16 kHz array."""
+    if not _load_profiles():
+        return "default"
+    return identify_embedding(_audio_to_embedding(audio))
+
+
+def identify_embedding(embedding: np.ndarray) -> str:
+    """Score a precomputed embedding (see speaker_embedding) against the profiles."""
     global _score_history
 
     profiles = _load_profiles()
     if not profiles:
         return "default"
 
-    embedding = _audio_to_embedding(audio_path)
     if embedding is None:
         return "default"
 
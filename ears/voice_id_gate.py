@@ -5,14 +5,15 @@ Voice ID gate: if enabled and speaker is unknown, discard audio.
 
 from ears.voice_id import identify_speaker, is_voice_id_enabled
 
-def should_process(audio_path: str, enabled: bool) -> bool:
+def should_process(audio, enabled: bool) -> bool:
     """
     Should this audio be processed?
     If Voice ID is enabled and speaker is unknown: False.
+    audio: WAV path or float32 mono 16 kHz array.
     """
     if not enabled:
         return True
     if not is_voice_id_enabled():
         return False  # Gate on but no profiles enrolled
-    speaker_id = identify_speaker(audio_path)
+    speaker_id = identify_speaker(audio)
     return speaker_id != "unknown"
\ No newline at end of file
@@ -0,0 +1,424 @@
+"""
+=============================================================================
+ears/whisper_service.py
+Seven — Centralized Whisper inference service
+
+WHAT THIS FILE DOES:
+    Owns every loaded Whisper model and every transcription request.
+        get_model(size)     one WhisperModel per size, loaded once
+        transcribe(...)     queued, prioritized, concurrency-bounded
+        start_server()      local TCP API (127.0.0.1:7892) so
+                            trigger_daemon.py can use Seven's models
+        client(size)        what the daemon calls: remote if Seven is up,
+                            in-process fallback if not
+
+WHY:
+    ears/core.py loaded a model at import, listen_for_interrupt called it
+    from a second thread at the same time as the main pipeline, and
+    trigger_daemon.VoiceListener loaded its own tiny.en in another process.
+    Two copies in RAM, and CPU threads fighting each other with no notion
+    of which request mattered more.
+
+PRIORITIES (lower runs first, FIFO within a level):
+    PRIORITY_MAIN       0   the user's utterance — final decode
+    PRIORITY_INTERRUPT  1   "stop" while Seven is speaking
+    PRIORITY_PARTIAL    2   speculative partial hypotheses
+    PRIORITY_TRIGGER    3   daemon voice-trigger phrases
+    Remote callers can never claim PRIORITY_MAIN.
+
+CONCURRENCY:
+    max_concurrency worker threads (auto: 1 on GPU, cores // 4 capped at 2
+    on CPU). Each model is created with num_workers equal to that, and
+    cpu_threads = cores // workers, so parallel decodes split the cores
+    instead of oversubscribing them.
+
+WIRE FORMAT (same JSON-line style as the overlay IPC on 7891):
+    request:  {"op": "transcribe", "size": "...", "priority": 3,
+               "options": {...}, "n_bytes": N}\\n  + N bytes float32 PCM
+              {"op": "ping"}\\n
+    response: {"ok": true, "segments": [...], "info": {...}}\\n
+
+    The server only decodes the default (configured) model or a size in
+    remote_sizes, and refuses requests over max_request_seconds of audio,
+    so a client cannot make Seven load arbitrary models or buffer an
+    unbounded payload.
+
+CONFIG (config.json -> ears.whisper_service):
+    max_concurrency      0      -- 0 = auto
+    server_enabled       True
+    port                 7892
+    remote_sizes         ["tiny.en"]   -- besides the default model
+    max_request_seconds  30
+=============================================================================
+"""
+
+import os
+import json
+import heapq
+import socket
+import itertools
+import threading
+import socketserver
+from types import SimpleNamespace
+
+import numpy as np
+from colorama import Fore
+
+from ears import settings as _settings
+
+PRIORITY_MAIN      = 0
+PRIORITY_INTERRUPT = 1
+PRIORITY_PARTIAL   = 2
+PRIORITY_TRIGGER   = 3
+
+SERVICE_HOST = "127.0.0.1"
+
+_DEFAULTS = {
+    "max_concurrency": 0,
+    "server_enabled":  True,
+    "port":            7892,
+    "remote_sizes":        ["tiny.en"],
+    "max_request_seconds": 30,
+}
+
+_SAMPLE_RATE = 16000
+
+# Options a remote caller may pass through to WhisperModel.transcribe()
+_REMOTE_OPTIONS = {
+    "beam_size", "language", "no_speech_threshold", "log_prob_threshold",
+    "vad_filter", "vad_parameters", "condition_on_previous_text",
+    "initial_prompt", "word_timestamps",
+}
+
+
+def get_settings() -> dict:
+    return _settings.load("whisper_service", _DEFAULTS)
+
+
+# =============================================================================
+# MODELS — one per size
+# =============================================================================
+
+_models       = {}
+_models_lock  = threading.Lock()
+_default_size = None
+_use_gpu      = None
+
+
+def _gpu_available() -> bool:
+    global _use_gpu
+    if _use_gpu is None:
+        try:
+            import torch
+            _use_gpu = bool(torch.cuda.is_available())
+            if _use_gpu:
+                print(Fore.CYAN + f"[EARS] GPU: {torch.cuda.get_device_name(0)}")
+        except Exception:
+            _use_gpu = False
+    return _use_gpu
+
+
+def worker_count() -> int:
+    configured = int(get_settings()["max_concurrency"] or 0)
+    if configured > 0:
+        return configured
+    if _gpu_available():
+        return 1
+    return max(1, min(2, (os.cpu_count() or 2) // 4))
+
+
+def _load(model_size: str):
+    from faster_whisper import WhisperModel
+
+    workers = worker_count()
+    if _gpu_available():
+        try:
+            model = WhisperModel(
+                model_size, device="cuda", compute_type="float16",
+                num_workers=workers,
+            )
+            print(Fore.GREEN + f"[EARS] Whisper {model_size} — GPU ready")
+            return model
+        except Exception as e:
+            print(Fore.YELLOW + f"[EARS] GPU init failed: {e}")
+
+    try:
+        model = WhisperModel(
+            model_size, device="cpu", compute_type="int8",
+            cpu_threads=max(1, (os.cpu_count() or 4) // workers),
+            num_workers=workers,
+        )
+        print(Fore.YELLOW + f"[EARS] Whisper {model_size} — CPU mode")
+        return model
+    except Exception as e:
+        print(Fore.RED + f"[EARS] Whisper load failed: {e}")
+        raise
+
+
+def get_model(model_size: str = None):
+    """The loaded model for `model_size` (default: the one set by set_default_size)."""
+    size = model_size or _default_size
+    if not size:
+        raise ValueError("no Whisper model size given and no default set")
+    with _models_lock:
+        model = _models.get(size)
+        if model is None:
+            print(Fore.CYAN + f"[EARS] Loading Whisper ({size})...")
+            model = _load(size)
+            _models[size] = model
+        return model
+
+
+def set_default_size(model_size: str):
+    global _default_size
+    _default_size = model_size
+
+
+def loaded_sizes() -> list:
+    with _models_lock:
+        return list(_models)
+
+
+def on_gpu(model_size: str = None) -> bool:
+    model = _models.get(model_size or _default_size)
+    return getattr(getattr(model, "model", None), "device", "cpu") == "cuda"
+
+
+# =============================================================================
+# PRIORITY QUEUE + WORKERS
+# =============================================================================
+
+_queue     = []
+_queue_cv  = threading.Condition()
+_seq       = itertools.count()
+_workers   = []
+_stats     = {"completed": 0, "failed": 0, "max_depth": 0}
+
+
+class _Job:
+    __slots__ = ("size", "samples", "options", "done", "result", "error")
+
+    def __init__(self, size, samples, options):
+        self.size    = size
+        self.samples = samples
+        self.options = options
+        self.done    = threading.Event()
+        self.result  = None
+        self.error   = None
+
+
+def _ensure_workers():
+    with _queue_cv:
+        alive = [t for t in _workers if t.is_alive()]
+        _workers[:] = alive
+        for i in range(len(alive), worker_count()):
+            t = threading.Thread(target=_worker_loop, daemon=True,
+                                 name=f"SevenWhisper-{i}")
+            t.start()
+            _workers.append(t)
+
+
+def _worker_loop():
+    while True:
+        with _queue_cv:
+            while not _queue:
+                _queue_cv.wait()
+            _, _, job = heapq.heappop(_queue)
+        try:
+            segments, info = get_model(job.size).transcribe(job.samples, **job.options)
+            job.result = (list(segments), info)   # decode happens while iterating
+            _stats["completed"] += 1
+        except Exception as e:
+            job.error = e
+            _stats["failed"] += 1
+        finally:
+            job.done.set()
+
+
+def transcribe(samples: np.ndarray, model_size: str = None,
+               priority: int = PRIORITY_MAIN, **options) -> tuple:
+    """
+    Queue one decode and wait for it.
+
+    ARGS:
+        samples:    float32 mono 16 kHz array
+        model_size: None = the default (configured) model
+        priority:   PRIORITY_* constant
+        options:    passed to WhisperModel.transcribe()
+
+    RETURNS:
+        (segments: list, info) — segments already materialized
+    """
+    job = _Job(model_size or _default_size, samples, options)
+    _ensure_workers()
+    with _queue_cv:
+        heapq.heappush(_queue, (priority, next(_seq), job))
+        _stats["max_depth"] = max(_stats["max_depth"], len(_queue))
+        _queue_cv.notify()
+    job.done.wait()
+    if job.error is not None:
+        raise job.error
+    return job.result
+
+
+def get_stats() -> dict:
+    with _queue_cv:
+        depth = len(_queue)
+    return {**_stats, "queue_depth": depth, "workers": worker_count(),
+            "models": loaded_sizes()}
+
+
+# =============================================================================
+# LOCAL TCP SERVER — for trigger_daemon.py
+# =============================================================================
+
+def _segment_to_dict(seg) -> dict:
+    return {
+        "text":           seg.text,
+        "start":          seg.start,
+        "end":            seg.end,
+        "no_speech_prob": getattr(seg, "no_speech_prob", 0.0),
+        "avg_logprob":    getattr(seg, "avg_logprob", 0.0),
+    }
+
+
+def _info_to_dict(info) -> dict:
+    if info is None:
+        return {}
+    return {
+        "duration":           getattr(info, "duration", None),
+        "duration_after_vad": getattr(info, "duration_after_vad", None),
+        "language":           getattr(info, "language", None),
+    }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            header = json.loads(self.rfile.readline().decode("utf-8") or "{}")
+            op = header.get("op")
+            if op == "ping":
+                reply = {"ok": True, "models": loaded_sizes()}
+            elif op == "transcribe":
+                cfg     = get_settings()
+                size    = header.get("size") or None
+                n_bytes = int(header.get("n_bytes", 0))
+                max_bytes = int(float(cfg["max_request_seconds"]) * _SAMPLE_RATE) * 4
+                if size is not None and size != _default_size and size not in cfg["remote_sizes"]:
+                    raise ValueError(f"model size {size!r} not served")
+                if n_bytes <= 0 or n_bytes > max_bytes or n_bytes % 4:
+                    raise ValueError(f"bad n_bytes {n_bytes} (max {max_bytes})")
+                raw     = self.rfile.read(n_bytes)
+                samples = np.frombuffer(raw, dtype=np.float32)
+                options = {k: v for k, v in (header.get("options") or {}).items()
+                           if k in _REMOTE_OPTIONS}
+                priority = max(PRIORITY_INTERRUPT, int(header.get("priority", PRIORITY_TRIGGER)))
+                segments, info = transcribe(samples, size, priority, **options)
+                reply = {
+                    "ok":       True,
+                    "segments": [_segment_to_dict(s) for s in segments],
+                    "info":     _info_to_dict(info),
+                }
+            else:
+                reply = {"ok": False, "error": f"unknown op {op!r}"}
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        try:
+            self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+        except Exception:
+            pass
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads      = True
+    allow_reuse_address = True
+
+
+_server = None
+
+
+def start_server():
+    """Serve transcribe requests on 127.0.0.1. Safe to call more than once."""
+    global _server
+    cfg = get_settings()
+    if _server is not None or not cfg["server_enabled"]:
+        return
+    try:
+        _server = _Server((SERVICE_HOST, int(cfg["port"])), _Handler)
+    except OSError as e:
+        print(Fore.YELLOW + f"[EARS] Whisper service port {cfg['port']} unavailable: {e}")
+        return
+    threading.Thread(target=_server.serve_forever, daemon=True,
+                     name="SevenWhisperServer").start()
+    print(Fore.GREEN + f"[EARS] Whisper service on {SERVICE_HOST}:{cfg['port']}")
+
+
+def stop_server():
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
+
+
+# =============================================================================
+# CLIENT — remote first, in-process fallback
+# =============================================================================
+
+class ServiceClient:
+    """
+    Model-like object for the daemon: client.transcribe(samples, **opts)
+    returns (segments, info) like WhisperModel.transcribe().
+    Uses Seven's service when it answers, and loads `model_size` here only
+    when nothing is listening on the port. A timeout or an error reply
+    means Seven is up but busy or refused the clip — that decode is
+    dropped (no segments) rather than loading a second model beside it.
+    """
+
+    def __init__(self, model_size: str, priority: int = PRIORITY_TRIGGER, timeout: float = 30.0):
+        self.model_size = model_size
+        self.priority   = priority
+        self.timeout    = timeout
+
+    def _request(self, header: dict, payload: bytes = b"") -> dict:
+        port = int(get_settings()["port"])
+        with socket.create_connection((SERVICE_HOST, port), timeout=self.timeout) as sock:
+            sock.sendall((json.dumps(header) + "\n").encode("utf-8") + payload)
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+        return json.loads(data.decode("utf-8") or "{}")
+
+    def remote_available(self) -> bool:
+        try:
+            return bool(self._request({"op": "ping"}).get("ok"))
+        except Exception:
+            return False
+
+    def transcribe(self, samples: np.ndarray, **options) -> tuple:
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        try:
+            reply = self._request({
+                "op":       "transcribe",
+                "size":     self.model_size,
+                "priority": self.priority,
+                "options":  options,
+                "n_bytes":  samples.nbytes,
+            }, samples.tobytes())
+            if reply.get("ok"):
+                segments = [SimpleNamespace(**s) for s in reply.get("segments", [])]
+                return segments, SimpleNamespace(**reply.get("info", {}))
+            print(Fore.YELLOW + f"[EARS] Whisper service error: {reply.get('error')} — decode dropped")
+        except ConnectionRefusedError:
+            # Seven not running — decode here
+            return transcribe(samples, self.model_size, self.priority, **options)
+        except (OSError, ValueError) as e:
+            print(Fore.YELLOW + f"[EARS] Whisper service unreachable ({e!r}) — decode dropped")
+        return [], SimpleNamespace()
+
+
+def client(model_size: str, priority: int = PRIORITY_TRIGGER) -> ServiceClient:
+    return ServiceClient(model_size, priority)
@@ -19,9 +19,31 @@ CLASSES OF INTEREST (from AudioSet ontology):
     class 431: "Chatter"               (voice — we IGNORE this class)
     class  0:  "Speech"                (voice — we IGNORE this class)
 
+BACKENDS (config.json -> ears.yamnet.backend):
+    "onnx"    onnxruntime + yamnet.onnx — already a Seven dependency.
+              Dynamic-length waveform: every 0.96s frame of a clip is
+              scored in ONE run.
+    "tflite"  tflite_runtime / ai_edge_litert + yamnet.tflite. The lite
+              model takes one 0.975s window; a longer clip is scored in
+              one invoke when the interpreter accepts a resized input,
+              window by window on the same interpreter otherwise.
+    "tf"      tensorflow + tensorflow_hub SavedModel (the original path).
+              Seconds to import, hundreds of MB resident.
+    "auto"    first of onnx, tflite, tf whose runtime AND model file exist.
+
+    Nothing is imported or loaded until the first classify() call, so
+    importing this module (or constructing YAMNetClassifier) is free.
+    After the runtime call only the class columns _find_indices selected
+    are gathered; the 521-way top-k is built only when asked for.
+
 MODEL LOCATION:
-    Downloaded once to: seven_data/models/yamnet/
-    Loaded from cache thereafter (offline forever).
+    seven_data/models/yamnet/
+        yamnet.onnx             python -m ears.yamnet_wrapper --export-onnx
+                                (one time, needs tensorflow + tf2onnx)
+        yamnet.tflite           YAMNet lite classification model
+        yamnet_class_map.csv    class names (written by --export-onnx;
+                                the .tflite carries its own label list)
+    The TF-Hub SavedModel is cached here too (TFHUB_CACHE_DIR).
 
 USAGE:
     classifier = YAMNetClassifier()
@@ -32,20 +54,15 @@ USAGE:
 
 import os
 import sys
+import csv
+import zipfile
+import threading
 import numpy as np
 from colorama import Fore
 
 # Suppress TensorFlow warnings for cleaner output
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"
 
-try:
-    import tensorflow as tf
-    import tensorflow_hub as hub
-except ImportError:
-    print(Fore.RED + "[YAMNET] tensorflow / tensorflow_hub not installed")
-    print(Fore.RED + "[YAMNET] Run Stage 1A to install dependencies")
-    raise
-
 
 # ─────────────────────────────────────────────────────────────────────────
 # MODEL CACHE LOCATION
@@ -70,6 +87,14 @@ os.environ["TFHUB_CACHE_DIR"] = _get_model_cache_dir()
 
 YAMNET_URL = "https://tfhub.dev/google/yamnet/1"
 
+ONNX_FILE      = "yamnet.onnx"
+TFLITE_FILE    = "yamnet.tflite"
+CLASS_MAP_FILE = "yamnet_class_map.csv"
+
+SAMPLE_RATE    = 16000
+WINDOW_SAMPLES = 15600   # 0.975s — one YAMNet frame incl. STFT padding
+HOP_SAMPLES    = 7680    # 0.48s frame hop
+
 
 # ─────────────────────────────────────────────────────────────────────────
 # CLASS INDEX MAP
@@ -85,6 +110,170 @@ VOICE_KEYWORDS = ["speech", "chatter", "conversation", "narration",
                   "child speech", "whispering", "singing"]
 
 
+def _read_class_map(csv_path):
+    """YAMNet class names from the CSV mapping file (index, mid, display_name)."""
+    names = []
+    with open(csv_path, "r", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)  # skip header row
+        for row in reader:
+            names.append(row[2])
+    return names
+
+
+def _get_backend_setting():
+    try:
+        from ears import settings as _settings
+        return str(_settings.load("yamnet", {"backend": "auto"})["backend"]).lower()
+    except Exception:
+        return "auto"
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# BACKENDS — each returns raw scores (num_frames, 521) for one waveform
+# ─────────────────────────────────────────────────────────────────────────
+
+class _TFHubBackend:
+    name = "tf"
+
+    @staticmethod
+    def available(model_dir):
+        import importlib.util
+        return (importlib.util.find_spec("tensorflow") is not None and
+                importlib.util.find_spec("tensorflow_hub") is not None)
+
+    def __init__(self, model_dir):
+        import tensorflow_hub as hub
+        print(Fore.CYAN + "[YAMNET] Loading TF-Hub model (may download ~17MB on first run)...")
+        self._model = hub.load(YAMNET_URL)
+        class_map_path = self._model.class_map_path().numpy().decode("utf-8")
+        self.class_names = _read_class_map(class_map_path)
+
+    def scores(self, waveform):
+        # Returns (scores, embeddings, spectrogram); scores is (frames, 521)
+        scores, _, _ = self._model(waveform)
+        return scores.numpy()
+
+
+class _OnnxBackend:
+    name = "onnx"
+
+    @staticmethod
+    def available(model_dir):
+        import importlib.util
+        return (importlib.util.find_spec("onnxruntime") is not None and
+                os.path.exists(os.path.join(model_dir, ONNX_FILE)) and
+                os.path.exists(os.path.join(model_dir, CLASS_MAP_FILE)))
+
+    def __init__(self, model_dir):
+        import onnxruntime as ort
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = 1   # the trigger daemon shares the CPU
+        self._session = ort.InferenceSession(
+            os.path.join(model_dir, ONNX_FILE), opts,
+            providers=["CPUExecutionProvider"],
+        )
+        self._input = self._session.get_inputs()[0].name
+        outputs = [o.name for o in self._session.get_outputs()]
+        # tf2onnx keeps YAMNet's output order: scores, embeddings, spectrogram
+        self._scores = next((o for o in outputs if "score" in o.lower()), outputs[0])
+        self.class_names = _read_class_map(os.path.join(model_dir, CLASS_MAP_FILE))
+
+    def scores(self, waveform):
+        return self._session.run([self._scores], {self._input: waveform})[0]
+
+
+class _TFLiteBackend:
+    name = "tflite"
+
+    @staticmethod
+    def _interpreter_cls():
+        try:
+            from tflite_runtime.interpreter import Interpreter
+            return Interpreter
+        except ImportError:
+            pass
+        try:
+            from ai_edge_litert.interpreter import Interpreter
+            return Interpreter
+        except ImportError:
+            return None
+
+    @classmethod
+    def available(cls, model_dir):
+        return (os.path.exists(os.path.join(model_dir, TFLITE_FILE)) and
+                cls._interpreter_cls() is not None)
+
+    def __init__(self, model_dir):
+        path = os.path.join(model_dir, TFLITE_FILE)
+        self._interp = self._interpreter_cls()(model_path=path, num_threads=1)
+        self._interp.allocate_tensors()
+        self._in  = self._interp.get_input_details()[0]["index"]
+        self._out = self._interp.get_output_details()[0]["index"]
+        self._len = WINDOW_SAMPLES
+        self._resizable = True
+        self.class_names = self._labels(path, model_dir)
+
+    @staticmethod
+    def _labels(path, model_dir):
+        # Lite models ship the label list as a zip-appended metadata file
+        try:
+            with zipfile.ZipFile(path) as zf:
+                name = next(n for n in zf.namelist() if n.endswith(".txt") or n.endswith(".csv"))
+                lines = zf.read(name).decode("utf-8").splitlines()
+            if name.endswith(".csv"):
+                return [row[2] for row in csv.reader(lines[1:])]
+            return [l.strip() for l in lines if l.strip()]
+        except Exception:
+            return _read_class_map(os.path.join(model_dir, CLASS_MAP_FILE))
+
+    def _invoke(self, waveform):
+        if len(waveform) != self._len:
+            self._len = None   # unknown until allocate succeeds — a failed resize must not stick
+            self._interp.resize_tensor_input(self._in, [len(waveform)])
+            self._interp.allocate_tensors()
+            self._len = len(waveform)
+        self._interp.set_tensor(self._in, waveform)
+        self._interp.invoke()
+        return self._interp.get_tensor(self._out).reshape(-1, len(self.class_names))
+
+    def scores(self, waveform):
+        if len(waveform) < WINDOW_SAMPLES:
+            waveform = np.pad(waveform, (0, WINDOW_SAMPLES - len(waveform)))
+        if len(waveform) > WINDOW_SAMPLES and self._resizable:
+            try:
+                return self._invoke(waveform)   # all frames in one invoke
+            except Exception:
+                self._resizable = False         # fixed-shape model
+        starts = range(0, len(waveform) - WINDOW_SAMPLES + 1, HOP_SAMPLES)
+        return np.concatenate([self._invoke(waveform[s:s + WINDOW_SAMPLES]) for s in starts])
+
+
+_BACKENDS = {b.name: b for b in (_OnnxBackend, _TFLiteBackend, _TFHubBackend)}
+
+
+def _select_backend(choice, model_dir):
+    if choice in _BACKENDS:
+        return _BACKENDS[choice]
+    for name in ("onnx", "tflite", "tf"):
+        if _BACKENDS[name].available(model_dir):
+            return _BACKENDS[name]
+    raise ImportError(
+        "no YAMNet runtime: need onnxruntime + yamnet.onnx, "
+        "tflite_runtime + yamnet.tflite, or tensorflow + tensorflow_hub"
+    )
+
+
+def backend_available(choice=None):
+    """Name of the backend classify() would use, or None. Imports nothing heavy."""
+    try:
+        backend = _select_backend((choice or _get_backend_setting()).lower(),
+                                  _get_model_cache_dir())
+    except ImportError:
+        return None
+    return backend.name if backend.available(_get_model_cache_dir()) else None
+
+
 # ─────────────────────────────────────────────────────────────────────────
 # YAMNET CLASSIFIER
 # ─────────────────────────────────────────────────────────────────────────
@@ -94,7 +283,7 @@ class YAMNetClassifier:
     Wraps YAMNet model for sound classification.
     
     USAGE:
-        classifier = YAMNetClassifier()   # loads model (slow first time)
+        classifier = YAMNetClassifier()   # cheap — model loads on first classify
         result = classifier.classify(audio_np_array, sample_rate=16000)
         
         result = {
@@ -109,27 +298,35 @@ class YAMNetClassifier:
         }
     """
 
-    _model = None
+    _backend = None
     _class_names = None
     _snap_indices = None
     _clap_indices = None
     _voice_indices = None
+    _load_lock = threading.Lock()
+
+    def __init__(self, backend=None):
+        self._backend_choice = (backend or _get_backend_setting()).lower()
 
-    def __init__(self):
-        if YAMNetClassifier._model is None:
-            self._load_model()
+    @property
+    def backend_name(self):
+        return YAMNetClassifier._backend.name if YAMNetClassifier._backend else None
+
+    def _ensure_loaded(self):
+        if YAMNetClassifier._backend is not None:
+            return
+        with YAMNetClassifier._load_lock:
+            if YAMNetClassifier._backend is None:
+                self._load_model()
 
     def _load_model(self):
-        """Load YAMNet from local cache or download if first time."""
-        print(Fore.CYAN + "[YAMNET] Loading model (may download ~17MB on first run)...")
+        """Load YAMNet through the selected runtime (first classify() only)."""
         try:
-            model = hub.load(YAMNET_URL)
-            YAMNetClassifier._model = model
-            print(Fore.GREEN + "[YAMNET] Model loaded")
+            model_dir = _get_model_cache_dir()
+            backend = _select_backend(self._backend_choice, model_dir)(model_dir)
+            print(Fore.GREEN + f"[YAMNET] Model loaded ({backend.name})")
 
-            # Load class names from model
-            class_map_path = model.class_map_path().numpy().decode("utf-8")
-            class_names = self._load_class_names(class_map_path)
+            class_names = backend.class_names
             YAMNetClassifier._class_names = class_names
             print(Fore.CYAN + f"[YAMNET] {len(class_names)} sound classes available")
 
@@ -148,6 +345,19 @@ class YAMNetClassifier:
             print(Fore.CYAN + f"[YAMNET] Clap classes: {YAMNetClassifier._clap_indices}")
             print(Fore.CYAN + f"[YAMNET] Voice classes: {len(YAMNetClassifier._voice_indices)} found")
 
+            # One gather per call: columns [snap..., clap..., voice...]
+            groups = [YAMNetClassifier._snap_indices,
+                      YAMNetClassifier._clap_indices,
+                      YAMNetClassifier._voice_indices]
+            YAMNetClassifier._selected = np.array(
+                [idx for g in groups for idx, _ in g], dtype=np.int64
+            )
+            bounds = np.cumsum([0] + [len(g) for g in groups])
+            YAMNetClassifier._group_slices = [
+                slice(bounds[i], bounds[i + 1]) for i in range(3)
+            ]
+            YAMNetClassifier._backend = backend
+
         except Exception as e:
             print(Fore.RED + f"[YAMNET] Failed to load: {e}")
             import traceback; traceback.print_exc()
@@ -155,15 +365,7 @@ class YAMNetClassifier:
 
     def _load_class_names(self, csv_path):
         """Load YAMNet class names from CSV mapping file."""
-        import csv
-        names = []
-        with open(csv_path, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            next(reader)  # skip header row
-            for row in reader:
-                # Format: index, mid, display_name
-                names.append(row[2])
-        return names
+        return _read_class_map(csv_path)
 
     def _find_indices(self, class_names, keywords):
         """Return list of class indices matching any keyword."""
@@ -174,17 +376,8 @@ class YAMNetClassifier:
                 indices.append((i, name))
         return indices
 
-    def classify(self, audio_samples, sample_rate=16000):
-        """
-        Classify a snippet of audio.
-        
-        ARGS:
-            audio_samples: numpy array of float32 in [-1, 1] range
-            sample_rate:   must be 16000 (YAMNet requirement)
-        
-        RETURNS:
-            dict with snap/clap/voice confidences and top-5 predictions
-        """
+    @staticmethod
+    def _prepare(audio_samples, sample_rate):
         # YAMNet requires 16kHz mono float32
         if sample_rate != 16000:
             raise ValueError(f"YAMNet requires 16kHz, got {sample_rate}")
@@ -201,50 +394,103 @@ class YAMNetClassifier:
         max_val = np.max(np.abs(audio_samples))
         if max_val > 1.0:
             audio_samples = audio_samples / max_val
+        return np.ascontiguousarray(audio_samples)
+
+    def _result(self, mean_scores_sel, full_scores=None, top_k=5):
+        snap_s, clap_s, voice_s = YAMNetClassifier._group_slices
+        result = {
+            "snap":  float(mean_scores_sel[snap_s].max(initial=0.0)),
+            "clap":  float(mean_scores_sel[clap_s].max(initial=0.0)),
+            "voice": float(mean_scores_sel[voice_s].max(initial=0.0)),
+        }
+        if top_k and full_scores is not None:
+            top = np.argsort(full_scores)[-top_k:][::-1]
+            result["top_5"] = [
+                (YAMNetClassifier._class_names[i], float(full_scores[i])) for i in top
+            ]
+        return result
+
+    def classify(self, audio_samples, sample_rate=16000, top_k=5):
+        """
+        Classify a snippet of audio.
+        
+        ARGS:
+            audio_samples: numpy array of float32 in [-1, 1] range
+            sample_rate:   must be 16000 (YAMNet requirement)
+            top_k:         size of the debug "top_5" list; 0 skips it
+        
+        RETURNS:
+            dict with snap/clap/voice confidences and top-5 predictions
+        """
+        self._ensure_loaded()
+        waveform = self._prepare(audio_samples, sample_rate)
 
-        # Run inference — returns (scores, embeddings, spectrogram)
         # scores shape: (num_frames, 521) — one prediction per 0.48s frame
-        scores, embeddings, spectrogram = YAMNetClassifier._model(audio_samples)
-        scores_np = scores.numpy()
+        scores = YAMNetClassifier._backend.scores(waveform)
 
-        # Aggregate: take mean across all frames
-        mean_scores = np.mean(scores_np, axis=0)
+        # Aggregate: mean across frames, only for the selected classes
+        sel = scores[:, YAMNetClassifier._selected].mean(axis=0)
+        full = scores.mean(axis=0) if top_k else None
+        return self._result(sel, full, top_k)
 
-        # Extract our targeted confidences (max across matching classes)
-        snap_conf = max(
-            [mean_scores[idx] for idx, _ in YAMNetClassifier._snap_indices],
-            default=0.0
-        )
-        clap_conf = max(
-            [mean_scores[idx] for idx, _ in YAMNetClassifier._clap_indices],
-            default=0.0
-        )
-        voice_conf = max(
-            [mean_scores[idx] for idx, _ in YAMNetClassifier._voice_indices],
-            default=0.0
-        )
+    def classify_frames(self, audio_samples, sample_rate=16000):
+        """
+        Per-frame snap/clap/voice for a longer recording, from ONE backend
+        call — replaces sliding classify() over overlapping windows.
 
-        # Top 5 predictions for debugging
-        top_5_indices = np.argsort(mean_scores)[-5:][::-1]
-        top_5 = [
-            (YAMNetClassifier._class_names[i], float(mean_scores[i]))
-            for i in top_5_indices
-        ]
-
-        return {
-            "snap":  float(snap_conf),
-            "clap":  float(clap_conf),
-            "voice": float(voice_conf),
-            "top_5": top_5,
-        }
+        RETURNS:
+            list of dicts, one per 0.96s frame (0.48s hop), with "start_s"
+        """
+        self._ensure_loaded()
+        waveform = self._prepare(audio_samples, sample_rate)
+        sel = YAMNetClassifier._backend.scores(waveform)[:, YAMNetClassifier._selected]
+        frames = []
+        for i, row in enumerate(sel):
+            r = self._result(row, top_k=0)
+            r["start_s"] = i * HOP_SAMPLES / float(SAMPLE_RATE)
+            frames.append(r)
+        return frames
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# ONE-TIME ONNX EXPORT
+# ─────────────────────────────────────────────────────────────────────────
+
+def export_onnx():
+    """
+    Convert the TF-Hub model to yamnet.onnx + yamnet_class_map.csv.
+    Needs tensorflow, tensorflow_hub and tf2onnx once; afterwards the
+    trigger daemon only needs onnxruntime.
+    """
+    import shutil
+    import tensorflow as tf
+    import tensorflow_hub as hub
+    import tf2onnx
+
+    model_dir = _get_model_cache_dir()
+    model = hub.load(YAMNET_URL)
+    shutil.copy(model.class_map_path().numpy().decode("utf-8"),
+                os.path.join(model_dir, CLASS_MAP_FILE))
+    # Hub SavedModels export __call__, not the serving signature that
+    # `tf2onnx.convert --saved-model` looks for — trace __call__ instead
+    spec = [tf.TensorSpec([None], tf.float32, name="waveform")]
+    fn = tf.function(lambda waveform: model(waveform), input_signature=spec)
+    tf2onnx.convert.from_function(fn, input_signature=spec, opset=13,
+                                  output_path=os.path.join(model_dir, ONNX_FILE))
+    print(Fore.GREEN + f"[YAMNET] Exported {os.path.join(model_dir, ONNX_FILE)}")
 
 
 # ─────────────────────────────────────────────────────────────────────────
 # STANDALONE TEST — Stage 1D
 # Records 3 seconds of audio, classifies with YAMNet, prints results
+# python -m ears.yamnet_wrapper --export-onnx   converts the model instead
 # ─────────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
+    if "--export-onnx" in sys.argv:
+        export_onnx()
+        sys.exit(0)
+
     import time
     import pyaudio
 
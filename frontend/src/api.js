@@ -6,6 +6,8 @@ const BASE_URL = window.location.protocol === 'file:'
   ? 'http://127.0.0.1:7777/api'
   : '/api';
 
+export const API_BASE = BASE_URL;
+
 const api = axios.create({
   baseURL: BASE_URL,
   timeout: 30000,
@@ -29,4 +31,27 @@ api.interceptors.response.use(
   e => { console.error('[API]', e.message); return Promise.reject(e); }
 );
 
+// Long-polls /api/changes and calls onChange(domain) whenever one of the
+// watched domains (tasks, schedules, triggers, workspaces) changes.
+// Returns a stop function — usable directly as a useEffect cleanup.
+export function watchChanges(domains, onChange) {
+  let stopped = false;
+  let cursor  = null;
+  (async () => {
+    while (!stopped) {
+      try {
+        const r = await api.get('/changes', {
+          params: { since: cursor ?? 0, domains: domains.join(','), timeout: 25 },
+        });
+        if (stopped) break;
+        if (cursor !== null) Object.keys(r.data.changed || {}).forEach(onChange);
+        cursor = r.data.cursor;
+      } catch {
+        await new Promise(res => setTimeout(res, 5000));
+      }
+    }
+  })();
+  return () => { stopped = true; };
+}
+
 export default api;
\ No newline at end of file
@@ -10,6 +10,8 @@
  * 
  * HOW IT WORKS:
  *   useStatus store receives user_text + seven_text from WebSocket
+ *   partial_text is the live transcript while the user is still talking —
+ *   shown dimmed in the user line until user_text replaces it
  *   This component reads them and displays with auto-scroll
  *   Fades out 6 seconds after Seven stops speaking
  */
@@ -18,7 +20,8 @@ import { useEffect, useRef, useState } from 'react';
 import useStatus from '../stores/useStatus';
 
 export default function ConversationPanel() {
-  const { userText, sevenText, listening, thinking, speaking, connected } = useStatus();
+  const { userText, partialText, sevenText, listening, thinking, speaking, connected } = useStatus();
+  const heardText  = userText || partialText;
   const sevenRef   = useRef(null);
   const [visible,  setVisible]  = useState(false);
   const [fadeOut,  setFadeOut]  = useState(false);
@@ -26,12 +29,12 @@ export default function ConversationPanel() {
 
   // Show panel whenever there is content
   useEffect(() => {
-    if (userText || sevenText || thinking || speaking) {
+    if (heardText || sevenText || thinking || speaking) {
       setVisible(true);
       setFadeOut(false);
       if (fadeTimer.current) clearTimeout(fadeTimer.current);
     }
-  }, [userText, sevenText, thinking, speaking]);
+  }, [heardText, sevenText, thinking, speaking]);
 
   // Fade out 5 seconds after Seven finishes speaking and is back to listening
   useEffect(() => {
@@ -53,7 +56,7 @@ export default function ConversationPanel() {
   }, [sevenText]);
 
   if (!connected) return null;
-  if (!visible && !userText && !sevenText && !thinking && !speaking) return null;
+  if (!visible && !heardText && !sevenText && !thinking && !speaking) return null;
 
   return (
     <div
@@ -71,17 +74,19 @@ export default function ConversationPanel() {
         }}
       >
         {/* User line */}
-        {userText && (
+        {heardText && (
           <div className="px-4 pt-3 pb-2 flex items-start gap-2.5">
             <div className="w-1.5 h-1.5 rounded-full bg-white/30 mt-1.5 shrink-0" />
-            <p className="text-[11px] text-white/50 leading-relaxed font-light">
-              {userText}
+            <p className={`text-[11px] leading-relaxed font-light ${
+              userText ? 'text-white/50' : 'text-white/30 italic'
+            }`}>
+              {heardText}
             </p>
           </div>
         )}
 
         {/* Divider between user and seven */}
-        {userText && (sevenText || thinking) && (
+        {heardText && (sevenText || thinking) && (
           <div className="mx-4 h-px bg-white/5" />
         )}
 
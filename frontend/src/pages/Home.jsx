@@ -9,7 +9,7 @@ import {
 } from 'lucide-react';
 import useStatus  from '../stores/useStatus';
 import useTasks   from '../stores/useTasks';
-import api        from '../api';
+import api, { watchChanges } from '../api';
 
 // ── Helpers ───────────────────────────────────────────────────────────────
 
@@ -463,10 +463,18 @@ export default function Home({ isFirstLaunch }) {
       setInterval(loadUsage, 10000),
       setInterval(fetchTS,   30000),
       setInterval(loadAll,   30000),
-      setInterval(() => api.get('/schedules').then(r => setScheds(r.data || [])).catch(() => {}), 15000),
     ];
 
-    return () => { clearInterval(si); intervals.forEach(clearInterval); };
+    // Schedules and tasks refetch when they change, not on a timer
+    const stopWatch = watchChanges(['schedules', 'tasks'], domain => {
+      if (domain === 'schedules') {
+        api.get('/schedules').then(r => setScheds(r.data || [])).catch(() => {});
+      } else {
+        fetchTasks(); fetchTS();
+      }
+    });
+
+    return () => { clearInterval(si); intervals.forEach(clearInterval); stopWatch(); };
   }, []);
 
   const tier  = cfg?.license?.tier || 'free';
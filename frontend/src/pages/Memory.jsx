@@ -253,7 +253,7 @@ function DayGroup({ dateStr, messages, defaultOpen, onDelete, searchQuery }) {
 
 // ── Conversations Tab ──────────────────────────────────────────────────────
 
-function ConversationsTab({ conversations, onDelete, searchQuery }) {
+function ConversationsTab({ conversations, onDelete, searchQuery, hasMore, onLoadMore }) {
   const [range,  setRange]  = useState('all');
   const [source, setSource] = useState('all');
 
@@ -361,6 +361,14 @@ function ConversationsTab({ conversations, onDelete, searchQuery }) {
           ))}
         </div>
       )}
+
+      {hasMore && (
+        <button onClick={onLoadMore}
+                className="w-full py-2 rounded-lg text-[9px] font-medium text-white/30
+                           hover:text-white/55 border border-white/6 transition-all duration-150">
+          Load older conversations
+        </button>
+      )}
     </div>
   );
 }
@@ -468,8 +476,8 @@ export default function Memory() {
   const [searching,  setSearching] = useState(false);
 
   const {
-    facts, conversations, totalConvos, stats, loading,
-    fetchFacts, fetchConvos, fetchStats, deleteFact, deleteConvo,
+    facts, conversations, totalConvos, convoCursor, stats, loading,
+    fetchFacts, fetchConvos, fetchMoreConvos, fetchStats, deleteFact, deleteConvo,
   } = useMemory();
 
   useEffect(() => {
@@ -574,6 +582,8 @@ export default function Memory() {
             conversations={conversations}
             onDelete={deleteConvo}
             searchQuery={search}
+            hasMore={!!convoCursor}
+            onLoadMore={() => fetchMoreConvos()}
           />
         ) : (
           <FactsTab
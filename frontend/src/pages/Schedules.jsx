@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react';
 import useSchedules from '../stores/useSchedules';
-import api from '../api';
+import api, { watchChanges } from '../api';
 import {
   Bell, Clock, Calendar, Timer, Plus, X,
   CheckCircle2, AlertCircle, Pencil, Trash2,
@@ -373,8 +373,7 @@ export default function Schedules() {
     api.get('/license/status')
        .then(r => setTier(r.data.tier || 'free'))
        .catch(() => {});
-    const i = setInterval(fetch, 15000);
-    return () => clearInterval(i);
+    return watchChanges(['schedules'], fetch);
   }, []);
 
   const active  = schedules.filter(s => s.status === 'active');
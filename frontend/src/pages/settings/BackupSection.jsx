@@ -63,7 +63,7 @@ export default function BackupSection({
             <input
               ref={importRef}
               type="file"
-              accept=".json"
+              accept=".json,.ndjson"
               onChange={importData}
               className="hidden"
             />
@@ -276,12 +276,11 @@ export default function Settings() {
   const exportData = async () => {
     setExporting(true);
     try {
-      const r = await api.get('/memory/export');
-      const blob = new Blob([JSON.stringify(r.data, null, 2)], { type: 'application/json' });
-      const url = URL.createObjectURL(blob);
+      const r = await api.get('/memory/export?format=ndjson', { responseType: 'blob' });
+      const url = URL.createObjectURL(r.data);
       const a = document.createElement('a');
       a.href = url;
-      a.download = `seven-backup-${new Date().toISOString().slice(0, 10)}.json`;
+      a.download = `seven-backup-${new Date().toISOString().slice(0, 10)}.ndjson`;
       a.click();
       URL.revokeObjectURL(url);
     } catch { alert('Export failed'); }
@@ -294,9 +293,10 @@ export default function Settings() {
     setImporting(true);
     setImportResult(null);
     try {
-      const text = await file.text();
-      const data = JSON.parse(text);
-      const r = await api.post('/memory/import', data);
+      // Sent as-is — the backend streams it and accepts .json or .ndjson
+      const r = await api.post('/memory/import', file, {
+        headers: { 'Content-Type': 'application/octet-stream' },
+      });
       const msg = r.data.message || `Imported ${r.data.imported_facts} facts, ${r.data.imported_conversations} conversations, ${r.data.imported_schedules || 0} schedules`;
       setImportResult({ success: true, msg });
     } catch { setImportResult({ success: false, msg: 'Import failed — invalid file' }); }
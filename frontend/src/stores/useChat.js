@@ -1,5 +1,59 @@
 import { create } from 'zustand';
-import api from '../api';
+import api, { API_BASE } from '../api';
+
+// Error carrying a user-facing detail. notStarted = the server never
+// accepted the request, so the turn did not run and retrying is safe.
+function chatError(detail, notStarted = false) {
+  const err = new Error(detail);
+  err.detail = detail;
+  err.notStarted = notStarted;
+  return err;
+}
+
+// POST /chat/stream and feed each SSE frame to onEvent(event, data).
+// Resolves with the 'done' payload. Rejects on HTTP or 'error' events.
+async function streamChat(text, onEvent) {
+  let res;
+  try {
+    res = await fetch(`${API_BASE}/chat/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ text }),
+    });
+  } catch (e) {
+    throw chatError(e.message || 'Connection error', true);
+  }
+  if (!res.ok || !res.body) throw chatError(`HTTP ${res.status}`, true);
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let done = null;
+
+  for (;;) {
+    const { value, done: finished } = await reader.read();
+    if (finished) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let sep;
+    while ((sep = buffer.indexOf('\n\n')) !== -1) {
+      const frame = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      let event = 'message';
+      let data = '';
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      }
+      const payload = data ? JSON.parse(data) : {};
+      if (event === 'error') throw chatError(payload.detail || 'Stream error');
+      if (event === 'done') done = payload;
+      onEvent(event, payload);
+    }
+  }
+  if (!done) throw chatError('Stream ended early');
+  return done;
+}
 
 const useChat = create((set, get) => ({
   messages: [],
@@ -26,24 +80,52 @@ const useChat = create((set, get) => ({
         return;
       }
 
-      // Normal chat — send to backend
-      const r = await api.post('/chat', { text });
-      const botMsg = {
-        role: 'assistant',
-        text: r.data.response,
-        actions: r.data.actions || [],
-        fileResults: r.data.file_results || null,
-        time: new Date(),
-      };
-      set((s) => ({ messages: [...s.messages, botMsg], sending: false }));
+      // Normal chat — stream sentences as Ollama generates them.
+      // The placeholder message grows in place; 'done' carries the final,
+      // tag-free text plus actions. Falls back to /chat only if the stream
+      // request itself failed — once the server accepted it the pipeline
+      // (and its actions) ran, and posting again would run them twice.
+      const botMsg = { role: 'assistant', text: '', actions: [], time: new Date(), streaming: true };
+      const idx = get().messages.length;
+      set((s) => ({ messages: [...s.messages, botMsg] }));
+      const patch = (fields) => set((s) => {
+        const messages = [...s.messages];
+        messages[idx] = { ...messages[idx], ...fields };
+        return { messages };
+      });
+
+      let shown = '';
+      let data;
+      try {
+        data = await streamChat(text, (event, payload) => {
+          if (event === 'sentence') {
+            shown = shown ? `${shown} ${payload.text}` : payload.text;
+            patch({ text: shown });
+          }
+        });
+      } catch (streamErr) {
+        if (!streamErr.notStarted) throw streamErr;
+        data = (await api.post('/chat', { text })).data;
+      }
+
+      patch({
+        text: data.response,
+        actions: data.actions || [],
+        fileResults: data.file_results || null,
+        streaming: false,
+      });
+      set({ sending: false });
     } catch (e) {
       const errMsg = {
         role: 'assistant',
-        text: e.response?.data?.detail || 'Connection error',
+        text: e.response?.data?.detail || e.detail || 'Connection error',
         error: true,
         time: new Date(),
       };
-      set((s) => ({ messages: [...s.messages, errMsg], sending: false }));
+      set((s) => ({
+        messages: [...s.messages.filter((m) => !(m.streaming && !m.text)), errMsg],
+        sending: false,
+      }));
     }
   },
 
@@ -1007,9 +1089,15 @@ Streaming:   ${speed.streaming ? 'ON' : 'OFF'}
 
 Samples:     ${speed.count}
 Average:     ${speed.avg}ms
+p50 / p90:   ${speed.p50}ms / ${speed.p90}ms
+p99:         ${speed.p99}ms
 Fastest:     ${speed.min}ms
 Slowest:     ${speed.max}ms
-
+${speed.ttft && speed.ttft.count ? `First token: p50 ${speed.ttft.p50}ms, p90 ${speed.ttft.p90}ms, p99 ${speed.ttft.p99}ms
+` : ''}${speed.response_cache ? `
+Cache:       ${speed.response_cache.enabled ? 'ON' : 'OFF'}
+Hit rate:    ${Math.round(speed.response_cache.hit_rate * 100)}% (${speed.response_cache.hits} hits, ${speed.response_cache.entries} entries)
+` : ''}
 ${'='.repeat(50)}
 Lower is better. Average < 2000ms is good.`;
       } catch (e) {
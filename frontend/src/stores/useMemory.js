@@ -1,10 +1,11 @@
 import { create } from 'zustand';
 import api from '../api';
 
-const useMemory = create((set) => ({
-  facts: [], conversations: [], totalConvos: 0, stats: null, loading: true,
+const useMemory = create((set, get) => ({
+  facts: [], conversations: [], totalConvos: 0, convoCursor: null, stats: null, loading: true,
   fetchFacts: async () => { try { const r = await api.get('/memory/facts'); set({ facts: r.data, loading: false }); } catch { set({ loading: false }); } },
-  fetchConvos: async (l=500, o=0) => { try { const r = await api.get(`/memory/conversations?limit=${l}&offset=${o}`); set({ conversations: r.data.conversations, totalConvos: r.data.total, loading: false }); } catch { set({ loading: false }); } },
+  fetchConvos: async (l=200) => { try { const r = await api.get(`/memory/conversations?limit=${l}`); set({ conversations: r.data.conversations, totalConvos: r.data.total, convoCursor: r.data.next_cursor || null, loading: false }); } catch { set({ loading: false }); } },
+  fetchMoreConvos: async (l=200) => { const c = get().convoCursor; if (!c) return; try { const r = await api.get(`/memory/conversations?limit=${l}&cursor=${encodeURIComponent(c)}`); set(s => ({ conversations: [...s.conversations, ...r.data.conversations], totalConvos: r.data.total, convoCursor: r.data.next_cursor || null })); } catch {} },
   fetchStats: async () => { try { const r = await api.get('/memory/stats'); set({ stats: r.data }); } catch {} },
   deleteFact: async (id) => { try { await api.delete(`/memory/facts/${id}`); set(s => ({ facts: s.facts.filter(f => f.id !== id) })); return true; } catch { return false; } },
   deleteConvo: async (id) => { try { await api.delete(`/memory/conversations/${id}`); set(s => ({ conversations: s.conversations.filter(c => c.id !== id), totalConvos: s.totalConvos - 1 })); return true; } catch { return false; } },
@@ -6,6 +6,7 @@ const useStatus = create((set, get) => ({
   speaking:   false,
   thinking:   false,
   userText:   '',
+  partialText: '',
   sevenText:  '',
   statusText: '',
   mood: 'neutral',
@@ -26,6 +27,7 @@ const useStatus = create((set, get) => ({
         ...r.data,
         moodValue:  r.data.mood_value,
         userText:   r.data.user_text  || '',
+        partialText: r.data.partial_text || '',
         sevenText:  r.data.seven_text || '',
         statusText: r.data.status_text || '',
         loading: false,
@@ -42,6 +44,7 @@ const useStatus = create((set, get) => ({
     thinking:   data.thinking   ?? false,
     speaking:   data.speaking   ?? false,
     userText:   data.user_text  ?? '',
+    partialText: data.partial_text ?? '',
     sevenText:  data.seven_text ?? '',
     statusText: data.status_text ?? '',
   }),
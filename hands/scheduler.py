@@ -30,6 +30,8 @@ import calendar
 from datetime import datetime, timedelta
 from colorama import Fore
 
+from seven_utils import changes
+
 # =========================================================================
 # STORAGE
 # =========================================================================
@@ -70,6 +72,8 @@ def _save():
             json.dump(_schedules, f, indent=2)
     except Exception as e:
         print(Fore.RED + f"[SCHEDULER] Save error: {e}")
+    # Every change to _schedules ends here — /api/schedules serves the list from memory
+    changes.bump("schedules")
 
 
 # Load on import
@@ -598,6 +598,19 @@ from main_modules.handlers.pre_executor       import pre_execute
 app_ui = None
 
 
+def _flush_write_queues():
+    """Store turns still in the write-behind queue and buffered usage time. os._exit() skips atexit."""
+    try:
+        from memory import ingest
+        ingest.shutdown(timeout=5)
+    except Exception:
+        pass
+    try:
+        telemetry.flush(final=True)
+    except Exception:
+        pass
+
+
 # ============================================================================
 # SEVEN LOGIC THREAD
 # ============================================================================
@@ -620,6 +633,7 @@ def seven_logic():
     try:
         import ears.core as _ears_core
         _ears_core.set_speaking_fn(ctx.mouth.is_speaking)
+        _ears_core.set_partial_fn(lambda t: api_set_state("partial_text", t))
         print(Fore.CYAN + "[SYSTEM] Speaking guard wired to ears")
     except Exception as _sg_err:
         print(Fore.YELLOW + f"[SYSTEM] Speaking guard not wired: {_sg_err}")
@@ -882,11 +896,10 @@ def seven_logic():
 
             if _came_from_voice:
                 if ctx.is_voice_id_enabled():
-                    # Voice ID enabled — identify the speaker
-                    # Note: voice_id needs a real audio file.
-                    # For now, use "voice_user" as the speaker ID when
-                    # Voice ID is disabled but input came from mic.
-                    speaker_id = ctx.identify_speaker(audio_path) if audio_path != "__voice__" else "voice_user"
+                    # Voice ID enabled — listen() already identified the
+                    # speaker from the in-memory clip, alongside Whisper.
+                    # None when the speaker_verify gate is off in config.
+                    speaker_id = ctx.last_speaker() or "voice_user"
                 else:
                     # Voice ID disabled — mark as voice_user so brain.py
                     # saves with source="voice" not source="chat"
@@ -964,8 +977,7 @@ def seven_logic():
                 try:
                     import voice_limits
                     if ctx.seven_memory:
-                        _current_facts = ctx.seven_memory.user_facts.count()
-                        _fact_ok, _fact_msg = voice_limits.check("facts_limit", _current_facts)
+                        _fact_ok, _fact_msg = voice_limits.check_memory("facts_limit", ctx.seven_memory)
                         if not _fact_ok:
                             api_set_state("speaking", True)
                             ctx.mouth.speak(_fact_msg)
@@ -1086,12 +1098,6 @@ def seven_logic():
                 print(Fore.RED + f"[HANDLERS] Dispatch error: {_hd_err}")
                 import traceback; traceback.print_exc()
 
-            if audio_path and os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                except Exception:
-                    pass
-
         except OSError as e:
             if "Stream closed" in str(e) or "9988" in str(e) or "9999" in str(e):
                 logger.warning(f"Mic device change detected: {e}")
@@ -1165,6 +1171,7 @@ def start_app():
                 pass
         def close(self):
             print(Fore.RED + "[SYSTEM] Shutdown requested")
+            _flush_write_queues()
             os._exit(0)
 
     app_ui = DummyUI()
@@ -1189,6 +1196,7 @@ def start_app():
                 logic_thread.start()
     except KeyboardInterrupt:
         print(Fore.RED + "\n[SYSTEM] Interrupted by user")
+        _flush_write_queues()
         os._exit(0)
 
 
@@ -29,6 +29,7 @@ class SevenContext:
         self.is_voice_id_enabled = None
         self.get_enrolled_speakers = None
         self.listen_for_interrupt = None
+        self.last_speaker = None
 
         # Set by main.py
         self.app_ui = None
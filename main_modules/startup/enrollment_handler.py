@@ -96,7 +96,7 @@ def handle_pending_enrollment(ctx, api_set_state):
             else:
                 print(Fore.YELLOW + f"[ENROLL] Clip {_i+1} empty")
                 ctx.mouth.speak("I did not catch that. Try again — speak clearly.")
-                _, _retry_clip = ctx.listen()
+                _, _retry_clip = ctx.listen(return_clip=True)
                 if _retry_clip and os.path.exists(_retry_clip):
                     # Same fixed-filename issue as above — copy before
                     # the next listen() call can overwrite it.
@@ -171,12 +171,12 @@ def handle_voice_enrollment_command(ctx, api_set_state):
         if clip_num > 0:
             ctx.mouth.speak("Got it. Keep going.")
             ctx.update_status(f"ENROLLING — Keep speaking... ({clip_num+1}/5)", "#ff00ff")
-        _, clip_path = ctx.listen()
+        _, clip_path = ctx.listen(return_clip=True)
         if clip_path and os.path.exists(clip_path):
-            # ctx.listen() always writes to the same temp file. Without
-            # copying to a unique name here, every loop iteration would
-            # overwrite the previous clip, and merging would repeat one
-            # clip five times instead of using five distinct recordings.
+            # listen(return_clip=True) always writes to the same temp
+            # file. Without copying to a unique name here, every loop
+            # iteration would overwrite the previous clip, and merging would
+            # repeat one clip five times instead of using five distinct recordings.
             _unique_path = os.path.join(
                 os.environ.get('APPDATA', ''), 'SEVEN',
                 f'voice_enroll_clip_{clip_num + 1}.wav'
@@ -23,10 +23,11 @@ def load_all_modules(ctx):
     # ── Ears (core only - no heavy models on startup) ──────────────────────
     try:
         from ears import listen
-        from ears.core import listen_for_interrupt
+        from ears.core import listen_for_interrupt, last_speaker
 
         ctx.listen               = listen
         ctx.listen_for_interrupt = listen_for_interrupt
+        ctx.last_speaker         = last_speaker
 
         # Safe fallbacks - replaced by background loader when ready
         ctx.identify_speaker      = lambda path: "default"
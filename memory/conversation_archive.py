@@ -0,0 +1,116 @@
+"""
+=============================================================================
+PROJECT SEVEN - memory/conversation_archive.py
+Cold storage for conversation turns rolled out of the vector index
+
+WHAT THIS FILE DOES:
+    memory/retention.py moves raw turns older than the hot window out of
+    the "conversations" collection. They land here: one row per turn in a
+    SQLite file next to chroma.sqlite3, document + metadata as
+    zlib-compressed JSON, no embedding. Search never reads this file; the
+    backup export does, so nothing is lost from a backup.
+=============================================================================
+"""
+
+import os
+import json
+import zlib
+import sqlite3
+import threading
+
+ARCHIVE_FILE = "conversation_archive.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archive (
+    id        TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL DEFAULT '',
+    speaker   TEXT NOT NULL DEFAULT 'default',
+    source    TEXT NOT NULL DEFAULT 'chat',
+    rollup_id TEXT NOT NULL DEFAULT '',
+    payload   BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_archive_time   ON archive (timestamp, id);
+CREATE INDEX IF NOT EXISTS idx_archive_rollup ON archive (rollup_id);
+"""
+
+_PAGE = 1000
+
+
+def _pack(document: str, metadata: dict) -> bytes:
+    raw = json.dumps({"document": document, "metadata": metadata}, ensure_ascii=False)
+    return zlib.compress(raw.encode("utf-8"), 6)
+
+
+def _unpack(payload: bytes) -> tuple:
+    data = json.loads(zlib.decompress(payload).decode("utf-8"))
+    return data.get("document", ""), data.get("metadata") or {}
+
+
+class ConversationArchive:
+
+    def __init__(self, memory_dir: str):
+        self.path  = os.path.join(memory_dir, ARCHIVE_FILE)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def add_many(self, ids: list, documents: list, metadatas: list, rollup_id: str = ""):
+        rows = []
+        for conv_id, doc, meta in zip(ids, documents, metadatas):
+            meta = meta or {}
+            rows.append((
+                conv_id,
+                meta.get("timestamp") or "",
+                meta.get("user_id") or "default",
+                meta.get("source") or "chat",
+                rollup_id,
+                _pack(doc or "", meta),
+            ))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO archive "
+                "(id, timestamp, speaker, source, rollup_id, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM archive").fetchone()[0]
+
+    def size_bytes(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def iter_turns(self):
+        """(document, metadata) for every archived turn, oldest first, read in pages."""
+        last = ("", "")
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT timestamp, id, payload FROM archive "
+                    "WHERE (timestamp > ? OR (timestamp = ? AND id > ?)) "
+                    "ORDER BY timestamp, id LIMIT ?",
+                    (last[0], last[0], last[1], _PAGE)
+                ).fetchall()
+            if not rows:
+                return
+            for ts, conv_id, payload in rows:
+                yield _unpack(payload)
+            last = (rows[-1][0], rows[-1][1])
+            if len(rows) < _PAGE:
+                return
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM archive")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,194 @@
+"""
+=============================================================================
+PROJECT SEVEN - memory/conversation_index.py
+Sidecar index over the "conversations" collection
+
+WHAT THIS FILE DOES:
+    Keeps (timestamp, speaker, source) -> id for every stored conversation
+    in a small SQLite file next to chroma.sqlite3. The History page pages
+    through this index and fetches documents only for the ids on the page,
+    instead of pulling the whole collection and sorting it in Python.
+
+PAGING:
+    Keyset, newest first. The cursor is the (timestamp, id) of the last row
+    on the previous page, so page 500 costs the same as page 1.
+    Offsets still work (old clients) but walk the index.
+
+MAINTENANCE:
+    SevenMemory.store_conversation / delete_conversations / clear_all
+    update it. If its row count disagrees with the collection (first run,
+    writes made by an older build, a crash between the two writes) it is
+    rebuilt from the collection metadata — lazily, on the first listing.
+=============================================================================
+"""
+
+import os
+import sqlite3
+import threading
+
+INDEX_FILE = "conversation_index.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id        TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL DEFAULT '',
+    speaker   TEXT NOT NULL DEFAULT 'default',
+    source    TEXT NOT NULL DEFAULT 'chat'
+);
+CREATE INDEX IF NOT EXISTS idx_conv_time    ON conversations (timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_conv_speaker ON conversations (speaker, timestamp DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_conv_source  ON conversations (source, timestamp DESC, id DESC);
+"""
+
+_REBUILD_BATCH = 5000
+_CURSOR_SEP    = "|"
+
+
+def encode_cursor(timestamp: str, conv_id: str) -> str:
+    return f"{timestamp}{_CURSOR_SEP}{conv_id}"
+
+
+def decode_cursor(cursor: str) -> tuple:
+    timestamp, _, conv_id = (cursor or "").rpartition(_CURSOR_SEP)
+    return timestamp, conv_id
+
+
+def _row(conv_id: str, meta: dict) -> tuple:
+    meta = meta or {}
+    return (
+        conv_id,
+        meta.get("timestamp") or "",
+        meta.get("user_id") or "default",
+        meta.get("source") or "chat",
+    )
+
+
+class ConversationIndex:
+
+    def __init__(self, memory_dir: str):
+        self.path  = os.path.join(memory_dir, INDEX_FILE)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    # -------------------------------------------------------------------------
+    # WRITE
+    # -------------------------------------------------------------------------
+
+    def add(self, conv_id: str, metadata: dict):
+        self.add_many([conv_id], [metadata])
+
+    def add_many(self, ids: list, metadatas: list):
+        rows = [_row(i, m) for i, m in zip(ids, metadatas)]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO conversations (id, timestamp, speaker, source) "
+                "VALUES (?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def remove(self, ids: list):
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM conversations WHERE id = ?", [(i,) for i in ids]
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM conversations")
+            self._conn.commit()
+
+    def rebuild(self, collection) -> int:
+        """Replace the index with the collection's metadata, read in batches."""
+        rows, offset = [], 0
+        while True:
+            batch = collection.get(include=["metadatas"], limit=_REBUILD_BATCH, offset=offset)
+            ids = batch.get("ids") or []
+            if not ids:
+                break
+            rows.extend(_row(i, m) for i, m in zip(ids, batch.get("metadatas") or [{}] * len(ids)))
+            offset += len(ids)
+            if len(ids) < _REBUILD_BATCH:
+                break
+        with self._lock:
+            self._conn.execute("DELETE FROM conversations")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO conversations (id, timestamp, speaker, source) "
+                "VALUES (?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+        return len(rows)
+
+    # -------------------------------------------------------------------------
+    # READ
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _filters(speaker: str = None, source: str = None) -> tuple:
+        clauses, params = [], []
+        if speaker:
+            clauses.append("speaker = ?")
+            params.append(speaker)
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        return clauses, params
+
+    def count(self, speaker: str = None, source: str = None) -> int:
+        clauses, params = self._filters(speaker, source)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM conversations{where}", params
+            ).fetchone()[0]
+
+    def page(self, limit: int = 50, cursor: str = None, offset: int = 0,
+             speaker: str = None, source: str = None) -> tuple:
+        """
+        One page, newest first.
+
+        RETURNS:
+            (rows: [(id, timestamp, speaker, source), ...],
+             next_cursor: str or None when this is the last page)
+        """
+        clauses, params = self._filters(speaker, source)
+        if cursor:
+            ts, conv_id = decode_cursor(cursor)
+            clauses.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+            params += [ts, ts, conv_id]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            f"SELECT id, timestamp, speaker, source FROM conversations{where} "
+            f"ORDER BY timestamp DESC, id DESC LIMIT ?"
+        )
+        params.append(int(limit) + 1)   # one extra row tells us if there is a next page
+        if offset and not cursor:
+            sql += " OFFSET ?"
+            params.append(int(offset))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][1], rows[-1][0])
+        return rows, next_cursor
+
+    def older_than(self, timestamp: str, limit: int, exclude_source: str = None) -> list:
+        """Oldest rows with timestamp < the given one: [(id, timestamp, speaker, source), ...]"""
+        sql = "SELECT id, timestamp, speaker, source FROM conversations WHERE timestamp < ?"
+        params = [timestamp]
+        if exclude_source:
+            sql += " AND source != ?"
+            params.append(exclude_source)
+        sql += " ORDER BY timestamp, id LIMIT ?"
+        params.append(int(limit))
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -29,8 +29,14 @@ logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
 
 import chromadb
 import datetime
+import threading
 from colorama import Fore
 
+from memory.conversation_index import ConversationIndex
+from memory.counters import MemoryCounters
+from memory.conversation_archive import ConversationArchive
+from memory import retention
+
 
 # =============================================================================
 # PATH
@@ -270,6 +276,23 @@ class SevenMemory:
             )
             print(Fore.GREEN + "[MEMORY] Online (fresh). Conversations: 0 | Facts: 0")
 
+        # Sidecar (timestamp, speaker, source) -> id index for the History page.
+        # Checked against the collection on first listing, rebuilt if out of sync.
+        self.conversation_index = ConversationIndex(MEMORY_DIR)
+        self._index_lock        = threading.Lock()
+        self._index_synced      = False
+
+        # Conversation/fact counts for plan-limit checks, kept in step with writes
+        self.counters = MemoryCounters()
+
+        # Held by conversation writes; retention holds it while it swaps in
+        # a compacted collection
+        self._write_lock = threading.RLock()
+
+        # Old turns: rolled up, archived to cold storage, index compacted
+        self.conversation_archive = ConversationArchive(MEMORY_DIR)
+        retention.start(self)
+
     def _verify_embedder(self, ef):
         """
         Test the embedder with a real ChromaDB query path.
@@ -369,28 +392,55 @@ class SevenMemory:
         """
         source: "chat" (typed in Console) or "voice" (spoken via microphone)
         """
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        memory_id = f"conv_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-        combined_text = f"User said: {user_input} | Seven replied: {seven_response}"
-        self.conversations.add(
-            documents=[combined_text],
-            metadatas=[{
+        self.store_conversations([{
+            "user_input":     user_input,
+            "seven_response": seven_response,
+            "user_id":        user_id,
+            "source":         source,
+        }])
+        print(Fore.CYAN + f"[MEMORY] Stored conversation ({source}): '{user_input[:50]}...'")
+
+    def store_conversations(self, turns):
+        """
+        Store several turns with one collection.add() — one embedding pass.
+        Each turn: {"user_input", "seven_response", "user_id", "source",
+        optional "timestamp" (datetime; defaults to now)}.
+        Used by memory.ingest's write-behind worker.
+        """
+        documents, metadatas, ids = [], [], []
+        for i, turn in enumerate(turns):
+            when = turn.get("timestamp") or datetime.datetime.now()
+            memory_id = f"conv_{when.strftime('%Y%m%d_%H%M%S_%f')}"
+            if i:
+                memory_id += f"_{i}"   # turns queued in the same microsecond
+            user_input     = turn["user_input"]
+            seven_response = turn["seven_response"]
+            documents.append(f"User said: {user_input} | Seven replied: {seven_response}")
+            metadatas.append({
                 "user_input":      user_input,
                 "seven_response":  seven_response,
-                "timestamp":       timestamp,
-                "user_id":         user_id,
+                "timestamp":       when.strftime("%Y-%m-%d %H:%M:%S"),
+                "user_id":         turn.get("user_id") or "default",
                 "type":            "conversation",
-                "source":          source,
-            }],
-            ids=[memory_id]
-        )
-        print(Fore.CYAN + f"[MEMORY] Stored conversation ({source}): '{user_input[:50]}...'")
+                "source":          turn.get("source") or "chat",
+            })
+            ids.append(memory_id)
+        if not ids:
+            return
+        with self._write_lock:
+            self.conversations.add(
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids
+            )
+            self.counters.added("conversations", metadatas)
+            self.index_conversations(ids, metadatas)
 
     def store_fact(self, fact_text, category="general", user_id="default"):
         # ── Plan limit check ──
         try:
             import voice_limits
-            current = self.user_facts.count()
+            current = self.count_facts()
             allowed, _ = voice_limits.check("facts_limit", current)
             if not allowed:
                 print(Fore.YELLOW +
@@ -412,18 +462,118 @@ class SevenMemory:
             print(Fore.YELLOW +
                   f"[MEMORY] Updating existing fact: '{fact_text[:50]}...'")
             self.user_facts.delete(ids=[existing[0]["id"]])
+            self.counters.removed("user_facts", [existing[0]["metadata"]])
+        metadata = {
+            "category":  category,
+            "timestamp": timestamp,
+            "user_id":   user_id,
+            "type":      "fact"
+        }
         self.user_facts.add(
             documents=[fact_text],
-            metadatas=[{
-                "category":  category,
-                "timestamp": timestamp,
-                "user_id":   user_id,
-                "type":      "fact"
-            }],
+            metadatas=[metadata],
             ids=[fact_id]
         )
+        self.counters.added("user_facts", [metadata])
         print(Fore.GREEN + f"[MEMORY] Stored fact: '{fact_text}'")  
 
+    def delete_facts(self, ids):
+        self._delete_counted("user_facts", self.user_facts, ids)
+
+    # =========================================================================
+    # COUNTS — maintained, for plan-limit checks
+    # =========================================================================
+
+    def count_conversations(self, user_id=None):
+        """Stored conversations, all users or one user_id. No collection read."""
+        return self.counters.count("conversations", self.conversations, user_id)
+
+    def count_facts(self, user_id=None):
+        """Stored facts, all users or one user_id. No collection read."""
+        return self.counters.count("user_facts", self.user_facts, user_id)
+
+    def _delete_counted(self, name, collection, ids):
+        try:
+            metas = collection.get(ids=ids, include=["metadatas"]).get("metadatas") or []
+        except Exception:
+            metas = None
+        collection.delete(ids=ids)
+        if metas is None:
+            self.counters.invalidate(name)
+        else:
+            self.counters.removed(name, metas)
+
+    # =========================================================================
+    # CONVERSATION LISTING — sidecar index, keyset pages
+    # =========================================================================
+
+    def index_conversations(self, ids, metadatas):
+        try:
+            self.conversation_index.add_many(ids, metadatas)
+        except Exception as e:
+            self._index_synced = False   # rebuilt on next listing
+            print(Fore.YELLOW + f"[MEMORY] Conversation index update failed: {e}")
+
+    def _ensure_index(self):
+        if self._index_synced:
+            return
+        with self._index_lock:
+            if self._index_synced:
+                return
+            if self.conversation_index.count() != self.conversations.count():
+                n = self.conversation_index.rebuild(self.conversations)
+                print(Fore.CYAN + f"[MEMORY] Conversation index rebuilt ({n} entries)")
+            self._index_synced = True
+
+    def delete_conversations(self, ids):
+        with self._write_lock:
+            self._delete_counted("conversations", self.conversations, ids)
+            try:
+                self.conversation_index.remove(ids)
+            except Exception as e:
+                self._index_synced = False
+                print(Fore.YELLOW + f"[MEMORY] Conversation index update failed: {e}")
+
+    def list_conversations(self, limit=50, cursor=None, offset=0, speaker=None, source=None):
+        """
+        One page of conversation history, newest first.
+        Only the documents on the page are read from ChromaDB.
+
+        Returns {"conversations": [...], "total": int, "next_cursor": str|None}
+        Pass next_cursor back as `cursor` for the following page.
+        """
+        self._ensure_index()
+        rows, next_cursor = self.conversation_index.page(
+            limit=limit, cursor=cursor, offset=offset, speaker=speaker, source=source
+        )
+        ids = [r[0] for r in rows]
+        found = {}
+        if ids:
+            res = self.conversations.get(ids=ids, include=["documents", "metadatas"])
+            for i, doc, meta in zip(res["ids"], res["documents"], res["metadatas"]):
+                found[i] = (doc, meta or {})
+
+        convos = []
+        for conv_id, timestamp, speaker_id, src in rows:
+            if conv_id not in found:
+                self._index_synced = False   # deleted behind the index's back
+                continue
+            doc, meta = found[conv_id]
+            convos.append({
+                "id":             conv_id,
+                "text":           doc,
+                "timestamp":      timestamp,
+                "user_input":     meta.get("user_input", ""),
+                "seven_response": meta.get("seven_response", ""),
+                "speaker":        speaker_id,
+                "source":         src,
+            })
+        return {
+            "conversations": convos,
+            "total":         self.conversation_index.count(speaker=speaker, source=source),
+            "next_cursor":   next_cursor,
+        }
+
     # =========================================================================
     # SEARCH
     # =========================================================================
@@ -453,20 +603,29 @@ class SevenMemory:
             return ""
         return self._format_memories(all_results)
 
+    def _count(self, collection, user_id=None):
+        name = getattr(collection, "name", "")
+        if name in ("conversations", "user_facts"):
+            return self.counters.count(name, collection, user_id)
+        return collection.count()
+
     def _search_collection(self, collection, query, n_results=5, user_id=None):
-        if collection.count() == 0:
+        total = self._count(collection)
+        if total == 0:
             return []
-        actual_n = min(n_results, collection.count())
 
-        # Try with user_id filter first, fall back to no filter
-        # ChromaDB where filter throws when no documents match
+        # Try with user_id filter first, fall back to no filter.
+        # The maintained per-user count skips the filtered query when this
+        # user has nothing stored (ChromaDB throws when no documents match).
         queries_to_try = []
         if user_id:
-            queries_to_try.append({"user_id": user_id})
-        queries_to_try.append(None)
+            user_total = self._count(collection, user_id)
+            if user_total:
+                queries_to_try.append(({"user_id": user_id}, min(n_results, user_total)))
+        queries_to_try.append((None, min(n_results, total)))
 
         results = None
-        for where_filter in queries_to_try:
+        for where_filter, actual_n in queries_to_try:
             try:
                 res = collection.query(
                     query_texts=[query],
@@ -593,8 +752,8 @@ class SevenMemory:
     def get_stats(self):
         try:
             return {
-                "total_conversations": self.conversations.count(),
-                "total_facts":         self.user_facts.count(),
+                "total_conversations": self.count_conversations(),
+                "total_facts":         self.count_facts(),
                 "storage_path":        MEMORY_DIR
             }
         except Exception:
@@ -605,14 +764,25 @@ class SevenMemory:
             }
 
     def clear_all(self):
-        self.client.delete_collection("conversations")
-        self.client.delete_collection("user_facts")
-        self.conversations = self.client.get_or_create_collection(
-            name="conversations", embedding_function=self.embedding_function
-        )
-        self.user_facts = self.client.get_or_create_collection(
-            name="user_facts", embedding_function=self.embedding_function
-        )
+        with self._write_lock:
+            self.client.delete_collection("conversations")
+            self.client.delete_collection("user_facts")
+            self.conversations = self.client.get_or_create_collection(
+                name="conversations", embedding_function=self.embedding_function
+            )
+            self.user_facts = self.client.get_or_create_collection(
+                name="user_facts", embedding_function=self.embedding_function
+            )
+        self.conversation_index.clear()
+        self.conversation_archive.clear()
+        self._index_synced = True
+        self.counters.reset("conversations")
+        self.counters.reset("user_facts")
+        try:
+            from memory import ingest
+            ingest.discard()   # turns queued before the wipe must not reappear
+        except Exception:
+            pass
         print(Fore.YELLOW + "[MEMORY] All memories cleared.")
 
 
@@ -0,0 +1,120 @@
+"""
+=============================================================================
+PROJECT SEVEN - memory/counters.py
+Maintained record counts for the memory collections
+
+WHAT THIS FILE DOES:
+    Keeps the number of stored conversations and facts — in total and per
+    user_id — in memory, so plan-limit checks (every chat and voice turn)
+    read an int instead of fetching or counting the collection.
+
+MAINTENANCE:
+    SevenMemory calls added() / removed() next to every write it makes.
+    A collection's counts are built from its metadata on the first read,
+    and re-checked against collection.count() at most every RECONCILE_S
+    seconds; a mismatch (a write that bypassed SevenMemory, a failed
+    update) triggers a rebuild. invalidate() forces one on the next read.
+=============================================================================
+"""
+
+import time
+import threading
+from collections import Counter
+
+RECONCILE_S    = 600
+_REBUILD_BATCH = 5000
+
+
+def _user(meta: dict) -> str:
+    return (meta or {}).get("user_id") or "default"
+
+
+class MemoryCounters:
+
+    def __init__(self, reconcile_s: float = RECONCILE_S):
+        self.reconcile_s = reconcile_s
+        self._lock       = threading.Lock()
+        self._by_user    = {}     # collection name -> Counter(user_id -> n)
+        self._checked    = {}     # collection name -> monotonic time of last check
+
+    # -------------------------------------------------------------------------
+    # WRITE
+    # -------------------------------------------------------------------------
+
+    def added(self, name: str, metadatas: list):
+        with self._lock:
+            counts = self._by_user.get(name)
+            if counts is not None:     # not built yet — the first read counts these
+                counts.update(_user(m) for m in metadatas)
+
+    def removed(self, name: str, metadatas: list):
+        with self._lock:
+            counts = self._by_user.get(name)
+            if counts is None:
+                return
+            counts.subtract(_user(m) for m in metadatas)
+            for user_id in [u for u, n in counts.items() if n <= 0]:
+                del counts[user_id]
+
+    def reset(self, name: str):
+        """The collection was emptied."""
+        with self._lock:
+            self._by_user[name] = Counter()
+            self._checked[name] = time.monotonic()
+
+    def invalidate(self, name: str = None):
+        with self._lock:
+            if name is None:
+                self._by_user.clear()
+                self._checked.clear()
+            else:
+                self._by_user.pop(name, None)
+                self._checked.pop(name, None)
+
+    # -------------------------------------------------------------------------
+    # READ
+    # -------------------------------------------------------------------------
+
+    def count(self, name: str, collection, user_id: str = None) -> int:
+        self._reconcile(name, collection)
+        with self._lock:
+            counts = self._by_user.get(name) or Counter()
+            if user_id is None:
+                return sum(counts.values())
+            return counts.get(user_id, 0)
+
+    def by_user(self, name: str, collection) -> dict:
+        self._reconcile(name, collection)
+        with self._lock:
+            return dict(self._by_user.get(name) or {})
+
+    def _reconcile(self, name: str, collection):
+        now = time.monotonic()
+        with self._lock:
+            counts  = self._by_user.get(name)
+            checked = self._checked.get(name, 0.0)
+            if counts is not None and now - checked < self.reconcile_s:
+                return
+            total = sum(counts.values()) if counts is not None else None
+        if total is not None and collection.count() == total:
+            with self._lock:
+                self._checked[name] = now
+            return
+        rebuilt = self._rebuild(collection)
+        with self._lock:
+            self._by_user[name] = rebuilt
+            self._checked[name] = now
+
+    @staticmethod
+    def _rebuild(collection) -> Counter:
+        counts, offset = Counter(), 0
+        while True:
+            batch = collection.get(include=["metadatas"], limit=_REBUILD_BATCH, offset=offset)
+            ids = batch.get("ids") or []
+            if not ids:
+                break
+            counts.update(_user(m) for m in (batch.get("metadatas") or [{}] * len(ids)))
+            offset += len(ids)
+            if len(ids) < _REBUILD_BATCH:
+                break
+        return counts
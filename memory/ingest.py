@@ -0,0 +1,309 @@
+"""
+=============================================================================
+PROJECT SEVEN - memory/ingest.py
+Write-behind queue for conversation storage
+
+WHAT THIS FILE DOES:
+    brain._save_conversation / store_voice_turn used to run fact extraction
+    and store_conversation (an embedding pass + a ChromaDB write) before
+    think() returned. They now submit() the turn here and return at once.
+    A worker thread embeds and inserts queued turns in batches — one
+    collection.add() per batch — when batch_size turns are waiting or the
+    oldest has waited window_ms.
+
+BACKPRESSURE:
+    The queue holds at most max_pending turns. A submit() that finds it full
+    waits up to block_ms for room, then writes its turn synchronously on
+    the caller's thread — slower, never lost. get_stats() reports queue
+    depth, high-water mark, blocked / synchronous submits and enqueue-to-
+    stored lag for /api/speed.
+
+SHUTDOWN:
+    flush() writes everything queued. shutdown() flushes and stops the
+    worker; it runs at exit and from main.py's exit paths (os._exit skips
+    atexit).
+
+CONFIG (config.json -> memory.write_behind):
+    enabled       True
+    batch_size    16
+    window_ms     1500
+    max_pending   512
+    block_ms      250
+=============================================================================
+"""
+
+import time
+import atexit
+import datetime
+import threading
+from collections import deque
+from colorama import Fore
+
+DEFAULTS = {
+    "enabled":     True,
+    "batch_size":  16,
+    "window_ms":   1500,
+    "max_pending": 512,
+    "block_ms":    250,
+}
+
+
+def get_settings() -> dict:
+    try:
+        import config
+        raw = config.KEY.get("memory", {}).get("write_behind", {}) or {}
+    except Exception:
+        raw = {}
+    merged = dict(DEFAULTS)
+    if isinstance(raw, dict):
+        merged.update({k: v for k, v in raw.items() if k in DEFAULTS})
+    return merged
+
+
+class _Turn:
+    __slots__ = ("user_input", "seven_response", "user_id", "source",
+                 "extract_facts", "timestamp", "queued_at")
+
+    def __init__(self, user_input, seven_response, user_id, source, extract_facts):
+        self.user_input     = user_input
+        self.seven_response = seven_response
+        self.user_id        = user_id
+        self.source         = source
+        self.extract_facts  = extract_facts
+        self.timestamp      = datetime.datetime.now()   # when it was said, not stored
+        self.queued_at      = time.monotonic()
+
+
+class ConversationIngest:
+
+    def __init__(self, memory=None, settings: dict = None):
+        self._memory   = memory          # None -> the memory.seven_memory singleton
+        self._settings = settings
+        self._cond     = threading.Condition()
+        self._pending  = deque()
+        self._inflight = 0
+        self._flushing = 0
+        self._stopping = False
+        self._worker   = None
+        self._stats = {
+            "submitted":   0,
+            "stored":      0,
+            "failed":      0,
+            "batches":     0,
+            "blocked":     0,    # submits that had to wait for room
+            "sync_writes": 0,    # submits written on the caller's thread (queue full)
+            "discarded":   0,
+            "high_water":  0,
+            "lag_ms_sum":  0.0,
+            "lag_ms_max":  0.0,
+            "batch_ms_last": 0.0,
+        }
+
+    def settings(self) -> dict:
+        return self._settings or get_settings()
+
+    def memory(self):
+        if self._memory is None:
+            from memory import seven_memory
+            return seven_memory
+        return self._memory
+
+    # -------------------------------------------------------------------------
+    # PRODUCER
+    # -------------------------------------------------------------------------
+
+    def submit(self, user_input, seven_response, user_id="default", source="chat",
+               extract_facts=False):
+        """Queue one turn for storage. Returns without touching ChromaDB."""
+        turn = _Turn(user_input, seven_response, user_id, source, extract_facts)
+        cfg  = self.settings()
+        if not cfg["enabled"]:
+            self._write([turn])
+            return
+
+        with self._cond:
+            self._stats["submitted"] += 1
+            limit = max(1, int(cfg["max_pending"]))
+            if len(self._pending) >= limit:
+                self._stats["blocked"] += 1
+                self._cond.wait_for(lambda: len(self._pending) < limit,
+                                    timeout=float(cfg["block_ms"]) / 1000)
+            if len(self._pending) >= limit or self._stopping:
+                self._stats["sync_writes"] += 1
+                queued = False
+            else:
+                self._pending.append(turn)
+                self._stats["high_water"] = max(self._stats["high_water"], len(self._pending))
+                self._ensure_worker()
+                self._cond.notify_all()
+                queued = True
+        if not queued:
+            self._write([turn])
+
+    def pending(self) -> int:
+        """Turns accepted but not yet stored (queued + in the batch being written)."""
+        with self._cond:
+            return len(self._pending) + self._inflight
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Write everything queued now. True if the queue drained in time."""
+        with self._cond:
+            if not self._pending and not self._inflight:
+                return True
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(
+                    lambda: not self._pending and not self._inflight, timeout=timeout
+                )
+            finally:
+                self._flushing -= 1
+
+    def discard(self) -> int:
+        """Drop queued turns (memory wipe). A batch already being written completes."""
+        with self._cond:
+            n = len(self._pending)
+            self._pending.clear()
+            self._stats["discarded"] += n
+            self._cond.notify_all()
+        return n
+
+    def shutdown(self, timeout: float = 10.0):
+        drained = self.flush(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            left = len(self._pending) + self._inflight
+        if not drained:
+            print(Fore.YELLOW + f"[MEMORY] Write-behind flush timed out — {left} turn(s) not stored")
+
+    # -------------------------------------------------------------------------
+    # WORKER
+    # -------------------------------------------------------------------------
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._loop, daemon=True, name="SevenMemoryIngest"
+            )
+            self._worker.start()
+
+    def _next_batch(self) -> list:
+        """Block until a batch is due; None when stopping with nothing queued."""
+        with self._cond:
+            while not self._pending:
+                if self._stopping:
+                    return None
+                self._cond.wait()
+            cfg  = self.settings()
+            size = max(1, int(cfg["batch_size"]))
+            due  = self._pending[0].queued_at + float(cfg["window_ms"]) / 1000
+            while (len(self._pending) < size and not self._flushing
+                   and not self._stopping and self._pending):
+                remaining = due - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = [self._pending.popleft() for _ in range(min(size, len(self._pending)))]
+            self._inflight = len(batch)
+            self._cond.notify_all()    # room for blocked producers
+            return batch
+
+    def _loop(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            if not batch:
+                continue
+            try:
+                self._write(batch)
+            except Exception as e:
+                print(Fore.YELLOW + f"[MEMORY] Write-behind batch of {len(batch)} failed: {e}")
+            finally:
+                with self._cond:
+                    self._inflight = 0
+                    self._cond.notify_all()
+
+    def _write(self, batch: list):
+        t0 = time.monotonic()
+        try:
+            mem = self.memory()
+            for turn in batch:
+                if turn.extract_facts:
+                    try:
+                        mem.extract_and_store_facts(turn.user_input, user_id=turn.user_id)
+                    except Exception:
+                        pass
+            mem.store_conversations([{
+                "user_input":     t.user_input,
+                "seven_response": t.seven_response,
+                "user_id":        t.user_id,
+                "source":         t.source,
+                "timestamp":      t.timestamp,
+            } for t in batch])
+            ok = True
+        except Exception as e:
+            ok = False
+            print(Fore.YELLOW + f"[MEMORY] Write-behind batch of {len(batch)} failed: {e}")
+        done = time.monotonic()
+        with self._cond:
+            s = self._stats
+            s["batches"] += 1
+            s["batch_ms_last"] = round((done - t0) * 1000, 1)
+            if not ok:
+                s["failed"] += len(batch)
+                return
+            s["stored"] += len(batch)
+            for turn in batch:
+                lag = (done - turn.queued_at) * 1000
+                s["lag_ms_sum"] += lag
+                s["lag_ms_max"]  = max(s["lag_ms_max"], lag)
+
+    # -------------------------------------------------------------------------
+
+    def get_stats(self) -> dict:
+        with self._cond:
+            s = dict(self._stats)
+            s["pending"] = len(self._pending) + self._inflight
+        lag_sum = s.pop("lag_ms_sum")
+        s["lag_ms_avg"]  = round(lag_sum / s["stored"], 1) if s["stored"] else 0.0
+        s["lag_ms_max"]  = round(s["lag_ms_max"], 1)
+        s["avg_batch"]   = round(s["stored"] / s["batches"], 1) if s["batches"] else 0.0
+        s["max_pending"] = int(self.settings()["max_pending"])
+        return s
+
+
+# =============================================================================
+# MODULE-LEVEL QUEUE
+# =============================================================================
+
+_ingest = ConversationIngest()
+
+
+def submit(user_input, seven_response, user_id="default", source="chat", extract_facts=False):
+    _ingest.submit(user_input, seven_response, user_id=user_id, source=source,
+                   extract_facts=extract_facts)
+
+
+def pending() -> int:
+    return _ingest.pending()
+
+
+def flush(timeout: float = 10.0) -> bool:
+    return _ingest.flush(timeout)
+
+
+def discard() -> int:
+    return _ingest.discard()
+
+
+def get_stats() -> dict:
+    return _ingest.get_stats()
+
+
+def shutdown(timeout: float = 10.0):
+    _ingest.shutdown(timeout)
+
+
+atexit.register(shutdown)
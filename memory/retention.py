@@ -0,0 +1,359 @@
+"""
+=============================================================================
+PROJECT SEVEN - memory/retention.py
+Retention tiers for conversation memory
+
+WHAT THIS FILE DOES:
+    Keeps the "conversations" collection — and with it every search's
+    HNSW query — from growing without bound.
+
+    hot      Turns newer than hot_days stay in the collection as they are.
+    rollup   Older turns are grouped per speaker and per week (or month)
+             into one summary document, stored in the collection with
+             type "summary" / source "rollup". Search still finds the
+             gist of old conversations through it.
+    cold     The raw old turns move to memory/conversation_archive.py
+             (compressed SQLite, no embeddings) and are deleted from the
+             collection. Backups include them.
+    compact  Deleting from ChromaDB only marks HNSW entries as deleted;
+             the index file keeps its size. After compact_after deletions
+             the collection is copied — stored embeddings, no re-embedding —
+             into a fresh one that replaces it.
+
+WHEN:
+    A background thread runs one pass startup_delay_s after launch, then
+    every interval_hours. Only collections above min_conversations are
+    touched, so the limited plans (7 / 77 turns) never roll anything up.
+    run_now() does a pass on demand (/api/memory/retention/run).
+
+SUMMARIES:
+    Extractive — what the user said, trimmed, in order — so a pass costs no
+    LLM calls and gives the same result every time.
+
+CONFIG (config.json -> memory.retention):
+    enabled            True
+    hot_days           90
+    period             "week"      ("week" | "month")
+    min_conversations  2000
+    max_per_pass       5000
+    summary_chars      1200
+    compact_after      5000
+    interval_hours     24
+    startup_delay_s    600
+=============================================================================
+"""
+
+import os
+import json
+import time
+import hashlib
+import datetime
+import threading
+from colorama import Fore
+
+DEFAULTS = {
+    "enabled":           True,
+    "hot_days":          90,
+    "period":            "week",
+    "min_conversations": 2000,
+    "max_per_pass":      5000,
+    "summary_chars":     1200,
+    "compact_after":     5000,
+    "interval_hours":    24,
+    "startup_delay_s":   600,
+}
+
+STATE_FILE    = "retention_state.json"
+ROLLUP_SOURCE = "rollup"
+_COMPACT_NAME = "conversations_compact"
+_COPY_BATCH   = 1000
+_TS_FORMAT    = "%Y-%m-%d %H:%M:%S"
+
+_run_lock = threading.Lock()
+_thread   = None
+
+
+def get_settings() -> dict:
+    try:
+        import config
+        raw = config.KEY.get("memory", {}).get("retention", {}) or {}
+    except Exception:
+        raw = {}
+    merged = dict(DEFAULTS)
+    if isinstance(raw, dict):
+        merged.update({k: v for k, v in raw.items() if k in DEFAULTS})
+    return merged
+
+
+# =============================================================================
+# STATE
+# =============================================================================
+
+def _state_path(memory) -> str:
+    return os.path.join(os.path.dirname(memory.conversation_archive.path), STATE_FILE)
+
+
+def _load_state(memory) -> dict:
+    try:
+        with open(_state_path(memory), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_state(memory, state: dict):
+    try:
+        with open(_state_path(memory), "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+    except Exception as e:
+        print(Fore.YELLOW + f"[RETENTION] Could not save state: {e}")
+
+
+# =============================================================================
+# ROLLUP + ARCHIVE
+# =============================================================================
+
+def _period_key(timestamp: str, period: str) -> str:
+    try:
+        day = datetime.datetime.strptime(timestamp[:10], "%Y-%m-%d")
+    except ValueError:
+        return "unknown"
+    if period == "month":
+        return day.strftime("%Y-%m")
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _summarize(speaker: str, period: str, metadatas: list, max_chars: int) -> str:
+    first = (metadatas[0].get("timestamp") or "")[:10]
+    last  = (metadatas[-1].get("timestamp") or "")[:10]
+    head  = (f"Summary of {len(metadatas)} conversations with {speaker} "
+             f"({period}, {first} to {last}). They talked about: ")
+    parts, used = [], len(head)
+    for meta in metadatas:
+        said = " ".join((meta.get("user_input") or "").split())
+        if not said:
+            continue
+        said = said[:80].rstrip(" .,!?")
+        if used + len(said) + 2 > max_chars:
+            parts.append("...")
+            break
+        parts.append(said)
+        used += len(said) + 2
+    return head + "; ".join(parts) + "."
+
+
+def _roll_group(memory, speaker, period_key, ids, cfg) -> int:
+    res = memory.conversations.get(ids=ids, include=["documents", "metadatas"])
+    found = {i: (d, m or {}) for i, d, m in zip(res["ids"], res["documents"], res["metadatas"])}
+    ids = [i for i in ids if i in found]
+    if not ids:
+        return 0
+    docs  = [found[i][0] for i in ids]
+    metas = [found[i][1] for i in ids]
+
+    # Same turns -> same rollup id, so a pass interrupted after the upsert
+    # and repeated does not leave two summaries
+    rollup_id = "rollup_" + hashlib.sha1("|".join(ids).encode()).hexdigest()[:20]
+    summary = _summarize(speaker, period_key, metas, int(cfg["summary_chars"]))
+    rollup_meta = {
+        "user_input":     f"[{len(ids)} conversations, {period_key}]",
+        "seven_response": summary,
+        "timestamp":      metas[-1].get("timestamp") or "",
+        "user_id":        speaker,
+        "type":           "summary",
+        "source":         ROLLUP_SOURCE,
+        "period":         period_key,
+        "turns":          len(ids),
+    }
+
+    # Archive first: if anything below fails the raw turns are safe twice
+    memory.conversation_archive.add_many(ids, docs, metas, rollup_id=rollup_id)
+    with memory._write_lock:
+        memory.conversations.upsert(documents=[summary], metadatas=[rollup_meta], ids=[rollup_id])
+        memory.counters.added("conversations", [rollup_meta])
+        memory.index_conversations([rollup_id], [rollup_meta])
+        memory.delete_conversations(ids)
+    return len(ids)
+
+
+def roll_up(memory, cfg: dict) -> dict:
+    """Archive + summarize turns older than hot_days. Returns counts."""
+    cutoff = (datetime.datetime.now() - datetime.timedelta(days=float(cfg["hot_days"])))
+    memory._ensure_index()
+    rows = memory.conversation_index.older_than(
+        cutoff.strftime(_TS_FORMAT), int(cfg["max_per_pass"]), exclude_source=ROLLUP_SOURCE
+    )
+    groups = {}
+    for conv_id, timestamp, speaker, _source in rows:
+        key = (speaker, _period_key(timestamp, cfg["period"]))
+        groups.setdefault(key, []).append(conv_id)
+
+    archived = rollups = 0
+    for (speaker, period_key), ids in groups.items():
+        try:
+            n = _roll_group(memory, speaker, period_key, ids, cfg)
+        except Exception as e:
+            print(Fore.YELLOW + f"[RETENTION] Rollup {speaker}/{period_key} failed: {e}")
+            continue
+        if n:
+            archived += n
+            rollups  += 1
+    return {"archived": archived, "rollups": rollups}
+
+
+# =============================================================================
+# COMPACTION
+# =============================================================================
+
+def compact(memory) -> int:
+    """
+    Rebuild the conversations collection (and its HNSW segment) from its own
+    stored embeddings. Writes wait on memory._write_lock meanwhile.
+    Returns the number of records copied.
+    """
+    client = memory.client
+    with memory._write_lock:
+        old = memory.conversations
+        try:
+            client.delete_collection(_COMPACT_NAME)
+        except Exception:
+            pass
+        new = client.create_collection(
+            name=_COMPACT_NAME,
+            embedding_function=memory.embedding_function,
+            metadata=old.metadata or None,
+        )
+        copied, offset = 0, 0
+        while True:
+            batch = old.get(include=["embeddings", "documents", "metadatas"],
+                            limit=_COPY_BATCH, offset=offset)
+            ids = batch.get("ids") or []
+            if not ids:
+                break
+            new.add(ids=ids, embeddings=batch["embeddings"],
+                    documents=batch["documents"], metadatas=batch["metadatas"])
+            copied += len(ids)
+            offset += len(ids)
+            if len(ids) < _COPY_BATCH:
+                break
+        if new.count() != old.count():
+            client.delete_collection(_COMPACT_NAME)
+            raise RuntimeError(f"copy incomplete ({new.count()} of {old.count()})")
+        client.delete_collection("conversations")
+        new.modify(name="conversations")
+        memory.conversations = new
+    return copied
+
+
+def recover(memory):
+    """Finish or discard a compaction that was interrupted by a crash."""
+    try:
+        names = {getattr(c, "name", c) for c in memory.client.list_collections()}
+    except Exception:
+        return
+    if _COMPACT_NAME not in names:
+        return
+    try:
+        staged = memory.client.get_collection(_COMPACT_NAME, embedding_function=memory.embedding_function)
+        if memory.conversations.count() == 0 and staged.count() > 0:
+            # Crashed between dropping the old collection and renaming
+            with memory._write_lock:
+                memory.client.delete_collection("conversations")
+                staged.modify(name="conversations")
+                memory.conversations = staged
+            memory.counters.invalidate("conversations")
+            memory._index_synced = False
+            print(Fore.CYAN + "[RETENTION] Restored compacted conversations collection")
+        else:
+            memory.client.delete_collection(_COMPACT_NAME)
+    except Exception as e:
+        print(Fore.YELLOW + f"[RETENTION] Compaction recovery failed: {e}")
+
+
+# =============================================================================
+# PASS
+# =============================================================================
+
+def run_now(memory=None, force: bool = False) -> dict:
+    """
+    One retention pass. Skipped (returns {"skipped": reason}) if disabled,
+    below min_conversations, or another pass is running — unless force.
+    """
+    if memory is None:
+        from memory import seven_memory as memory
+    cfg = get_settings()
+    if not cfg["enabled"] and not force:
+        return {"skipped": "disabled"}
+    if not _run_lock.acquire(blocking=False):
+        return {"skipped": "already running"}
+    try:
+        t0    = time.perf_counter()
+        state = _load_state(memory)
+        total = memory.count_conversations()
+        result = {"archived": 0, "rollups": 0, "compacted": False}
+
+        if total >= int(cfg["min_conversations"]) or force:
+            result.update(roll_up(memory, cfg))
+
+        deleted = int(state.get("deleted_since_compact", 0)) + result["archived"]
+        if deleted >= int(cfg["compact_after"]) or (force and deleted):
+            try:
+                n = compact(memory)
+                result["compacted"] = True
+                print(Fore.CYAN + f"[RETENTION] Compacted conversations index ({n} records)")
+                deleted = 0
+                state["last_compact"] = datetime.datetime.now().strftime(_TS_FORMAT)
+            except Exception as e:
+                print(Fore.YELLOW + f"[RETENTION] Compaction failed: {e}")
+
+        state["deleted_since_compact"] = deleted
+        state["archived_total"] = int(state.get("archived_total", 0)) + result["archived"]
+        state["rollups_total"]  = int(state.get("rollups_total", 0)) + result["rollups"]
+        state["last_run"] = datetime.datetime.now().strftime(_TS_FORMAT)
+        _save_state(memory, state)
+
+        result["elapsed_s"] = round(time.perf_counter() - t0, 2)
+        if result["archived"] or result["compacted"]:
+            print(Fore.CYAN + f"[RETENTION] Archived {result['archived']} turns into "
+                              f"{result['rollups']} summaries in {result['elapsed_s']}s")
+        return result
+    finally:
+        _run_lock.release()
+
+
+def get_stats(memory=None) -> dict:
+    if memory is None:
+        from memory import seven_memory as memory
+    state = _load_state(memory)
+    return {
+        "settings":              get_settings(),
+        "hot_conversations":     memory.count_conversations(),
+        "archived_turns":        memory.conversation_archive.count(),
+        "archive_bytes":         memory.conversation_archive.size_bytes(),
+        "deleted_since_compact": int(state.get("deleted_since_compact", 0)),
+        "rollups_total":         int(state.get("rollups_total", 0)),
+        "last_run":              state.get("last_run"),
+        "last_compact":          state.get("last_compact"),
+    }
+
+
+def _loop(memory):
+    cfg = get_settings()
+    time.sleep(float(cfg["startup_delay_s"]))
+    while True:
+        try:
+            run_now(memory)
+        except Exception as e:
+            print(Fore.YELLOW + f"[RETENTION] Pass failed: {e}")
+        time.sleep(max(1.0, float(get_settings()["interval_hours"])) * 3600)
+
+
+def start(memory):
+    """Called once by SevenMemory.__init__."""
+    global _thread
+    recover(memory)
+    if _thread is not None and _thread.is_alive():
+        return
+    _thread = threading.Thread(target=_loop, args=(memory,), daemon=True, name="SevenRetention")
+    _thread.start()
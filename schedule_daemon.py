@@ -406,13 +406,14 @@ def main():
             if not seven_running:
                 try:
                     import sqlite3
+                    if SEVEN_ROOT not in sys.path:
+                        sys.path.insert(0, SEVEN_ROOT)
+                    from seven_utils.db import connect as _db_connect
                     _seven_data = os.path.join(APPDATA, 'SEVEN', 'seven_data')
                     _tasks_db   = os.path.join(_seven_data, 'tasks.db')
 
                     if os.path.exists(_tasks_db):
-                        _tconn = sqlite3.connect(_tasks_db, timeout=5)
-                        _tconn.row_factory = sqlite3.Row
-                        _tconn.execute("PRAGMA journal_mode=WAL")
+                        _tconn = _db_connect(_tasks_db, row_factory=sqlite3.Row, timeout=5)
 
                         from datetime import date as _date_cls
                         _today = _date_cls.today().isoformat()
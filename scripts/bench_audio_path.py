@@ -0,0 +1,195 @@
+"""
+scripts/bench_audio_path.py
+Micro-benchmark: per-stage allocations and time of the listen() audio path,
+WAV-bytes pipeline (before) vs float32 array pipeline (after).
+
+Usage:
+    python scripts/bench_audio_path.py                 - synthetic 3s clip
+    python scripts/bench_audio_path.py --wav clip.wav  - your own recording
+    python scripts/bench_audio_path.py --repeat 50
+
+Stages, in listen() order:
+    capture   sr.AudioData -> WAV bytes (before) / float32 array (after)
+    agc       agc.apply_to_wav_bytes   / agc.apply(inplace=True)
+    aec       decode + aec.apply + re-encode / aec.apply(inplace=True)
+    gates     signal_gates.check       / signal_gates.check_array
+    whisper   faster-whisper decode of BytesIO / nothing (array passed)
+
+The AEC stage runs with an empty loopback buffer, so it measures the
+framing around aec.apply(), not the cross-correlation itself (unchanged).
+If faster-whisper is not installed, the "before" whisper stage uses a
+wave-module decode — a lower bound on what decode_audio() costs.
+No microphone, no Whisper model needed.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+import wave
+import tracemalloc
+import contextlib
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ears import agc, aec, signal_gates
+
+RATE = 16000
+
+
+@contextlib.contextmanager
+def _quiet():
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def load_pcm(path):
+    """int16 mono 16 kHz bytes, like sr.AudioData.frame_data from the capture bus."""
+    if path:
+        from ears.capture_bus import _to_mono_16k
+        with wave.open(path, "rb") as wf:
+            raw = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+            pcm = _to_mono_16k(raw, wf.getframerate(), wf.getnchannels())
+        return pcm.tobytes()
+    # 3 s of quiet, speech-like amplitude-modulated noise (AGC will engage)
+    rng = np.random.default_rng(7)
+    t   = np.arange(3 * RATE) / RATE
+    env = 0.5 + 0.5 * np.sin(2 * np.pi * 3.0 * t) ** 2
+    sig = rng.standard_normal(len(t)) * env * 0.025
+    return (np.clip(sig, -1, 1) * 32767).astype(np.int16).tobytes()
+
+
+def wav_from_pcm(pcm):
+    """What sr.AudioData.get_wav_data() does."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(RATE)
+        wf.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _whisper_decode(wav_bytes):
+    try:
+        from faster_whisper.audio import decode_audio
+        return decode_audio(io.BytesIO(wav_bytes), sampling_rate=RATE)
+    except ImportError:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+            pcm = wf.readframes(wf.getnframes())
+        return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def before_stages(pcm):
+    """The pre-change listen() path, stage by stage."""
+    state = {}
+
+    def capture():
+        state["wav"] = wav_from_pcm(pcm)
+
+    def agc_stage():
+        state["wav"] = agc.apply_to_wav_bytes(state["wav"])
+
+    def aec_stage():
+        with wave.open(io.BytesIO(state["wav"]), "rb") as wf:
+            sr_ = wf.getframerate()
+            raw = wf.readframes(wf.getnframes())
+        f32 = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32767.0
+        cleaned = aec.apply(f32, sr_)
+        buf = io.BytesIO()
+        with wave.open(buf, "wb") as wf_out:
+            wf_out.setnchannels(1)
+            wf_out.setsampwidth(2)
+            wf_out.setframerate(sr_)
+            wf_out.writeframes((cleaned * 32767.0).astype(np.int16).tobytes())
+        state["wav"] = buf.getvalue()
+
+    def gates():
+        signal_gates.check(state["wav"], 200.0)
+
+    def whisper():
+        _whisper_decode(state["wav"])
+
+    return [("capture", capture), ("agc", agc_stage), ("aec", aec_stage),
+            ("gates", gates), ("whisper", whisper)]
+
+
+def after_stages(pcm):
+    """The float32 path now in ears/core.py."""
+    state = {}
+
+    def capture():
+        f32 = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+        f32 *= np.float32(1.0 / 32767.0)
+        state["f32"] = f32
+
+    def agc_stage():
+        state["f32"] = agc.apply(state["f32"], inplace=True)
+
+    def aec_stage():
+        state["f32"] = aec.apply(state["f32"], RATE, inplace=True)
+
+    def gates():
+        signal_gates.check_array(state["f32"], 200.0, RATE)
+
+    def whisper():
+        pass   # faster-whisper receives state["f32"] as-is
+
+    return [("capture", capture), ("agc", agc_stage), ("aec", aec_stage),
+            ("gates", gates), ("whisper", whisper)]
+
+
+def measure(make_stages, pcm, repeat):
+    """Per stage: (peak bytes allocated, best time in ms)."""
+    results = {}
+    for _ in range(repeat):
+        agc.reset()
+        for name, fn in make_stages(pcm):
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            with _quiet():
+                fn()
+            dt = (time.perf_counter() - t0) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            prev = results.get(name, (0, float("inf")))
+            results[name] = (max(prev[0], peak), min(prev[1], dt))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wav", help="WAV file to use instead of the synthetic clip")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pcm = load_pcm(args.wav)
+    clip_kb = len(pcm) / 1024
+
+    before = measure(before_stages, pcm, args.repeat)
+    after  = measure(after_stages,  pcm, args.repeat)
+
+    print("=" * 66)
+    print("  LISTEN() AUDIO PATH — per-stage peak allocation and time")
+    print(f"  clip: {len(pcm) / 2 / RATE:.2f}s  ({clip_kb:.0f} KB int16)")
+    print("=" * 66)
+    print(f"  {'stage':<10}{'before KB':>12}{'after KB':>12}{'before ms':>12}{'after ms':>12}")
+    tot_b = tot_a = tms_b = tms_a = 0.0
+    for name, _ in before_stages(pcm):
+        kb_b, ms_b = before[name][0] / 1024, before[name][1]
+        kb_a, ms_a = after[name][0] / 1024, after[name][1]
+        tot_b += kb_b
+        tot_a += kb_a
+        tms_b += ms_b
+        tms_a += ms_a
+        print(f"  {name:<10}{kb_b:>12.0f}{kb_a:>12.0f}{ms_b:>12.3f}{ms_a:>12.3f}")
+    print("  " + "-" * 58)
+    print(f"  {'total':<10}{tot_b:>12.0f}{tot_a:>12.0f}{tms_b:>12.3f}{tms_a:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+scripts/bench_keyword_spotter.py
+Keyword-spotting front gate: detection rate, Whisper escalations avoided,
+CPU use and detection latency, on synthetic fixtures.
+
+Usage:
+    python scripts/bench_keyword_spotter.py
+    python scripts/bench_keyword_spotter.py --trials 100 --threshold 0.3
+
+Fixtures are formant-synthesized "words": a keyword is a fixed sequence of
+vowel/fricative targets; each rendition gets a different pitch, speaking
+rate, loudness and background noise. Distractors are other random
+sequences that do not contain a keyword (what Seven's own TTS voice and
+room chatter look like to the gate). Two renditions per keyword are enrolled as templates, exactly as
+KeywordSpotter.learn() would store Whisper-confirmed clips.
+
+Reported:
+    hit rate        keyword clips that the gate escalates
+    false escalate  distractor clips that still go to Whisper
+    CPU             spotter process time per second of audio
+    latency         audio time from the end of the keyword to the frame
+                    that fired (the endpointer closes the clip there,
+                    instead of waiting for its hangover)
+No microphone, no Whisper model needed.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ears import keyword_spotter as kws
+
+RATE = 16000
+
+# (F1, F2, F3) vowel targets; None = fricative (band noise)
+_UNITS = {
+    "a": (730, 1090, 2440), "i": (270, 2290, 3010), "u": (300, 870, 2240),
+    "e": (530, 1840, 2480), "o": (570, 840, 2410), "ae": (660, 1720, 2410),
+    "er": (490, 1350, 1690), "s": None, "sh": None, "f": None,
+}
+_FRIC_BAND = {"s": (4000, 7500), "sh": (2000, 5000), "f": (1200, 7000)}
+
+
+def synth(units, f0=120.0, rate=1.0, level=0.1, snr_db=20.0, rng=None):
+    """Harmonic + noise synthesis of a unit sequence, 150 ms per unit at rate 1."""
+    rng = rng or np.random.default_rng()
+    seg_n = int(0.15 * RATE / rate)
+    out = []
+    for i, u in enumerate(units):
+        t = np.arange(seg_n) / RATE
+        if _UNITS[u] is None:
+            lo, hi = _FRIC_BAND[u]
+            spec = np.fft.rfft(rng.standard_normal(seg_n))
+            freqs = np.fft.rfftfreq(seg_n, 1 / RATE)
+            spec[(freqs < lo) | (freqs > hi)] = 0
+            seg = np.fft.irfft(spec, seg_n) * 0.3
+        else:
+            nxt = units[i + 1] if i + 1 < len(units) and _UNITS[units[i + 1]] else u
+            a, b = np.array(_UNITS[u], float), np.array(_UNITS[nxt], float)
+            ramp = np.clip((t / t[-1] - 0.6) / 0.4, 0, 1)[:, None]
+            formants = a + (b - a) * ramp               # glide into the next vowel
+            pitch = f0 * (1 + 0.05 * np.sin(2 * np.pi * 3 * t))
+            phase = 2 * np.pi * np.cumsum(pitch) / RATE
+            seg = np.zeros(seg_n)
+            for h in range(1, int(4000 / f0)):
+                fh = h * pitch
+                amp = sum(1.0 / (1 + ((fh - formants[:, j]) / (60 + 20 * j)) ** 2) for j in range(3))
+                seg += amp * np.sin(h * phase) / h
+        env = np.minimum(1, np.minimum(np.arange(seg_n), np.arange(seg_n)[::-1]) / (0.01 * RATE))
+        out.append(seg * env)
+    speech = np.concatenate(out)
+    speech *= level / (np.sqrt(np.mean(speech ** 2)) + 1e-9)
+    pad = np.zeros(int(0.3 * RATE))
+    clip = np.concatenate((pad, speech, pad))
+    noise = rng.standard_normal(len(clip)) * level / (10 ** (snr_db / 20))
+    return (clip + noise).astype(np.float32), len(pad) + len(speech)
+
+
+def rendition(units, rng):
+    return synth(units, f0=rng.uniform(90, 220), rate=rng.uniform(0.8, 1.25),
+                 level=rng.uniform(0.03, 0.3), snr_db=rng.uniform(10, 30), rng=rng)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=60)
+    parser.add_argument("--threshold", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    keywords = {
+        "stop":      ["s", "a", "o"],
+        "wait":      ["u", "e", "i"],
+        "hey seven": ["ae", "i", "s", "e", "er", "e"],
+    }
+    vocab = [u for u in _UNITS]
+
+    store   = kws.TemplateStore(tempfile.mkdtemp(prefix="kws_bench_"))
+    spotter = kws.KeywordSpotter(list(keywords), store=store)
+    for phrase, units in keywords.items():
+        for _ in range(2):
+            clip, _ = rendition(units, rng)
+            store.add(phrase, kws.template_features(clip), 5)
+    thr = args.threshold if args.threshold is not None else float(kws.get_settings()["threshold"])
+
+    def run(clip, end=None):
+        spotter.reset()
+        spotter._thr = thr
+        fired_at = None
+        for i in range(0, len(clip), 512):   # StreamingVAD frame size
+            if spotter.feed(clip[i:i + 512]) and fired_at is None:
+                fired_at = min(i + 512, len(clip))
+                break
+        hit = spotter.hit is not None
+        latency = (fired_at - end) * 1000 / RATE if hit and end else None
+        return hit, latency
+
+    hits, lat = 0, []
+    for _ in range(args.trials):
+        phrase = list(keywords)[rng.integers(len(keywords))]
+        clip, end = rendition(keywords[phrase], rng)
+        hit, l = run(clip, end)
+        hits += hit
+        if l is not None:
+            lat.append(l)
+
+    def contains_keyword(units):
+        joined = " " + " ".join(units) + " "
+        return any(" " + " ".join(k) + " " in joined for k in keywords.values())
+
+    false = 0
+    for _ in range(args.trials):
+        units = list(rng.choice(vocab, size=rng.integers(3, 9)))
+        while contains_keyword(units):
+            units = list(rng.choice(vocab, size=rng.integers(3, 9)))
+        clip, _ = rendition(units, rng)
+        false += run(clip)[0]
+
+    audio_s = spotter.stats["frames"] * kws.HOP / RATE
+    cpu_pct = spotter.stats["cpu_ms"] / 1000 / audio_s * 100
+
+    print("=" * 62)
+    print(f"  KEYWORD SPOTTER — synthetic fixtures   threshold={thr:.2f}")
+    print("=" * 62)
+    print(f"  keywords            {', '.join(keywords)}  (2 templates each)")
+    print(f"  hit rate            {hits}/{args.trials}  ({hits / args.trials:.0%})")
+    print(f"  false escalations   {false}/{args.trials}  ({false / args.trials:.0%})")
+    print(f"  Whisper calls       {hits + false}/{2 * args.trials} clips "
+          f"(before: {2 * args.trials}/{2 * args.trials})")
+    print(f"  CPU                 {cpu_pct:.2f}% of one core "
+          f"({spotter.stats['cpu_ms']:.0f} ms for {audio_s:.1f} s audio)")
+    if lat:
+        lat.sort()
+        print(f"  detection latency   median {lat[len(lat) // 2]:+.0f} ms, "
+              f"max {lat[-1]:+.0f} ms after keyword end")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+scripts/bench_partial_transcription.py
+End-of-speech -> final-text latency, with and without partial transcription.
+
+Usage:
+    python scripts/bench_partial_transcription.py --wav a.wav b.wav
+    python scripts/bench_partial_transcription.py --model small.en --device cuda
+    python scripts/bench_partial_transcription.py          - every WAV in
+                                                             scripts/fixtures/speech/
+
+Each recording is replayed in real time through the capture bus
+(WavFileSource) and the streaming VAD endpointer, exactly like listen():
+
+    full      endpoint reached -> decode the whole utterance (beam 5)
+    partials  re-decode every interval_ms while speaking (beam 1, word
+              timestamps), commit the agreed prefix, decode only the tail
+              at the endpoint
+
+Reported latency = endpoint -> final text, plus the configured hangover
+(the endpointer confirms end-of-speech hangover_ms after the last word).
+Needs faster-whisper and the model weights; no microphone.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ears import capture_bus, endpointer
+from ears import partial_transcriber as partials
+
+FIXTURE_DIR = os.path.join(ROOT, "scripts", "fixtures", "speech")
+
+
+def make_decoders(model):
+    """Same decode parameters as ears.core._decode_partial / _transcribe."""
+
+    def decode_partial(samples, prompt=None):
+        segments, _ = model.transcribe(
+            samples, beam_size=1, language="en",
+            condition_on_previous_text=False, initial_prompt=prompt or None,
+            word_timestamps=True, vad_filter=False,
+        )
+        return [(w.start, w.end, w.word)
+                for seg in segments if seg.no_speech_prob <= 0.6
+                for w in (seg.words or [])]
+
+    def decode_final(samples, prompt=None):
+        segments, info = model.transcribe(
+            samples, beam_size=5, language="en",
+            condition_on_previous_text=False, initial_prompt=prompt or None,
+            no_speech_threshold=0.6, log_prob_threshold=-0.4,
+            vad_filter=True,
+            vad_parameters={"threshold": 0.6, "min_speech_duration_ms": 300,
+                            "min_silence_duration_ms": 400},
+        )
+        return "".join(s.text for s in segments).strip(), info
+
+    return decode_partial, decode_final
+
+
+def run_once(path, mode, decode_partial, decode_final):
+    bus = capture_bus.set_source(capture_bus.WavFileSource(path, realtime=True))
+    sub = bus.subscribe("bench", preroll=30)
+    sub.cursor = 0
+    pt = None
+    if mode == "partials":
+        pt = partials.PartialTranscriber(decode_partial, decode_final)
+    try:
+        samples = endpointer.capture(sub, timeout=10, phrase_limit=15,
+                                     consumer="bench",
+                                     on_frame=pt.feed if pt else None)
+        t_end = time.perf_counter()
+        if pt:
+            text, _ = pt.finalize(samples)
+        else:
+            text, _ = decode_final(samples)
+        latency = (time.perf_counter() - t_end) * 1000
+    finally:
+        if pt:
+            pt.cancel()
+        sub.close()
+        capture_bus.shutdown()
+    return text, latency, (pt.stats if pt else None)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wav", nargs="*", help="speech recordings (16 kHz mono preferred)")
+    parser.add_argument("--model", default="small.en")
+    parser.add_argument("--device", default="cpu")
+    args = parser.parse_args()
+
+    paths = args.wav or sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.wav")))
+    if not paths:
+        print(f"No recordings given and none found in {FIXTURE_DIR}")
+        sys.exit(1)
+
+    from faster_whisper import WhisperModel
+    compute = "float16" if args.device == "cuda" else "int8"
+    model = WhisperModel(args.model, device=args.device, compute_type=compute)
+    decode_partial, decode_final = make_decoders(model)
+    hangover = float(endpointer.get_settings()["hangover_ms"])
+
+    print("=" * 72)
+    print(f"  END-OF-SPEECH -> FINAL TEXT   model={args.model} device={args.device}")
+    print(f"  (latency includes {hangover:.0f} ms endpointer hangover)")
+    print("=" * 72)
+    totals = {"full": [], "partials": []}
+    for path in paths:
+        print(f"\n{os.path.basename(path)}")
+        for mode in ("full", "partials"):
+            text, ms, stats = run_once(path, mode, decode_partial, decode_final)
+            totals[mode].append(ms + hangover)
+            extra = ""
+            if stats:
+                extra = (f"  tail={stats['final_audio_s']:.2f}s "
+                         f"committed={stats['committed_words']}w "
+                         f"partials={stats['partial_decodes']}")
+            print(f"  {mode:<9}{ms + hangover:>8.0f} ms{extra}")
+            print(f"           | {text}")
+
+    print("\n" + "-" * 72)
+    for mode, vals in totals.items():
+        vals = sorted(vals)
+        print(f"  {mode:<9} median {vals[len(vals) // 2]:>8.0f} ms   max {vals[-1]:>8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+scripts/bench_sentence_stream.py
+Micro-benchmark: legacy stream_sentences rescanning loop vs SentenceSegmenter.
+
+Usage:
+    python scripts/bench_sentence_stream.py             - default run
+    python scripts/bench_sentence_stream.py --repeat 50 - more timing rounds
+
+Replays scripts/fixtures/ollama_stream_llama3.ndjson (Ollama /api/generate
+stream format, one JSON line per token) through both segmenters, then a
+synthetic long, punctuation-light stream where the quadratic rescan shows.
+No Ollama needed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from brain_modules.sentence_segmenter import SentenceSegmenter
+
+FIXTURE = os.path.join(ROOT, "scripts", "fixtures", "ollama_stream_llama3.ndjson")
+
+
+def load_tokens(path):
+    tokens = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                tokens.append(json.loads(line).get("response", ""))
+    return tokens
+
+
+def legacy_segment(tokens):
+    """Verbatim copy of the pre-SentenceSegmenter loop in ollama_client."""
+    out = []
+    buffer = ""
+    sentence_endings = {'.', '!', '?'}
+    for token in tokens:
+        if token:
+            buffer += token
+        if buffer:
+            last_boundary = -1
+            for i, ch in enumerate(buffer):
+                if ch in sentence_endings:
+                    if i + 1 < len(buffer) and buffer[i + 1] == ' ':
+                        last_boundary = i + 1
+                    elif i + 1 >= len(buffer):
+                        last_boundary = i + 1
+            if last_boundary > 0:
+                sentence = buffer[:last_boundary].strip()
+                buffer   = buffer[last_boundary:].strip()
+                if sentence and len(sentence) > 1:
+                    out.append(sentence)
+    if buffer.strip():
+        out.append(buffer.strip())
+    return out
+
+
+def segmenter_segment(tokens, **kw):
+    seg = SentenceSegmenter(**kw)
+    out = []
+    for token in tokens:
+        out.extend(seg.feed(token))
+    out.extend(seg.flush())
+    return out
+
+
+def timed(fn, tokens, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(tokens)
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    recorded = load_tokens(FIXTURE)
+    long_run = [" word"] * 4000 + ["."]   # ~20k chars, one sentence
+
+    print("=" * 60)
+    print("  SENTENCE SEGMENTER BENCHMARK")
+    print("=" * 60)
+
+    print(f"\nRecorded stream: {len(recorded)} tokens")
+    old = legacy_segment(recorded)
+    new = segmenter_segment(recorded)
+    print(f"  legacy     {len(old):>3} chunks  {timed(legacy_segment, recorded, args.repeat):8.3f} ms")
+    print(f"  segmenter  {len(new):>3} chunks  {timed(segmenter_segment, recorded, args.repeat):8.3f} ms")
+    print("\n  legacy splits:")
+    for s in old:
+        print(f"    | {s}")
+    print("\n  segmenter splits:")
+    for s in new:
+        print(f"    | {s}")
+
+    print(f"\nPunctuation-light stream: {len(long_run)} tokens, {len(''.join(long_run))} chars")
+    rounds = max(1, args.repeat // 10)
+    print(f"  legacy     {timed(legacy_segment, long_run, rounds):10.3f} ms")
+    print(f"  segmenter  {timed(segmenter_segment, long_run, rounds):10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+scripts/bench_transcript_filters.py
+Hallucination filter + autocorrect: table-per-call (before) vs compiled
+tables (after, ears/hallucination_filter.py and ears/autocorrect.py).
+
+Usage:
+    python scripts/bench_transcript_filters.py
+    python scripts/bench_transcript_filters.py --utterances 50000
+    python scripts/bench_transcript_filters.py --file transcripts.txt   - one per line
+
+Corpus: commands, misheard commands ("hey heaven", "lose camera"), every
+exact hallucination with and without a tail, substring and ad hits,
+long TV-style runs and word salad. Both sides get the same text; the
+"before" functions are the pre-change code, kept here as the reference.
+
+Reported: verdicts/corrections that differ (must be 0) and microseconds
+per utterance for each side. Needs rapidfuzz; pyahocorasick is used by
+the after side when installed.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rapidfuzz import fuzz
+
+from ears import autocorrect as ac
+from ears import hallucination_filter as hf
+
+
+def _log(msg):
+    print(msg)
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# BEFORE
+# ─────────────────────────────────────────────────────────────────────────
+
+def before_is_hallucination(clean: str, raw_lower: str = "") -> tuple:
+    """The pre-change is_hallucination(), verbatim."""
+    data = hf._load()
+
+    # Exact match against known silence outputs
+    if clean in data["exact"]:
+        return True, f"exact match: '{clean}'"
+
+    # Partial match — text starts with a known hallucination phrase
+    # Catches: "thank you bye bye", "thanks for watching everyone"
+    # where the full string is not in exact list but starts with one
+    exact_set = set(data["exact"])
+    for phrase in exact_set:
+        if not phrase:
+            continue
+        if clean.startswith(phrase + " ") or clean.startswith(phrase + "."):
+            return True, f"starts with hallucination: '{phrase}'"
+
+    # Hallucination saturation — more than half the words are known hallucinations
+    # Catches: "thank you bye bye" where 3/3 words are hallucination phrases
+    words = clean.split()
+    if len(words) >= 2:
+        # Check individual words against single-word hallucinations
+        single_word_hallucinations = {
+            p for p in exact_set
+            if p and len(p.split()) == 1
+        }
+        hallucination_word_count = sum(
+            1 for w in words if w in single_word_hallucinations
+        )
+        if hallucination_word_count / len(words) >= 0.75:
+            return True, (
+                f"hallucination saturation "
+                f"({hallucination_word_count}/{len(words)} words): '{clean}'"
+            )
+
+    # Outro hallucinations — Whisper invents these from TV/audio bleed
+    if clean.startswith(("thank you", "thanks")):
+        if any(k in clean for k in (
+            "watching", "having me", "joining",
+            "listening", "for me", "for watching", "for having me"
+        )):
+            return True, f"outro phrase: '{clean}'"
+
+    # Substring match — use punctuation-preserved text
+    check_text = raw_lower if raw_lower else clean
+    for pattern in data["substrings"]:
+        if pattern in check_text:
+            return True, f"substring match: '{pattern}'"
+
+    words = clean.split()
+
+    # Repeated single syllable — "ba ba ba", "da da da"
+    if len(words) >= 3:
+        unique = set(words)
+        if len(unique) == 1 and len(list(unique)[0]) <= 3:
+            return True, f"repeated syllable: '{clean}'"
+
+    # Pure filler — 85%+ of words are connectors with no intent
+    if len(words) >= 6:
+        filler_set    = set(data.get("filler_words", []))
+        content_words = [w for w in words if w not in filler_set]
+        filler_ratio  = 1 - (len(content_words) / len(words))
+        if filler_ratio > 0.85:
+            return True, f"pure filler ({filler_ratio:.0%}): '{clean}'"
+
+    # Music/singing detection
+    # Whisper transcribes sung lyrics with characteristic patterns:
+    # repetitive syllables, phonetic spellings, hyphenated sounds
+    words = clean.split() if not words else words
+    if len(words) >= 4:
+        # Check for sung phonetics: "o-o-o-o", "we-e-e", "la-la-la"
+        hyphenated = [w for w in words if '-' in w and len(w) > 3]
+        if len(hyphenated) >= 2:
+            return True, f"sung phonetics detected: {hyphenated[:3]}"
+
+        # Check for music emoji patterns already cleaned
+        if any(c in clean for c in ['♪', '♫', '🎵', '🎶']):
+            return True, "music emoji in transcription"
+
+        # High ratio of very short words (1-2 chars) = phonetic singing
+        short_words = [w for w in words if len(w) <= 2]
+        if len(words) >= 6 and len(short_words) / len(words) > 0.5:
+            return True, f"high ratio of short phonemes ({len(short_words)}/{len(words)})"
+
+    # Commercial / advertisement detection
+    # TV ads and phone ads have specific patterns that are never commands:
+    # prices, brand delivery platforms, calls to action
+    _ad_patterns = {
+        "rupees", "swiggy", "zomato", "amazon", "flipkart",
+        "order now", "download", "offer valid", "call now",
+        "buy now", "shop now", "subscribe now", "click here",
+        "visit", "terms and conditions", "limited time",
+        "never go out of style", "all the traditions",
+        "soft kulab", "crisp chale",
+    }
+    _ad_matches = [p for p in _ad_patterns if p in clean]
+    if _ad_matches:
+        return True, f"commercial content detected: {_ad_matches[:2]}"
+
+    # Long transcriptions with no command structure
+    # Real commands are under 20 words. 25+ words = ambient audio (ads, TV, radio)
+    words = clean.split() if not words else words
+    if len(words) > 25:
+        # Check if there are any intent words at all
+        intent_set = set(data.get("intent_words", []))
+        has_intent = any(w in intent_set for w in words)
+        if not has_intent:
+            return True, (
+                f"long non-command transcription ({len(words)} words, "
+                f"no intent words)"
+            )
+
+    # Ordinal number sequence detection
+    # "10th, 7th, 8th, 8th, 8th" — TV audio counting, not a command
+    ordinal_matches = hf._ORDINAL_RE.findall(clean)
+    if len(ordinal_matches) >= 3:
+        return True, (
+            f"ordinal number sequence ({len(ordinal_matches)} ordinals) "
+            f"— likely TV/radio audio"
+        )
+
+    # Price/commercial number detection
+    if hf._PRICE_RE.search(clean):
+        return True, "price mention detected — likely commercial audio"
+
+    return False, ""
+
+
+def before_correct(text: str) -> str:
+    """The pre-change autocorrect.correct(), verbatim."""
+    if not text or not text.strip():
+        return text
+
+    result = text.lower().strip()
+
+    for wrong, right, threshold in ac._CORRECTIONS:
+        # Skip identity entries
+        if wrong == right:
+            continue
+
+        # Check if wrong phrase appears in text with sufficient similarity
+        # Use partial_ratio for multi-word phrases (checks substrings)
+        # Use ratio for single words (avoids false positives)
+        wrong_words = wrong.split()
+
+        if len(wrong_words) == 1:
+            # Single word: check each word in result
+            words = result.split()
+            new_words = []
+            changed   = False
+            for w in words:
+                score = fuzz.ratio(w, wrong)
+                if score >= threshold:
+                    new_words.append(right)
+                    changed = True
+                    _log((
+                        f"[EARS] Autocorrect: '{w}' -> '{right}' "
+                        f"(score={score:.0f})"
+                    ))
+                else:
+                    new_words.append(w)
+            if changed:
+                result = " ".join(new_words)
+        else:
+            # Multi-word phrase: use partial_ratio on full text
+            score = fuzz.partial_ratio(wrong, result)
+            if score >= threshold:
+                _log((
+                    f"[EARS] Autocorrect: '{wrong}' -> '{right}' "
+                    f"(score={score:.0f})"
+                ))
+                result = result.replace(wrong, right)
+
+    return result
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# CORPUS
+# ─────────────────────────────────────────────────────────────────────────
+
+_COMMANDS = [
+    "open file explorer", "close camera", "what is the weather today",
+    "hey seven open chrome", "play some music on spotify", "set a timer for ten minutes",
+    "remind me to call mom at five", "what time is it", "turn the volume down",
+    "take a screenshot", "search for python tutorials", "enroll my voice",
+    "how much battery is left", "open notepad and write a list",
+]
+_MISHEARD = [
+    "hey heaven open chrome", "lose camera", "clothes the window", "hoping spotify",
+    "and roll my voice", "semen what time is it", "fight explorer please",
+    "what's the whether like", "canyon open notepad", "k seven play music",
+    "savin turn it down", "i7", "in role", "stephen close camera", "opan chrome",
+]
+_TAILS = ["", " everyone", " for watching", " so much", " bye bye", ". see you"]
+_VOCAB = ("the a of to and is it on in time week place new music ba da la "
+          "what how open close seven window file camera note later good "
+          "rupees order now visit www. channel video subscribe").split()
+
+
+def build_corpus(n, rng):
+    exact = [p for p in hf._load()["exact"] if p.strip()]
+    subs  = hf._load()["substrings"]
+    out = []
+    while len(out) < n:
+        r = rng.random()
+        if r < 0.35:
+            out.append(_COMMANDS[rng.integers(len(_COMMANDS))])
+        elif r < 0.55:
+            out.append(_MISHEARD[rng.integers(len(_MISHEARD))])
+        elif r < 0.70:
+            out.append(exact[rng.integers(len(exact))] + _TAILS[rng.integers(len(_TAILS))])
+        elif r < 0.78:
+            out.append("check out " + subs[rng.integers(len(subs))] + " today")
+        else:
+            k = int(rng.integers(3, 40))
+            out.append(" ".join(rng.choice(_VOCAB, size=k)))
+    return out
+
+
+def _clean(text):
+    clean = text.lower().strip()
+    for ch in [".", "!", ",", "?", "..."]:
+        clean = clean.replace(ch, "")
+    return clean.strip()
+
+
+def _time(fn, items):
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = [fn(*item) for item in items]
+    return results, (time.perf_counter() - t0) * 1e6 / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--utterances", type=int, default=20000)
+    parser.add_argument("--file", help="transcripts to replay, one per line")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            corpus = [line.strip() for line in f if line.strip()]
+    else:
+        corpus = build_corpus(args.utterances, np.random.default_rng(args.seed))
+    hf_items = [(_clean(t), t.lower()) for t in corpus]
+    ac_items = [(t,) for t in corpus]
+
+    # Warm both sides (table compile, first-call imports) outside the timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        hf.reload()
+        ac.reload()
+
+    hb, hb_us = _time(before_is_hallucination, hf_items)
+    ha, ha_us = _time(hf.is_hallucination, hf_items)
+    cb, cb_us = _time(before_correct, ac_items)
+    ca, ca_us = _time(ac.correct, ac_items)
+
+    h_diff = sum(b[0] != a[0] for b, a in zip(hb, ha))
+    c_diff = sum(b != a for b, a in zip(cb, ca))
+
+    print("=" * 66)
+    print(f"  TRANSCRIPT FILTERS — {len(corpus)} utterances, "
+          f"aho-corasick={'yes' if hf._ahocorasick else 'no'}")
+    print("=" * 66)
+    print(f"  {'':<20}{'before us/utt':>15}{'after us/utt':>15}{'differ':>10}")
+    print(f"  {'is_hallucination':<20}{hb_us:>15.2f}{ha_us:>15.2f}{h_diff:>10}")
+    print(f"  {'autocorrect':<20}{cb_us:>15.2f}{ca_us:>15.2f}{c_diff:>10}")
+    print("-" * 66)
+    rejected = sum(v for v, _ in ha)
+    changed  = sum(a != t.lower().strip() for a, t in zip(ca, corpus))
+    print(f"  {rejected} rejected as hallucinations, {changed} autocorrected")
+    if h_diff or c_diff:
+        for (b, a), t in zip(zip(cb, ca), corpus):
+            if b != a:
+                print(f"  autocorrect differs: {t!r}: {b!r} vs {a!r}")
+                break
+        for (b, a), t in zip(zip(hb, ha), corpus):
+            if b[0] != a[0]:
+                print(f"  verdict differs: {t!r}: {b} vs {a}")
+                break
+
+
+if __name__ == "__main__":
+    main()
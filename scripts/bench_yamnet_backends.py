@@ -0,0 +1,108 @@
+"""
+scripts/bench_yamnet_backends.py
+YAMNet runtimes compared: startup time, resident memory, per-clip latency.
+
+Usage:
+    python scripts/bench_yamnet_backends.py                  - every installed backend
+    python scripts/bench_yamnet_backends.py --backends onnx tf
+    python scripts/bench_yamnet_backends.py --clips 200
+
+Each backend runs in a fresh child process so import cost and RSS are not
+shared between them:
+    startup     import + model load + first classify() of a 1s clip
+    RSS         resident memory after startup (psutil), MB
+    clip p50    classify() of a 1s clip, what audio_triggers_ml does per onset
+    10s scan    sliding 1s window every 100ms over 10s (91 classify calls)
+                vs one classify_frames() call over the same audio
+Needs the runtime and model file for each backend (see ears/yamnet_wrapper.py).
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def child(backend, clips):
+    import numpy as np
+    t0 = time.perf_counter()
+    from ears.yamnet_wrapper import YAMNetClassifier
+    rng = np.random.default_rng(0)
+    clf = YAMNetClassifier(backend=backend)
+    clip = (rng.standard_normal(16000) * 0.05).astype(np.float32)
+    clip[8000:8150] += np.exp(-np.arange(150) / 30.0).astype(np.float32) * 0.6   # a snap
+    clf.classify(clip, top_k=0)
+    startup = time.perf_counter() - t0
+
+    try:
+        import psutil
+        rss = psutil.Process().memory_info().rss / 1e6
+    except ImportError:
+        import resource
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+    lat = []
+    for _ in range(clips):
+        t = time.perf_counter()
+        clf.classify(clip, top_k=0)
+        lat.append((time.perf_counter() - t) * 1000)
+    lat.sort()
+
+    long = np.tile(clip, 10)
+    t = time.perf_counter()
+    for s in range(0, len(long) - 16000 + 1, 1600):
+        clf.classify(long[s:s + 16000], top_k=0)
+    sliding = (time.perf_counter() - t) * 1000
+    t = time.perf_counter()
+    clf.classify_frames(long)
+    batched = (time.perf_counter() - t) * 1000
+
+    print(json.dumps({
+        "backend": clf.backend_name, "startup_s": startup, "rss_mb": rss,
+        "p50_ms": lat[len(lat) // 2], "p95_ms": lat[int(len(lat) * 0.95) - 1],
+        "sliding_ms": sliding, "frames_ms": batched,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="*", default=["onnx", "tflite", "tf"])
+    parser.add_argument("--clips", type=int, default=100)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.clips)
+        return
+
+    from ears.yamnet_wrapper import backend_available
+
+    print("=" * 78)
+    print("  YAMNET BACKENDS")
+    print("=" * 78)
+    print(f"  {'backend':<8}{'startup s':>11}{'RSS MB':>9}{'clip p50':>10}{'clip p95':>10}"
+          f"{'10s sliding':>13}{'10s frames':>12}")
+    for name in args.backends:
+        if backend_available(name) is None:
+            print(f"  {name:<8}  not installed (runtime or model file missing)")
+            continue
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", name, "--clips", str(args.clips)],
+            capture_output=True, text=True,
+        )
+        lines = [l for l in out.stdout.splitlines() if l.startswith("{")]
+        if out.returncode or not lines:
+            print(f"  {name:<8}  failed: {out.stderr.strip().splitlines()[-1:]}")
+            continue
+        r = json.loads(lines[-1])
+        print(f"  {name:<8}{r['startup_s']:>11.2f}{r['rss_mb']:>9.0f}{r['p50_ms']:>8.1f}ms"
+              f"{r['p95_ms']:>8.1f}ms{r['sliding_ms']:>11.0f}ms{r['frames_ms']:>10.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""
+scripts/load_test_api.py
+Load test: /api/status latency while /api/chat is busy, against a fake Ollama.
+
+Usage:
+    python scripts/load_test_api.py                     - spawn Seven's API, 20 s of load
+    python scripts/load_test_api.py --chat 8 --status 4 --duration 30
+    python scripts/load_test_api.py --stream            - use /api/chat/stream
+    python scripts/load_test_api.py --export 2          - plus /api/memory/export downloads
+    python scripts/load_test_api.py --url http://127.0.0.1:7777   - a running Seven
+
+What it does:
+    1. Starts a fake Ollama on 127.0.0.1:11434 (/api/tags, /api/generate,
+       /api/chat). Every generation takes --gen-ms, streamed token by token
+       when asked to stream — a slow local model without the GPU.
+    2. Starts backend.api_server in a child process on a free port (the
+       chat rate limit is lifted there), or uses --url.
+    3. Baseline: --status clients poll /api/status for --baseline seconds.
+    4. Load: the same pollers, plus --chat clients sending chats back to
+       back (and --export clients downloading backups) for --duration.
+    5. Reports p50 / p95 / p99 / max status latency for both phases, chat
+       throughput, rejections (429 rate limit / 503 busy) and errors, and
+       the executor pool stats from /api/speed.
+
+Before the async routes, p99 status latency under load grew with the
+number of chats in flight: every one held a threadpool thread. It should
+now stay near the baseline whatever --chat is.
+
+Seven's Ollama URL is fixed, so port 11434 must be free (stop Ollama first).
+A running Seven (--url) keeps its 30 chats/minute rate limit — expect 429s.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+OLLAMA_PORT = 11434
+REPLY = ("Sure. Here is a short answer while the model takes its time, "
+         "one token after another, the way a slow laptop GPU would. "
+         "That should be enough text to keep the stream busy.")
+PROMPTS = [
+    "Tell me something interesting about octopuses.",
+    "What should I cook tonight?",
+    "Explain how a heat pump works.",
+    "Write a two line poem about Mondays.",
+    "Why is the sky blue?",
+]
+
+
+# =============================================================================
+# FAKE OLLAMA
+# =============================================================================
+
+class FakeOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    gen_ms = 1500
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, data, status=200):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/api/tags"):
+            self._json({"models": [{"name": "llama3:latest"}, {"name": "phi3:mini"}]})
+        elif self.path.startswith("/api/version"):
+            self._json({"version": "0.0.0-fake"})
+        else:
+            self._json({"error": "not found"}, 404)
+
+    def do_POST(self):
+        length  = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.startswith("/api/generate"):
+            key = "response"
+        elif self.path.startswith("/api/chat"):
+            key = "message"
+        else:
+            self._json({"error": "not found"}, 404)
+            return
+
+        tokens = [w + " " for w in REPLY.split()]
+        delay  = self.gen_ms / 1000.0 / len(tokens)
+
+        def _chunk(text, done):
+            out = {"model": payload.get("model", "llama3"), "done": done}
+            out[key] = {"role": "assistant", "content": text} if key == "message" else text
+            return out
+
+        if payload.get("stream", True):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for tok in tokens + [""]:
+                if tok:
+                    time.sleep(delay)
+                line = (json.dumps(_chunk(tok, not tok)) + "\n").encode()
+                self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            time.sleep(self.gen_ms / 1000.0)
+            self._json(_chunk(REPLY, True))
+
+
+class _QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass    # clients hanging up mid-stream at the end of the run
+
+
+def start_fake_ollama(gen_ms):
+    FakeOllama.gen_ms = gen_ms
+    try:
+        server = _QuietServer(("127.0.0.1", OLLAMA_PORT), FakeOllama)
+    except OSError:
+        sys.exit(f"Port {OLLAMA_PORT} is in use — stop Ollama before running the load test.")
+    threading.Thread(target=server.serve_forever, daemon=True, name="FakeOllama").start()
+    return server
+
+
+# =============================================================================
+# SEVEN API (child process)
+# =============================================================================
+
+def serve(port):
+    """Child process: Seven's API app on `port`, chat rate limit lifted."""
+    import uvicorn
+    from backend import api_server
+    api_server.RATE_LIMIT = 10 ** 9
+    uvicorn.run(api_server.app, host="127.0.0.1", port=port,
+                log_level="warning", access_log=False)
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_api():
+    port = _free_port()
+    proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--serve", str(port)],
+                            cwd=ROOT, stdout=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            sys.exit("Seven's API exited during startup (run with --serve PORT to see why).")
+        try:
+            if Client(url).request("GET", "/api/version")[0] == 200:
+                return proc, url
+        except OSError:
+            pass
+        time.sleep(0.25)
+    proc.kill()
+    sys.exit("Seven's API did not come up within 60 s.")
+
+
+# =============================================================================
+# CLIENTS
+# =============================================================================
+
+class Client:
+    """One keep-alive connection per client thread."""
+
+    def __init__(self, url, timeout=120):
+        u = urllib.parse.urlparse(url)
+        self.host, self.port, self.timeout = u.hostname, u.port or 80, timeout
+        self.conn = None
+
+    def request(self, method, path, body=None):
+        """(status, body bytes). Reconnects once if the server dropped the connection."""
+        data    = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if data else {}
+        for attempt in (0, 1):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self.conn.request(method, path, body=data, headers=headers)
+                resp = self.conn.getresponse()
+                return resp.status, resp.read()
+            except (http.client.HTTPException, ConnectionError):
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    raise
+
+
+class Stats:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data = {}
+
+    def add(self, key, value):
+        with self.lock:
+            self.data.setdefault(key, []).append(value)
+
+    def get(self, key):
+        with self.lock:
+            return list(self.data.get(key, []))
+
+
+def status_poller(url, stats, stop, phase, interval):
+    client = Client(url, timeout=30)
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            code, _ = client.request("GET", "/api/status")
+            ms = (time.perf_counter() - t0) * 1000
+            stats.add(f"status_{phase[0]}", ms)
+            if code != 200:
+                stats.add("status_errors", code)
+        except Exception as e:
+            stats.add("status_errors", type(e).__name__)
+        time.sleep(interval)
+
+
+def chat_client(url, stats, stop, n, stream):
+    client = Client(url)
+    path   = "/api/chat/stream" if stream else "/api/chat"
+    i = n
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            code, _ = client.request("POST", path, {"text": PROMPTS[i % len(PROMPTS)],
+                                                    "speaker_id": "loadtest"})
+            ms = (time.perf_counter() - t0) * 1000
+            if code == 200:
+                stats.add("chat_ok", ms)
+            elif code in (429, 503):
+                stats.add("chat_rejected", code)
+                time.sleep(1.0)
+            else:
+                stats.add("chat_errors", code)
+                time.sleep(0.5)
+        except Exception as e:
+            stats.add("chat_errors", type(e).__name__)
+            time.sleep(0.5)
+        i += 1
+
+
+def export_client(url, stats, stop):
+    client = Client(url)
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        try:
+            code, body = client.request("GET", "/api/memory/export")
+            if code == 200:
+                stats.add("export_ok", (time.perf_counter() - t0) * 1000)
+                stats.add("export_bytes", len(body))
+            else:
+                stats.add("export_errors", code)
+                time.sleep(0.5)
+        except Exception as e:
+            stats.add("export_errors", type(e).__name__)
+            time.sleep(0.5)
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def percentile(sorted_vals, pct):
+    if not sorted_vals:
+        return 0.0
+    k = min(len(sorted_vals) - 1, int(round(pct / 100.0 * (len(sorted_vals) - 1))))
+    return sorted_vals[k]
+
+
+def latency_row(label, vals):
+    v = sorted(vals)
+    if not v:
+        return f"  {label:<22} no samples"
+    return (f"  {label:<22} n={len(v):<6} p50={percentile(v, 50):7.1f}  p95={percentile(v, 95):7.1f}"
+            f"  p99={percentile(v, 99):7.1f}  max={v[-1]:7.1f} ms")
+
+
+def _counts(vals):
+    out = {}
+    for v in vals:
+        out[str(v)] = out.get(str(v), 0) + 1
+    return out
+
+
+def report(stats, args, url):
+    print()
+    print(f"=== /api/status latency ({args.status} pollers, every {args.interval * 1000:.0f} ms) ===")
+    print(latency_row("baseline", stats.get("status_b")))
+    print(latency_row(f"under load ({args.chat} chat)", stats.get("status_l")))
+    base, load = sorted(stats.get("status_b")), sorted(stats.get("status_l"))
+    if base and load:
+        print(f"  p99 under load / baseline: {percentile(load, 99) / max(percentile(base, 99), 0.001):.1f}x")
+    if stats.get("status_errors"):
+        print(f"  errors: {_counts(stats.get('status_errors'))}")
+
+    print()
+    print(f"=== chat ({'stream' if args.stream else 'blocking'}, fake generation {args.gen_ms} ms) ===")
+    ok = stats.get("chat_ok")
+    print(f"  completed {len(ok)}  ({len(ok) / args.duration:.2f}/s)")
+    print(latency_row("chat latency", ok))
+    if stats.get("chat_rejected"):
+        print(f"  rejected  {_counts(stats.get('chat_rejected'))}   (429 rate limit, 503 llm pool busy)")
+    if stats.get("chat_errors"):
+        print(f"  errors    {_counts(stats.get('chat_errors'))}")
+
+    if args.export:
+        print()
+        print("=== export ===")
+        print(latency_row("export", stats.get("export_ok")))
+        size = stats.get("export_bytes")
+        if size:
+            print(f"  last backup {size[-1] / 1024:.0f} KB")
+        if stats.get("export_errors"):
+            print(f"  errors    {_counts(stats.get('export_errors'))}")
+
+    try:
+        code, body = Client(url, timeout=10).request("GET", "/api/speed")
+        pools = json.loads(body).get("executors") if code == 200 else None
+    except Exception:
+        pools = None
+    if pools:
+        print()
+        print("=== executor pools (/api/speed) ===")
+        for kind, s in pools.items():
+            print(f"  {kind:<10} workers={s['workers']}  completed={s['completed']:<5} failed={s['failed']:<4}"
+                  f" wait avg={s['wait_ms_avg']:.1f} max={s['wait_ms_max']:.1f} ms"
+                  f"  run avg={s['run_ms_avg']:.1f} ms")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[2],
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--url", help="a running Seven API (default: spawn one)")
+    ap.add_argument("--chat", type=int, default=8, help="concurrent chat clients (default 8)")
+    ap.add_argument("--status", type=int, default=4, help="concurrent /api/status pollers (default 4)")
+    ap.add_argument("--export", type=int, default=0, help="concurrent /api/memory/export clients")
+    ap.add_argument("--stream", action="store_true", help="chat via /api/chat/stream")
+    ap.add_argument("--interval", type=float, default=0.1, help="status poll interval, s (default 0.1)")
+    ap.add_argument("--baseline", type=float, default=5.0, help="baseline seconds (default 5)")
+    ap.add_argument("--duration", type=float, default=20.0, help="load seconds (default 20)")
+    ap.add_argument("--gen-ms", type=int, default=1500, help="fake Ollama generation time (default 1500)")
+    ap.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.serve:
+        serve(args.serve)
+        return
+
+    start_fake_ollama(args.gen_ms)
+    proc = None
+    url  = args.url
+    if not url:
+        print("Starting Seven's API...")
+        proc, url = spawn_api()
+    print(f"Target {url}, fake Ollama on :{OLLAMA_PORT}")
+
+    stats, phase = Stats(), ["b"]
+    stop_status, stop_load = threading.Event(), threading.Event()
+    threads = [threading.Thread(target=status_poller, daemon=True,
+                                args=(url, stats, stop_status, phase, args.interval))
+               for _ in range(args.status)]
+    try:
+        for t in threads:
+            t.start()
+        print(f"Baseline: {args.status} status pollers for {args.baseline:.0f} s...")
+        time.sleep(args.baseline)
+
+        phase[0] = "l"
+        load = [threading.Thread(target=chat_client, daemon=True,
+                                 args=(url, stats, stop_load, n, args.stream))
+                for n in range(args.chat)]
+        load += [threading.Thread(target=export_client, daemon=True,
+                                  args=(url, stats, stop_load))
+                 for _ in range(args.export)]
+        for t in load:
+            t.start()
+        print(f"Load: + {args.chat} chat and {args.export} export clients for {args.duration:.0f} s...")
+        time.sleep(args.duration)
+        stop_status.set()
+        stop_load.set()
+
+        report(stats, args, url)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_status.set()
+        stop_load.set()
+        if proc:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+seven_utils/changes.py
+Change versions for the data the UI polls: tasks, schedules, triggers, workspaces.
+
+Usage:
+    from seven_utils import changes
+
+    changes.bump("tasks")          # after a write has committed
+    changes.version("tasks")       # -> int, grows with every change
+    changes.etag("tasks")          # -> 'W/"tasks-1760781234567"'
+    changes.changed_since(n)       # -> {domain: version} of domains newer than n
+
+One counter is shared by every domain and starts at the process start
+time in milliseconds, so versions keep growing across restarts and a
+`since` left over from a previous run simply reads as old.
+
+Writes made by another process (panel server, trigger daemon) or by code
+that does not call bump() still count: each domain can watch its files
+(db + -wal). When their mtime/size differ from what this process last saw,
+the domain is bumped on the next read. An unchanged poll costs one
+os.stat() per watched file — no query, no JSON.
+
+Standard library only, like seven_utils/db.py.
+"""
+
+import os
+import time
+import threading
+
+DOMAINS = ("tasks", "schedules", "triggers", "workspaces")
+
+_lock     = threading.Lock()
+_seq      = int(time.time() * 1000)
+_versions = {d: _seq for d in DOMAINS}
+_files    = {}   # abspath -> set of domains stored in it
+_stamps   = {}   # abspath -> (mtime_ns, size) or None
+
+
+def _stamp(path: str):
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def watch(domain: str, *paths: str):
+    """Bump `domain` whenever one of these files changes outside bump()."""
+    with _lock:
+        for path in paths:
+            path = os.path.abspath(path)
+            _files.setdefault(path, set()).add(domain)
+            _stamps.setdefault(path, _stamp(path))
+
+
+def watch_db(domain: str, db_path: str):
+    """watch() a SQLite file and its WAL — committed writes land in the WAL first."""
+    watch(domain, db_path, db_path + "-wal")
+
+
+def _bump_locked(domains):
+    global _seq
+    _seq += 1
+    for d in domains:
+        _versions[d] = _seq
+
+
+def _poll_files_locked():
+    changed = set()
+    for path, domains in _files.items():
+        stamp = _stamp(path)
+        if stamp != _stamps[path]:
+            _stamps[path] = stamp
+            changed |= domains
+    if changed:
+        _bump_locked(changed)
+
+
+def bump(*domains: str):
+    """Record a write to these domains. Call after the commit, not before."""
+    with _lock:
+        # Our own write changed the files too — don't count it a second time
+        for path, watched in _files.items():
+            if watched.intersection(domains):
+                _stamps[path] = _stamp(path)
+        _bump_locked(domains)
+
+
+def version(domain: str) -> int:
+    with _lock:
+        _poll_files_locked()
+        return _versions.get(domain, 0)
+
+
+def versions() -> dict:
+    with _lock:
+        _poll_files_locked()
+        return dict(_versions)
+
+
+def etag(domain: str) -> str:
+    return f'W/"{domain}-{version(domain)}"'
+
+
+def changed_since(since: int, domains=None) -> dict:
+    """{domain: version} for the domains (all, or those listed) changed after `since`."""
+    with _lock:
+        _poll_files_locked()
+        return {d: v for d, v in _versions.items()
+                if v > since and (not domains or d in domains)}
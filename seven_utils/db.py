@@ -0,0 +1,170 @@
+"""
+seven_utils/db.py
+Pooled SQLite connections for tasks.db and triggers.db.
+
+Usage:
+    from seven_utils.db import connect
+
+    with connect(TASKS_DB, row_factory=sqlite3.Row) as conn:
+        rows = conn.execute("SELECT * FROM tasks").fetchall()
+
+connect() returns this thread's connection to that file, opening it on
+first use. Opening is where the cost was: every call used to create a new
+connection, re-run PRAGMA journal_mode=WAL and re-prepare its statements.
+A pooled connection keeps its prepared statements (cached_statements) and
+had its pragmas set once:
+
+    journal_mode=WAL      once per file per process (it is persistent)
+    synchronous=NORMAL    safe with WAL, one fsync per checkpoint
+    mmap_size             64 MB of the file read through the page cache
+    cache_size            8 MB page cache per connection
+    foreign_keys          when the caller asks for it
+
+Behaves like sqlite3.connect() for the existing call sites:
+    `with conn:`   commits or rolls back, as before
+    conn.close()   rolls back anything uncommitted, as a real close would,
+                   but leaves the connection open in the pool
+
+Works in Seven, the panel server and both daemons — no imports beyond the
+standard library. get_stats() reports query count and latency per file.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+import weakref
+
+MMAP_SIZE     = 64 * 1024 * 1024
+CACHE_KIB     = 8 * 1024
+STATEMENTS    = 256
+SLOW_QUERY_MS = 50.0
+
+_local      = threading.local()
+_lock       = threading.Lock()
+_wal_done   = set()
+_all_conns  = weakref.WeakSet()
+_stats      = {}     # db file name -> {"queries", "total_ms", "max_ms", "slow", "connections"}
+
+
+def _record(db_name: str, elapsed_ms: float):
+    with _lock:
+        s = _stats.setdefault(db_name, {"queries": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                        "slow": 0, "connections": 0})
+        s["queries"]  += 1
+        s["total_ms"] += elapsed_ms
+        if elapsed_ms > s["max_ms"]:
+            s["max_ms"] = elapsed_ms
+        if elapsed_ms >= SLOW_QUERY_MS:
+            s["slow"] += 1
+
+
+class TimedCursor(sqlite3.Cursor):
+
+    def execute(self, sql, parameters=()):
+        t0 = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _record(self.connection.db_name, (time.perf_counter() - t0) * 1000)
+
+    def executemany(self, sql, seq_of_parameters):
+        t0 = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _record(self.connection.db_name, (time.perf_counter() - t0) * 1000)
+
+    def executescript(self, sql_script):
+        t0 = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            _record(self.connection.db_name, (time.perf_counter() - t0) * 1000)
+
+
+class PooledConnection(sqlite3.Connection):
+
+    db_name = ""
+
+    def cursor(self, factory=TimedCursor):
+        return super().cursor(factory)
+
+    # sqlite3.Connection.execute* do not go through cursor().execute — time them here
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+    def close(self):
+        """Stays open in the pool. Uncommitted work is discarded, as on a real close."""
+        if self.in_transaction:
+            self.rollback()
+
+    def really_close(self):
+        super().close()
+
+
+def _open(path: str, timeout: float, foreign_keys: bool) -> PooledConnection:
+    conn = sqlite3.connect(path, timeout=timeout, factory=PooledConnection,
+                           cached_statements=STATEMENTS, check_same_thread=False)
+    conn.db_name = os.path.basename(path)
+    with _lock:
+        first = path not in _wal_done
+        _wal_done.add(path)
+        _stats.setdefault(conn.db_name, {"queries": 0, "total_ms": 0.0, "max_ms": 0.0,
+                                         "slow": 0, "connections": 0})["connections"] += 1
+    if first:
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size=-{CACHE_KIB}")
+    conn.execute(f"PRAGMA foreign_keys={'ON' if foreign_keys else 'OFF'}")
+    _all_conns.add(conn)
+    return conn
+
+
+def connect(path: str, row_factory=None, foreign_keys: bool = False,
+            timeout: float = 10) -> PooledConnection:
+    """This thread's pooled connection to `path` (opened on first use)."""
+    pool = getattr(_local, "pool", None)
+    if pool is None:
+        pool = _local.pool = {}
+    key  = (os.path.abspath(path), row_factory, foreign_keys)
+    conn = pool.get(key)
+    if conn is None:
+        conn = pool[key] = _open(key[0], timeout, foreign_keys)
+        conn.row_factory = row_factory
+    return conn
+
+
+def close_all():
+    """Close every pooled connection (shutdown, or before replacing a DB file)."""
+    global _local
+    for conn in list(_all_conns):
+        try:
+            conn.really_close()
+        except Exception:
+            pass
+    with _lock:
+        _wal_done.clear()
+    _local = threading.local()
+
+
+def get_stats() -> dict:
+    """Per DB file: query count, avg/max latency in ms, slow queries, connections opened."""
+    with _lock:
+        out = {}
+        for name, s in _stats.items():
+            out[name] = {
+                "queries":     s["queries"],
+                "avg_ms":      round(s["total_ms"] / s["queries"], 3) if s["queries"] else 0.0,
+                "max_ms":      round(s["max_ms"], 2),
+                "slow":        s["slow"],
+                "connections": s["connections"],
+            }
+        return out
@@ -24,6 +24,8 @@ from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 import uvicorn
 
+from seven_utils.db import connect as db_connect
+
 # ── DB Path ──────────────────────────────────────────────────────────────────
 
 def _get_tasks_db():
@@ -55,10 +57,7 @@ app.add_middleware(
 # ── DB helpers ────────────────────────────────────────────────────────────────
 
 def _conn():
-    conn = sqlite3.connect(TASKS_DB, timeout=10)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
-    return conn
+    return db_connect(TASKS_DB, row_factory=sqlite3.Row)
 
 
 def _row(row) -> dict:
@@ -8,8 +8,10 @@ Version: 1.3 - With server sync
 import os
 import uuid
 import time
+import atexit
 import sqlite3
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 
 # =============================================================================
 # CONFIGURATION
@@ -32,6 +34,7 @@ LICENSE_DB     = os.path.join(DATA_DIR, "license.db")
 SESSION_TIMEOUT  = 600   # 10 min idle = session ends
 SAVE_INTERVAL    = 60    # Save to local DB every 60 seconds
 SERVER_INTERVAL  = 120   # Ping server every 2 minutes
+HISTORY_DAYS     = 30    # Days of daily_usage kept in memory for /api/usage/history
 
 # Session state
 _session = {
@@ -44,6 +47,15 @@ _session = {
     "total_synced_minutes": 0,     # total already sent to server
 }
 
+# Buffered writer state (see BUFFERED WRITER below)
+_lock         = threading.RLock()   # _session time, _pending, _rollup
+_db_lock      = threading.Lock()    # the long-lived connections
+_connections  = {}                  # db path -> sqlite3 connection, open for the whole run
+_schema_ready = set()               # db paths whose schema was checked this run
+_pending      = {}                  # "YYYY-MM-DD" -> active seconds not yet written
+_rollup       = None                # totals + recent daily_usage, mirrored from telemetry.db
+_cached       = {}                  # "device_id" / "email" read from their files once
+
 # =============================================================================
 # DEVICE ID MANAGEMENT
 # =============================================================================
@@ -56,6 +68,9 @@ def get_device_id():
       2. Windows MachineGuid (survives reinstall)
       3. Generated UUID (fallback)
     """
+    if _cached.get("device_id"):
+        return _cached["device_id"]
+
     os.makedirs(DATA_DIR, exist_ok=True)
 
     # Return cached if exists
@@ -63,6 +78,7 @@ def get_device_id():
         with open(DEVICE_ID_FILE, "r") as f:
             did = f.read().strip()
             if did:
+                _cached["device_id"] = did
                 return did
 
     # Try Windows registry MachineGuid
@@ -87,6 +103,7 @@ def get_device_id():
     with open(DEVICE_ID_FILE, "w") as f:
         f.write(device_id)
 
+    _cached["device_id"] = device_id
     return device_id
 
 # =============================================================================
@@ -101,6 +118,10 @@ def save_email(email):
     
     with open(EMAIL_FILE, "w") as f:
         f.write(email)
+    _cached["email"] = email
+    with _lock:
+        if _rollup is not None:
+            _rollup["email"] = email
     
     # Update databases with email
     device_id = get_device_id()
@@ -108,29 +129,21 @@ def save_email(email):
     # Update telemetry.db
     try:
         init_db()
-        conn = sqlite3.connect(TELEMETRY_DB)
-        c = conn.cursor()
-        c.execute("UPDATE stats SET email = ? WHERE device_id = ?", (email, device_id))
-        conn.commit()
-        conn.close()
+        with _db_lock:
+            conn = _connect(TELEMETRY_DB)
+            with conn:
+                conn.execute("UPDATE stats SET email = ? WHERE device_id = ?", (email, device_id))
     except Exception as e:
         print(f"[TELEMETRY] Warning: Could not update telemetry.db email: {e}")
     
     # Update license.db
     try:
         if os.path.exists(LICENSE_DB):
-            conn = sqlite3.connect(LICENSE_DB)
-            c = conn.cursor()
-            
-            # Try to add email column if it doesn't exist
-            try:
-                c.execute("ALTER TABLE activations ADD COLUMN email TEXT")
-            except:
-                pass
-            
-            c.execute("UPDATE activations SET email = ? WHERE device_id = ?", (email, device_id))
-            conn.commit()
-            conn.close()
+            init_license_db()
+            with _db_lock:
+                conn = _connect(LICENSE_DB)
+                with conn:
+                    conn.execute("UPDATE activations SET email = ? WHERE device_id = ?", (email, device_id))
     except Exception as e:
         print(f"[TELEMETRY] Warning: Could not update license.db email: {e}")
     
@@ -139,11 +152,14 @@ def save_email(email):
 
 def get_email():
     """Get saved email or None."""
+    if "email" in _cached:
+        return _cached["email"]
+    email = None
     if os.path.exists(EMAIL_FILE):
         with open(EMAIL_FILE, "r") as f:
-            email = f.read().strip()
-            return email if email else None
-    return None
+            email = f.read().strip() or None
+    _cached["email"] = email
+    return email
 
 # =============================================================================
 # COUNTRY DETECTION
@@ -165,40 +181,53 @@ def get_country_from_ip():
 # DATABASE INITIALIZATION
 # =============================================================================
 
+def _connect(path):
+    """
+    The connection to telemetry.db / license.db, opened once and kept.
+    Use only while holding _db_lock.
+    """
+    conn = _connections.get(path)
+    if conn is None:
+        conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        _connections[path] = conn
+    return conn
+
+
 def init_db():
     """Initialize telemetry database."""
     os.makedirs(DATA_DIR, exist_ok=True)
     
-    conn = sqlite3.connect(TELEMETRY_DB)
-    c = conn.cursor()
-    
-    # Main stats table
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS stats (
-            device_id TEXT PRIMARY KEY,
-            country TEXT,
-            email TEXT,
-            install_date TEXT,
-            last_seen TEXT,
-            active_hours REAL DEFAULT 0,
-            app_version TEXT,
-            license_tier TEXT DEFAULT 'free'
-        )
-    """)
-    
-    # Daily usage table (NEW - tracks per day)
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS daily_usage (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            device_id TEXT,
-            date TEXT,
-            hours REAL DEFAULT 0,
-            UNIQUE(device_id, date)
-        )
-    """)
-    
-    conn.commit()
-    conn.close()
+    with _db_lock:
+        conn = _connect(TELEMETRY_DB)
+        c = conn.cursor()
+        
+        # Main stats table
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS stats (
+                device_id TEXT PRIMARY KEY,
+                country TEXT,
+                email TEXT,
+                install_date TEXT,
+                last_seen TEXT,
+                active_hours REAL DEFAULT 0,
+                app_version TEXT,
+                license_tier TEXT DEFAULT 'free'
+            )
+        """)
+        
+        # Daily usage table (NEW - tracks per day)
+        c.execute("""
+            CREATE TABLE IF NOT EXISTS daily_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                device_id TEXT,
+                date TEXT,
+                hours REAL DEFAULT 0,
+                UNIQUE(device_id, date)
+            )
+        """)
+        
+        conn.commit()
+        _schema_ready.add(TELEMETRY_DB)
 
 
 def init_license_db():
@@ -206,20 +235,20 @@ def init_license_db():
     if not os.path.exists(LICENSE_DB):
         return
     
-    conn = sqlite3.connect(LICENSE_DB)
-    c = conn.cursor()
-    
-    # Check if activations table exists
-    c.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='activations'")
-    if c.fetchone():
-        # Try to add email column
-        try:
-            c.execute("ALTER TABLE activations ADD COLUMN email TEXT")
-            conn.commit()
-        except:
-            pass
-    
-    conn.close()
+    with _db_lock:
+        conn = _connect(LICENSE_DB)
+        c = conn.cursor()
+        
+        # Check if activations table exists
+        c.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='activations'")
+        if c.fetchone():
+            # Try to add email column
+            try:
+                c.execute("ALTER TABLE activations ADD COLUMN email TEXT")
+                conn.commit()
+            except:
+                pass
+        _schema_ready.add(LICENSE_DB)
 
 # =============================================================================
 # USAGE TIME TRACKING (CORE LOGIC)
@@ -228,49 +257,51 @@ def init_license_db():
 def log_activity():
     """
     Call this whenever user does something.
-    Tracks time between activities and saves periodically.
+    Tracks time between activities. Runs on every /api/status poll, so it
+    only buffers — the telemetry thread does the writing (see flush()).
     """
     now = time.time()
     
-    # First activity ever
-    if _session["last_activity"] is None:
-        _session["start_time"] = now
-        _session["last_activity"] = now
-        _session["last_save_time"] = now
-        _session["accumulated_seconds"] = 0
-        print(f"[TELEMETRY] Session started")
-        return
-    
-    # Calculate time since last activity
-    elapsed = now - _session["last_activity"]
-    
-    # If idle too long, start new session
-    if elapsed > SESSION_TIMEOUT:
-        # Save previous session first
-        if _session["accumulated_seconds"] > 10:
-            _save_usage_time(_session["accumulated_seconds"])
+    with _lock:
+        # First activity ever
+        if _session["last_activity"] is None:
+            _session["start_time"] = now
+            _session["last_activity"] = now
+            _session["last_save_time"] = now
+            _session["accumulated_seconds"] = 0
+            print(f"[TELEMETRY] Session started")
+            return
+        
+        # Calculate time since last activity
+        elapsed = now - _session["last_activity"]
+        
+        # If idle too long, start new session
+        if elapsed > SESSION_TIMEOUT:
+            # Keep previous session first
+            if _session["accumulated_seconds"] > 10:
+                _add_time(_session["accumulated_seconds"])
+            
+            # Start new session
+            _session["start_time"] = now
+            _session["last_activity"] = now
+            _session["last_save_time"] = now
+            _session["accumulated_seconds"] = 0
+            print(f"[TELEMETRY] New session started (was idle)")
+            return
+        
+        # Accumulate active time
+        if elapsed > 0 and elapsed < SESSION_TIMEOUT:
+            _session["accumulated_seconds"] += elapsed
         
-        # Start new session
-        _session["start_time"] = now
         _session["last_activity"] = now
-        _session["last_save_time"] = now
-        _session["accumulated_seconds"] = 0
-        print(f"[TELEMETRY] New session started (was idle)")
-        return
-    
-    # Accumulate active time
-    if elapsed > 0 and elapsed < SESSION_TIMEOUT:
-        _session["accumulated_seconds"] += elapsed
-    
-    _session["last_activity"] = now
-    
-    # Save periodically
-    time_since_save = now - (_session["last_save_time"] or now)
-    
-    if time_since_save >= SAVE_INTERVAL and _session["accumulated_seconds"] > 0:
-        _save_usage_time(_session["accumulated_seconds"])
-        _session["accumulated_seconds"] = 0
-        _session["last_save_time"] = now
+        
+        # Move it to the write buffer periodically
+        time_since_save = now - (_session["last_save_time"] or now)
+        
+        if time_since_save >= SAVE_INTERVAL and _session["accumulated_seconds"] > 0:
+            _add_time(_session["accumulated_seconds"])
+            _session["accumulated_seconds"] = 0
+            _session["last_save_time"] = now
 
 
 def _format_time(total_minutes):
@@ -289,49 +320,119 @@ def _format_time(total_minutes):
         return f"{minutes} min"
 
 
-def _save_usage_time(seconds, sync_server=False):
-    """
-    Save accumulated usage time to local databases.
-    sync_server=True → also ping Render server with pending minutes.
-    """
-    if seconds < 5:
+# =============================================================================
+# BUFFERED WRITER
+# =============================================================================
+#
+# Active time goes into _pending, per day, and is written every
+# SAVE_INTERVAL by the telemetry thread: one transaction per DB, on
+# connections kept open for the whole run.
+#
+# _rollup mirrors telemetry.db — total hours, last_seen, email and the
+# last HISTORY_DAYS of daily_usage. It is read once and then advanced by
+# each flush, so the total for log lines and /api/usage/* is never queried.
+
+def _add_time(seconds):
+    """Buffer active seconds against today's date."""
+    if seconds <= 0:
         return
-
-    minutes   = seconds / 60.0
+    today = datetime.now().strftime("%Y-%m-%d")
+    with _lock:
+        _pending[today] = _pending.get(today, 0.0) + seconds
+
+
+def _load_rollup():
+    """The in-memory rollup, read from telemetry.db on first use."""
+    global _rollup
+    with _lock:
+        if _rollup is not None:
+            return _rollup
+        rollup = {"total_hours": 0.0, "last_seen": None, "email": None, "daily": {}}
+        if os.path.exists(TELEMETRY_DB):
+            device_id = get_device_id()
+            since     = (datetime.now() - timedelta(days=HISTORY_DAYS)).strftime("%Y-%m-%d")
+            try:
+                with _db_lock:
+                    conn = _connect(TELEMETRY_DB)
+                    row  = conn.execute(
+                        "SELECT active_hours, last_seen, email FROM stats WHERE device_id = ?",
+                        (device_id,)
+                    ).fetchone()
+                    if not row:
+                        row = conn.execute(
+                            "SELECT active_hours, last_seen, email FROM stats "
+                            "ORDER BY last_seen DESC LIMIT 1"
+                        ).fetchone()
+                    days = conn.execute(
+                        "SELECT date, hours FROM daily_usage WHERE device_id = ? AND date >= ?",
+                        (device_id, since)
+                    ).fetchall()
+            except Exception as e:
+                # Tables not created yet — try again on the next read
+                print(f"[TELEMETRY] Could not load usage totals: {e}")
+                return rollup
+            if row:
+                rollup["total_hours"] = row[0] or 0.0
+                rollup["last_seen"]   = row[1]
+                rollup["email"]       = row[2]
+            rollup["daily"] = {d: h or 0.0 for d, h in days}
+        _rollup = rollup
+        return _rollup
+
+
+def _advance_rollup(batch, now_iso, email):
+    with _lock:
+        if _rollup is None:
+            return
+        _rollup["total_hours"] += sum(batch.values()) / 3600.0
+        _rollup["last_seen"]    = now_iso
+        if email:
+            _rollup["email"] = email
+        daily = _rollup["daily"]
+        for day, seconds in batch.items():
+            daily[day] = daily.get(day, 0.0) + seconds / 3600.0
+        cutoff = (datetime.now() - timedelta(days=HISTORY_DAYS)).strftime("%Y-%m-%d")
+        for day in [d for d in daily if d < cutoff]:
+            del daily[day]
+
+
+def _write_usage(batch):
+    """Write {date: seconds} to telemetry.db and license.db."""
+    hours     = sum(batch.values()) / 3600.0
     device_id = get_device_id()
     email     = get_email()
     now_iso   = datetime.now().isoformat()
-    today     = datetime.now().strftime("%Y-%m-%d")
 
-    print(f"[TELEMETRY] Saving {round(minutes, 1)} min for "
+    print(f"[TELEMETRY] Saving {round(hours * 60, 1)} min for "
           f"{email or device_id[:8]}...")
 
     # 1. Local telemetry.db
     try:
-        init_db()
-        conn = sqlite3.connect(TELEMETRY_DB)
-        c    = conn.cursor()
-
-        c.execute("""
-            INSERT INTO stats
-                (device_id, email, install_date, last_seen, active_hours, app_version, license_tier)
-            VALUES (?, ?, ?, ?, ?, '1.1.0', 'free')
-            ON CONFLICT(device_id) DO UPDATE SET
-                email        = COALESCE(?, email),
-                last_seen    = ?,
-                active_hours = active_hours + ?
-        """, (device_id, email, now_iso, now_iso, minutes / 60.0,
-              email, now_iso, minutes / 60.0))
-
-        c.execute("""
-            INSERT INTO daily_usage (device_id, date, hours)
-            VALUES (?, ?, ?)
-            ON CONFLICT(device_id, date) DO UPDATE SET
-                hours = hours + ?
-        """, (device_id, today, minutes / 60.0, minutes / 60.0))
-
-        conn.commit()
-        conn.close()
+        if TELEMETRY_DB not in _schema_ready:
+            init_db()
+        _load_rollup()   # before the write, so the write is counted exactly once
+        with _db_lock:
+            conn = _connect(TELEMETRY_DB)
+            with conn:
+                conn.execute("""
+                    INSERT INTO stats
+                        (device_id, email, install_date, last_seen, active_hours, app_version, license_tier)
+                    VALUES (?, ?, ?, ?, ?, '1.1.0', 'free')
+                    ON CONFLICT(device_id) DO UPDATE SET
+                        email        = COALESCE(?, email),
+                        last_seen    = ?,
+                        active_hours = active_hours + ?
+                """, (device_id, email, now_iso, now_iso, hours,
+                      email, now_iso, hours))
+
+                conn.executemany("""
+                    INSERT INTO daily_usage (device_id, date, hours)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(device_id, date) DO UPDATE SET
+                        hours = hours + ?
+                """, [(device_id, day, sec / 3600.0, sec / 3600.0)
+                      for day, sec in sorted(batch.items())])
+        _advance_rollup(batch, now_iso, email)
         print(f"[TELEMETRY] Local DB saved — {_format_time(_get_total_minutes())}")
     except Exception as e:
         print(f"[TELEMETRY] local DB error: {e}")
@@ -339,80 +440,126 @@ def _save_usage_time(seconds, sync_server=False):
     # 2. Local license.db (referral tracking)
     try:
         if os.path.exists(LICENSE_DB):
-            init_license_db()
-            conn = sqlite3.connect(LICENSE_DB)
-            c    = conn.cursor()
-
-            c.execute("""
-                INSERT INTO activations
-                    (device_id, license_key, activated_at, last_validated, usage_hours, email)
-                VALUES (?, 'FREE_USER', ?, ?, ?, ?)
-                ON CONFLICT(device_id) DO UPDATE SET
-                    usage_hours   = usage_hours + ?,
-                    last_validated = ?,
-                    email         = COALESCE(?, email)
-            """, (device_id, now_iso, now_iso, minutes / 60.0, email,
-                  minutes / 60.0, now_iso, email))
-
-            if email:
-                c.execute("""
-                    UPDATE referrals
-                    SET usage_hours = usage_hours + ?,
-                        is_complete = CASE
-                            WHEN usage_hours + ? >= 7 THEN 1
-                            ELSE 0
-                        END,
-                        completed_at = CASE
-                            WHEN usage_hours + ? >= 7 AND is_complete = 0 THEN ?
-                            ELSE completed_at
-                        END
-                    WHERE referred_email = ? AND is_complete = 0
-                """, (minutes / 60.0, minutes / 60.0,
-                      minutes / 60.0, now_iso, email))
-
-            conn.commit()
-            conn.close()
+            if LICENSE_DB not in _schema_ready:
+                init_license_db()
+            with _db_lock:
+                conn = _connect(LICENSE_DB)
+                with conn:
+                    conn.execute("""
+                        INSERT INTO activations
+                            (device_id, license_key, activated_at, last_validated, usage_hours, email)
+                        VALUES (?, 'FREE_USER', ?, ?, ?, ?)
+                        ON CONFLICT(device_id) DO UPDATE SET
+                            usage_hours   = usage_hours + ?,
+                            last_validated = ?,
+                            email         = COALESCE(?, email)
+                    """, (device_id, now_iso, now_iso, hours, email,
+                          hours, now_iso, email))
+
+                    if email:
+                        conn.execute("""
+                            UPDATE referrals
+                            SET usage_hours = usage_hours + ?,
+                                is_complete = CASE
+                                    WHEN usage_hours + ? >= 7 THEN 1
+                                    ELSE 0
+                                END,
+                                completed_at = CASE
+                                    WHEN usage_hours + ? >= 7 AND is_complete = 0 THEN ?
+                                    ELSE completed_at
+                                END
+                            WHERE referred_email = ? AND is_complete = 0
+                        """, (hours, hours, hours, now_iso, email))
     except Exception as e:
         print(f"[TELEMETRY] license.db error: {e}")
 
-    # 3. Server ping (every SERVER_INTERVAL seconds only)
+
+def _sync_server():
+    """Ping the server with the minutes it has not seen yet."""
+    pending = _session["pending_minutes"]
+    if pending < 0.5:   # at least 30 seconds accumulated
+        return
+    try:
+        import server_sync
+        # Also send total so server can correct if behind
+        total_min = _get_total_minutes()
+        result = server_sync.send_usage_ping(
+                get_device_id(), round(pending, 2), get_email(),
+                total_minutes=round(total_min, 2)
+            )
+        if result and result.get("success"):
+            with _lock:
+                _session["pending_minutes"]     -= pending
+                _session["total_synced_minutes"] += pending
+                _session["last_server_sync"]    = time.time()
+            print(f"[TELEMETRY] Server synced: "
+                  f"{round(pending, 2)} min sent | "
+                  f"total synced: "
+                  f"{round(_session['total_synced_minutes'], 1)} min")
+    except Exception as e:
+        print(f"[TELEMETRY] Server sync failed (ok): {e}")
+
+
+def flush(sync_server=False, final=False):
+    """
+    Write buffered time to the local DBs. Called every SAVE_INTERVAL by the
+    telemetry thread; final=True (shutdown) also takes the unsaved session time.
+    sync_server=True → also ping Render server with pending minutes.
+    """
+    with _lock:
+        if final and _session["accumulated_seconds"] > 0:
+            _add_time(_session["accumulated_seconds"])
+            _session["accumulated_seconds"] = 0
+        batch = None
+        # Slivers under 5 s stay buffered until there is more
+        if sum(_pending.values()) >= 5:
+            batch = dict(_pending)
+            _pending.clear()
+    if batch:
+        _write_usage(batch)
     if sync_server:
-        pending = _session["pending_minutes"]
-        if pending >= 0.5:   # at least 30 seconds accumulated
-            try:
-                import server_sync
-                # Also send total so server can correct if behind
-                total_min = _get_total_minutes()
-                result = server_sync.send_usage_ping(
-                        device_id, round(pending, 2), email,
-                        total_minutes=round(total_min, 2)
-                    )
-                if result and result.get("success"):
-                    _session["pending_minutes"]    = 0
-                    _session["total_synced_minutes"] += pending
-                    _session["last_server_sync"]   = time.time()
-                    print(f"[TELEMETRY] Server synced: "
-                          f"{round(pending, 2)} min sent | "
-                          f"total synced: "
-                          f"{round(_session['total_synced_minutes'], 1)} min")
-            except Exception as e:
-                print(f"[TELEMETRY] Server sync failed (ok): {e}")
+        _sync_server()
 
 
 def _get_total_minutes():
-    """Read total minutes from local telemetry.db."""
+    """Total minutes written to telemetry.db (materialized, no query)."""
     try:
-        conn = sqlite3.connect(TELEMETRY_DB)
-        c    = conn.cursor()
-        c.execute("SELECT active_hours FROM stats WHERE device_id = ?",
-                  (get_device_id(),))
-        row = c.fetchone()
-        conn.close()
-        return (row[0] or 0) * 60 if row else 0
+        return _load_rollup()["total_hours"] * 60
     except Exception:
         return 0
 
 
+def get_usage_totals():
+    """
+    For /api/usage/stats: total hours including time not written yet,
+    last_seen and email — from memory.
+    """
+    rollup = _load_rollup()
+    with _lock:
+        unsaved = sum(_pending.values()) + _session["accumulated_seconds"]
+        return {
+            "total_hours": rollup["total_hours"] + unsaved / 3600.0,
+            "last_seen":   rollup["last_seen"],
+            "email":       rollup["email"],
+        }
+
+
+def get_daily_usage():
+    """
+    For /api/usage/history: {"YYYY-MM-DD": hours} for the last HISTORY_DAYS,
+    including time not written yet — from memory.
+    """
+    rollup = _load_rollup()
+    with _lock:
+        daily = dict(rollup["daily"])
+        for day, seconds in _pending.items():
+            daily[day] = daily.get(day, 0.0) + seconds / 3600.0
+        if _session["accumulated_seconds"] > 0:
+            today = datetime.now().strftime("%Y-%m-%d")
+            daily[today] = daily.get(today, 0.0) + _session["accumulated_seconds"] / 3600.0
+        return daily
+
+
 def get_active_hours():
     """Get current session accumulated hours (not yet saved)."""
     return _session["accumulated_seconds"] / 3600.0
@@ -422,6 +569,9 @@ def get_active_minutes():
     """Get current session accumulated minutes (not yet saved)."""
     return _session["accumulated_seconds"] / 60.0
 
+
+atexit.register(flush, final=True)
+
 # =============================================================================
 # BACKGROUND TELEMETRY
 # =============================================================================
@@ -432,26 +582,19 @@ def send_ping(force_server=False):
     Send ONLY new minutes (delta) to server every SERVER_INTERVAL.
     Never sends total - always sends what accumulated since last sync.
     """
-    try:
-        if _session["accumulated_seconds"] <= 0:
-            return
-    except Exception as e:
-        print(f"[TELEMETRY] send_ping error: {e}")
-        import traceback
-        traceback.print_exc()
-        return
-
     now       = time.time()
     last_sync = _session["last_server_sync"] or 0
     do_server = force_server or (now - last_sync >= SERVER_INTERVAL)
 
-    # pending_minutes = only what has NOT been sent to server yet
-    pending_add = _session["accumulated_seconds"] / 60.0
-    _session["pending_minutes"] += pending_add
+    with _lock:
+        if _session["accumulated_seconds"] > 0:
+            # pending_minutes = only what has NOT been sent to server yet
+            _session["pending_minutes"] += _session["accumulated_seconds"] / 60.0
+            _add_time(_session["accumulated_seconds"])
+            _session["accumulated_seconds"] = 0
+            _session["last_save_time"]      = now
 
-    _save_usage_time(_session["accumulated_seconds"], sync_server=do_server)
-    _session["accumulated_seconds"] = 0
-    _session["last_save_time"]      = now
+    flush(sync_server=do_server)
 
 
 def start_telemetry():
@@ -461,7 +604,7 @@ def start_telemetry():
     2. Register device on server immediately (background)
     3. Start background loop: log every 60s, save every 60s, server every 10min
     """
-    import threading
+    global _rollup
 
     init_db()
     init_license_db()
@@ -471,17 +614,19 @@ def start_telemetry():
 
     # Register in local DB immediately
     try:
-        conn = sqlite3.connect(TELEMETRY_DB)
-        c    = conn.cursor()
-        c.execute("""
-            INSERT OR IGNORE INTO stats
-                (device_id, email, install_date, last_seen, active_hours,
-                 app_version, license_tier)
-            VALUES (?, ?, ?, ?, 0, '1.1.0', 'free')
-        """, (device_id, email,
-              datetime.now().isoformat(), datetime.now().isoformat()))
-        conn.commit()
-        conn.close()
+        with _db_lock:
+            conn = _connect(TELEMETRY_DB)
+            with conn:
+                c = conn.execute("""
+                    INSERT OR IGNORE INTO stats
+                        (device_id, email, install_date, last_seen, active_hours,
+                         app_version, license_tier)
+                    VALUES (?, ?, ?, ?, 0, '1.1.0', 'free')
+                """, (device_id, email,
+                      datetime.now().isoformat(), datetime.now().isoformat()))
+        if c.rowcount:
+            with _lock:
+                _rollup = None   # totals now come from this device's new row
     except Exception:
         pass
 
@@ -621,10 +766,11 @@ def start_telemetry():
                 tick_count += 1
 
                 # Add 60 seconds - app is open so user is active
-                _session["accumulated_seconds"] += 60
-                _session["last_activity"] = time.time()
-                if _session["start_time"] is None:
-                    _session["start_time"] = time.time()
+                with _lock:
+                    _session["accumulated_seconds"] += 60
+                    _session["last_activity"] = time.time()
+                    if _session["start_time"] is None:
+                        _session["start_time"] = time.time()
 
                 # Keep Render server awake every 10 minutes
                 if tick_count % 10 == 0:
@@ -213,6 +213,8 @@ if _app_path and _app_path not in sys.path:
     sys.path.insert(0, _app_path)
     PROJECT_ROOT = _app_path
 
+from seven_utils.db import connect as db_connect
+
 APPDATA      = os.environ.get('APPDATA', os.path.expanduser('~'))
 LOCK_FILE    = os.path.join(APPDATA, 'SEVEN', 'trigger_daemon.lock')
 
@@ -384,9 +386,7 @@ def load_triggers():
     if not os.path.exists(TRIGGERS_DB):
         return []
     try:
-        conn = sqlite3.connect(TRIGGERS_DB, timeout=5)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
+        conn = db_connect(TRIGGERS_DB, row_factory=sqlite3.Row, timeout=5)
         rows = conn.execute(
             "SELECT * FROM triggers WHERE enabled = 1"
         ).fetchall()
@@ -412,8 +412,7 @@ def load_triggers():
 def update_fire_stats(trigger_id):
     """Increment fire count for a trigger."""
     try:
-        conn = sqlite3.connect(TRIGGERS_DB, timeout=5)
-        conn.execute("PRAGMA journal_mode=WAL")
+        conn = db_connect(TRIGGERS_DB, row_factory=sqlite3.Row, timeout=5)
         conn.execute(
             "UPDATE triggers SET fire_count = fire_count + 1, last_fired = ? WHERE id = ?",
             (datetime.now().isoformat(), trigger_id)
@@ -832,9 +831,7 @@ def execute_trigger(trigger):
         ws_id   = action_data.get("workspace_id")
         ws_name = action_data.get("workspace_name")
         try:
-            conn = sqlite3.connect(TRIGGERS_DB, timeout=5)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
+            conn = db_connect(TRIGGERS_DB, row_factory=sqlite3.Row, timeout=5)
             if ws_id:
                 ws_row = conn.execute(
                     "SELECT apps FROM workspaces WHERE id = ?", (ws_id,)
@@ -1246,9 +1243,7 @@ def _exec_open_workspace(data):
     workspace_name = data.get("workspace_name")
 
     try:
-        conn = sqlite3.connect(TRIGGERS_DB, timeout=5)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
+        conn = db_connect(TRIGGERS_DB, row_factory=sqlite3.Row, timeout=5)
 
         if workspace_id:
             row = conn.execute(
@@ -2011,8 +2006,11 @@ class ReloadPoller:
 #   This listener runs in trigger_daemon.py which survives Seven UI close.
 #
 # MODEL LOADING:
-#   Model loaded ONCE at class init. Never per-loop.
+#   Transcriber obtained ONCE at class init. Never per-loop.
 #   Loading per-loop would cost 2-5s per 1.5s capture — impossible.
+#   Decodes go to Seven's Whisper service (ears/whisper_service.py,
+#   127.0.0.1:7892) when Seven is running; tiny.en is loaded here only
+#   as a fallback, on the first decode that finds Seven down.
 # ─────────────────────────────────────────────────────────────────────────
 
 class VoiceListener(threading.Thread):
@@ -2043,9 +2041,7 @@ class VoiceListener(threading.Thread):
             return
 
         try:
-            conn = sqlite3.connect(TRIGGERS_DB, timeout=5)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
+            conn = db_connect(TRIGGERS_DB, row_factory=sqlite3.Row, timeout=5)
             rows = conn.execute(
                 "SELECT * FROM triggers "
                 "WHERE enabled = 1 AND voice_phrase IS NOT NULL "
@@ -2077,21 +2073,20 @@ class VoiceListener(threading.Thread):
 
     def _load_model(self):
         """
-        Load tiny.en Whisper model once.
+        Get a tiny.en transcriber from ears/whisper_service.py.
         tiny.en is used because trigger phrases are short and known.
-        Loading happens at daemon start, not per audio chunk.
+        The client decodes through Seven's Whisper service (TRIGGER
+        priority, behind the user's own speech) when Seven is running,
+        and loads tiny.en in this process only when it is not.
         """
         if not self._phrase_map:
             return  # no phrases — do not waste memory loading model
 
         try:
-            from faster_whisper import WhisperModel
-            self._model = WhisperModel(
-                "tiny.en",
-                device="cpu",
-                compute_type="int8"
-            )
-            print("[VOICE TRIGGER] tiny.en Whisper loaded for phrase detection")
+            from ears import whisper_service as _whisper
+            self._model = _whisper.client("tiny.en", priority=_whisper.PRIORITY_TRIGGER)
+            where = "Seven's Whisper service" if self._model.remote_available() else "in-process"
+            print(f"[VOICE TRIGGER] tiny.en transcriber ready ({where})")
         except Exception as e:
             print(f"[VOICE TRIGGER] Whisper load failed: {e}")
             self._model = None
@@ -2118,10 +2113,26 @@ class VoiceListener(threading.Thread):
         time.sleep(5.0)
         print("[VOICE TRIGGER] Listener started — watching for phrases...")
 
-        # Open microphone ONCE — hold open for daemon lifetime
+        # Subscribe ONCE — hold for daemon lifetime. Attaches to Seven's
+        # shared capture bus when Seven is running, otherwise opens the mic.
+        # With the VAD endpointer on, frames are read straight off the bus;
+        # otherwise speech_recognition's energy threshold does the capture.
+        import numpy as _np
+        from ears import capture_bus as _capture_bus
+        from ears import endpointer as _endpointer
+        from ears import keyword_spotter as _kws
+
+        bus_sub = None
+        mic     = None
         try:
-            mic     = sr.Microphone()
-            mic_ctx = mic.__enter__()
+            if _endpointer.is_enabled():
+                bus = _capture_bus.get_bus()
+                if bus is None:
+                    raise OSError("capture bus disabled")
+                bus_sub = bus.subscribe("voice_trigger")
+            else:
+                mic     = _capture_bus.microphone("voice_trigger")
+                mic_ctx = mic.__enter__()
         except Exception as e:
             print(f"[VOICE TRIGGER] Microphone unavailable: {e}")
             return
@@ -2129,28 +2140,51 @@ class VoiceListener(threading.Thread):
         try:
             while not self.stop_event.is_set():
 
-                # Capture audio chunk
+                # Capture audio chunk — float32 array, no WAV encode/decode
+                # Keyword gate — phrases can change on reload(), so re-fetch
+                spotter = (_kws.get_spotter("voice_trigger", self._phrase_map)
+                           if _kws.is_enabled() else None)
+
                 try:
-                    audio = recognizer.listen(
-                        mic_ctx,
-                        timeout=1.5,
-                        phrase_time_limit=4
-                    )
-                except sr.WaitTimeoutError:
+                    if mic is None:
+                        if bus_sub is None:
+                            raise OSError("capture bus unavailable")
+                        if spotter:
+                            spotter.reset()
+                        samples = _endpointer.capture(
+                            bus_sub, timeout=1.5, phrase_limit=4,
+                            consumer="voice_trigger",
+                            on_frame=spotter.feed if spotter else None,
+                        )
+                    else:
+                        audio = recognizer.listen(
+                            mic_ctx,
+                            timeout=1.5,
+                            phrase_time_limit=4
+                        )
+                        pcm = audio.get_raw_data(convert_rate=16000, convert_width=2)
+                        samples = _np.frombuffer(pcm, dtype=_np.int16).astype(_np.float32)
+                        samples *= _np.float32(1.0 / 32767.0)
+                        if spotter:
+                            spotter.scan(samples)
+                except (sr.WaitTimeoutError, _endpointer.EndpointTimeout):
                     continue
                 except Exception as e:
                     print(f"[VOICE TRIGGER] Capture error: {e}")
+                    if mic is None:
+                        # Seven owned the shared bus and exited — attach to
+                        # the next owner or take the microphone over here
+                        bus_sub = _capture_bus.resubscribe(bus_sub, "voice_trigger")
                     time.sleep(0.5)
                     continue
 
+                if spotter and not spotter.should_escalate():
+                    continue
+
                 # Transcribe in RAM
                 try:
-                    import io as _io
-                    wav_bytes = audio.get_wav_data()
-                    wav_buf   = _io.BytesIO(wav_bytes)
-
-                    result = self._model.transcribe(
-                        wav_buf,
+                    segments, _ = self._model.transcribe(
+                        samples,
                         beam_size=1,
                         language="en",
                         no_speech_threshold=0.6,
@@ -2158,11 +2192,6 @@ class VoiceListener(threading.Thread):
                         vad_filter=True,
                     )
 
-                    if isinstance(result, tuple):
-                        segments = list(result[0])
-                    else:
-                        segments = list(result)
-
                     text = "".join(s.text for s in segments).strip().lower()
 
                 except Exception as e:
@@ -2175,6 +2204,9 @@ class VoiceListener(threading.Thread):
                 # Clean punctuation for matching
                 clean = text.replace(".", "").replace(",", "").replace("?", "").strip()
 
+                if spotter:
+                    spotter.learn(clean, samples)
+
                 # Match against all configured phrases
                 best_phrase  = None
                 best_score   = 0
@@ -2203,11 +2235,14 @@ class VoiceListener(threading.Thread):
                     time.sleep(2.0)
 
         finally:
-            try:
-                mic.__exit__(None, None, None)
-                print("[VOICE TRIGGER] Microphone released")
-            except Exception:
-                pass
+            if bus_sub is not None:
+                bus_sub.close()
+            if mic is not None:
+                try:
+                    mic.__exit__(None, None, None)
+                except Exception:
+                    pass
+            print("[VOICE TRIGGER] Capture subscription released")
 
     def stop(self):
         """Signal the listener loop to stop."""
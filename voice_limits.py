@@ -62,17 +62,32 @@ LIMIT_MESSAGES = {
 }
 
 
+# Memory-backed features -> SevenMemory counter method
+MEMORY_COUNTS = {
+    "facts_limit":          "count_facts",
+    "conversation_history": "count_conversations",
+}
+
+_tier_cache = (None, "free")   # (config.json mtime, tier)
+
+
 def get_tier() -> str:
-    """Read current tier from config.json. Always safe."""
+    """Read current tier from config.json (re-read only when it changes). Always safe."""
+    global _tier_cache
     try:
         appdata     = os.environ.get("APPDATA", os.path.expanduser("~"))
         config_path = os.path.join(appdata, "SEVEN", "config.json")
         if os.path.exists(config_path):
+            mtime = os.path.getmtime(config_path)
+            if _tier_cache[0] == mtime:
+                return _tier_cache[1]
             with open(config_path, "r") as f:
                 cfg = json.load(f)
             tier = cfg.get("license", {}).get("tier", "free")
-            if tier in TIER_LIMITS:
-                return tier
+            if tier not in TIER_LIMITS:
+                tier = "free"
+            _tier_cache = (mtime, tier)
+            return tier
     except Exception:
         pass
     return "free"
@@ -111,6 +126,20 @@ def check(feature: str, current_count: int) -> tuple:
     return False, msg
 
 
+def check_memory(feature: str, memory=None) -> tuple:
+    """
+    check() with the current count read from SevenMemory's maintained
+    counters — no collection read. Allowed if memory is unavailable.
+    """
+    try:
+        if memory is None:
+            from memory import seven_memory as memory
+        current = getattr(memory, MEMORY_COUNTS[feature])()
+    except Exception:
+        return True, ""
+    return check(feature, current)
+
+
 def check_bool(feature: str) -> tuple:
     """
     Check if a boolean feature is available.